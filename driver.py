@@ -37,6 +37,24 @@ def main():
                             help='Name of saved log files')
     arg_parser.add_argument('--mute', '-m', action='store_true',
                             help='Mute all non-error output')
+    arg_parser.add_argument('--start-time', action='store', default=None,
+                            help='Seek to this telemetry time before running'
+                                 ' (overrides StartTime in the config file)')
+    arg_parser.add_argument('--end-time', action='store', default=None,
+                            help='Stop after this telemetry time'
+                                 ' (overrides EndTime in the config file)')
+    arg_parser.add_argument('--max-frames', action='store', type=int,
+                            default=None,
+                            help='Stop after this many frames'
+                                 ' (overrides MaxFrames in the config file)')
+    arg_parser.add_argument('--batch', '-b', nargs='+', default=None,
+                            metavar='TELEMETRY_FILE',
+                            help='Run each telemetry file in parallel worker'
+                                 ' processes and save a summary of all runs')
+    arg_parser.add_argument('--workers', '-w', action='store', type=int,
+                            default=None,
+                            help='Number of batch worker processes'
+                                 ' (defaults to the number of CPUs)')
 
     """
     Testing specific arguments
@@ -71,6 +89,7 @@ def main():
     """
     from onair.src.util.cleanup import setup_folders
     from onair.src.run_scripts.execution_engine import ExecutionEngine
+    from onair.src.run_scripts.batch_run import run_batch, save_batch_summary
 
     if args.mute:
         blockPrint()
@@ -100,7 +119,22 @@ def main():
             save_name = args.save_name
         else:
             save_name = datetime.now().strftime("%m%d%Y_%H%M%S")
+        # Command line run parameters override those of the config file
+        run_params = {name : val for name, val in [('run_start_time', args.start_time),
+                                                   ('run_end_time', args.end_time),
+                                                   ('run_max_frames', args.max_frames)]
+                      if val != None}
+        if args.batch:
+            summary = run_batch(args.configfile, args.batch, args.workers, run_params)
+            save_batch_summary(summary, os.path.join(
+                os.environ['RESULTS_PATH'], 'batch_' + save_name + '.json'))
+            print(f"Batch: {len(summary['files'])} files, "
+                  f"{summary['total_frames']} frames in "
+                  f"{summary['seconds']:.2f} s")
+            return
         OnAIR = ExecutionEngine(args.configfile, save_name, args.save)
+        for name, val in run_params.items():
+            OnAIR.set_run_param(name, val)
         OnAIR.run_sim()
 
 
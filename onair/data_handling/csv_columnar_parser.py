@@ -0,0 +1,91 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+CSV Columnar Parser
+
+Parses a CSV file into one contiguous 2-D float array (frames x columns) with a
+matching validity mask, instead of a list of lists of Python floats.
+"""
+
+import csv
+from itertools import islice
+import numpy as np
+
+from onair.data_handling import csv_parser
+from onair.data_handling.parser_util import *
+from onair.data_handling.frame_cache import load_frame_cache, save_frame_cache
+
+class DataSource(csv_parser.DataSource):
+    # Element type of the frame store; np.float32 halves memory, but cannot
+    # hold epoch timestamps to better than about a minute
+    dtype = np.float64
+    # Keep a memory-mapped binary copy of the parsed frames next to the file
+    use_frame_cache = True
+
+    def process_data_file(self, data_file):
+        cached = None
+        if self.use_frame_cache:
+            cached = load_frame_cache(data_file, self.meta_data_file, self.dtype)
+        if cached != None:
+            self.sim_data, self.valid_mask = cached
+        else:
+            self.sim_data, self.valid_mask = self.parse_csv_data(data_file)
+            if self.use_frame_cache:
+                save_frame_cache(data_file, self.meta_data_file,
+                                 self.sim_data, self.valid_mask)
+        self.frame_index = 0
+
+##### INITIAL PROCESSING ####
+    def parse_csv_data(self, data_file):
+        blocks = []
+        masks = []
+
+        with open(data_file, 'r', newline='') as csv_file:
+            dataset = csv.reader(csv_file, delimiter=',')
+            # Headers set the width of every frame
+            width = len(next(dataset, []))
+
+            # Column types are inferred once, from the first chunk of rows
+            column_types = None
+            rows = list(islice(dataset, self.chunk_rows))
+            while len(rows) > 0:
+                if column_types == None:
+                    column_types = infer_column_types(rows)[:width]
+                    column_types += [GENERIC_COLUMN] * (width - len(column_types))
+                block, mask = self.columnize(rows, width, column_types)
+                blocks.append(block)
+                masks.append(mask)
+                rows = list(islice(dataset, self.chunk_rows))
+
+        if len(blocks) == 0:
+            return np.empty((0, width), dtype=self.dtype), np.empty((0, width), dtype=bool)
+        return np.concatenate(blocks), np.concatenate(masks)
+
+    def columnize(self, rows, width, column_types):
+        block = np.zeros((len(rows), width), dtype=self.dtype)
+        mask = np.ones((len(rows), width), dtype=bool)
+
+        for col in range(width):
+            cells = [row[col] if col < len(row) else '' for row in rows]
+            values, invalid = convert_column(cells, column_types[col])
+            block[:, col] = values
+            mask[invalid, col] = False
+        return block, mask
+
+##### GETTERS ##################################
+
+    # Get a view of the frame at self.index and increment the index
+    def get_next(self):
+        self.frame_index = self.frame_index + 1
+        return self.sim_data[self.frame_index - 1]
+
+    # Validity of each value in the frame last returned by get_next
+    def get_validity(self):
+        return self.valid_mask[self.frame_index - 1]
@@ -0,0 +1,92 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+CSV Multi-File Parser
+
+Streams frames across every CSV file in a directory, or matching a glob
+pattern, in sorted order. The next file is parsed on a background thread while
+frames of the current one are handed out. file_boundary marks the first frame
+of each file, on which the Simulator resets the agent's per-file state.
+"""
+
+import os
+import glob
+from concurrent.futures import ThreadPoolExecutor
+
+from onair.data_handling import csv_parser
+
+class DataSource(csv_parser.DataSource):
+    # Parse the next file on a background thread while the current one is used
+    prefetch_next_file = True
+
+    def process_data_file(self, data_file):
+        self.data_files = self.list_data_files(data_file)
+        if len(self.data_files) == 0:
+            raise FileNotFoundError(f"No telemetry files found for '{data_file}'.")
+        self.prefetcher = ThreadPoolExecutor(max_workers=1) if self.prefetch_next_file else None
+        self.pending_file = None
+        self.file_index = -1
+        self.file_boundary = False
+        self.next_file()
+
+    def list_data_files(self, data_file):
+        if os.path.isdir(data_file):
+            return sorted(glob.glob(os.path.join(data_file, '*.csv')))
+        return sorted(glob.glob(data_file))
+
+##### FILE HANDLING ############################
+    def next_file(self):
+        """Moves on to the next file holding any frames, closing when none are left"""
+        self.sim_data = []
+        self.frame_index = 0
+        while len(self.sim_data) == 0 and self.file_index + 1 < len(self.data_files):
+            self.file_index = self.file_index + 1
+            self.sim_data = self.load_file(self.file_index)
+        if len(self.sim_data) == 0:
+            self.close()
+
+    def load_file(self, file_index):
+        """Frames of data_files[file_index], taken from the prefetch when there is one"""
+        if self.pending_file != None:
+            frames = self.pending_file.result()
+        else:
+            frames = self.parse_csv_data(self.data_files[file_index])
+        self.pending_file = None
+        if self.prefetcher != None and file_index + 1 < len(self.data_files):
+            self.pending_file = self.prefetcher.submit(self.parse_csv_data,
+                                                       self.data_files[file_index + 1])
+        return frames
+
+    def close(self):
+        if self.pending_file != None:
+            self.pending_file.cancel()
+        if self.prefetcher != None:
+            self.prefetcher.shutdown(wait=False)
+            self.prefetcher = None
+        self.pending_file = None
+
+##### GETTERS ##################################
+
+    # Name of the file the frame last returned by get_next came from
+    def get_current_file(self):
+        return self.data_files[self.file_index]
+
+    # Get the next frame, marking whether it is the first of its file
+    def get_next(self):
+        if self.frame_index == len(self.sim_data):
+            self.next_file()
+        self.file_boundary = self.frame_index == 0
+        return super().get_next()
+
+    # Return whether or not there are frames left in any of the files
+    def has_more(self):
+        if self.frame_index == len(self.sim_data):
+            self.next_file()
+        return self.frame_index < len(self.sim_data)
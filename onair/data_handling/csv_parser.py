@@ -12,12 +12,15 @@ CSV Parser
 """
 
 import csv
+from itertools import islice
 
 from onair.data_handling.on_air_data_source import OnAirDataSource
 from onair.src.util.print_io import *
 from onair.data_handling.parser_util import *
 
 class DataSource(OnAirDataSource):
+    # Number of rows converted together while parsing
+    chunk_rows = 65536
 
     def process_data_file(self, data_file):
         self.sim_data = self.parse_csv_data(data_file)
@@ -30,18 +33,18 @@ class DataSource(OnAirDataSource):
         all_data = []
 
         with open(data_file, 'r', newline='') as csv_file:
-            dataset = csv.reader(csv_file, delimiter=',')
-
-            #Initialize the entire data dictionary
-            index = 0
-            for row in dataset:
-                if index == 0:
-                    # Skip first row (headers)
-                    pass
-                else:
-                    rowVals = floatify_input(list(row))
-                    all_data.append(rowVals)
-                index = index + 1
+            dataset = iter(csv.reader(csv_file, delimiter=','))
+            # Skip first row (headers)
+            next(dataset, None)
+
+            # Column types are inferred once, from the first chunk of rows
+            column_types = None
+            rows = list(islice(dataset, self.chunk_rows))
+            while len(rows) > 0:
+                if column_types == None:
+                    column_types = infer_column_types(rows)
+                all_data.extend(floatify_rows(rows, column_types))
+                rows = list(islice(dataset, self.chunk_rows))
 
         return all_data
 
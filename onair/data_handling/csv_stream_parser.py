@@ -0,0 +1,116 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+CSV Stream Parser
+
+Streams frames out of a CSV file instead of loading the whole file up front.
+Memory use is bounded by the read buffer and the read-ahead window, no matter
+how large the file is. A sparse time index, persisted next to the file, lets
+the stream seek to a time and be limited to a run window.
+"""
+
+import csv
+from itertools import islice
+from collections import deque
+
+from onair.data_handling import csv_parser
+from onair.data_handling.parser_util import *
+from onair.data_handling.time_index import load_time_index, find_index_entry, to_time
+
+class DataSource(csv_parser.DataSource):
+    # Size (in bytes) of each buffered read from the data file
+    read_buffer_size = 1024 * 1024
+    # Number of parsed frames held ahead of get_next
+    read_ahead_frames = 64
+
+    # Frames between entries of the sparse time index
+    index_interval = 1024
+    # Column holding each frame's time
+    time_column = 0
+
+    def process_data_file(self, data_file):
+        self.data_file = data_file
+        self.column_types = None
+        self.time_index = None
+        self.end_time = None
+        self.open_data_file()
+
+    def open_data_file(self, offset=None, frame_index=0):
+        self.frame_index = frame_index
+        self.read_ahead = deque()
+        self.csv_file = open(self.data_file, 'r', newline='',
+                             buffering=self.read_buffer_size)
+        self.dataset = csv.reader(self.csv_file, delimiter=',')
+        if offset == None:
+            # Skip first row (headers)
+            next(self.dataset, None)
+        else:
+            self.csv_file.seek(offset)
+        self.fill_read_ahead()
+
+##### STREAMING ################################
+    def fill_read_ahead(self):
+        if self.dataset == None:
+            return
+        rows = list(islice(self.dataset, self.read_ahead_frames - len(self.read_ahead)))
+        if len(rows) > 0:
+            # Column types are inferred once, from the first rows read
+            if self.column_types == None:
+                self.column_types = infer_column_types(rows)
+            self.read_ahead.extend(floatify_rows(rows, self.column_types))
+        if len(self.read_ahead) < self.read_ahead_frames:
+            self.close()
+
+    def close(self):
+        if self.dataset != None:
+            self.csv_file.close()
+            self.dataset = None
+
+##### SEEKING ##################################
+    def seek(self, time):
+        """Position the stream at the first frame at or after time"""
+        target = to_time(time)
+        if self.time_index == None:
+            self.time_index = load_time_index(self.data_file, self.time_column,
+                                              self.index_interval)
+        self.close()
+        if len(self.time_index['offsets']) == 0:
+            self.read_ahead = deque()
+            return
+        entry = find_index_entry(self.time_index, target)
+        self.open_data_file(self.time_index['offsets'][entry],
+                            self.time_index['rows'][entry])
+        # At most index_interval frames lie between the entry and the target
+        while self.has_more() and self.read_ahead[0][self.time_column] < target:
+            self.get_next()
+
+    def set_run_window(self, start_time=None, end_time=None):
+        self.end_time = None if end_time == None else to_time(end_time)
+        if start_time != None:
+            self.seek(start_time)
+
+##### GETTERS ##################################
+
+    # Get the next streamed frame and increment the index
+    def get_next(self):
+        frame = self.read_ahead.popleft()
+        self.frame_index = self.frame_index + 1
+        if len(self.read_ahead) == 0:
+            self.fill_read_ahead()
+        return frame
+
+    # Return whether or not there are streamed frames left in the run window,
+    # closing the data file once there are not
+    def has_more(self):
+        if len(self.read_ahead) > 0 and (self.end_time == None
+                                         or self.read_ahead[0][self.time_column] <= self.end_time):
+            return True
+        self.close()
+        return False
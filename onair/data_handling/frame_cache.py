@@ -0,0 +1,77 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+frame_cache.py
+Sidecar binary cache of parsed telemetry frames, memory-mapped on reuse
+
+Only csv_columnar_parser.py uses it. csv_parser.py keeps each row as
+floatify_input gives it, and rows may be ragged, so a rectangular array
+cannot always give them back. Nor does csv_parser.py work out the
+validity mask stored alongside, and a cache it wrote would be read by
+the columnar parser for the same file.
+"""
+
+import os
+import json
+import hashlib
+import numpy as np
+
+CACHE_VERSION = 1
+
+def cache_paths(data_file):
+    return (data_file + '.frames.npy',
+            data_file + '.valid.npy',
+            data_file + '.cache.json')
+
+def cache_key(data_file, meta_file, dtype):
+    """Identifies a parse of data_file; any change to it invalidates the cache"""
+    stat = os.stat(data_file)
+    with open(meta_file, 'rb') as f:
+        meta_hash = hashlib.sha256(f.read()).hexdigest()
+    return {'version' : CACHE_VERSION,
+            'path' : os.path.abspath(data_file),
+            'size' : stat.st_size,
+            'mtime_ns' : stat.st_mtime_ns,
+            'meta_hash' : meta_hash,
+            'dtype' : np.dtype(dtype).str}
+
+def load_frame_cache(data_file, meta_file, dtype):
+    """Returns memory-mapped (frames, valid_mask), or None when the cache is missing or stale"""
+    frames_path, valid_path, key_path = cache_paths(data_file)
+    try:
+        with open(key_path, 'r') as f:
+            stored_key = json.load(f)
+        if stored_key != cache_key(data_file, meta_file, dtype):
+            return None
+        return (np.load(frames_path, mmap_mode='r'),
+                np.load(valid_path, mmap_mode='r'))
+    except (OSError, ValueError):
+        return None
+
+def save_frame_cache(data_file, meta_file, frames, valid_mask):
+    """Writes the cache next to data_file; returns False if it could not be written"""
+    frames_path, valid_path, key_path = cache_paths(data_file)
+    try:
+        key = cache_key(data_file, meta_file, frames.dtype)
+        # Key is written last so a partial write is never seen as valid
+        if os.path.exists(key_path):
+            os.remove(key_path)
+        write_atomic(frames_path, lambda f: np.save(f, frames))
+        write_atomic(valid_path, lambda f: np.save(f, valid_mask))
+        write_atomic(key_path, lambda f: f.write(json.dumps(key).encode()))
+    except OSError:
+        return False
+    return True
+
+def write_atomic(path, write_function):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        write_function(f)
+    os.replace(tmp_path, path)
@@ -0,0 +1,150 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+FramePrefetcher Class
+Reads frames from a DataSource on a producer thread into a bounded queue, so
+parsing and I/O overlap reasoning on the frames before them
+"""
+
+import copy
+import queue
+import threading
+
+# Kinds of item the producer queues
+FRAME = 0
+END = 1
+ERROR = 2
+
+class FramePrefetcher:
+    def __init__(self, data_source, depth=8, drop_frames=False):
+        """Starts reading frames of data_source, holding up to depth of them.
+           When the queue is full the producer waits for room, or, with
+           drop_frames, drops the oldest queued frame instead."""
+        if depth < 1:
+            raise ValueError('Prefetch depth must be at least 1')
+        self.data_source = data_source
+        self.depth = depth
+        self.drop_frames = drop_frames
+        self.frames = queue.Queue(maxsize=depth)
+        self.stopping = threading.Event()
+        self.pending = None
+        self.has_pending = False
+        self.finished = False
+        # Whether the frame last returned by get_next started a new file of the source
+        self.file_boundary = False
+        # When the frame last returned by get_next arrived at the source, if timed
+        self.frame_received_time = None
+
+        # Queue occupancy stats
+        self.frames_read = 0
+        self.frames_dropped = 0
+        self.full_waits = 0
+        self.empty_waits = 0
+        self.occupancy_samples = 0
+        self.occupancy_total = 0
+        self.occupancy_max = 0
+
+        self.producer = threading.Thread(target=self.produce, daemon=True)
+        self.producer.start()
+
+    ################################################
+    ################### Producer ###################
+
+    def produce(self):
+        try:
+            while not self.stopping.is_set() and self.data_source.has_more():
+                # Copied, as a DataSource may reuse the frame it returns
+                frame = copy.copy(self.data_source.get_next())
+                # The boundary and arrival time are read now, as the source moves
+                # on before the frame is reasoned on
+                self.put((FRAME, (frame, self.data_source.file_boundary == True,
+                                  self.data_source.frame_received_time)))
+                self.frames_read += 1
+            self.put((END, None))
+        except Exception as e:
+            self.put((ERROR, e))
+
+    def put(self, item):
+        if self.frames.full():
+            self.full_waits += 1
+        if self.drop_frames:
+            # The end of the frames, too, takes the place of the oldest frame
+            while True:
+                try:
+                    self.frames.put_nowait(item)
+                    return
+                except queue.Full:
+                    try:
+                        self.frames.get_nowait()
+                        self.frames_dropped += 1
+                    except queue.Empty:
+                        pass
+        # Waits for room, giving up once stopped
+        while not self.stopping.is_set():
+            try:
+                self.frames.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    ################################################
+    ################### Consumer ###################
+
+    def has_more(self):
+        if not self.has_pending and not self.finished:
+            self.take()
+        return self.has_pending
+
+    def get_next(self):
+        if not self.has_more():
+            raise IndexError('No frames left to get')
+        frame, self.file_boundary, self.frame_received_time = self.pending
+        self.pending = None
+        self.has_pending = False
+        return frame
+
+    def take(self):
+        occupancy = self.frames.qsize()
+        self.occupancy_samples += 1
+        self.occupancy_total += occupancy
+        self.occupancy_max = max(self.occupancy_max, occupancy)
+        if occupancy == 0:
+            self.empty_waits += 1
+        kind, value = self.frames.get()
+        if kind == FRAME:
+            self.pending = value
+            self.has_pending = True
+            return
+        self.finished = True
+        if kind == ERROR:
+            raise value
+
+    def stop(self):
+        """Stops the producer, discarding frames it read ahead"""
+        self.stopping.set()
+        try:
+            while True:
+                self.frames.get_nowait()
+        except queue.Empty:
+            pass
+        self.producer.join(timeout=1.0)
+
+    def get_stats(self):
+        """Occupancy of the frame queue each time a frame was taken from it.
+           Many empty_waits mean reasoning waits on ingestion; many
+           full_waits mean ingestion waits on reasoning."""
+        mean_occupancy = self.occupancy_total / self.occupancy_samples if self.occupancy_samples > 0 else 0.0
+        return {'depth' : self.depth,
+                'frames_read' : self.frames_read,
+                'frames_dropped' : self.frames_dropped,
+                'mean_occupancy' : mean_occupancy,
+                'max_occupancy' : self.occupancy_max,
+                'full_waits' : self.full_waits,
+                'empty_waits' : self.empty_waits}
@@ -0,0 +1,55 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+IngestLatency Class
+Times how long frames of a live DataSource take from their message being
+received by a listener thread until Agent.reason returns with them
+"""
+
+import collections
+import time
+
+import numpy as np
+
+class IngestLatency:
+    def __init__(self, window=10000):
+        """Keeps totals of every frame, and the latencies of the last window
+           frames for percentiles"""
+        self.frames = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.recent = collections.deque(maxlen=window)
+
+    @staticmethod
+    def now():
+        return time.perf_counter()
+
+    def record(self, received_time):
+        """Records the latency of a frame received at received_time, a time of now()"""
+        seconds = self.now() - received_time
+        self.frames += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.recent.append(seconds)
+
+    def get_stats(self):
+        """Latencies in seconds; the percentiles are of the recent frames only"""
+        if self.frames == 0:
+            return {'frames' : 0,
+                    'mean_seconds' : 0.0,
+                    'p50_seconds' : 0.0,
+                    'p99_seconds' : 0.0,
+                    'max_seconds' : 0.0}
+        p50, p99 = np.percentile(np.array(self.recent), [50, 99]).tolist()
+        return {'frames' : self.frames,
+                'mean_seconds' : self.total_seconds / self.frames,
+                'p50_seconds' : p50,
+                'p99_seconds' : p99,
+                'max_seconds' : self.max_seconds}
@@ -14,6 +14,13 @@ class ConfigKeyError(KeyError):
     pass
 
 class OnAirDataSource(ABC):
+    # True when the frame last returned by get_next starts a new, unrelated
+    # stream of telemetry, such as the next file of a multi-file source
+    file_boundary = False
+    # When the frame last returned by get_next arrived, as an IngestLatency.now();
+    # None for sources that do not time their frames
+    frame_received_time = None
+
     def __init__(self, data_file, meta_file, ss_breakdown = False):
         """An initial parsing needs to happen in order to use the parser classes
             This means that, if you want to use this class to parse in real time,
@@ -61,3 +68,23 @@ class OnAirDataSource(ABC):
         Used by file-based data to indicate if there are more frames (True) or if the end of the file has been reached (False)
         """
         raise NotImplementedError
+
+    async def get_next_async(self):
+        """
+        Awaitable get_next; sources whose frames arrive on an event loop override this to await them
+        """
+        return self.get_next()
+
+    async def has_more_async(self):
+        """
+        Awaitable has_more
+        """
+        return self.has_more()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not await self.has_more_async():
+            raise StopAsyncIteration
+        return await self.get_next_async()
@@ -9,6 +9,18 @@
 
 from .tlm_json_parser import parseTlmConfJson, str2lst
 import datetime
+import re
+
+# Column types chosen by infer_column_types
+FLOAT_COLUMN = 'float'
+MIN_SEC_COLUMN = 'min_sec'
+DAY_OF_YEAR_COLUMN = 'day_of_year'
+CONSTANT_COLUMN = 'constant'
+GENERIC_COLUMN = 'generic'
+
+MIN_SEC_PATTERN = re.compile(r'\d+:\d+')
+# '%Y-%j-%H:%M:%S.%f' split into its minute prefix, seconds and fraction
+DAY_OF_YEAR_PATTERN = re.compile(r'(\d{4}-\d{3}-\d{2}:\d{2}):([0-5]\d)\.(\d{1,6})')
 
 def extract_meta_data_handle_ss_breakdown(meta_data_file, ss_breakdown):
     parsed_meta_data = extract_meta_data(meta_data_file)
@@ -68,3 +80,92 @@ def convert_str_to_timestamp(time_str):
         # Use 1 am on Jan 1st, 2000 as the date if only minutes and seconds are specified
         t = datetime.datetime(2000, 1, 1, 1, int(min_sec[0]), int(min_sec[1]), 0)
         return t.timestamp()
+
+def convert_cell(cell):
+    """Same conversion as floatify_input, but reports whether it succeeded"""
+    try:
+        return float(cell), True
+    except ValueError:
+        try:
+            return convert_str_to_timestamp(cell), True
+        except:
+            return 0.0, False
+
+def infer_column_types(rows, sample_size=16):
+    """Picks a converter type for each column from the first rows"""
+    sample = rows[:sample_size]
+    width = len(sample[0]) if len(sample) > 0 else 0
+    column_types = []
+    for col in range(width):
+        cells = [row[col] for row in sample if col < len(row)]
+        column_types.append(infer_cell_type(cells))
+    return column_types
+
+def infer_cell_type(cells):
+    try:
+        for cell in cells:
+            float(cell)
+        return FLOAT_COLUMN
+    except ValueError:
+        pass
+    if all(MIN_SEC_PATTERN.fullmatch(cell) for cell in cells):
+        return MIN_SEC_COLUMN
+    if all(DAY_OF_YEAR_PATTERN.fullmatch(cell) for cell in cells):
+        return DAY_OF_YEAR_COLUMN
+    if len(set(cells)) == 1:
+        return CONSTANT_COLUMN
+    return GENERIC_COLUMN
+
+def convert_column(cells, column_type):
+    """Converts a column of cells exactly as floatify_input would.
+       Returns the values and the indices of cells that fell back to 0.0"""
+    if column_type == FLOAT_COLUMN:
+        try:
+            return list(map(float, cells)), []
+        except ValueError:
+            pass
+    memo = {}
+    if column_type == DAY_OF_YEAR_COLUMN:
+        convert = lambda cell: convert_day_of_year_cell(cell, memo)
+    else:
+        # Time-of-hour, constant and unknown cells repeat, so each distinct
+        # string only goes through the exception-driven path once
+        convert = lambda cell: memo[cell] if cell in memo else memo.setdefault(cell, convert_cell(cell))
+    values = []
+    invalid = []
+    for index, cell in enumerate(cells):
+        value, valid = convert(cell)
+        values.append(value)
+        if not valid:
+            invalid.append(index)
+    return values, invalid
+
+def convert_day_of_year_cell(cell, prefix_memo):
+    match = DAY_OF_YEAR_PATTERN.fullmatch(cell)
+    if match == None:
+        return convert_cell(cell)
+    prefix, seconds, fraction = match.groups()
+    if prefix not in prefix_memo:
+        try:
+            t = datetime.datetime.strptime(prefix, '%Y-%j-%H:%M')
+            prefix_memo[prefix] = int(t.timestamp())
+        except ValueError:
+            prefix_memo[prefix] = None
+    prefix_seconds = prefix_memo[prefix]
+    if prefix_seconds == None:
+        return convert_cell(cell)
+    # Same arithmetic as datetime.timestamp(): whole seconds plus microseconds
+    return (prefix_seconds + int(seconds)) + int(fraction.ljust(6, '0')) / 1e6, True
+
+def floatify_rows(rows, column_types=None):
+    """Equivalent to [floatify_input(row) for row in rows], converting whole columns at once"""
+    if len(rows) == 0:
+        return []
+    if column_types == None:
+        column_types = infer_column_types(rows)
+    width = len(column_types)
+    if any(len(row) != width for row in rows):
+        return [floatify_input(row) for row in rows]
+    columns = [convert_column([row[col] for row in rows], column_types[col])[0]
+               for col in range(width)]
+    return [list(row) for row in zip(*columns)] if width > 0 else [[] for row in rows]
@@ -14,22 +14,28 @@ redis_adapter AdapterDataSource class
 Receives messages from REDIS server, serves as a data source for sim.py
 """
 
+import asyncio
 import threading
-import time
 import redis
 import json
 
 from onair.data_handling.on_air_data_source import OnAirDataSource
 from onair.data_handling.on_air_data_source import ConfigKeyError
 from onair.data_handling.tlm_json_parser import parseJson
+from onair.data_handling.ingest_latency import IngestLatency
 from onair.src.util.print_io import *
 from onair.data_handling.parser_util import *
 
 class DataSource(OnAirDataSource):
+    # Seconds get_next waits for a message before raising TimeoutError; None waits for good
+    frame_timeout = None
+    # When the message of the frame being received arrived, as an IngestLatency.now()
+    received_time = None
 
     def __init__(self, data_file, meta_file, ss_breakdown = False):
         super().__init__(data_file, meta_file, ss_breakdown)
-        self.new_data_lock = threading.Lock()
+        # A condition, so the listener threads can wake get_next when data arrives
+        self.new_data_lock = threading.Condition()
         self.new_data = False
         self.servers = []
         self.currentData = []
@@ -44,27 +50,8 @@ class DataSource(OnAirDataSource):
         """Establish connection to REDIS server."""
         print_msg('Redis adapter connecting to server...')
         for idx, server_config in enumerate(self.server_configs):
-            server_config_keys = server_config.keys()
-            if 'address' in server_config_keys:
-                address = server_config['address']
-            else:
-                address = 'localhost'
-
-            if 'port' in server_config_keys:
-                port = server_config['port']
-            else:
-                port = 6379
-            
-            if 'db' in server_config_keys:
-                db = server_config['db']
-            else:
-                db = 0
+            address, port, db, password = self.server_settings(server_config)
 
-            if 'password' in server_config_keys:
-                password = server_config['password']
-            else:
-                password = ''
-                 
             #if there are subscriptions in this Redis server configuration's subscription key
             if len(server_config['subscriptions']) != 0:
                 #Create the servers and append them to self.servers list
@@ -91,6 +78,30 @@ class DataSource(OnAirDataSource):
             else:
                 print_msg("No subscriptions given! Redis server not created")       
 
+    def server_settings(self, server_config):
+        """(address, port, db, password) of a server configuration, with defaults for those not given"""
+        server_config_keys = server_config.keys()
+        if 'address' in server_config_keys:
+            address = server_config['address']
+        else:
+            address = 'localhost'
+
+        if 'port' in server_config_keys:
+            port = server_config['port']
+        else:
+            port = 6379
+
+        if 'db' in server_config_keys:
+            db = server_config['db']
+        else:
+            db = 0
+
+        if 'password' in server_config_keys:
+            password = server_config['password']
+        else:
+            password = ''
+        return address, port, db, password
+
     def parse_meta_data_file(self, meta_data_file, ss_breakdown):
         self.server_configs = []
         configs = extract_meta_data_handle_ss_breakdown(
@@ -128,22 +139,28 @@ class DataSource(OnAirDataSource):
         return self.all_headers, self.binning_configs['test_assignments']
 
     def get_next(self):
-        """Provides the latest data from REDIS channel"""
-        data_available = False
+        """Provides the latest data from REDIS channel, waiting up to
+           frame_timeout seconds for a listener thread to receive it"""
+        with self.new_data_lock:
+            if not self.new_data_lock.wait_for(self.has_data, self.frame_timeout):
+                raise TimeoutError(f'Redis adapter received no data in {self.frame_timeout} seconds')
 
-        while not data_available:
-            with self.new_data_lock:
-                data_available = self.has_data()
+        return self.read_new_data()
 
-            if not data_available:
-                time.sleep(0.01)
+    async def get_next_async(self):
+        """get_next on a worker thread, so waiting on the listener threads
+           does not block the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_next)
 
+    def read_new_data(self):
+        """Swaps the double buffer, returning the frame just received"""
         read_index = 0
         with self.new_data_lock:
             self.new_data = False
             self.double_buffer_read_index = (
                 self.double_buffer_read_index + 1) % 2
             read_index = self.double_buffer_read_index
+            self.frame_received_time = self.received_time
 
         return self.currentData[read_index]['data']
 
@@ -154,59 +171,66 @@ class DataSource(OnAirDataSource):
     def message_listener(self, pubsub):
         """Loop for listening for messages on channels"""
         for message in pubsub.listen():
-            if message['type'] == 'message':
-                channel_name = f"{message['channel'].decode()}"
-                # Attempt to load message as json
-                try:
-                    data = json.loads(message['data'])
-                except ValueError:
-                    # Warn of non-json conforming channel data received
-                    non_json_msg = f'Subscribed channel `{channel_name}\' ' \
-                                    'message received but is not in json ' \
-                                   f'format.\nMessage:\n{message["data"]}'
-                    print_msg(non_json_msg, ['WARNING'])
-                    continue
-                # Select the current data
-                currentData = self.currentData[
-                    (self.double_buffer_read_index + 1) % 2]
-                # turn all data points to unknown
-                currentData['data'] = ['-' for _ in currentData['data']]
-                # Find expected keys for received channel
-                expected_message_keys = \
-                    [k for k in currentData['headers'] if channel_name in k]
-                # Time is an expected key for all channels
-                expected_message_keys.append("time")
-                # Parse through the message keys for data points
-                for key in list(data.keys()):
-                    if key.lower() == 'time':
-                        header_string = key.lower()
-                    else:
-                        header_string = f"{channel_name}.{key}"
-                    # Look for channel specific values
-                    try:
-                        index = currentData['headers'].index(header_string)
-                        currentData['data'][index] = data[key]
-                        expected_message_keys.remove(header_string)
-                    # Unexpected key in data
-                    except ValueError:
-                        # warn user about key in data that is not in header
-                        print_msg(f"Unused key `{key}' in message " \
-                                  f'from channel `{channel_name}.\'',
-                                  ['WARNING'])
-                with self.new_data_lock:
-                    self.new_data = True
-                # Warn user about expected keys missing from received data
-                for k in expected_message_keys:
-                    print_msg(f'Message from channel `{channel_name}\' ' \
-                              f'did not contain `{k}\' key\nMessage:\n' \
-                              f'{data}', ['WARNING'])
-            else:
-                # Warn user about non message receipts
-                print_msg(f"Redis adapter: channel " \
-                          f"'{message['channel'].decode()}' received " \
-                          f"message type: {message['type']}.", ['WARNING'])
+            self.receive_message(message)
         # When listener loop exits warn user
         print_msg("Redis subscription listener exited.", ['WARNING'])
 
+    def receive_message(self, message):
+        """Fills the frame being received with a pubsub message's data"""
+        if message['type'] == 'message':
+            received_time = IngestLatency.now()
+            channel_name = f"{message['channel'].decode()}"
+            # Attempt to load message as json
+            try:
+                data = json.loads(message['data'])
+            except ValueError:
+                # Warn of non-json conforming channel data received
+                non_json_msg = f'Subscribed channel `{channel_name}\' ' \
+                                'message received but is not in json ' \
+                               f'format.\nMessage:\n{message["data"]}'
+                print_msg(non_json_msg, ['WARNING'])
+                return
+            # Select the current data
+            currentData = self.currentData[
+                (self.double_buffer_read_index + 1) % 2]
+            # turn all data points to unknown
+            currentData['data'] = ['-' for _ in currentData['data']]
+            # Find expected keys for received channel
+            expected_message_keys = \
+                [k for k in currentData['headers'] if channel_name in k]
+            # Time is an expected key for all channels
+            expected_message_keys.append("time")
+            # Parse through the message keys for data points
+            for key in list(data.keys()):
+                if key.lower() == 'time':
+                    header_string = key.lower()
+                else:
+                    header_string = f"{channel_name}.{key}"
+                # Look for channel specific values
+                try:
+                    index = currentData['headers'].index(header_string)
+                    currentData['data'][index] = data[key]
+                    expected_message_keys.remove(header_string)
+                # Unexpected key in data
+                except ValueError:
+                    # warn user about key in data that is not in header
+                    print_msg(f"Unused key `{key}' in message " \
+                              f'from channel `{channel_name}.\'',
+                              ['WARNING'])
+            with self.new_data_lock:
+                self.new_data = True
+                self.received_time = received_time
+                self.new_data_lock.notify_all()
+            # Warn user about expected keys missing from received data
+            for k in expected_message_keys:
+                print_msg(f'Message from channel `{channel_name}\' ' \
+                          f'did not contain `{k}\' key\nMessage:\n' \
+                          f'{data}', ['WARNING'])
+        else:
+            # Warn user about non message receipts
+            print_msg(f"Redis adapter: channel " \
+                      f"'{message['channel'].decode()}' received " \
+                      f"message type: {message['type']}.", ['WARNING'])
+
     def has_data(self):
         return self.new_data
@@ -0,0 +1,93 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the
+# Administrator of the National Aeronautics and Space Administration.
+# No copyright is claimed in the United States under Title 17, U.S. Code.
+# All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+redis_async_adapter AdapterDataSource class
+
+Receives messages from REDIS servers on the asyncio event loop of the run,
+serves as a data source for Simulator.run_sim_async. Every subscription of
+every source listens on a task of that one loop rather than on a thread of its
+own, and get_next_async wakes as soon as a message arrives instead of polling.
+"""
+
+import asyncio
+import redis.asyncio
+
+from onair.data_handling import redis_adapter
+from onair.src.util.print_io import *
+
+class DataSource(redis_adapter.DataSource):
+    # Set when a message fills the frame being received; made by listen_async,
+    # as an Event must be made on the loop that waits on it
+    data_event = None
+
+    def connect(self):
+        """Creates a client for each server with subscriptions; they connect
+           and subscribe on the event loop with the first get_next_async"""
+        self.clients = []
+        self.listeners = []
+        self.listening = False
+        for idx, server_config in enumerate(self.server_configs):
+            address, port, db, password = self.server_settings(server_config)
+
+            if len(server_config['subscriptions']) != 0:
+                self.clients.append((idx, redis.asyncio.Redis(address, port, db, password),
+                                     server_config['subscriptions']))
+            else:
+                print_msg("No subscriptions given! Redis server not created")
+
+    async def listen_async(self):
+        """Connects and subscribes to each server, listening to it on a task
+           of the running event loop"""
+        print_msg('Redis adapter connecting to server...')
+        self.listening = True
+        self.data_event = asyncio.Event()
+        for idx, client, subscriptions in self.clients:
+            try:
+                #Ping server to make sure we can connect
+                await client.ping()
+                print_msg(f'... connected to server # {idx}!')
+
+                pubsub = client.pubsub()
+                for s in subscriptions:
+                    await pubsub.subscribe(s)
+                    print_msg(f"Subscribing to channel: {s} on server # {idx}")
+                self.servers.append(client)
+                self.listeners.append(asyncio.create_task(self.message_listener_async(pubsub)))
+
+            #This except will be hit if client.ping() threw an exception (could not properly ping server)
+            except Exception:
+                print_msg(f'Did not connect to server # {idx}. Not setting up subscriptions.', 'RED')
+
+    async def message_listener_async(self, pubsub):
+        """Loop for listening for messages on channels"""
+        async for message in pubsub.listen():
+            self.receive_message(message)
+        # When listener loop exits warn user
+        print_msg("Redis subscription listener exited.", ['WARNING'])
+
+    def receive_message(self, message):
+        super().receive_message(message)
+        if self.has_data() and self.data_event != None:
+            self.data_event.set()
+
+    def get_next(self):
+        raise RuntimeError('The redis async adapter only gives frames to get_next_async; '
+                           'run with the OPTIONS key AsyncRun = true')
+
+    async def get_next_async(self):
+        """Waits on the event loop for the next message, then provides the
+           latest data from REDIS channels"""
+        if not self.listening:
+            await self.listen_async()
+        while not self.has_data():
+            self.data_event.clear()
+            await self.data_event.wait()
+        return self.read_new_data()
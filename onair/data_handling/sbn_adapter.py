@@ -13,6 +13,7 @@ SBN_Adapter class
 Receives messages from SBN, serves as a data source for sim.py
 """
 
+import asyncio
 import threading
 import time
 import datetime
@@ -21,6 +22,7 @@ import json
 
 from onair.data_handling.on_air_data_source import OnAirDataSource
 from onair.data_handling.on_air_data_source import ConfigKeyError
+from onair.data_handling.ingest_latency import IngestLatency
 from ctypes import *
 import sbn_python_client as sbn
 import message_headers as msg_hdr
@@ -30,11 +32,16 @@ from onair.data_handling.parser_util import *
 # Note: The double buffer does not clear between switching. If fresh data doesn't come in, stale data is returned (delayed by 1 frame)
 
 class DataSource(OnAirDataSource):
+    # Seconds get_next waits for a message before raising TimeoutError; None waits for good
+    frame_timeout = None
+    # When the message of the frame being received arrived, as an IngestLatency.now()
+    received_time = None
 
     def __init__(self, data_file, meta_file, ss_breakdown = False):
         super().__init__(data_file, meta_file, ss_breakdown);
 
-        self.new_data_lock = threading.Lock()
+        # A condition, so the listener thread can wake get_next when data arrives
+        self.new_data_lock = threading.Condition()
         self.new_data = False
         self.double_buffer_read_index = 0
         self.connect()
@@ -118,25 +125,25 @@ class DataSource(OnAirDataSource):
     def get_next(self):
         """Provides the latest data from SBN in a dictionary of lists structure.
         Returned data is safe to use until the next get_next call.
-        Blocks until new data is available."""
-
-        data_available = False
-
-        while not data_available:
-            with self.new_data_lock:
-                data_available = self.has_data()
-
-            if not data_available:
-                time.sleep(0.01)
+        Blocks until new data is available, for up to frame_timeout seconds."""
+        with self.new_data_lock:
+            if not self.new_data_lock.wait_for(self.has_data, self.frame_timeout):
+                raise TimeoutError(f'SBN adapter received no data in {self.frame_timeout} seconds')
 
         read_index = 0
         with self.new_data_lock:
             self.new_data = False
             self.double_buffer_read_index = (self.double_buffer_read_index + 1) % 2
             read_index = self.double_buffer_read_index
+            self.frame_received_time = self.received_time
 
         return self.currentData[read_index]['data']
 
+    async def get_next_async(self):
+        """get_next on a worker thread, so waiting on the listener thread
+           does not block the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_next)
+
     def has_more(self):
         """Returns true if the adapter has more data.
            For now always true: connection should be live as long as cFS is running.
@@ -149,6 +156,7 @@ class DataSource(OnAirDataSource):
         while(True):
             generic_recv_msg_p = POINTER(sbn.sbn_data_generic_t)()
             sbn.recv_msg(generic_recv_msg_p)
+            received_time = IngestLatency.now()
 
             msgID = generic_recv_msg_p.contents.TlmHeader.Primary.StreamId
             app_name, data_struct = self.msgID_lookup_table[msgID]
@@ -161,9 +169,9 @@ class DataSource(OnAirDataSource):
             print(", ".join([field_name + ": " + str(getattr(recv_msg, field_name)) for field_name, field_type in recv_msg._fields_[1:]]))
 
             # TODO: Lock needed here?
-            self.get_current_data(recv_msg, data_struct, app_name)
+            self.get_current_data(recv_msg, data_struct, app_name, received_time)
 
-    def get_current_data(self, recv_msg, data_struct, app_name):
+    def get_current_data(self, recv_msg, data_struct, app_name, received_time=None):
         # TODO: Lock needed here?
         current_buffer = self.currentData[(self.double_buffer_read_index + 1) %2]
 
@@ -183,6 +191,8 @@ class DataSource(OnAirDataSource):
 
         with self.new_data_lock:
             self.new_data = True
+            self.received_time = IngestLatency.now() if received_time == None else received_time
+            self.new_data_lock.notify_all()
 
     def has_data(self):
         return self.new_data
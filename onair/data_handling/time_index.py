@@ -0,0 +1,84 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+time_index.py
+Sparse time -> byte offset index of a CSV telemetry file, persisted next to the file
+"""
+
+import os
+import json
+from bisect import bisect_left
+
+from onair.data_handling.parser_util import convert_cell
+
+def index_path(data_file):
+    return data_file + '.index.json'
+
+def index_key(data_file, time_column, interval):
+    stat = os.stat(data_file)
+    return {'path' : os.path.abspath(data_file),
+            'size' : stat.st_size,
+            'mtime_ns' : stat.st_mtime_ns,
+            'time_column' : time_column,
+            'interval' : interval}
+
+def load_time_index(data_file, time_column, interval):
+    """Returns the persisted index, building (and persisting) it when missing or stale"""
+    key = index_key(data_file, time_column, interval)
+    try:
+        with open(index_path(data_file), 'r') as f:
+            index = json.load(f)
+        if index['key'] == key:
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = build_time_index(data_file, time_column, interval)
+    index['key'] = key
+    try:
+        with open(index_path(data_file), 'w') as f:
+            json.dump(index, f)
+    except OSError:
+        pass
+    return index
+
+def build_time_index(data_file, time_column, interval):
+    """Records the time, byte offset and row number of every interval-th data row.
+       Rows are assumed to be one per line and in nondecreasing time order."""
+    times = []
+    offsets = []
+    rows = []
+    with open(data_file, 'rb') as f:
+        # Skip first row (headers)
+        offset = len(f.readline())
+        row = 0
+        for line in f:
+            if row % interval == 0:
+                cells = line.rstrip(b'\r\n').split(b',')
+                cell = cells[time_column].decode() if time_column < len(cells) else ''
+                times.append(convert_cell(cell)[0])
+                offsets.append(offset)
+                rows.append(row)
+            offset += len(line)
+            row += 1
+    return {'times' : times, 'offsets' : offsets, 'rows' : rows}
+
+def find_index_entry(index, time):
+    """Position of the last index entry strictly before time (or the first entry)"""
+    return max(bisect_left(index['times'], time) - 1, 0)
+
+def to_time(value):
+    """Converts a time given as a number or in a telemetry time format to a float"""
+    if isinstance(value, str):
+        time, valid = convert_cell(value)
+        if not valid:
+            raise ValueError(f"Time '{value}' is not in a recognized time format")
+        return time
+    return float(value)
@@ -14,6 +14,11 @@ from abc import ABC, abstractmethod
    and/or imported plugins/libraries
 """
 class AIPlugin(ABC):
+    # The interfaces reuse render_reasoning's result until the next update;
+    # plugins whose reasoning can differ between renders of one frame, or
+    # that have side effects when rendering, set this to False
+    cache_reasoning = True
+
     def __init__(self, _name, _headers):
         """
         Superclass for data driven components: VAE, PPO, etc. Allows for easier modularity.
@@ -36,3 +41,17 @@ class AIPlugin(ABC):
         """
         raise NotImplementedError
 
+    def reset(self):
+        """
+        The telemetry moves on to an unrelated stream, such as the next file;
+        systems keeping state from earlier frames should clear it
+        """
+        pass
+
+    def finish(self):
+        """
+        The run is over; systems holding output back, such as buffered
+        writes, should write it out
+        """
+        pass
+
@@ -12,24 +12,74 @@ Planners interface class for managing all planning-based AI components
 """
 from ..util.plugin_import import import_plugins
 from ..util.data_conversion import *
+from .reasoning_cache import ReasoningCache
+from .plugin_executor import PluginExecutor, map_plugins, gather_plugins, settle
 
 class PlannersInterface:
-    def __init__(self, headers, _planner_plugins={}):
+    reasoning_cache = None
+    # Runs the plugins concurrently when the layer is parallel
+    executor = None
+
+    def __init__(self, headers, _planner_plugins={}, parallel=False, process_plugins=()):
         assert(len(headers)>0), 'Headers are required'
         self.headers = headers
-        self.planner_constructs = import_plugins(self.headers,_planner_plugins)
+        self.planner_constructs = import_plugins(self.headers,_planner_plugins,
+                                                 process_plugins=process_plugins)
+        self.reasoning_cache = ReasoningCache()
+        if parallel and len(self.planner_constructs) > 1:
+            self.executor = PluginExecutor(len(self.planner_constructs))
 
     def update(self, high_level_data):
         # Raw TLM should be transformed into high-leve state representation here
         # Can store something as stale unless a planning thread is launched
-        for plugin in self.planner_constructs:
-            plugin.update(high_level_data=high_level_data)
+        if self.reasoning_cache != None:
+            self.reasoning_cache.new_frame()
+        map_plugins(self.executor, lambda plugin: plugin.update(high_level_data=high_level_data),
+                    self.planner_constructs)
+
+    async def update_async(self, high_level_data):
+        """update, awaiting the plugins whose update is a coroutine"""
+        if self.reasoning_cache != None:
+            self.reasoning_cache.new_frame()
+        await gather_plugins(self.executor, lambda plugin: plugin.update(high_level_data=high_level_data),
+                             self.planner_constructs)
 
     def check_for_salient_event(self):
         pass
 
+    def reset(self):
+        """Resets every plugin, as the telemetry moves on to an unrelated stream"""
+        for plugin in self.planner_constructs:
+            plugin.reset()
+
+    def finish(self):
+        """Finishes every plugin, as the run is over"""
+        for plugin in self.planner_constructs:
+            plugin.finish()
+
     def render_reasoning(self):
+        # Plugin order, not finishing order, decides the order of the diagnoses
+        reasonings = map_plugins(self.executor, self.render_plugin_reasoning, self.planner_constructs)
         diagnoses = {}
-        for plugin in self.planner_constructs:
-            diagnoses[plugin.component_name] = plugin.render_reasoning()
+        for plugin, reasoning in zip(self.planner_constructs, reasonings):
+            diagnoses[plugin.component_name] = reasoning
+        return diagnoses
+
+    def render_plugin_reasoning(self, plugin):
+        """What plugin reasons from its latest update, rendered once per frame"""
+        if self.reasoning_cache != None:
+            return self.reasoning_cache.render(plugin)
+        return plugin.render_reasoning()
+
+    async def render_reasoning_async(self):
+        """render_reasoning, awaiting the plugins whose render_reasoning is a coroutine"""
+        reasonings = await gather_plugins(None, self.render_plugin_reasoning_async, self.planner_constructs)
+        diagnoses = {}
+        for plugin, reasoning in zip(self.planner_constructs, reasonings):
+            diagnoses[plugin.component_name] = reasoning
         return diagnoses
+
+    async def render_plugin_reasoning_async(self, plugin):
+        if self.reasoning_cache != None:
+            return await self.reasoning_cache.render_async(plugin)
+        return await settle(plugin.render_reasoning())
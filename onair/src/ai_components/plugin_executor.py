@@ -0,0 +1,50 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+PluginExecutor Class
+Runs the plugins of one layer concurrently on a pool of threads, which suits
+plugins that wait on I/O or spend their time in NumPy with the GIL released
+"""
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor, wait
+
+class PluginExecutor:
+    def __init__(self, max_workers):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='onair-plugin')
+
+    def map(self, call, plugins):
+        """[call(plugin) for plugin in plugins], with the calls run concurrently"""
+        futures = [self.pool.submit(call, plugin) for plugin in plugins]
+        # Every call is joined before any error is raised, so no plugin is
+        # still running when the next layer starts
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True)
+
+def map_plugins(executor, call, plugins):
+    """[call(plugin) for plugin in plugins], run on executor when there is one"""
+    if executor == None:
+        return [call(plugin) for plugin in plugins]
+    return executor.map(call, plugins)
+
+async def settle(result):
+    """What an async plugin hook gives once awaited; results of other hooks
+       are given as they are"""
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+async def gather_plugins(executor, call, plugins):
+    """map_plugins for plugins whose hooks may be coroutines, which are
+       awaited together"""
+    return list(await asyncio.gather(*[settle(result) for result in map_plugins(executor, call, plugins)]))
@@ -0,0 +1,210 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+ProcessPlugin Class
+Hosts a plugin in a worker process of its own, so a CPU-bound plugin written
+in pure Python does not hold the GIL the main loop needs. Frames of floats are
+published to the worker through a shared memory ring; everything else is sent
+over a pipe, which also carries the reasoning back.
+"""
+import atexit
+import multiprocessing
+import time
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .ai_plugin_abstract.ai_plugin import AIPlugin
+
+class FrameRing:
+    """Ring of float64 frames in shared memory, after a header counting the
+       frames written and read, so the writer never overwrites a frame the
+       reader has yet to read"""
+    HEADER_BYTES = 16
+
+    def __init__(self, memory, num_slots, frame_size):
+        self.num_slots = num_slots
+        self.frame_size = frame_size
+        # [frames written, frames read]; each count has a single writer
+        self.counts = np.ndarray((2, ), dtype=np.int64, buffer=memory.buf)
+        self.frames = np.ndarray((num_slots, frame_size), dtype=np.float64,
+                                 buffer=memory.buf, offset=self.HEADER_BYTES)
+
+    @classmethod
+    def size_of(cls, num_slots, frame_size):
+        return cls.HEADER_BYTES + num_slots * frame_size * np.dtype(np.float64).itemsize
+
+    def is_full(self):
+        return self.counts[0] - self.counts[1] >= self.num_slots
+
+    def write(self, frame):
+        self.frames[self.counts[0] % self.num_slots] = frame
+        self.counts[0] += 1
+
+    def read(self):
+        frame = self.frames[self.counts[1] % self.num_slots].tolist()
+        self.counts[1] += 1
+        return frame
+
+def is_float_frame(frame, frame_size):
+    """Only frames of floats go through the ring, so plugins get back exactly
+       the values they would have been given in process"""
+    return len(frame) == frame_size and all(type(value) is float for value in frame)
+
+def serve_plugin(construct_name, module_path, headers, connection, memory_name, num_slots):
+    """Worker process loop: builds the plugin, then runs the updates and
+       renders sent over connection until told to stop"""
+    # Imported here as plugin_import builds ProcessPlugins itself
+    from ..util.plugin_import import import_plugins
+
+    # Attaching only closes the memory at exit; the main process unlinks it
+    memory = shared_memory.SharedMemory(name=memory_name)
+    ring = FrameRing(memory, num_slots, len(headers))
+    try:
+        try:
+            plugin = import_plugins(headers, {construct_name : module_path})[0]
+        except Exception:
+            connection.send(('error', traceback.format_exc()))
+            return
+        connection.send(('ready', getattr(plugin, 'cache_reasoning', True)))
+
+        # An update's or reset's error is raised by the next render, as they are not answered
+        error = None
+        while True:
+            message = connection.recv()
+            if message[0] == 'update':
+                _, low_level_data, high_level_data = message
+                if low_level_data is None:
+                    low_level_data = ring.read()
+                if error == None:
+                    try:
+                        plugin.update(low_level_data, high_level_data)
+                    except Exception:
+                        error = traceback.format_exc()
+            elif message[0] == 'reset':
+                if error == None:
+                    try:
+                        plugin.reset()
+                    except Exception:
+                        error = traceback.format_exc()
+            elif message[0] == 'finish':
+                # Answered, so the run only ends once the plugin is finished
+                if error == None:
+                    try:
+                        plugin.finish()
+                        connection.send(('result', None))
+                    except Exception:
+                        connection.send(('error', traceback.format_exc()))
+                else:
+                    connection.send(('error', error))
+                    error = None
+            elif message[0] == 'render':
+                if error == None:
+                    try:
+                        connection.send(('result', plugin.render_reasoning()))
+                    except Exception:
+                        connection.send(('error', traceback.format_exc()))
+                else:
+                    connection.send(('error', error))
+                    error = None
+            else:
+                break
+    finally:
+        del ring
+        memory.close()
+        connection.close()
+
+class ProcessPlugin(AIPlugin):
+    """Stands in for the plugin at module_path, which runs in a worker process.
+       An update returns as soon as it is sent, so the plugin updates while
+       the main loop carries on; render_reasoning waits for the reasoning."""
+    # spawn starts the worker without a copy of the main process's threads
+    start_method = 'spawn'
+    # Frames sent that the worker may not have read yet
+    ring_slots = 4
+    # Seconds between checks for a free slot when the ring is full
+    ring_poll_seconds = 0.0005
+
+    def __init__(self, _name, _headers, module_path):
+        super().__init__(_name, _headers)
+        self.module_path = module_path
+        self.memory = shared_memory.SharedMemory(create=True, size=FrameRing.size_of(self.ring_slots, len(_headers)))
+        self.ring = FrameRing(self.memory, self.ring_slots, len(_headers))
+        self.ring.counts[:] = 0
+
+        context = multiprocessing.get_context(self.start_method)
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(target=serve_plugin,
+                                       args=(_name, module_path, list(_headers), worker_connection,
+                                             self.memory.name, self.ring_slots),
+                                       name=f'onair-plugin-{_name}', daemon=True)
+        self.process.start()
+        worker_connection.close()
+        atexit.register(self.close)
+
+        try:
+            self.cache_reasoning = self.receive()
+        except RuntimeError:
+            self.close()
+            raise
+
+    def update(self, low_level_data=[], high_level_data={}):
+        frame = low_level_data
+        if is_float_frame(low_level_data, self.ring.frame_size):
+            while self.ring.is_full():
+                if not self.process.is_alive():
+                    raise RuntimeError(f"Plugin '{self.component_name}' worker process has exited")
+                time.sleep(self.ring_poll_seconds)
+            self.ring.write(low_level_data)
+            frame = None
+        self.connection.send(('update', frame, high_level_data))
+
+    def render_reasoning(self):
+        self.connection.send(('render', ))
+        return self.receive()
+
+    def reset(self):
+        # Like an update, not answered; the worker resets after the updates sent before
+        self.connection.send(('reset', ))
+
+    def finish(self):
+        # Waits for the worker, so output the plugin holds back is written
+        # before the run returns
+        self.connection.send(('finish', ))
+        self.receive()
+
+    def receive(self):
+        try:
+            kind, value = self.connection.recv()
+        except EOFError as e:
+            raise RuntimeError(f"Plugin '{self.component_name}' worker process has exited") from e
+        if kind == 'error':
+            raise RuntimeError(f"Plugin '{self.component_name}' failed in its worker process:\n{value}")
+        return value
+
+    def close(self):
+        """Stops the worker and frees the shared memory; safe to call again"""
+        if self.memory == None:
+            return
+        try:
+            self.connection.send(('stop', ))
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+        self.ring = None
+        self.memory.close()
+        self.memory.unlink()
+        self.memory = None
+        atexit.unregister(self.close)
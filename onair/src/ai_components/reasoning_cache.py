@@ -0,0 +1,49 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+ReasoningCache Class
+Keeps what each plugin's render_reasoning gives for the current frame, so a
+frame's reasoning is only rendered once however many times it is asked for
+"""
+from .plugin_executor import settle
+
+class ReasoningCache:
+    def __init__(self):
+        self.epoch = 0
+        # id of each plugin : (epoch its reasoning was rendered in, reasoning)
+        self.results = {}
+
+    def new_frame(self):
+        """Invalidates every cached result; called when the plugins are updated"""
+        self.epoch += 1
+
+    def render(self, plugin):
+        """plugin.render_reasoning(), rendered at most once per frame unless the
+           plugin opts out by setting cache_reasoning to False"""
+        if getattr(plugin, 'cache_reasoning', True) == False:
+            return plugin.render_reasoning()
+        cached = self.results.get(id(plugin))
+        if cached != None and cached[0] == self.epoch:
+            return cached[1]
+        reasoning = plugin.render_reasoning()
+        self.results[id(plugin)] = (self.epoch, reasoning)
+        return reasoning
+
+    async def render_async(self, plugin):
+        """render for plugins whose render_reasoning may be a coroutine, which
+           is awaited before its reasoning is cached"""
+        if getattr(plugin, 'cache_reasoning', True) == False:
+            return await settle(plugin.render_reasoning())
+        cached = self.results.get(id(plugin))
+        if cached != None and cached[0] == self.epoch:
+            return cached[1]
+        reasoning = await settle(plugin.render_reasoning())
+        self.results[id(plugin)] = (self.epoch, reasoning)
+        return reasoning
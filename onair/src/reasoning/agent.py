@@ -17,16 +17,23 @@ from ..reasoning.complex_reasoning_interface import ComplexReasoningInterface
 from ..reasoning.diagnosis import Diagnosis
 
 class Agent:
-    def __init__(self, vehicle, learners_plugin_dict, planners_plugin_dict, complex_plugin_dict):
+    def __init__(self, vehicle, learners_plugin_dict, planners_plugin_dict, complex_plugin_dict, parallel_layers=(), process_plugins=()):
 
         self.vehicle_rep = vehicle
         self.mission_status = self.vehicle_rep.get_status()
         self.bayesian_status = self.vehicle_rep.get_bayesian_status()
 
-        # AI Interfaces
-        self.learning_systems = LearnersInterface(self.vehicle_rep.get_headers(),learners_plugin_dict)
-        self.planning_systems = PlannersInterface(self.vehicle_rep.get_headers(),planners_plugin_dict)
-        self.complex_reasoning_systems = ComplexReasoningInterface(self.vehicle_rep.get_headers(),complex_plugin_dict)
+        # AI Interfaces, running the plugins of each layer in parallel_layers concurrently
+        # and those named in process_plugins in worker processes
+        self.learning_systems = LearnersInterface(self.vehicle_rep.get_headers(),learners_plugin_dict,
+                                                  parallel='learners' in parallel_layers,
+                                                  process_plugins=process_plugins)
+        self.planning_systems = PlannersInterface(self.vehicle_rep.get_headers(),planners_plugin_dict,
+                                                  parallel='planners' in parallel_layers,
+                                                  process_plugins=process_plugins)
+        self.complex_reasoning_systems = ComplexReasoningInterface(self.vehicle_rep.get_headers(),complex_plugin_dict,
+                                                                   parallel='complex' in parallel_layers,
+                                                                   process_plugins=process_plugins)
 
     def reason(self, frame):
         aggregate_high_level_info = {}
@@ -39,6 +46,33 @@ class Agent:
 
         return self.complex_reasoning_systems.update_and_render_reasoning(aggregate_high_level_info)
 
+    async def reason_async(self, frame):
+        """reason, awaiting the plugins whose update or render_reasoning is a coroutine"""
+        aggregate_high_level_info = {}
+        self.vehicle_rep.update(frame)
+        aggregate_high_level_info['vehicle_rep'] = self.vehicle_rep.get_state_information()
+        await self.learning_systems.update_async(self.vehicle_rep.curr_data, aggregate_high_level_info)
+        aggregate_high_level_info['learning_systems'] = await self.learning_systems.render_reasoning_async()
+        await self.planning_systems.update_async(aggregate_high_level_info)
+        aggregate_high_level_info['planning_systems'] = await self.planning_systems.render_reasoning_async()
+
+        return await self.complex_reasoning_systems.update_and_render_reasoning_async(aggregate_high_level_info)
+
+    def reset(self):
+        """Clears what was kept from earlier frames, as when the telemetry
+           moves on to the next file"""
+        self.vehicle_rep.reset()
+        self.learning_systems.reset()
+        self.planning_systems.reset()
+        self.complex_reasoning_systems.reset()
+
+    def finish(self):
+        """Lets every plugin write out what it holds back, as the run is over"""
+        self.vehicle_rep.finish()
+        self.learning_systems.finish()
+        self.planning_systems.finish()
+        self.complex_reasoning_systems.finish()
+
     def diagnose(self, time_step):
         """ Grab the mnemonics from the """
         learning_system_results = self.learning_systems.render_reasoning()
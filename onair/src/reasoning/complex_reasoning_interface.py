@@ -10,24 +10,90 @@
 """
 Reasoning interface class for managing all complex custom reasoning components
 """
+import asyncio
 
 from ..util.data_conversion import *
 from ..util.plugin_import import import_plugins
+from ..ai_components.reasoning_cache import ReasoningCache
+from ..ai_components.plugin_executor import PluginExecutor, settle
 
 class ComplexReasoningInterface:
-    def __init__(self, headers, _reasoning_plugins={}):
+    reasoning_cache = None
+    # Runs the plugins concurrently when the layer is parallel
+    executor = None
+
+    def __init__(self, headers, _reasoning_plugins={}, parallel=False, process_plugins=()):
         assert(len(headers)>0), 'Headers are required'
         self.headers = headers
-        self.reasoning_constructs = import_plugins(self.headers,_reasoning_plugins)
+        self.reasoning_constructs = import_plugins(self.headers,_reasoning_plugins,
+                                                   process_plugins=process_plugins)
+        self.reasoning_cache = ReasoningCache()
+        if parallel and len(self.reasoning_constructs) > 1:
+            self.executor = PluginExecutor(len(self.reasoning_constructs))
 
     def update_and_render_reasoning(self, high_level_data):
         intelligent_outcomes = high_level_data
         intelligent_outcomes['complex_systems'] = {}
-        for plugin in self.reasoning_constructs:
-            plugin.update(high_level_data=intelligent_outcomes)
-            intelligent_outcomes['complex_systems'].update({plugin.component_name:plugin.render_reasoning()})
+        if self.reasoning_cache != None:
+            self.reasoning_cache.new_frame()
+        if self.executor == None:
+            for plugin in self.reasoning_constructs:
+                plugin.update(high_level_data=intelligent_outcomes)
+                intelligent_outcomes['complex_systems'].update({plugin.component_name:self.render_plugin_reasoning(plugin)})
+        else:
+            # Concurrent plugins see none of each other's outputs; these are
+            # added once every plugin is done, in plugin order
+            def update_and_render(plugin):
+                plugin.update(high_level_data=intelligent_outcomes)
+                return self.render_plugin_reasoning(plugin)
+            reasonings = self.executor.map(update_and_render, self.reasoning_constructs)
+            for plugin, reasoning in zip(self.reasoning_constructs, reasonings):
+                intelligent_outcomes['complex_systems'].update({plugin.component_name:reasoning})
+        return intelligent_outcomes
+
+    async def update_and_render_reasoning_async(self, high_level_data):
+        """update_and_render_reasoning, awaiting the plugins whose hooks are coroutines"""
+        intelligent_outcomes = high_level_data
+        intelligent_outcomes['complex_systems'] = {}
+        if self.reasoning_cache != None:
+            self.reasoning_cache.new_frame()
+
+        async def update_and_render(plugin):
+            await settle(plugin.update(high_level_data=intelligent_outcomes))
+            return await self.render_plugin_reasoning_async(plugin)
+
+        if self.executor == None:
+            for plugin in self.reasoning_constructs:
+                intelligent_outcomes['complex_systems'].update({plugin.component_name:await update_and_render(plugin)})
+        else:
+            # As with update_and_render_reasoning, concurrent plugins see none
+            # of each other's outputs
+            reasonings = await asyncio.gather(*[update_and_render(plugin) for plugin in self.reasoning_constructs])
+            for plugin, reasoning in zip(self.reasoning_constructs, reasonings):
+                intelligent_outcomes['complex_systems'].update({plugin.component_name:reasoning})
         return intelligent_outcomes
 
+    def render_plugin_reasoning(self, plugin):
+        """What plugin reasons from its latest update, rendered once per frame"""
+        if self.reasoning_cache != None:
+            return self.reasoning_cache.render(plugin)
+        return plugin.render_reasoning()
+
+    async def render_plugin_reasoning_async(self, plugin):
+        if self.reasoning_cache != None:
+            return await self.reasoning_cache.render_async(plugin)
+        return await settle(plugin.render_reasoning())
+
     def check_for_salient_event(self):
         pass
 
+    def reset(self):
+        """Resets every plugin, as the telemetry moves on to an unrelated stream"""
+        for plugin in self.reasoning_constructs:
+            plugin.reset()
+
+    def finish(self):
+        """Finishes every plugin, as the run is over"""
+        for plugin in self.reasoning_constructs:
+            plugin.finish()
+
@@ -0,0 +1,78 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+Batch Run
+Runs one config over many telemetry files, spread across a pool of processes
+"""
+
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ..run_scripts.execution_engine import ExecutionEngine
+
+def run_batch(config_file, telemetry_files, max_workers=None, run_params={}):
+    """Runs each telemetry file with its own engine, setting each run
+       parameter name to its value in run_params (as ExecutionEngine.set_run_param);
+       results keep the order of telemetry_files"""
+    # The save paths are made once, here, instead of by each run, as every run
+    # shares them; workers inherit the ONAIR_* environment variables naming them
+    ExecutionEngine().init_save_paths()
+    start = time.perf_counter()
+    if max_workers == 1:
+        results = [run_telemetry_file(config_file, telemetry_file, run_params)
+                   for telemetry_file in telemetry_files]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(run_telemetry_file,
+                                    [config_file] * len(telemetry_files),
+                                    telemetry_files,
+                                    [run_params] * len(telemetry_files)))
+    return summarize_batch(results, time.perf_counter() - start)
+
+def run_telemetry_file(config_file, telemetry_file, run_params={}):
+    """Runs a single telemetry file with a new Simulator and new plugin instances"""
+    # Diagnosis picks mnemonics at random; seeding per file keeps results
+    # independent of which worker, and in what order, ran the file
+    random.seed(telemetry_file)
+
+    engine = ExecutionEngine()
+    engine.config_filepath = config_file
+    engine.parse_configs(config_file)
+    for name, val in run_params.items():
+        engine.set_run_param(name, val)
+    engine.fullTelemetryFile = telemetry_file
+    engine.parse_data(engine.data_source_file,
+                      engine.fullTelemetryFile, engine.fullMetaFile,
+                      engine.subsystems_breakdown)
+    engine.setup_sim()
+    engine.sim.record_statuses = True
+
+    start = time.perf_counter()
+    diagnosis = engine.run_sim()
+    seconds = time.perf_counter() - start
+
+    return {'telemetry_file' : telemetry_file,
+            'diagnosis' : diagnosis,
+            'status_timeline' : engine.sim.status_timeline,
+            'frames' : len(engine.sim.status_timeline),
+            'seconds' : seconds}
+
+def summarize_batch(results, seconds):
+    total_frames = sum(result['frames'] for result in results)
+    return {'files' : results,
+            'total_frames' : total_frames,
+            'seconds' : seconds,
+            'frames_per_second' : total_frames / seconds if seconds > 0 else 0.0}
+
+def save_batch_summary(summary, save_file):
+    with open(save_file, 'w') as f:
+        json.dump(summary, f, indent=2, default=str)
@@ -12,6 +12,7 @@ Execution Engine, which sets configs and sets up the simulation
 """
 
 import os
+import asyncio
 import configparser
 import importlib
 import ast
@@ -21,6 +22,12 @@ from time import gmtime, strftime
 
 from ..run_scripts.sim import Simulator
 
+# Optional PLUGINS key that runs the plugins of each layer concurrently
+PARALLEL_LAYER_KEYS = {'learners' : 'LearnersParallel',
+                       'planners' : 'PlannersParallel',
+                       'complex' : 'ComplexParallel'}
+# Values of the optional OPTIONS key SubsystemRollupMode
+SUBSYSTEM_ROLLUP_MODES = ['strict', 'distr', 'max']
 
 class ExecutionEngine:
     def __init__(self, config_file='', run_name='', save_flag=False):
@@ -31,6 +38,15 @@ class ExecutionEngine:
 
         # Init Options
         self.IO_Enabled = False
+        self.run_start_time = None
+        self.run_end_time = None
+        self.run_max_frames = None
+        self.subsystems_breakdown = False
+        self.prefetch_depth = 0
+        self.prefetch_drop_frames = False
+        self.async_run = False
+        self.evidence_confidence = False
+        self.subsystem_rollup_mode = 'strict'
 
         # Init Paths
         self.dataFilePath = ''
@@ -50,6 +66,8 @@ class ExecutionEngine:
         self.learners_plugin_dict = ['']
         self.planners_plugin_dict = ['']
         self.complex_plugin_dict = ['']
+        self.parallel_layers = []
+        self.process_plugins = []
 
         self.save_flag = save_flag
         self.save_name = run_name
@@ -58,7 +76,8 @@ class ExecutionEngine:
             self.init_save_paths()
             self.parse_configs(config_file)
             self.parse_data(self.data_source_file,
-                            self.fullTelemetryFile, self.fullMetaFile)
+                            self.fullTelemetryFile, self.fullMetaFile,
+                            self.subsystems_breakdown)
             self.setup_sim()
 
     def parse_configs(self, config_filepath):
@@ -92,11 +111,28 @@ class ExecutionEngine:
                 config['PLUGINS']['PlannersPluginDict'])
             self.complex_plugin_dict = self.parse_plugins_dict(
                 config['PLUGINS']['ComplexPluginDict'])
+            # Parse Optional Data: PLUGINS layers that run their plugins concurrently
+            self.parallel_layers = [layer for layer, key in PARALLEL_LAYER_KEYS.items()
+                                    if config.getboolean('PLUGINS', key, fallback=False)]
+            # Parse Optional Data: PLUGINS hosted in worker processes
+            self.process_plugins = self.parse_plugin_names(
+                config.get('PLUGINS', 'ProcessPlugins', fallback='[]'))
 
             # Parse Optional Data: OPTIONS
             # 'OPTIONS' must exist, but individual options return False if missing
             if config.has_section('OPTIONS'):
                 self.IO_Enabled = config['OPTIONS'].getboolean('IO_Enabled')
+                self.run_start_time = config['OPTIONS'].get('StartTime', fallback=None)
+                self.run_end_time = config['OPTIONS'].get('EndTime', fallback=None)
+                self.run_max_frames = config['OPTIONS'].getint('MaxFrames', fallback=None)
+                self.subsystems_breakdown = config['OPTIONS'].getboolean('SubsystemBreakdown', fallback=False)
+                self.prefetch_depth = config['OPTIONS'].getint('PrefetchDepth', fallback=0)
+                self.prefetch_drop_frames = config['OPTIONS'].getboolean('PrefetchDropFrames', fallback=False)
+                self.async_run = config['OPTIONS'].getboolean('AsyncRun', fallback=False)
+                self.evidence_confidence = config['OPTIONS'].getboolean('EvidenceConfidence', fallback=False)
+                self.subsystem_rollup_mode = config['OPTIONS'].get('SubsystemRollupMode', fallback='strict')
+                if self.subsystem_rollup_mode not in SUBSYSTEM_ROLLUP_MODES:
+                    raise ValueError(f"In config file '{config_filepath}' SubsystemRollupMode {self.subsystem_rollup_mode} is not one of {SUBSYSTEM_ROLLUP_MODES}.")
             else:
                 self.IO_Enabled = False
 
@@ -117,6 +153,19 @@ class ExecutionEngine:
                 raise FileNotFoundError(f"In config file '{self.config_filepath}' Plugin path '{plugin_file}' does not exist.")
         return temp_plugin_dict
 
+    def parse_plugin_names(self, config_plugin_names):
+        # Parse Optional Data: list of plugin names
+        ast_plugin_names = self.ast_parse_eval(config_plugin_names)
+        if isinstance(ast_plugin_names.body, ast.List):
+            plugin_names = ast.literal_eval(config_plugin_names)
+        else:
+            raise ValueError(f"Plugin names {config_plugin_names} from {self.config_filepath} are invalid. They must be a list.")
+
+        for plugin_name in plugin_names:
+            if not isinstance(plugin_name, str):
+                raise ValueError(f"In config file '{self.config_filepath}' plugin name {plugin_name} is not a string.")
+        return plugin_names
+
     def parse_data(self, parser_file_name, data_file_name, metadata_file_name, subsystems_breakdown=False):
         data_source_spec = importlib.util.spec_from_file_location(
             'data_source', parser_file_name)
@@ -130,12 +179,26 @@ class ExecutionEngine:
                              self.knowledge_rep_plugin_dict,
                              self.learners_plugin_dict,
                              self.planners_plugin_dict,
-                             self.complex_plugin_dict)
+                             self.complex_plugin_dict,
+                             parallel_layers=self.parallel_layers,
+                             process_plugins=self.process_plugins)
+        self.sim.prefetch_depth = self.prefetch_depth
+        self.sim.prefetch_drop_frames = self.prefetch_drop_frames
+        self.sim.agent.vehicle_rep.evidence_confidence = self.evidence_confidence
+        self.sim.agent.vehicle_rep.subsystem_rollup_mode = self.subsystem_rollup_mode
 
     def run_sim(self):
-        self.sim.run_sim(self.IO_Enabled)
+        if self.run_start_time != None or self.run_end_time != None:
+            if not hasattr(self.simDataSource, 'set_run_window'):
+                raise ValueError(f"DataSource '{self.data_source_file}' does not support StartTime/EndTime run windows.")
+            self.simDataSource.set_run_window(self.run_start_time, self.run_end_time)
+        if self.async_run:
+            diagnosis = asyncio.run(self.sim.run_sim_async(self.IO_Enabled, max_frames=self.run_max_frames))
+        else:
+            diagnosis = self.sim.run_sim(self.IO_Enabled, max_frames=self.run_max_frames)
         if self.save_flag:
             self.save_results(self.save_name)
+        return diagnosis
 
     def init_save_paths(self):
         save_path = os.environ['RESULTS_PATH']
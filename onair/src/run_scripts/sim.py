@@ -16,45 +16,142 @@ from ..systems.vehicle_rep import VehicleRepresentation
 from ..util.file_io import *
 from ..util.print_io import *
 from ..util.sim_io import *
+from ...data_handling.frame_prefetcher import FramePrefetcher
+from ...data_handling.ingest_latency import IngestLatency
 
 DIAGNOSIS_INTERVAL = 100
 
 class Simulator:
-    def __init__(self, dataSource, knowledge_rep_plugin_dict, learners_plugin_dict, planners_plugin_dict, complex_plugin_dict):
+    # Keep the vehicle status of every frame in status_timeline
+    record_statuses = False
+    # Frames read ahead of reasoning by a FramePrefetcher thread; 0 reads
+    # each frame only when it is reasoned on
+    prefetch_depth = 0
+    # Drop the oldest read-ahead frame, instead of waiting, when the queue is full
+    prefetch_drop_frames = False
+    prefetcher = None
+
+    def __init__(self, dataSource, knowledge_rep_plugin_dict, learners_plugin_dict, planners_plugin_dict, complex_plugin_dict, parallel_layers=(), process_plugins=()):
         self.simData = dataSource
         headers, tests = dataSource.get_vehicle_metadata()
-        vehicle = VehicleRepresentation(headers, tests, knowledge_rep_plugin_dict)
-        self.agent = Agent(vehicle, learners_plugin_dict, planners_plugin_dict, complex_plugin_dict)
+        subsystem_assignments = dataSource.binning_configs['subsystem_assignments']
+        vehicle = VehicleRepresentation(headers, tests, knowledge_rep_plugin_dict, subsystem_assignments)
+        self.agent = Agent(vehicle, learners_plugin_dict, planners_plugin_dict, complex_plugin_dict,
+                           parallel_layers=parallel_layers, process_plugins=process_plugins)
+        # Seconds from each timed frame's arrival until reasoning on it is done
+        self.ingest_latency = IngestLatency()
+
+    def run_sim(self, IO_Flag=False, max_frames=None):
+        if IO_Flag == True: print_sim_header()
+        diagnosis_list = []
+        time_step = 0
+        last_diagnosis = time_step
+        last_fault = time_step
+        self.status_timeline = []
+
+        frames = self.simData
+        if self.prefetch_depth > 0:
+            self.prefetcher = FramePrefetcher(self.simData, self.prefetch_depth, self.prefetch_drop_frames)
+            frames = self.prefetcher
+        try:
+            while frames.has_more() and (max_frames == None or time_step < max_frames):
+                next = frames.get_next()
+                if frames.file_boundary == True and time_step > 0:
+                    # Nothing of the file before carries over to a new file
+                    self.agent.reset()
+                self.agent.reason(next)
+                self.record_latency(frames)
+                last_diagnosis, last_fault = self.finish_frame(time_step, IO_Flag, diagnosis_list,
+                                                               last_diagnosis, last_fault)
+                time_step += 1
+            if IO_Flag == True: self.print_run_stats()
+            return self.final_diagnosis(diagnosis_list, time_step)
+        finally:
+            if self.prefetcher != None:
+                self.prefetcher.stop()
+            # After the final diagnosis, which renders the learners once more
+            self.agent.finish()
 
-    def run_sim(self, IO_Flag=False):
+    async def run_sim_async(self, IO_Flag=False, max_frames=None):
+        """run_sim on an event loop, awaiting each frame from the data source
+           and the plugins whose hooks are coroutines. Frames are not prefetched,
+           as a source awaited on the loop does not hold up the run."""
         if IO_Flag == True: print_sim_header()
         diagnosis_list = []
         time_step = 0
         last_diagnosis = time_step
         last_fault = time_step
+        self.status_timeline = []
+
+        try:
+            while await self.simData.has_more_async() and (max_frames == None or time_step < max_frames):
+                next = await self.simData.get_next_async()
+                if self.simData.file_boundary == True and time_step > 0:
+                    self.agent.reset()
+                await self.agent.reason_async(next)
+                self.record_latency(self.simData)
+                last_diagnosis, last_fault = self.finish_frame(time_step, IO_Flag, diagnosis_list,
+                                                               last_diagnosis, last_fault)
+                time_step += 1
+            if IO_Flag == True: self.print_run_stats()
+            return self.final_diagnosis(diagnosis_list, time_step)
+        finally:
+            self.agent.finish()
+
+    def record_latency(self, frames):
+        """Records the ingest to reason latency of the frame just reasoned on,
+           when frames timed its arrival"""
+        if frames.frame_received_time != None:
+            self.ingest_latency.record(frames.frame_received_time)
+
+    def get_latency_stats(self):
+        """Seconds from a frame's arrival at a live DataSource until Agent.reason
+           returns with it"""
+        return self.ingest_latency.get_stats()
+
+    def print_run_stats(self):
+        """Prints how long timed frames took from arrival until reasoning on
+           them was done, and how full the read-ahead queue ran"""
+        latency = self.get_latency_stats()
+        if latency['frames'] > 0:
+            print_msg(f"Ingest to reason latency of {latency['frames']} frames: "
+                      f"mean {latency['mean_seconds']:.6f} s, p50 {latency['p50_seconds']:.6f} s, "
+                      f"p99 {latency['p99_seconds']:.6f} s, max {latency['max_seconds']:.6f} s")
+        if self.prefetcher != None:
+            prefetch = self.prefetcher.get_stats()
+            print_msg(f"Prefetch queue of depth {prefetch['depth']}: {prefetch['frames_read']} frames read, "
+                      f"{prefetch['frames_dropped']} dropped, mean occupancy {prefetch['mean_occupancy']:.2f}, "
+                      f"max occupancy {prefetch['max_occupancy']}, {prefetch['full_waits']} full waits, "
+                      f"{prefetch['empty_waits']} empty waits")
 
-        while self.simData.has_more():
-            next = self.simData.get_next()
-            self.agent.reason(next)
-            self.IO_check(time_step, IO_Flag)
+    def finish_frame(self, time_step, IO_Flag, diagnosis_list, last_diagnosis, last_fault):
+        """Reports on the frame just reasoned on and diagnoses it when it is
+           faulting; returns the updated (last_diagnosis, last_fault)"""
+        self.IO_check(time_step, IO_Flag)
+        if self.record_statuses:
+            self.status_timeline.append(self.agent.vehicle_rep.get_status())
 
-            ### Stop when a fault is reached
-            if self.agent.mission_status == 'RED':
-                if last_fault == time_step - 1: #if they are consecutive
-                    if (time_step - last_diagnosis) % DIAGNOSIS_INTERVAL == 0:
-                        diagnosis_list.append(self.agent.diagnose(time_step))
-                        last_diagnosis = time_step
-                else:
+        ### Stop when a fault is reached
+        if self.agent.mission_status == 'RED':
+            if last_fault == time_step - 1: #if they are consecutive
+                if (time_step - last_diagnosis) % DIAGNOSIS_INTERVAL == 0:
                     diagnosis_list.append(self.agent.diagnose(time_step))
                     last_diagnosis = time_step
-                last_fault = time_step
-            time_step += 1
+            else:
+                diagnosis_list.append(self.agent.diagnose(time_step))
+                last_diagnosis = time_step
+            last_fault = time_step
+        return last_diagnosis, last_fault
 
+    def final_diagnosis(self, diagnosis_list, time_step):
         # Final diagnosis processing
+        if time_step == 0:
+            # No frame was reasoned on, as when the run window selects none,
+            # so there is nothing to diagnose
+            return None
         if len(diagnosis_list) == 0:
             diagnosis_list.append(self.agent.diagnose(time_step))
-        final_diagnosis = diagnosis_list[-1]
-        return final_diagnosis
+        return diagnosis_list[-1]
 
     def IO_check(self, time_step, IO_Flag):
         if IO_Flag == True:
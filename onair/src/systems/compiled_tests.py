@@ -0,0 +1,160 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+Compiled Tests
+Telemetry tests with everything that depends only on the config worked out
+once, so a call costs a bisect or a hash lookup. Statuses and mass assignments
+are the same as those of the TelemetryTestSuite test functions.
+"""
+
+from bisect import bisect_left, bisect_right
+
+def compile_test(test, all_tests, epsilon):
+    """Compiled form of a single test from test_assignments"""
+    test_name = test[0]
+    test_data = test[1:]
+    if test_name == 'FEASIBILITY' and CompiledFeasibility.can_compile(test_data):
+        return CompiledFeasibility(test_data, epsilon)
+    if test_name == 'STATE' and CompiledState.can_compile(test_data):
+        return CompiledState(test_data)
+    if test_name == 'NOOP':
+        return CompiledNoop()
+    return ScalarTest(all_tests[test_name], test_data, epsilon)
+
+class CompiledFeasibility:
+    @staticmethod
+    def can_compile(test_params):
+        if len(test_params) not in (2, 4):
+            return False
+        if not all(isinstance(bound, (int, float)) for bound in test_params):
+            return False
+        return all(test_params[i] <= test_params[i+1] for i in range(len(test_params) - 1))
+
+    def __init__(self, test_params, epsilon):
+        self.bounds = list(test_params)
+        deltas = [abs(test_params[i+1] - test_params[i]) for i in range(0, len(test_params) - 1)]
+        self.delta = epsilon * min(deltas)
+
+        self.statuses = ['RED', 'YELLOW', 'GREEN', 'YELLOW', 'RED']
+        if len(test_params) == 2:
+            self.statuses = ['RED', 'GREEN', 'RED']
+
+        self.lowest_bound = self.bounds[0]
+        self.highest_bound = self.bounds[-1]
+        self.l_range = self.lowest_bound - self.delta
+        self.u_range = self.highest_bound + self.delta
+        self.lb_buffers = [bound + self.delta for bound in self.bounds]
+        self.ub_buffers = [bound - self.delta for bound in self.bounds]
+
+    def interval(self, val):
+        """Index into statuses of the interval val falls in, None when val is NaN"""
+        if val <= self.lowest_bound:
+            return 0
+        if val >= self.highest_bound:
+            return len(self.bounds)
+        if val != val:
+            return None
+        # On an internal bound the interval to its right applies
+        return bisect_right(self.bounds, val)
+
+    def status(self, val):
+        interval = self.interval(float(val))
+        return '---' if interval == None else self.statuses[interval]
+
+    def mass_assignments(self, val):
+        val = float(val)
+        interval = self.interval(val)
+        if interval == None:
+            return []
+        stat = self.statuses[interval]
+
+        if interval == 0:
+            right_stat = self.statuses[1]
+            if val == self.lowest_bound:
+                return [({stat, right_stat}, 1.0)]
+            if val < self.l_range:
+                return [({stat}, 1.0)]
+            mass = abs(self.lowest_bound - val)/self.delta
+            return [({stat}, mass), ({stat, right_stat}, 1.0 - mass)]
+
+        if interval == len(self.bounds):
+            left_stat = self.statuses[interval - 1]
+            if val == self.highest_bound:
+                return [({left_stat, stat}, 1.0)]
+            if val > self.u_range:
+                return [({stat}, 1.0)]
+            mass = abs(self.highest_bound - val)/self.delta
+            return [({stat}, mass), ({left_stat, stat}, 1.0 - mass)]
+
+        l_index = interval - 1
+        if val == self.bounds[l_index]:
+            # Every internal bound equal to val adds its pair of statuses
+            return [({self.statuses[i], self.statuses[i+1]}, 1.0)
+                    for i in range(bisect_left(self.bounds, val), interval)]
+        left_stat = self.statuses[l_index]
+        right_stat = self.statuses[interval + 1]
+        if val < self.lb_buffers[l_index]:
+            mass = abs(self.bounds[l_index] - val)/self.delta
+            return [({stat}, mass), ({left_stat, stat}, 1.0 - mass)]
+        if val > self.ub_buffers[interval]:
+            mass = abs(self.bounds[interval] - val)/self.delta
+            return [({stat}, mass), ({stat, right_stat}, 1.0 - mass)]
+        return [({stat}, 1.0)]
+
+class CompiledState:
+    @staticmethod
+    def can_compile(test_params):
+        if len(test_params) != 3:
+            return False
+        try:
+            for values in test_params:
+                # 'in' on a string only accepts strings
+                if isinstance(values, str):
+                    return False
+                set(values)
+        except TypeError:
+            return False
+        return True
+
+    def __init__(self, test_params):
+        # Later assignments win, as GREEN is checked before YELLOW before RED
+        self.lookup = {}
+        for stat, values in zip(['RED', 'YELLOW', 'GREEN'], reversed(test_params)):
+            for value in values:
+                self.lookup[value] = stat
+
+    def status(self, val):
+        return self.lookup.get(int(float(val)), '---')
+
+    def mass_assignments(self, val):
+        stat = self.status(val)
+        if stat == '---':
+            return [({'RED', 'YELLOW', 'GREEN'}, 1.0)]
+        return [({stat}, 1.0)]
+
+class CompiledNoop:
+    def status(self, val):
+        return 'GREEN'
+
+    def mass_assignments(self, val):
+        return [({'GREEN'}, 1.0)]
+
+class ScalarTest:
+    """A test that cannot be compiled, run through its TelemetryTestSuite function"""
+    def __init__(self, test_function, test_params, epsilon):
+        self.test_function = test_function
+        self.test_params = test_params
+        self.epsilon = epsilon
+
+    def status(self, val):
+        return self.test_function(val, self.test_params, self.epsilon)[0]
+
+    def mass_assignments(self, val):
+        return self.test_function(val, self.test_params, self.epsilon)[1]
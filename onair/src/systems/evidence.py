@@ -0,0 +1,155 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+Evidence
+Dempster-Shafer combination of test mass assignments. A set of statuses is a
+bitmask over GREEN, YELLOW and RED, so a mass function is a vector of the 8
+masses of those sets. Dempster's rule multiplies commonality functions, which
+combines any number of mass functions with array operations.
+"""
+
+import numpy as np
+
+from .status import NO_STATUS, GREEN, YELLOW, RED
+
+# Bit of each status in a set of statuses
+STATUS_BITS = {'GREEN' : 1, 'YELLOW' : 2, 'RED' : 4}
+# Bit of each status code; NO_STATUS belongs to no set
+CODE_BITS = np.zeros(4, dtype=np.int64)
+CODE_BITS[[GREEN, YELLOW, RED]] = [1, 2, 4]
+NUM_SETS = 8
+EMPTY = 0
+# The set of every status
+THETA = 7
+
+# All mass on THETA; combining with it changes nothing
+VACUOUS = np.zeros(NUM_SETS)
+VACUOUS[THETA] = 1.0
+
+_sets = np.arange(NUM_SETS)
+# IS_SUBSET[a, b] when set a is a subset of set b
+IS_SUBSET = (_sets[:, np.newaxis] & _sets[np.newaxis, :]) == _sets[:, np.newaxis]
+_sizes = np.array([bin(s).count('1') for s in _sets])
+
+# masses @ COMMONALITY gives q(A), the sum of the masses of the supersets of A
+COMMONALITY = IS_SUBSET.T.astype(np.float64)
+# commonality @ MOBIUS gives back the masses
+MOBIUS = np.where(IS_SUBSET.T, (-1.0) ** (_sizes[:, np.newaxis] - _sizes[np.newaxis, :]), 0.0)
+# masses @ BELIEF gives Bel(A), the sum of the masses of the non-empty subsets of A
+BELIEF = (IS_SUBSET & (_sets[:, np.newaxis] != EMPTY)).astype(np.float64)
+# masses @ PLAUSIBILITY gives Pl(A), the sum of the masses of the sets meeting A
+PLAUSIBILITY = ((_sets[:, np.newaxis] & _sets[np.newaxis, :]) != EMPTY).astype(np.float64)
+
+def to_bitmask(statuses):
+    bitmask = 0
+    for stat in statuses:
+        bitmask |= STATUS_BITS[stat]
+    return bitmask
+
+def normalize_rows(masses):
+    """Scales each row of masses to sum to 1; rows without mass become VACUOUS"""
+    # A matrix product sums short rows much faster than sum(axis=-1)
+    totals = (masses.reshape(-1, NUM_SETS) @ np.ones(NUM_SETS)).reshape(masses.shape[:-1])
+    empty = totals <= 0
+    if np.any(empty):
+        masses[empty] = VACUOUS
+        totals[empty] = 1.0
+    masses /= totals[..., np.newaxis]
+    return masses
+
+def mass_vector(mass_assignments):
+    """Mass vector of a test's list of (set of statuses, mass) assignments"""
+    masses = np.zeros(NUM_SETS)
+    for statuses, mass in mass_assignments:
+        masses[to_bitmask(statuses)] += mass
+    return normalize_rows(masses[np.newaxis, :])[0]
+
+def status_masses(codes):
+    """Mass vectors of tests that give a single status, or no status at all"""
+    masses = np.zeros((len(codes), NUM_SETS))
+    masses[np.arange(len(codes)), CODE_BITS[codes]] = 1.0
+    masses[codes == NO_STATUS] = VACUOUS
+    return masses
+
+def to_commonality(masses):
+    # A 2-D product is much faster than a stacked matrix product
+    return (masses.reshape(-1, NUM_SETS) @ COMMONALITY).reshape(masses.shape)
+
+def discount(masses, reliability):
+    """Moves all but reliability of each mass function onto THETA"""
+    discounted = masses * reliability
+    discounted[..., THETA] += 1.0 - reliability
+    return discounted
+
+def from_commonality(commonality):
+    """(masses, conflict) from combined commonality functions, with the mass
+       Dempster's rule gives the empty set taken out as conflict"""
+    combined = np.maximum(commonality @ MOBIUS, 0.0)
+    conflict = np.minimum(combined[..., EMPTY], 1.0)
+    combined[..., EMPTY] = 0.0
+    # Evidence in total conflict says nothing, so it becomes VACUOUS
+    return normalize_rows(combined), conflict
+
+def combine(masses, axis=-2):
+    """Dempster's rule over axis of an array of mass vectors"""
+    factors = np.moveaxis(to_commonality(masses), axis, 0)
+    # Multiplying one slice at a time beats np.prod over a short axis
+    commonality = np.ones(factors.shape[1:])
+    for factor in factors:
+        commonality *= factor
+    return from_commonality(commonality)
+
+def combine_groups(masses, groups, num_groups):
+    """Dempster's rule over the mass vectors of each group; groups without
+       members are VACUOUS"""
+    commonality = np.ones((num_groups, NUM_SETS))
+    if len(groups) > 0:
+        order = np.argsort(groups, kind='stable')
+        sorted_groups = groups[order]
+        starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+        commonality[sorted_groups[starts]] = np.multiply.reduceat(to_commonality(masses)[order], starts, axis=0)
+    return from_commonality(commonality)
+
+def combine_lists(mass_vectors):
+    """Dempster's rule over each list of mass vectors"""
+    width = max((len(vectors) for vectors in mass_vectors), default=0)
+    masses = np.tile(VACUOUS, (len(mass_vectors), max(width, 1), 1))
+    for row, vectors in enumerate(mass_vectors):
+        if len(vectors) > 0:
+            masses[row, :len(vectors)] = vectors
+    return combine(masses, axis=1)
+
+class Evidence:
+    """Combined mass vector of each name, with the conflict between the
+       evidence combined into it"""
+    def __init__(self, names, masses, conflict):
+        self.names = list(names)
+        self.masses = masses
+        self.conflict = conflict
+
+    def get_belief(self, statuses=['RED']):
+        """Belief, for each name, that its status is one of statuses"""
+        return self.masses @ BELIEF[:, to_bitmask(statuses)]
+
+    def get_code_belief(self, codes):
+        """Belief, for each name, in the status with its code in codes;
+           0.0 for NO_STATUS"""
+        return np.sum(self.masses * BELIEF[:, CODE_BITS[codes]].T, axis=1)
+
+    def get_plausibility(self, statuses=['RED']):
+        """Plausibility, for each name, that its status is one of statuses"""
+        return self.masses @ PLAUSIBILITY[:, to_bitmask(statuses)]
+
+    def get_interval(self, name, stat='RED'):
+        """(belief, plausibility) that name has status stat"""
+        index = self.names.index(name)
+        bitmask = to_bitmask([stat])
+        masses = self.masses[index]
+        return float(masses @ BELIEF[:, bitmask]), float(masses @ PLAUSIBILITY[:, bitmask])
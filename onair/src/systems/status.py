@@ -11,6 +11,12 @@
 Status Class
 """
 
+import numpy as np
+
+STATUSES = ['---', 'GREEN', 'YELLOW', 'RED']
+NO_STATUS, GREEN, YELLOW, RED = range(len(STATUSES))
+STATUS_CODES = {stat : code for code, stat in enumerate(STATUSES)}
+
 class Status:
     def __init__(self, name='MISSION', stat='---', conf=-1.0):
         self.name =  name
@@ -31,3 +37,70 @@ class Status:
 
     def get_name(self):
         return self.name
+
+class StatusArray:
+    """Statuses of many mnemonics, held as a status-code array and a confidence
+       array. A Status is only made when a single mnemonic is asked for."""
+    def __init__(self, names):
+        self.names = list(names)
+        self.codes = np.full(len(self.names), NO_STATUS, dtype=np.int8)
+        self.confidences = np.full(len(self.names), -1.0)
+        # Number of mnemonics with each status code
+        self.counts = np.bincount(self.codes, minlength=len(STATUSES))
+        # Set of indices with each status code, built when first asked for
+        self.status_indices = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        return Status(self.names[index], STATUSES[self.codes[index]], float(self.confidences[index]))
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self.names)))
+
+    ##### GETTERS & SETTERS ##################################
+    def set_status(self, index, stat, conf):
+        """Sets one status, keeping counts and index sets up to date"""
+        code = STATUS_CODES[stat]
+        old_code = self.codes[index]
+        if code != old_code:
+            self.codes[index] = code
+            self.counts[old_code] -= 1
+            self.counts[code] += 1
+            if old_code in self.status_indices:
+                self.status_indices[old_code].discard(index)
+            if code in self.status_indices:
+                self.status_indices[code].add(index)
+        self.confidences[index] = conf
+
+    def set_codes(self, codes, confidences):
+        """Replaces every status at once"""
+        self.codes[:] = codes
+        self.confidences[:] = confidences
+        self.counts = np.bincount(self.codes, minlength=len(STATUSES))
+        self.status_indices = {}
+
+    def get_status_indices(self, stat):
+        """Sorted indices of the mnemonics with status stat"""
+        code = STATUS_CODES[stat]
+        if code not in self.status_indices:
+            self.status_indices[code] = set(np.flatnonzero(self.codes == code).tolist())
+        return sorted(self.status_indices[code])
+
+    def get_status_names(self, stat):
+        if stat not in STATUS_CODES:
+            return []
+        return [self.names[index] for index in self.get_status_indices(stat)]
+
+    def get_rollup(self):
+        """Status of all the mnemonics together, from the counts alone, as
+           TelemetryTestSuite.calc_single_status gives in 'strict' mode"""
+        if self.counts[RED] > 0:
+            return 'RED', float(self.counts[RED] / len(self.names))
+        tied = np.flatnonzero(self.counts == self.counts.max())
+        if len(tied) == 1:
+            return STATUSES[tied[0]], 1.0
+        # Counter.most_common breaks ties by first occurrence
+        first_seen = [np.argmax(self.codes == code) for code in tied]
+        return STATUSES[tied[np.argmin(first_seen)]], 1.0
@@ -0,0 +1,118 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+StatusRollup Class
+Rolls mnemonic status codes up into a status for each subsystem, counting
+codes with a single bincount instead of a Counter per subsystem, then
+keeping the counts up to date from the mnemonics that changed
+"""
+
+import numpy as np
+
+from .status import STATUSES, RED
+from .evidence import discount, combine_groups
+
+def select_statuses(counts, mode='strict', first_seen=None):
+    """TelemetryTestSuite.calc_single_status for each row of status code counts.
+       first_seen(rows) gives the position each code first occurs at in those
+       rows; it is only called for rows whose most common codes are tied."""
+    totals = counts.sum(axis=1)
+    most = counts.max(axis=1)
+    statuses = np.argmax(counts, axis=1)
+    confidences = np.ones(len(counts))
+
+    # In 'strict' mode any RED decides the status, so its ties never matter
+    has_red = counts[:, RED] > 0 if mode == 'strict' else np.zeros(len(counts), dtype=bool)
+    is_most = counts == most[:, np.newaxis]
+    tied = np.flatnonzero((np.sum(is_most, axis=1) > 1) & ~has_red)
+    if len(tied) > 0:
+        # Counter.most_common breaks ties by first occurrence
+        positions = np.where(is_most[tied], first_seen(tied), np.iinfo(np.int64).max)
+        statuses[tied] = np.argmin(positions, axis=1)
+
+    if mode == 'strict':
+        statuses[has_red] = RED
+        confidences[has_red] = counts[has_red, RED] / totals[has_red]
+    elif mode == 'distr':
+        confidences = most / totals
+    return statuses, confidences
+
+class StatusRollup:
+    def __init__(self, subsystem_assignments):
+        """subsystem_assignments holds the list of subsystems of each mnemonic"""
+        self.subsystems = []
+        subsystem_indices = {}
+        member_mnemonics = []
+        member_subsystems = []
+        for mnemonic_index, assigned in enumerate(subsystem_assignments):
+            for subsystem in assigned:
+                if subsystem not in subsystem_indices:
+                    subsystem_indices[subsystem] = len(self.subsystems)
+                    self.subsystems.append(subsystem)
+                member_mnemonics.append(mnemonic_index)
+                member_subsystems.append(subsystem_indices[subsystem])
+        # One (mnemonic, subsystem) pair per membership, in mnemonic order
+        self.member_mnemonics = np.array(member_mnemonics, dtype=np.int64)
+        self.member_subsystems = np.array(member_subsystems, dtype=np.int64)
+        # Memberships of mnemonic i are member_starts[i] up to member_starts[i + 1]
+        self.member_starts = np.searchsorted(self.member_mnemonics, np.arange(len(subsystem_assignments) + 1))
+        # Status code of each membership, and code counts of each subsystem, at
+        # the last rollup; then its mode and (status codes, confidences)
+        self.member_codes = None
+        self.counts = None
+        self.latest_mode = None
+        self.latest_rollup = None
+
+    def rollup(self, codes, mode='strict', changed_indices=None):
+        """(status codes, confidences) of each subsystem, from the status code
+           of each mnemonic. When changed_indices is given, only the codes of
+           those mnemonics may differ from the last rollup's."""
+        num_codes = len(STATUSES)
+        if changed_indices is None or self.counts is None:
+            self.member_codes = codes[self.member_mnemonics].astype(np.int64)
+            keys = self.member_subsystems * num_codes + self.member_codes
+            self.counts = np.bincount(keys, minlength=len(self.subsystems) * num_codes).reshape(-1, num_codes)
+        elif not self.recount(codes, changed_indices) and mode == self.latest_mode:
+            return self.latest_rollup
+
+        def first_seen(rows):
+            keys = self.member_subsystems * num_codes + self.member_codes
+            positions = np.full(len(self.subsystems) * num_codes, np.iinfo(np.int64).max)
+            np.minimum.at(positions, keys, np.arange(len(keys)))
+            return positions.reshape(-1, num_codes)[rows]
+
+        self.latest_mode = mode
+        self.latest_rollup = select_statuses(self.counts, mode, first_seen)
+        return self.latest_rollup
+
+    def recount(self, codes, changed_indices):
+        """Moves the counts of the memberships of changed_indices to their new
+           codes; False when none of their codes changed"""
+        indices = np.asarray(changed_indices, dtype=np.int64)
+        starts = self.member_starts[indices]
+        lengths = self.member_starts[indices + 1] - starts
+        # Every membership of each changed mnemonic
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        new_codes = codes[self.member_mnemonics[positions]]
+        moved = new_codes != self.member_codes[positions]
+        if not np.any(moved):
+            return False
+        positions = positions[moved]
+        subsystems = self.member_subsystems[positions]
+        np.subtract.at(self.counts, (subsystems, self.member_codes[positions]), 1)
+        np.add.at(self.counts, (subsystems, new_codes[moved]), 1)
+        self.member_codes[positions] = new_codes[moved]
+        return True
+
+    def combine_evidence(self, masses, reliability):
+        """(mass vectors, conflicts) of each subsystem, combining the mass
+           vectors of its mnemonics discounted to reliability"""
+        return combine_groups(discount(masses[self.member_mnemonics], reliability),
+                              self.member_subsystems, len(self.subsystems))
@@ -13,10 +13,30 @@ Handles telemetry mnemonic testing
 """
 
 # from collections import Counter
-from .status import Status
+import numpy as np
+from .status import Status, StatusArray, STATUS_CODES
+from .vectorized_suite import VectorizedSuite
+from .compiled_tests import compile_test
+from .evidence import Evidence, mass_vector, combine_lists
 from collections import Counter
 
 class TelemetryTestSuite:
+    # Set by __init__ when every test can be evaluated by VectorizedSuite
+    vectorized_suite = None
+    # Set by __init__ to the compiled tests of each header
+    compiled_tests = None
+    # Set by __init__ to the StatusArray every frame's results are written to
+    status_results = None
+    # Set by __init__ to the index of each header name
+    header_indices = None
+    # Fraction of changed headers above which execute_changed runs the whole
+    # vectorized suite instead
+    incremental_limit = 0.25
+    # Frame the latest results are for, and its evidence once get_evidence
+    # has combined it
+    latest_frame = None
+    latest_evidence = None
+
     def __init__(self, headers=[], tests=[]):
         self.dataFields = headers
         self.tests = tests
@@ -25,17 +45,84 @@ class TelemetryTestSuite:
         self.all_tests = {'STATE' : self.state,
                           'FEASIBILITY' : self.feasibility,
                           'NOOP' : self.noop}
+        self.compiled_tests = self.compile_tests(tests)
+        self.vectorized_suite = self.build_vectorized_suite(headers, tests)
+        if self.compiled_tests != None and len(headers) == len(tests):
+            self.status_results = StatusArray(headers)
+        self.header_indices = {}
+        for index, name in enumerate(headers):
+            # First occurrence, as with list.index
+            self.header_indices.setdefault(name, index)
+
+    def compile_tests(self, tests):
+        try:
+            return [[compile_test(test, self.all_tests, self.epsilon) for test in header_tests]
+                    for header_tests in tests]
+        except (TypeError, KeyError, IndexError):
+            return None
+
+    def build_vectorized_suite(self, headers, tests):
+        if len(headers) != len(tests):
+            return None
+        try:
+            return VectorizedSuite(tests)
+        except (TypeError, ValueError):
+            return None
 
     ################################################
     ################  Running Tests  ############### 
 
     def execute_suite(self, updated_frame, sync_data={}):
+        self.latest_frame = updated_frame
+        self.latest_evidence = None
+        if self.status_results != None and len(updated_frame) == len(self.status_results):
+            self.execute_compiled_suite(updated_frame)
+            self.latest_results = self.status_results
+            return
         results = []
         for i in range(len(updated_frame)):
             results.append(self.run_tests(i, updated_frame[i], sync_data))
         self.latest_results = results
 
+    def execute_compiled_suite(self, updated_frame):
+        """Writes the status of every header into status_results in place"""
+        results = self.status_results
+        evaluated = None
+        if self.vectorized_suite != None:
+            evaluated = self.vectorized_suite.evaluate(updated_frame)
+        if evaluated != None:
+            results.set_codes(*evaluated)
+        else:
+            for i in range(len(updated_frame)):
+                self.execute_compiled_tests(i, updated_frame[i])
+
+    def execute_changed(self, updated_frame, changed_indices):
+        """Re-runs only the tests of the headers at changed_indices, keeping the
+           latest statuses of all other headers. Returns False when the whole
+           suite was run instead."""
+        results = self.status_results
+        if (results == None or self.latest_results is not results
+                or len(updated_frame) != len(results)
+                or (self.vectorized_suite != None
+                    and len(changed_indices) > self.incremental_limit * len(results))):
+            self.execute_suite(updated_frame)
+            return False
+        self.latest_frame = updated_frame
+        self.latest_evidence = None
+        for i in changed_indices:
+            self.execute_compiled_tests(i, updated_frame[i])
+        return True
+
+    def execute_compiled_tests(self, header_index, test_val):
+        status = [test.status(test_val) for test in self.compiled_tests[header_index]]
+        self.status_results.set_status(header_index, *self.calc_single_status(status))
+
     def run_tests(self, header_index, test_val, sync_data):
+        if self.compiled_tests != None:
+            status = [test.status(test_val) for test in self.compiled_tests[header_index]]
+            bayesian = self.calc_single_status(status)
+            return Status(self.dataFields[header_index], bayesian[0], bayesian[1])
+
         status = []
         tests = self.tests[header_index]
 
@@ -47,14 +134,37 @@ class TelemetryTestSuite:
             status.append(stat) # tuple
 
         bayesian = self.calc_single_status(status)
-        # TODO: Add all mass assignments?
+        # Mass assignments are combined by get_evidence, when asked for
         return Status(self.dataFields[header_index], bayesian[0], bayesian[1])
 
 
+    def get_mass_assignments(self, header_index, test_val):
+        """Mass assignments of each test of a header, worked out only on request"""
+        if self.compiled_tests != None:
+            return [test.mass_assignments(test_val) for test in self.compiled_tests[header_index]]
+        return [self.all_tests[test[0]](test_val, test[1:], self.epsilon)[1]
+                for test in self.tests[header_index]]
+
+    def get_evidence(self):
+        """Evidence of each header's tests on the latest frame, combined with
+           Dempster's rule; None before any frame"""
+        if self.latest_evidence == None and self.latest_frame != None:
+            frame = self.latest_frame
+            combined = None
+            if self.vectorized_suite != None:
+                combined = self.vectorized_suite.evaluate_masses(frame, self.epsilon)
+            if combined == None:
+                combined = combine_lists([[mass_vector(mass_assignments) for mass_assignments in self.get_mass_assignments(i, frame[i])]
+                                          for i in range(len(frame))])
+            self.latest_evidence = Evidence(self.dataFields, *combined)
+        return self.latest_evidence
+
     def get_latest_result(self, fieldName):
         if self.latest_results == None:
             return None
-        hdr_index = self.dataFields.index(fieldName)
+        hdr_index = None if self.header_indices == None else self.header_indices.get(fieldName)
+        if hdr_index == None:
+            hdr_index = self.dataFields.index(fieldName)
         return self.latest_results[hdr_index]
 
     ################################################
@@ -218,10 +328,20 @@ class TelemetryTestSuite:
             return max_occurrence, 1.0 # return max 
 
     def get_suite_status(self):
+        if isinstance(self.latest_results, StatusArray) and len(self.latest_results) > 0:
+            return self.latest_results.get_rollup()
         status_strings = [res.get_status() for res in self.latest_results]
         return self.calc_single_status(status_strings) 
 
+    def get_status_codes(self):
+        """Status code of each header's latest result"""
+        if isinstance(self.latest_results, StatusArray):
+            return self.latest_results.codes
+        return np.array([STATUS_CODES[res.get_status()] for res in self.latest_results], dtype=np.int8)
+
     def get_status_specific_mnemonics(self, status='RED'):
+        if isinstance(self.latest_results, StatusArray):
+            return self.latest_results.get_status_names(status)
         names = [res.get_name() for res in self.latest_results if res.get_status() == status]
         return names
 
@@ -0,0 +1,254 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+VectorizedSuite Class
+Evaluates the tests of every mnemonic in a frame at once with NumPy array
+operations, giving the same statuses and confidences as TelemetryTestSuite
+"""
+
+import numpy as np
+
+from .status import STATUSES, NO_STATUS, GREEN, YELLOW, RED
+from .status_rollup import select_statuses
+from .evidence import NUM_SETS, CODE_BITS, VACUOUS, normalize_rows, status_masses, combine
+
+# Status of each threshold interval, indexed by how many thresholds are <= the value
+FEASIBILITY_STATUSES = {2 : np.array([RED, GREEN, RED], dtype=np.int8),
+                        4 : np.array([RED, YELLOW, GREEN, YELLOW, RED], dtype=np.int8)}
+
+# Largest integer every STATE key is exactly representable as
+MAX_STATE_KEY = 2 ** 52
+
+class VectorizedSuite:
+    def __init__(self, tests):
+        """Groups the tests of every mnemonic by test type.
+           Raises ValueError when any test can only be run by the scalar suite."""
+        self.num_headers = len(tests)
+        self.num_tests = np.array([len(header_tests) for header_tests in tests], dtype=np.int64)
+        if np.any(self.num_tests == 0):
+            raise ValueError('Every mnemonic needs at least one test')
+        self.width = int(self.num_tests.max()) if self.num_headers > 0 else 0
+
+        feasibility = {2 : [], 4 : []}
+        state = []
+        noop = []
+        for header_index, header_tests in enumerate(tests):
+            for slot, test in enumerate(header_tests):
+                test_name = test[0]
+                test_data = test[1:]
+                if test_name == 'FEASIBILITY' and len(test_data) in feasibility:
+                    feasibility[len(test_data)].append((header_index, slot, test_data))
+                elif test_name == 'STATE' and len(test_data) == 3:
+                    state.append((header_index, slot, test_data))
+                elif test_name == 'NOOP':
+                    noop.append((header_index, slot))
+                else:
+                    raise ValueError(f'Test {test_name} with {len(test_data)} parameters cannot be vectorized')
+
+        self.feasibility_groups = [self.compile_feasibility(group, FEASIBILITY_STATUSES[num_params])
+                                   for num_params, group in feasibility.items() if len(group) > 0]
+        self.state_group = self.compile_state(state) if len(state) > 0 else None
+        self.noop_headers = np.array([entry[0] for entry in noop], dtype=np.int64)
+        self.noop_slots = np.array([entry[1] for entry in noop], dtype=np.int64)
+        # Status code of every test of every mnemonic, reused for each frame
+        self.codes = np.full((self.num_headers, self.width), -1, dtype=np.int8)
+
+    def compile_feasibility(self, group, statuses):
+        headers = np.array([entry[0] for entry in group], dtype=np.int64)
+        slots = np.array([entry[1] for entry in group], dtype=np.int64)
+        try:
+            thresholds = np.array([entry[2] for entry in group], dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise ValueError('FEASIBILITY thresholds must be numbers') from e
+        # With nondecreasing thresholds the interval a value falls in is the
+        # count of thresholds <= the value, matching the scalar bound checks
+        if np.any(np.isnan(thresholds)) or np.any(np.diff(thresholds, axis=1) < 0):
+            raise ValueError('FEASIBILITY thresholds must be sorted numbers')
+        return headers, slots, thresholds, statuses
+
+    def compile_state(self, group):
+        """STATE sets become one sorted array of (test, value) keys"""
+        members = {}
+        for test_id, (header_index, slot, test_data) in enumerate(group):
+            # An earlier set wins, as GREEN is checked before YELLOW before RED
+            for stat, values in zip([RED, YELLOW, GREEN], reversed(test_data)):
+                if not isinstance(values, (list, tuple, set, frozenset)):
+                    raise ValueError('STATE parameters must be collections of numbers')
+                for value in values:
+                    if not isinstance(value, (int, float)) or not abs(value) < MAX_STATE_KEY:
+                        raise ValueError('STATE parameters must be collections of numbers')
+                    # int(val) is never equal to a non-integral value
+                    if float(value).is_integer():
+                        members[(test_id, int(value))] = stat
+
+        headers = np.array([entry[0] for entry in group], dtype=np.int64)
+        slots = np.array([entry[1] for entry in group], dtype=np.int64)
+        if len(members) == 0:
+            return headers, slots, 0, 0, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8)
+
+        low = min(value for _, value in members)
+        span = max(value for _, value in members) - low + 1
+        if len(group) * span >= MAX_STATE_KEY:
+            raise ValueError('STATE values span too wide a range to vectorize')
+        keys = np.array([test_id * span + value - low for test_id, value in members], dtype=np.int64)
+        stats = np.array(list(members.values()), dtype=np.int8)
+        order = np.argsort(keys)
+        return headers, slots, low, span, keys[order], stats[order]
+
+    ################################################
+    ################  Running Tests  ###############
+
+    def evaluate(self, frame):
+        """Returns (status codes, confidences) for each mnemonic, or None when
+           the frame must be run through the scalar suite instead"""
+        if len(frame) != self.num_headers:
+            return None
+        if self.num_headers == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        values = self.frame_values(frame)
+        if values is None:
+            return None
+
+        codes = self.codes
+        codes.fill(-1)
+        codes[self.noop_headers, self.noop_slots] = GREEN
+        for headers, slots, thresholds, statuses in self.feasibility_groups:
+            codes[headers, slots] = self.feasibility(values[headers], thresholds, statuses)
+        if self.state_group != None:
+            state_codes = self.state(values, *self.state_group)
+            if state_codes is None:
+                return None
+            codes[self.state_group[0], self.state_group[1]] = state_codes
+
+        return self.calc_statuses(codes)
+
+    def evaluate_masses(self, frame, epsilon):
+        """Returns (mass vectors, conflicts) of the tests of each mnemonic
+           combined with Dempster's rule, or None when the frame must be run
+           through the scalar suite instead"""
+        if len(frame) != self.num_headers:
+            return None
+        values = self.frame_values(frame)
+        if values is None:
+            return None
+
+        # Vacuous masses in the padding slots leave the combination unchanged
+        masses = np.tile(VACUOUS, (self.num_headers, max(self.width, 1), 1))
+        masses[self.noop_headers, self.noop_slots] = status_masses(np.full(len(self.noop_headers), GREEN))
+        for headers, slots, thresholds, statuses in self.feasibility_groups:
+            masses[headers, slots] = self.feasibility_masses(values[headers], thresholds, statuses, epsilon)
+        if self.state_group != None:
+            state_codes = self.state(values, *self.state_group)
+            if state_codes is None:
+                return None
+            masses[self.state_group[0], self.state_group[1]] = status_masses(state_codes)
+        return combine(masses, axis=1)
+
+    def frame_values(self, frame):
+        try:
+            return np.asarray(frame, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+
+    def feasibility(self, values, thresholds, statuses):
+        interval = np.sum(thresholds <= values[:, np.newaxis], axis=1)
+        # A value on the lowest bound is below it, not in the interval to its right
+        interval[values <= thresholds[:, 0]] = 0
+        result = statuses[interval]
+        result[np.isnan(values)] = NO_STATUS
+        return result
+
+    def feasibility_masses(self, values, thresholds, statuses, epsilon):
+        """Mass vectors of FEASIBILITY tests, as CompiledFeasibility.mass_assignments"""
+        num_bounds = thresholds.shape[1]
+        rows = np.arange(len(values))
+        bits = CODE_BITS[statuses]
+        delta = epsilon * np.min(np.abs(np.diff(thresholds, axis=1)), axis=1)
+        lowest = thresholds[:, 0]
+        highest = thresholds[:, -1]
+        interval = np.sum(thresholds <= values[:, np.newaxis], axis=1)
+        interval[values <= lowest] = 0
+        is_nan = np.isnan(values)
+        masses = np.zeros((len(values), NUM_SETS))
+
+        def add(where, sets, mass):
+            masses[rows[where], sets[where] if np.ndim(sets) else sets] += mass
+
+        def add_buffered(where, bound, stat, pair):
+            # Within delta of a bound part of the mass also goes to the pair
+            # of statuses either side of it
+            mass = np.abs(bound[where] - values[where]) / delta[where]
+            add(where, stat, mass)
+            add(where, pair, 1.0 - mass)
+
+        below = ~is_nan & (interval == 0)
+        on_lowest = below & (values == lowest)
+        add(on_lowest, bits[0] | bits[1], 1.0)
+        below_buffer = below & ~on_lowest & (values < lowest - delta)
+        add(below_buffer, bits[0], 1.0)
+        add_buffered(below & ~on_lowest & ~below_buffer, lowest, bits[0], bits[0] | bits[1])
+
+        above = ~is_nan & (interval == num_bounds)
+        on_highest = above & (values == highest)
+        add(on_highest, bits[-2] | bits[-1], 1.0)
+        above_buffer = above & ~on_highest & (values > highest + delta)
+        add(above_buffer, bits[-1], 1.0)
+        add_buffered(above & ~on_highest & ~above_buffer, highest, bits[-1], bits[-2] | bits[-1])
+
+        inside = ~is_nan & (interval > 0) & (interval < num_bounds)
+        inner = np.clip(interval, 1, num_bounds - 1)
+        left_bound = thresholds[rows, inner - 1]
+        right_bound = thresholds[rows, inner]
+        stat, left_stat, right_stat = bits[inner], bits[inner - 1], bits[inner + 1]
+        on_bound = inside & (values == left_bound)
+        # Every internal bound equal to the value adds its pair of statuses
+        for bound in range(1, num_bounds - 1):
+            add(on_bound & (thresholds[:, bound] == values), bits[bound] | bits[bound + 1], 1.0)
+        near_left = inside & ~on_bound & (values < left_bound + delta)
+        add_buffered(near_left, left_bound, stat, left_stat | stat)
+        near_right = inside & ~on_bound & ~near_left & (values > right_bound - delta)
+        add_buffered(near_right, right_bound, stat, stat | right_stat)
+        add(inside & ~on_bound & ~near_left & ~near_right, stat, 1.0)
+
+        # NaN values give no mass assignments, so the test says nothing
+        return normalize_rows(masses)
+
+    def state(self, values, headers, slots, low, span, keys, stats):
+        values = values[headers]
+        # int() of these raises in the scalar suite
+        if not np.all(np.isfinite(values)):
+            return None
+        result = np.full(len(headers), NO_STATUS, dtype=np.int8)
+        if len(keys) == 0:
+            return result
+        truncated = np.trunc(values)
+        in_range = (truncated >= low) & (truncated < low + span)
+        test_ids = np.flatnonzero(in_range)
+        lookup = test_ids * span + (truncated[in_range].astype(np.int64) - low)
+        positions = np.minimum(np.searchsorted(keys, lookup), len(keys) - 1)
+        found = keys[positions] == lookup
+        result[test_ids[found]] = stats[positions[found]]
+        return result
+
+    ################################################
+    ############## Combining statuses ##############
+
+    def calc_statuses(self, codes):
+        return combine_status_codes(codes)
+
+def combine_status_codes(codes):
+    """Vectorized TelemetryTestSuite.calc_single_status in 'strict' mode, for
+       each row of codes holding status codes padded with -1"""
+    counts = np.stack([np.sum(codes == code, axis=1) for code in range(len(STATUSES))], axis=1)
+
+    def first_seen(rows):
+        return np.stack([np.argmax(codes[rows] == code, axis=1) for code in range(len(STATUSES))], axis=1)
+
+    return select_statuses(counts, 'strict', first_seen)
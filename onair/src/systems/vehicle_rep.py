@@ -12,7 +12,11 @@ VehicleRepresentation Class
 Handles retrieval and storage of vehicle subsystem information
 """
 
-from .status import Status
+import numpy as np
+
+from .status import Status, STATUSES, NO_STATUS
+from .status_rollup import StatusRollup
+from .evidence import Evidence, discount, combine_groups
 from .telemetry_test_suite import TelemetryTestSuite
 
 from ..util.print_io import *
@@ -20,13 +24,38 @@ from ..util.plugin_import import import_plugins
 # from ..util.data_conversion import *
 
 class VehicleRepresentation:
-    def __init__(self, headers, tests, _knowledge_rep_plugins={}):
+    # Re-run tests only for the mnemonics whose values changed in a frame
+    incremental_updates = True
+    # Indices of the mnemonics changed by the last update_curr_data
+    changed_indices = None
+    # Run every test on the next update, as after a reset
+    rerun_all_tests = False
+    # Set by __init__ when given the subsystem assignments of the headers
+    subsystem_rollup = None
+    # calc_single_status mode used for subsystem statuses: 'strict', 'distr' or
+    # 'max', as set by the SubsystemRollupMode option
+    subsystem_rollup_mode = 'strict'
+    # Weight of a mnemonic's evidence about its subsystems; below 1.0 so that
+    # mnemonics in complete disagreement do not leave nothing to combine
+    subsystem_evidence_reliability = 0.9
+    # Set each frame's status confidences to the belief in each status given
+    # the combined test evidence, instead of the share of mnemonics with it
+    evidence_confidence = False
+
+    def __init__(self, headers, tests, _knowledge_rep_plugins={}, subsystem_assignments=None):
         assert(len(headers) == len(tests))
         self.headers = headers
         self.knowledge_synthesis_constructs = import_plugins(self.headers,_knowledge_rep_plugins)
 
         self.status = Status('MISSION')
         self.test_suite = TelemetryTestSuite(headers, tests)
+
+        self.subsystem_statuses = {}
+        if subsystem_assignments != None:
+            assert(len(subsystem_assignments) == len(headers))
+            self.subsystem_rollup = StatusRollup(subsystem_assignments)
+            for subsystem in self.subsystem_rollup.subsystems:
+                self.subsystem_statuses[subsystem] = Status(subsystem)
    
         self.curr_data = ['-']* len(self.headers) #stale data
 
@@ -34,18 +63,60 @@ class VehicleRepresentation:
     def update(self, frame):
         # Update constructs
         self.update_curr_data(frame)
-        self.test_suite.execute_suite(self.curr_data)
-        self.status.set_status(*self.test_suite.get_suite_status())
+        # Only the statuses of retested_indices changed; None when all may have
+        retested_indices = None
+        if self.incremental_updates and self.changed_indices != None and not self.rerun_all_tests:
+            if self.test_suite.execute_changed(self.curr_data, self.changed_indices):
+                retested_indices = self.changed_indices
+        else:
+            self.test_suite.execute_suite(self.curr_data)
+        self.rerun_all_tests = False
+        stat, conf = self.test_suite.get_suite_status()
+        if self.evidence_confidence and stat != '---':
+            conf = float(self.get_mission_evidence().get_belief([stat])[0])
+        self.status.set_status(stat, conf)
+        self.update_subsystem_statuses(retested_indices)
         self.update_constructs(self.curr_data)
 
+    def reset(self):
+        """Forgets the data of earlier frames, as when the telemetry moves on
+           to the next file, so none of it is taken as current"""
+        self.curr_data = ['-'] * len(self.headers)
+        self.rerun_all_tests = True
+        for construct in self.knowledge_synthesis_constructs:
+            construct.reset()
+
+    def finish(self):
+        """Finishes each knowledge synthesis construct, as the run is over"""
+        for construct in self.knowledge_synthesis_constructs:
+            construct.finish()
+
     def update_constructs(self, frame):
         for construct in self.knowledge_synthesis_constructs:
             construct.update(frame)
 
+    def update_subsystem_statuses(self, retested_indices=None):
+        """Rolls the test suite's statuses up into each subsystem's Status;
+           retested_indices, when given, are the only mnemonics retested"""
+        if self.subsystem_rollup == None or (retested_indices != None and len(retested_indices) == 0):
+            return
+        statuses, confidences = self.subsystem_rollup.rollup(self.test_suite.get_status_codes(),
+                                                             self.subsystem_rollup_mode,
+                                                             retested_indices)
+        if self.evidence_confidence:
+            beliefs = self.get_subsystem_evidence().get_code_belief(statuses)
+            confidences = np.where(statuses == NO_STATUS, confidences, beliefs)
+        for subsystem, stat, conf in zip(self.subsystem_rollup.subsystems, statuses.tolist(), confidences.tolist()):
+            self.subsystem_statuses[subsystem].set_status(STATUSES[stat], conf)
+
     def update_curr_data(self, frame):
+        changed_indices = []
         for i in range(len(frame)):
             if frame[i] != '-':
+                if frame[i] != self.curr_data[i]:
+                    changed_indices.append(i)
                 self.curr_data[i] = frame[i]
+        self.changed_indices = changed_indices
 
     ##### GETTERS AND SETTERS #####
     def get_headers(self):
@@ -66,6 +137,29 @@ class VehicleRepresentation:
     def get_bayesian_status(self):
         return self.status.get_bayesian_status()
 
+    def get_subsystem_statuses(self):
+        return self.subsystem_statuses
+
+    def get_evidence(self):
+        return self.test_suite.get_evidence()
+
+    def get_mission_evidence(self):
+        """Evidence of every mnemonic combined into one MISSION mass vector,
+           each discounted as for get_subsystem_evidence"""
+        evidence = self.test_suite.get_evidence()
+        if evidence == None:
+            return None
+        masses = discount(evidence.masses, self.subsystem_evidence_reliability)
+        return Evidence([self.status.get_name()],
+                        *combine_groups(masses, np.zeros(len(masses), dtype=np.int64), 1))
+
+    def get_subsystem_evidence(self):
+        evidence = self.test_suite.get_evidence()
+        if self.subsystem_rollup == None or evidence == None:
+            return None
+        return Evidence(self.subsystem_rollup.subsystems,
+                        *self.subsystem_rollup.combine_evidence(evidence.masses, self.subsystem_evidence_reliability))
+
     def get_batch_status_reports(self, batch_data):
         return
 
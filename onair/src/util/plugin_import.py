@@ -16,10 +16,17 @@ import importlib.util
 import sys
 import os
 
-def import_plugins(headers, module_dict):
+from ..ai_components.process_plugin import ProcessPlugin
+
+def import_plugins(headers, module_dict, process_plugins=()):
+    """An instance of the Plugin of each module; those named in
+       process_plugins run in worker processes behind a ProcessPlugin"""
     plugin_list = []
     init_filename = "__init__.py"
     for construct_name, module_path in module_dict.items():
+        if construct_name in process_plugins:
+            plugin_list.append(ProcessPlugin(construct_name, headers, module_path))
+            continue
         true_path = module_path
         # Compatibility for plugin paths that already include __init__.py
         if module_path.endswith(init_filename):
@@ -0,0 +1,149 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+Columnar output format
+A file holds a header naming its columns, then chunks of rows stored column by
+column. Numeric columns are float64 arrays and any other column is UTF-8 text,
+each compressed on its own.
+
+    header: b'ONAIRCOL', version (uint8), compression (uint8),
+            length (uint32) of the JSON {"columns": [names]} that follows
+    chunk:  rows (uint32), columns (uint32), then for each column its kind
+            (b'f' float64 or b's' NUL separated text), the length (uint64) of
+            its compressed data and the data
+
+All integers are little endian. A chunk may hold more columns than the header
+names; rows shorter than their chunk are padded with NaN or ''.
+"""
+
+import bz2
+import glob
+import json
+import lzma
+import os
+import struct
+import zlib
+from itertools import zip_longest
+
+import numpy as np
+
+MAGIC = b'ONAIRCOL'
+VERSION = 1
+FILE_HEADER = struct.Struct('<BBI')
+CHUNK_HEADER = struct.Struct('<II')
+COLUMN_HEADER = struct.Struct('<cQ')
+FLOAT_COLUMN = b'f'
+TEXT_COLUMN = b's'
+
+# Name : (code, compress, decompress)
+COMPRESSIONS = {'none' : (0, bytes, bytes),
+                'zlib' : (1, zlib.compress, zlib.decompress),
+                'bz2' : (2, bz2.compress, bz2.decompress),
+                'lzma' : (3, lzma.compress, lzma.decompress)}
+DECOMPRESSORS = {code : decompress for code, _, decompress in COMPRESSIONS.values()}
+
+def compression_codec(compression):
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression '{compression}', expected one of {sorted(COMPRESSIONS)}")
+    return COMPRESSIONS[compression]
+
+def encode_header(columns, compression='zlib'):
+    code = compression_codec(compression)[0]
+    names = json.dumps({'columns' : [str(column) for column in columns]}).encode('utf-8')
+    return MAGIC + FILE_HEADER.pack(VERSION, code, len(names)) + names
+
+def encode_chunk(rows, compression='zlib'):
+    """Bytes of a chunk holding rows, each a list of values"""
+    compress = compression_codec(compression)[1]
+    columns = list(zip_longest(*rows, fillvalue=None))
+    parts = [CHUNK_HEADER.pack(len(rows), len(columns))]
+    for column in columns:
+        try:
+            kind = FLOAT_COLUMN
+            data = np.array(column, dtype='<f8').tobytes()
+        except (TypeError, ValueError):
+            kind = TEXT_COLUMN
+            data = '\0'.join('' if value is None else str(value) for value in column).encode('utf-8')
+        data = compress(data)
+        parts.append(COLUMN_HEADER.pack(kind, len(data)))
+        parts.append(data)
+    return b''.join(parts)
+
+def read_file(file_name):
+    """(column names, chunks) of a columnar file, each chunk a list of its
+       column arrays"""
+    with open(file_name, 'rb') as file:
+        data = file.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"'{file_name}' is not a columnar output file")
+    offset = len(MAGIC)
+    version, code, names_length = FILE_HEADER.unpack_from(data, offset)
+    if version != VERSION:
+        raise ValueError(f"'{file_name}' has unsupported version {version}")
+    decompress = DECOMPRESSORS[code]
+    offset += FILE_HEADER.size
+    names = json.loads(data[offset:offset + names_length].decode('utf-8'))['columns']
+    offset += names_length
+
+    chunks = []
+    while offset < len(data):
+        num_rows, num_columns = CHUNK_HEADER.unpack_from(data, offset)
+        offset += CHUNK_HEADER.size
+        chunk = []
+        for _ in range(num_columns):
+            kind, length = COLUMN_HEADER.unpack_from(data, offset)
+            offset += COLUMN_HEADER.size
+            column = decompress(data[offset:offset + length])
+            offset += length
+            if kind == FLOAT_COLUMN:
+                chunk.append(np.frombuffer(column, dtype='<f8'))
+            else:
+                chunk.append(np.array(column.decode('utf-8').split('\0'), dtype=str))
+        chunks.append((num_rows, chunk))
+    return names, chunks
+
+def load_run(paths):
+    """Every row of one or more columnar files as {column name : array}, in
+       one call. paths is a file name, a glob pattern matching the files of a
+       run or a list of file names; files are read in sorted order.
+       A column is float64 when every value in it is numeric, and text otherwise."""
+    if isinstance(paths, (str, os.PathLike)):
+        file_names = sorted(glob.glob(str(paths))) or [paths]
+    else:
+        file_names = sorted(paths)
+
+    names = []
+    pieces = [] # Arrays of each column
+    total_rows = 0
+    for file_name in file_names:
+        file_columns, chunks = read_file(file_name)
+        names.extend(file_columns[len(names):])
+        for num_rows, chunk in chunks:
+            while len(pieces) < len(chunk):
+                # A column first seen now had no values in the rows before
+                pieces.append([np.full(total_rows, np.nan)])
+            for index, column_pieces in enumerate(pieces):
+                column_pieces.append(chunk[index] if index < len(chunk) else np.full(num_rows, np.nan))
+            total_rows += num_rows
+    while len(pieces) < len(names):
+        pieces.append([np.full(total_rows, np.nan)])
+
+    run = {}
+    for index, column_pieces in enumerate(pieces):
+        name = names[index] if index < len(names) else f'column_{index}'
+        if name in run:
+            name = f'{name}_{index}'
+        if all(piece.dtype == np.float64 for piece in column_pieces):
+            run[name] = np.concatenate(column_pieces)
+        else:
+            # Padding of a text column is '' rather than NaN
+            run[name] = np.concatenate([piece if piece.dtype != np.float64 else
+                                        np.where(np.isnan(piece), '', piece.astype(str)) for piece in column_pieces])
+    return run
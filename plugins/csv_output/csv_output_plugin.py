@@ -7,10 +7,142 @@
 # Licensed under the NASA Open Source Agreement version 1.3
 # See "NOSA GSC-19165-1 OnAIR.pdf"
 
+import itertools
+import os
+import queue
+import threading
+import time
 from datetime import datetime
 from onair.src.ai_components.ai_plugin_abstract.ai_plugin import AIPlugin
+from .columnar import compression_codec, encode_header, encode_chunk
+
+class RowWriter:
+    """
+    Appends rows to a file held open between writes. Rows wait in a buffer
+    until max_rows of them are waiting or max_seconds have passed since the
+    last flush, even when open moves on to another file in between; in
+    background mode a thread writes each flushed batch, so writing never
+    waits on the disk unless max_batches are already queued.
+    """
+    file_mode = 'a'
+
+    def __init__(self, max_rows=100, max_seconds=1.0, background=False, max_batches=16):
+        self.max_rows = max_rows
+        self.max_seconds = max_seconds
+        self.file = None
+        self.file_name = None
+        self.rows = []
+        # (file, rows) of each file moved on from with rows still waiting,
+        # closed once they are written
+        self.earlier_files = []
+        self.waiting_rows = 0
+        self.last_flush = time.monotonic()
+        self.batches = None
+        self.error = None
+        if background:
+            self.batches = queue.Queue(maxsize=max_batches)
+            threading.Thread(target=self.write_batches, daemon=True).start()
+
+    def open(self, file_name, headers):
+        """Moves on to file_name, starting it with headers when it is empty;
+           rows of the file before wait to be written with the next flush"""
+        if self.file != None:
+            self.earlier_files.append((self.file, self.rows))
+            self.rows = []
+        self.file = open(file_name, self.file_mode)
+        self.file_name = file_name
+        if self.file.tell() == 0:
+            self.write_header(headers)
+
+    def write_header(self, headers):
+        self.rows.append(','.join(headers) + '\n')
+        self.waiting_rows += 1
+
+    def write(self, row):
+        self.rows.append(row)
+        self.waiting_rows += 1
+        if self.waiting_rows >= self.max_rows or time.monotonic() - self.last_flush >= self.max_seconds:
+            self.flush()
+
+    def flush(self):
+        for file, rows in self.earlier_files:
+            if len(rows) > 0:
+                self.send(file, self.encode(rows))
+            self.send(file, None)
+        self.earlier_files = []
+        if len(self.rows) > 0:
+            self.send(self.file, self.encode(self.rows))
+            self.rows = []
+        self.waiting_rows = 0
+        self.last_flush = time.monotonic()
+
+    def encode(self, rows):
+        return ''.join(rows)
+
+    def close(self):
+        """Writes out every row and closes the file; in background mode, waits
+           for the thread to finish writing"""
+        if self.file == None:
+            return
+        self.flush()
+        self.send(self.file, None)
+        if self.batches != None:
+            self.batches.join()
+        self.file = None
+        self.file_name = None
+
+    def send(self, file, text):
+        """Writes text to file, or closes file when text is None"""
+        if self.error != None: # The thread failed to write an earlier batch
+            error, self.error = self.error, None
+            raise error
+        if self.batches != None:
+            self.batches.put((file, text))
+        elif text == None:
+            file.close()
+        else:
+            file.write(text)
+            file.flush()
+
+    def write_batches(self):
+        while True:
+            file, text = self.batches.get()
+            try:
+                if text == None:
+                    file.close()
+                else:
+                    file.write(text)
+                    file.flush()
+            except Exception as e:
+                self.error = e
+            finally:
+                self.batches.task_done()
+
+class ColumnarWriter(RowWriter):
+    """
+    RowWriter of rows of values in the columnar format of columnar.py, each
+    flush writing one chunk
+    """
+    file_mode = 'ab'
+
+    def __init__(self, max_rows=100, max_seconds=1.0, background=False, max_batches=16, compression='zlib'):
+        compression_codec(compression) # Raises for an unknown compression before any file is opened
+        self.compression = compression
+        super().__init__(max_rows, max_seconds, background, max_batches)
+
+    def write_header(self, headers):
+        self.send(self.file, encode_header(headers, self.compression))
+
+    def encode(self, rows):
+        return encode_chunk(rows, self.compression)
+
+# Numbers each plugin made in this process, so no two share a file name
+instance_numbers = itertools.count(1)
 
 class Plugin(AIPlugin):
+    # Each render writes a row out
+    cache_reasoning = False
+
     def __init__(self, name, headers):
         super().__init__(name, headers)
 
@@ -21,9 +153,23 @@ class Plugin(AIPlugin):
         self.current_buffer = [] # List of telemetry points
         self.filename_preamble = "csv_out_"
         self.filename = ""
+        self.file_name = ""
 
-        # Note: Files might exceede the specified lines_per_file if data is written too quickly.
-        # File names are generated by a timestamp, so new files can only be created every minute at most.
+        # Rows are flushed to the file once flush_rows are waiting or
+        # flush_seconds have passed; background_writes flushes on a thread
+        self.flush_rows = 100
+        self.flush_seconds = 1.0
+        self.background_writes = False
+        # 'csv' writes text rows; 'columnar' writes the compressed binary
+        # columns of columnar.py, which columnar.load_run reads back
+        self.output_format = 'csv'
+        self.compression = 'zlib'
+        self.writer = None
+        # Files are numbered from the time of the first frame, the process id
+        # and the plugin's instance number, so a file is never reused however
+        # quickly rows are written or however many runs start at once
+        self.run_stamp = ""
+        self.file_number = 0
 
     def update(self,low_level_data=[], high_level_data={}):
         """
@@ -37,10 +183,12 @@ class Plugin(AIPlugin):
                     self.headers.append(str(plugin))
 
         self.current_buffer = []
+        # Columnar output keeps values as they are, so numbers are stored as numbers
+        keep = str if self.output_format != 'columnar' else (lambda telem_point: telem_point)
 
         # Add low level data
         for telem_point in low_level_data:
-            self.current_buffer.append(str(telem_point))
+            self.current_buffer.append(keep(telem_point))
 
         # Add high level data
         for layer in high_level_data.keys():
@@ -49,34 +197,49 @@ class Plugin(AIPlugin):
                 plugin_output = high_level_data[layer].get(plugin, "empty")
                 # Assume each plugin is outputting a list
                 for telem_point in plugin_output:
-                    self.current_buffer.append(str(telem_point))
+                    self.current_buffer.append(keep(telem_point))
                     
     def render_reasoning(self):
         """
         System should return its diagnosis
         """
 
-        if (self.first_frame):
-            date_stamp = datetime.today().strftime('%j_%H_%M')
-            self.file_name = self.filename_preamble + date_stamp + ".csv"
+        if self.writer == None:
+            if self.output_format == 'columnar':
+                self.writer = ColumnarWriter(self.flush_rows, self.flush_seconds, self.background_writes,
+                                             compression=self.compression)
+            else:
+                self.writer = RowWriter(self.flush_rows, self.flush_seconds, self.background_writes)
 
-            # Write out headers to file
-            with open(self.file_name, 'a') as file:
-                delimiter = ','
-                file.write(delimiter.join(self.headers) + '\n')
+        if (self.first_frame):
+            self.run_stamp = f"{datetime.today().strftime('%j_%H_%M_%S')}_{os.getpid()}_{next(instance_numbers)}"
+            self.file_name = self.next_file_name()
             self.first_frame = False
-        pass
+
+        if self.writer.file_name != self.file_name:
+            self.writer.open(self.file_name, self.headers)
 
         # Write out data frame to file
-        with open(self.file_name, 'a') as file:
-            delimiter = ','
-            file.write(delimiter.join(self.current_buffer) + '\n')
+        if self.output_format == 'columnar':
+            self.writer.write(self.current_buffer)
+        else:
+            self.writer.write(','.join(self.current_buffer) + '\n')
         self.current_buffer = []
         self.lines_current += 1
 
         if (self.lines_per_file != 0 and self.lines_per_file == self.lines_current):
-            # Create new file
-            date_stamp = datetime.today().strftime('%j_%H_%M')
-            self.file_name = self.filename_preamble + date_stamp + ".csv"
+            # The next render starts a new file; rows of this one are written
+            # with the next flush, so flush_rows batches span files
+            self.file_name = self.next_file_name()
 
             self.lines_current = 0
+
+    def finish(self):
+        """Writes out the rows still buffered, as the run is over"""
+        if self.writer != None:
+            self.writer.close()
+
+    def next_file_name(self):
+        self.file_number += 1
+        extension = 'col' if self.output_format == 'columnar' else 'csv'
+        return f"{self.filename_preamble}{self.run_stamp}_{self.file_number:04d}.{extension}"
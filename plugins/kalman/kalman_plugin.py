@@ -12,13 +12,30 @@ import numpy as np
 from onair.src.ai_components.ai_plugin_abstract.ai_plugin import AIPlugin
 
 class Plugin(AIPlugin):
-    def __init__(self, name, headers, window_size=3):
+    # Filter online when not given to __init__; plugins/kalman_online turns it on
+    online = False
+
+    def __init__(self, name, headers, window_size=3, online=None):
         """
         :param headers: (int) length of time agent examines
         :param window_size: (int) size of time window to examine
+        :param online: (bool) keep each attribute's filter state between frames,
+                       stepping it once per sample, instead of filtering every window again;
+                       None keeps the class's online
         """
         super().__init__(name, headers)
-        self.frames = []
+        # Ring buffer of the latest window_size values of each attribute,
+        # allocated by the first update
+        self.buffer = None
+        self.valid = None
+        self.head = 0
+        self.count = 0
+        if online != None:
+            self.online = online
+        # Online filter state of each attribute, and the absolute innovation of each sample
+        self.states = None
+        self.residuals = None
+        self.gain = None
         self.component_name = name
         self.headers = headers
         self.window_size = window_size
@@ -35,24 +52,127 @@ class Plugin(AIPlugin):
         :param frame: (list of floats) input sequence of len (input_dim)
         :return: None
         """
-        for data_point_index in range(len(frame)):
-            if len(self.frames) < len(frame): # If the frames variable is empty, append each data point in frame to it, each point wrapped as a list
-                # This is done so the data can have each attribute grouped in one list before being passed to kalman
-                # Ex: [[1:00, 1:01, 1:02, 1:03, 1:04, 1:05], [1, 2, 3, 4, 5]]
-                self.frames.append([frame[data_point_index]])
-            else:
-                self.frames[data_point_index].append(frame[data_point_index])
-                if len(self.frames[data_point_index]) > self.window_size: # If after adding a point to the frame, that attribute is larger than the window_size, take out the first element
-                    self.frames[data_point_index].pop(0)
+        if len(frame) == 0:
+            return
+        values, valid = self.to_row(frame)
+        if self.buffer is None or len(self.buffer) < len(values):
+            self.allocate(len(values))
+        # Each value is written twice, window_size apart, so the latest
+        # window_size values of every attribute are one contiguous slice
+        columns = [self.head, self.head + self.window_size]
+        self.buffer[:len(values), columns] = values[:, np.newaxis]
+        self.valid[:len(values), columns] = valid[:, np.newaxis]
+        if len(values) < len(self.buffer): # Attributes missing from the frame are stale
+            self.buffer[len(values):, columns] = np.nan
+            self.valid[len(values):, columns] = False
+        if self.online:
+            self.residuals[:, columns] = np.abs(self.filter_step(self.buffer[:, self.head]))[:, np.newaxis]
+        self.head = (self.head + 1) % self.window_size
+        self.count = min(self.count + 1, self.window_size)
+
+    def reset(self):
+        """
+        Forgets the windows and filter states of earlier frames
+        """
+        self.buffer = None
+        self.valid = None
+        self.head = 0
+        self.count = 0
+        self.states = None
+        self.residuals = None
 
     def render_reasoning(self):
         """
         System should return its diagnosis
         """
-        broken_attributes = self.frame_diagnosis(self.frames, self.headers)
+        if self.online:
+            if self.residuals is None:
+                return []
+            return self.residual_diagnosis(self.window_of(self.residuals), self.headers)
+        values, valid = self.get_window()
+        broken_attributes = self.frame_diagnosis(values, self.headers, valid)
         return broken_attributes
     #### END: Classes mandated by plugin architecture
 
+    # Grows the ring buffer to num_attributes rows, keeping the windows already in it
+    def allocate(self, num_attributes):
+        buffer = np.full((num_attributes, 2 * self.window_size), np.nan)
+        valid = np.zeros((num_attributes, 2 * self.window_size), dtype=bool)
+        if self.buffer is not None:
+            buffer[:len(self.buffer)] = self.buffer
+            valid[:len(self.valid)] = self.valid
+        self.buffer = buffer
+        self.valid = valid
+        if self.online:
+            # NaN states are filters yet to see their first observation
+            states = np.full((num_attributes, 2), np.nan)
+            residuals = np.full((num_attributes, 2 * self.window_size), np.nan)
+            if self.states is not None:
+                states[:len(self.states)] = self.states
+                residuals[:len(self.residuals)] = self.residuals
+            self.states = states
+            self.residuals = residuals
+            if self.gain is None:
+                self.gain = self.steady_state_gain()
+
+    # Values of a frame as floats, and whether each is valid; a '-' is a stale
+    # value, which becomes a NaN the filter treats as a missing observation
+    def to_row(self, frame):
+        try:
+            values = np.asarray(frame, dtype=np.float64)
+            return values, np.ones(len(values), dtype=bool)
+        except (TypeError, ValueError):
+            valid = np.array([not (isinstance(value, str) and value == '-') for value in frame])
+            values = np.array([float(value) if is_valid else np.nan for value, is_valid in zip(frame, valid)])
+            return values, valid
+
+    # Views, oldest value first, of the window of each attribute and of which
+    # of its values are valid
+    def get_window(self):
+        if self.buffer is None:
+            return np.empty((0, 0)), np.empty((0, 0), dtype=bool)
+        return self.window_of(self.buffer), self.window_of(self.valid)
+
+    # View of the current window of a ring buffer written alongside self.buffer
+    def window_of(self, ring):
+        end = self.head + self.window_size
+        return ring[:, end - self.count:end]
+
+    # The model never changes, so its filter's covariance, and with it the
+    # gain, settles to a fixed point that every step can share
+    def steady_state_gain(self, tolerance=1e-12, max_iterations=10000):
+        transition = np.asarray(self.kf.state_transition, dtype=np.float64)
+        process_noise = np.asarray(self.kf.process_noise, dtype=np.float64)
+        observation = np.asarray(self.kf.observation_model, dtype=np.float64)
+        observation_noise = np.atleast_2d(np.asarray(self.kf.observation_noise, dtype=np.float64))
+        predicted_covariance = process_noise
+        for _ in range(max_iterations):
+            innovation_covariance = observation @ predicted_covariance @ observation.T + observation_noise
+            gain = predicted_covariance @ observation.T @ np.linalg.inv(innovation_covariance)
+            covariance = predicted_covariance - gain @ observation @ predicted_covariance
+            next_predicted = transition @ covariance @ transition.T + process_noise
+            if np.allclose(next_predicted, predicted_covariance, rtol=0.0, atol=tolerance):
+                break
+            predicted_covariance = next_predicted
+        return gain[:, 0]
+
+    # One predict/update step of every attribute's filter. Returns the
+    # innovations, the residuals of the one step predictions, which are NaN
+    # for stale values and for a filter's first observation
+    def filter_step(self, values):
+        transition = np.asarray(self.kf.state_transition, dtype=np.float64)
+        observation = np.asarray(self.kf.observation_model, dtype=np.float64)[0]
+        predicted = self.states @ transition.T
+        innovations = values - predicted @ observation
+        updated = ~np.isnan(innovations)
+        predicted[updated] += innovations[updated, np.newaxis] * self.gain
+        # A filter starts at its first observation, with no rate of change
+        started = np.isnan(predicted[:, 0]) & ~np.isnan(values)
+        predicted[started, 0] = values[started]
+        predicted[started, 1] = 0.0
+        self.states = predicted
+        return innovations
+
     # Gets mean of values
     def mean(self, values):
         return sum(values)/len(values)
@@ -77,31 +197,28 @@ class Plugin(AIPlugin):
         predicted =  self.kf.predict(data, forward_steps) # Make a prediction on the smoothed data
         return predicted
 
+    # Predicts each point after the first in every row of data from one filtering
+    # pass over all the rows at once; the filtered state at a point, stepped
+    # forward, is what predict gives for the data up to that point
+    def one_step_predictions(self, data):
+        filtered = self.kf.compute(data[:, :-1], 0, smoothed=False, filtered=True).filtered
+        step_observation = np.dot(self.kf.observation_model, self.kf.state_transition)[0]
+        return np.dot(filtered.states.mean, step_observation)
+
+    # Absolute errors of the one step predictions of every row of data
+    def generate_residuals(self, data):
+        if data.shape[1] < 2: # If there's not enough data there are no errors
+            return np.zeros((data.shape[0], 1))
+        return np.abs(data[:, 1:] - self.one_step_predictions(data))
+
     def predictions_for_given_data(self, data):
-        returned_data = []
-        initial_val = data[0]
-        for item in range(len(data)-1):
-            predicted = self.predict(data[0:item+1], 1, initial_val)
-            actual_next_state = data[item+1]
-            pred_mean = predicted.observations.mean
-            returned_data.append(pred_mean)
-        if(len(returned_data) == 0): # If there's not enough data just set it to 0
-            returned_data.append(0)
-        return returned_data
+        if len(data) < 2: # If there's not enough data just set it to 0
+            return [0]
+        return self.one_step_predictions(np.array([data], dtype=np.float64))[0].tolist()
 
     # Get data, make predictions, and then find the errors for these predictions
     def generate_residuals_for_given_data(self, data):
-        residuals = []
-        initial_val = data[0]
-        for item in range(len(data)-1):
-            predicted = self.predict(data[0:item+1], 1, initial_val)
-            actual_next_state = data[item+1]
-            pred_mean = predicted.observations.mean
-            residual_error = float(self.residual(pred_mean, actual_next_state))
-            residuals.append(residual_error)
-        if(len(residuals) == 0): # If there are no residuals because the data is of length 1, then just say residuals is equal to [0]
-            residuals.append(0)
-        return residuals
+        return self.generate_residuals(np.array([data], dtype=np.float64))[0].tolist()
 
     #Info: takes a chunk of data of n size. Walks through it and gets residual errors.
     #Takes the mean of the errors and determines if they're too large overall in order to determine whether or not there's a chunk in said error.
@@ -112,10 +229,29 @@ class Plugin(AIPlugin):
                 return False
         return True
 
-    def frame_diagnosis(self, frame, headers):
-        kal_broken_attributes = []
-        for attribute_index in range(len(frame)):
-            error = self.current_attribute_chunk_get_error(frame[attribute_index])
-            if error and not headers[attribute_index].upper() == 'TIME':
-                kal_broken_attributes.append(headers[attribute_index])
-        return kal_broken_attributes
+    def frame_diagnosis(self, frame, headers, valid=None):
+        if len(frame) == 0:
+            return []
+        # Every attribute's window is filtered together as one row of an array
+        data = np.asarray(frame, dtype=np.float64)
+        residuals = self.generate_residuals(data)
+        if valid is None or data.shape[1] < 2:
+            mean_residuals = np.mean(residuals, axis=1)
+        else: # Stale values were never observed, so have no residuals
+            mean_residuals = self.observed_mean(residuals, valid[:, 1:])
+        return self.broken_attributes(mean_residuals, headers)
+
+    # Diagnosis from the online filters' residuals, NaN where there are none
+    def residual_diagnosis(self, residuals, headers):
+        if len(residuals) == 0:
+            return []
+        return self.broken_attributes(self.observed_mean(residuals, ~np.isnan(residuals)), headers)
+
+    # Mean of the observed residuals of each attribute, 0 when none were observed
+    def observed_mean(self, residuals, observed):
+        return np.where(observed, residuals, 0.0).sum(axis=1) / np.maximum(observed.sum(axis=1), 1)
+
+    def broken_attributes(self, mean_residuals, headers):
+        errors = ~(np.abs(mean_residuals) < 1.5)
+        return [headers[attribute_index] for attribute_index in np.flatnonzero(errors)
+                if not headers[attribute_index].upper() == 'TIME']
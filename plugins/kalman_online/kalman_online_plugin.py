@@ -0,0 +1,19 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+"""
+The Kalman plugin with online filtering on, for plugin dicts of config
+files, which can only name a plugin's path:
+    KnowledgeRepPluginDict = {'Kalman Filter': 'plugins/kalman_online'}
+"""
+
+from plugins.kalman import kalman_plugin
+
+class Plugin(kalman_plugin.Plugin):
+    online = True
@@ -7,10 +7,89 @@
 # Licensed under the NASA Open Source Agreement version 1.3
 # See "NOSA GSC-19165-1 OnAIR.pdf"
 
+import atexit
+import copy
+import queue
+import threading
+import time
 from onair.src.ai_components.ai_plugin_abstract.ai_plugin import AIPlugin
 
+def format_report(report):
+    """Lines of a (component_name, event, details) report; details is None,
+       or the data a verbose report shows"""
+    component_name, event, details = report
+    lines = [f"{component_name}: {event}"]
+    if details != None:
+        if event == 'UPDATE':
+            headers, low_level_data, high_level_data = details
+            lines.append(f" : headers {headers}")
+            lines.append(f" : low_level_data {low_level_data.__class__} = '{low_level_data}'")
+            lines.append(f" : high_level_data {high_level_data.__class__} = '{high_level_data}'")
+        else:
+            low_level_data, high_level_data = details
+            lines.append(f" : My low_level_data is {low_level_data}")
+            lines.append(f" : My high_level_data is {high_level_data}")
+    return lines
+
+class ReportQueue:
+    """
+    Bounded queue of reports printed by a background thread, so reporting
+    never waits on the terminal. Reports that find the queue full are dropped,
+    and the number dropped is printed with the next report.
+    """
+    def __init__(self, max_reports=1024):
+        self.reports = queue.Queue(maxsize=max_reports)
+        self.dropped = 0
+        self.printed_dropped = 0
+        threading.Thread(target=self.print_reports, daemon=True).start()
+
+    def put(self, report):
+        try:
+            self.reports.put_nowait(report)
+        except queue.Full:
+            self.dropped += 1
+
+    def print_reports(self):
+        while True:
+            report = self.reports.get()
+            try:
+                if self.dropped != self.printed_dropped:
+                    print(f"reporter: {self.dropped - self.printed_dropped} reports dropped")
+                    self.printed_dropped = self.dropped
+                for line in format_report(report):
+                    print(line)
+            finally:
+                self.reports.task_done()
+
+    def drain(self):
+        """Waits for every queued report to be printed"""
+        self.reports.join()
+
+# One queue, and thread, is shared by every reporter
+shared_report_queue = None
+
+def get_report_queue():
+    global shared_report_queue
+    if shared_report_queue == None:
+        shared_report_queue = ReportQueue()
+        atexit.register(shared_report_queue.drain)
+    return shared_report_queue
+
 class Plugin(AIPlugin):
     verbose_mode = False
+    # Reports every render, even of a frame already rendered
+    cache_reasoning = False
+    # Only every report_every-th frame is reported, and no more often than
+    # once every report_interval seconds; a frame's render_reasoning is
+    # reported when its update was
+    report_every = 1
+    report_interval = 0.0
+    # Reports go through the shared ReportQueue instead of being printed
+    # while the frame waits
+    queue_reports = False
+    frames_seen = 0
+    last_report = None
+    reporting = True
 
     def update(self, low_level_data=[], high_level_data={}):
         """
@@ -19,18 +98,48 @@ class Plugin(AIPlugin):
         """
         self.low_level_data = low_level_data
         self.high_level_data = high_level_data
-        print(f"{self.component_name}: UPDATE")
-        if self.verbose_mode:
-            print(f" : headers {self.headers}")
-            print(f" : low_level_data {low_level_data.__class__} = '{low_level_data}'")
-            print(f" : high_level_data {high_level_data.__class__} = '{high_level_data}'")
+        self.reporting = self.sample_frame()
+        if self.reporting:
+            details = None
+            if self.verbose_mode:
+                details = (self.headers, ) + self.snapshot()
+            self.report('UPDATE', details)
 
     def render_reasoning(self):
         """
         Reporter outputs that it is reasoning and gives its known low and
         high level data.
         """
-        print(f"{self.component_name}: RENDER_REASONING")
-        if self.verbose_mode:
-            print(f" : My low_level_data is {self.low_level_data}")
-            print(f" : My high_level_data is {self.high_level_data}")
+        if self.reporting:
+            self.report('RENDER_REASONING', self.snapshot() if self.verbose_mode else None)
+
+    def finish(self):
+        """Waits for the queued reports to be printed, as the run is over"""
+        if self.queue_reports and shared_report_queue != None:
+            shared_report_queue.drain()
+
+    def sample_frame(self):
+        """Counts a frame and returns whether it is reported"""
+        self.frames_seen += 1
+        if (self.frames_seen - 1) % self.report_every != 0:
+            return False
+        now = time.monotonic()
+        if self.last_report != None and now - self.last_report < self.report_interval:
+            return False
+        self.last_report = now
+        return True
+
+    def snapshot(self):
+        """(low, high) level data to report; a queued report is formatted
+           later, so it gets copies the next frame cannot change"""
+        if self.queue_reports:
+            return copy.copy(self.low_level_data), copy.copy(self.high_level_data)
+        return self.low_level_data, self.high_level_data
+
+    def report(self, event, details):
+        report = (self.component_name, event, details)
+        if self.queue_reports:
+            get_report_queue().put(report)
+        else:
+            for line in format_report(report):
+                print(line)
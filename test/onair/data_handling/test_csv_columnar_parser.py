@@ -0,0 +1,220 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test CSV Columnar Parser Functionality """
+import pytest
+from unittest.mock import MagicMock
+import numpy as np
+
+import onair.data_handling.csv_columnar_parser as csv_columnar_parser
+from onair.data_handling.csv_columnar_parser import DataSource
+
+@pytest.fixture
+def setup_teardown():
+    pytest.cut = DataSource.__new__(DataSource)
+    yield 'setup_teardown'
+
+# process_data_file tests
+def test_CSV_Columnar_process_data_file_sets_sim_data_and_valid_mask_from_parse_csv_data_and_frame_index_to_zero(mocker, setup_teardown):
+    # Arrange
+    arg_data_file = MagicMock()
+
+    fake_sim_data = MagicMock()
+    fake_valid_mask = MagicMock()
+
+    pytest.cut.use_frame_cache = False
+
+    mocker.patch.object(pytest.cut, 'parse_csv_data', return_value=(fake_sim_data, fake_valid_mask))
+    mocker.patch(csv_columnar_parser.__name__ + '.load_frame_cache')
+    mocker.patch(csv_columnar_parser.__name__ + '.save_frame_cache')
+
+    # Act
+    pytest.cut.process_data_file(arg_data_file)
+
+    # Assert
+    assert pytest.cut.parse_csv_data.call_args_list[0].args == (arg_data_file, )
+    assert pytest.cut.sim_data == fake_sim_data
+    assert pytest.cut.valid_mask == fake_valid_mask
+    assert pytest.cut.frame_index == 0
+    assert csv_columnar_parser.load_frame_cache.call_count == 0
+    assert csv_columnar_parser.save_frame_cache.call_count == 0
+
+def test_CSV_Columnar_process_data_file_uses_frame_cache_without_parsing_when_cache_is_valid(mocker, setup_teardown):
+    # Arrange
+    arg_data_file = MagicMock()
+
+    fake_meta_data_file = MagicMock()
+    fake_sim_data = MagicMock()
+    fake_valid_mask = MagicMock()
+
+    pytest.cut.use_frame_cache = True
+    pytest.cut.meta_data_file = fake_meta_data_file
+
+    mocker.patch.object(pytest.cut, 'parse_csv_data')
+    mocker.patch(csv_columnar_parser.__name__ + '.load_frame_cache', return_value=(fake_sim_data, fake_valid_mask))
+    mocker.patch(csv_columnar_parser.__name__ + '.save_frame_cache')
+
+    # Act
+    pytest.cut.process_data_file(arg_data_file)
+
+    # Assert
+    assert csv_columnar_parser.load_frame_cache.call_args_list[0].args == (arg_data_file, fake_meta_data_file, pytest.cut.dtype)
+    assert pytest.cut.parse_csv_data.call_count == 0
+    assert csv_columnar_parser.save_frame_cache.call_count == 0
+    assert pytest.cut.sim_data == fake_sim_data
+    assert pytest.cut.valid_mask == fake_valid_mask
+    assert pytest.cut.frame_index == 0
+
+def test_CSV_Columnar_process_data_file_parses_and_saves_frame_cache_when_cache_is_missing_or_stale(mocker, setup_teardown):
+    # Arrange
+    arg_data_file = MagicMock()
+
+    fake_meta_data_file = MagicMock()
+    fake_sim_data = MagicMock()
+    fake_valid_mask = MagicMock()
+
+    pytest.cut.use_frame_cache = True
+    pytest.cut.meta_data_file = fake_meta_data_file
+
+    mocker.patch.object(pytest.cut, 'parse_csv_data', return_value=(fake_sim_data, fake_valid_mask))
+    mocker.patch(csv_columnar_parser.__name__ + '.load_frame_cache', return_value=None)
+    mocker.patch(csv_columnar_parser.__name__ + '.save_frame_cache')
+
+    # Act
+    pytest.cut.process_data_file(arg_data_file)
+
+    # Assert
+    assert pytest.cut.parse_csv_data.call_args_list[0].args == (arg_data_file, )
+    assert csv_columnar_parser.save_frame_cache.call_count == 1
+    assert csv_columnar_parser.save_frame_cache.call_args_list[0].args == (arg_data_file, fake_meta_data_file, fake_sim_data, fake_valid_mask)
+    assert pytest.cut.sim_data == fake_sim_data
+    assert pytest.cut.valid_mask == fake_valid_mask
+
+# parse_csv_data tests
+def test_CSV_Columnar_parse_csv_data_returns_empty_arrays_of_header_width_when_dataset_is_just_headers(mocker, setup_teardown):
+    # Arrange
+    arg_data_file = MagicMock()
+
+    fake_csv_file = MagicMock()
+    fake_width = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+    fake_dataset = iter([['header'] * fake_width])
+
+    mocker.patch(csv_columnar_parser.__name__ + '.open', return_value=fake_csv_file)
+    mocker.patch(csv_columnar_parser.__name__ + '.csv.reader', return_value=fake_dataset)
+    mocker.patch.object(pytest.cut, 'columnize')
+
+    # Act
+    result_data, result_mask = pytest.cut.parse_csv_data(arg_data_file)
+
+    # Assert
+    assert csv_columnar_parser.open.call_args_list[0].args == (arg_data_file, 'r')
+    assert csv_columnar_parser.open.call_args_list[0].kwargs == {'newline':''}
+    assert pytest.cut.columnize.call_count == 0
+    assert result_data.shape == (0, fake_width)
+    assert result_data.dtype == DataSource.dtype
+    assert result_mask.shape == (0, fake_width)
+
+def test_CSV_Columnar_parse_csv_data_columnizes_rows_in_chunks_and_concatenates_results(mocker, setup_teardown):
+    # Arrange
+    arg_data_file = MagicMock()
+
+    fake_csv_file = MagicMock()
+    fake_chunk_rows = pytest.gen.randint(1, 5) # arbitrary, from 1 to 5
+    fake_num_rows = pytest.gen.randint(1, 20) # arbitrary, from 1 to 20
+    fake_rows = [[str(i), str(i * 2)] for i in range(fake_num_rows)]
+    fake_dataset = iter([['a', 'b']] + fake_rows)
+
+    pytest.cut.chunk_rows = fake_chunk_rows
+    pytest.cut.dtype = np.float64
+
+    mocker.patch(csv_columnar_parser.__name__ + '.open', return_value=fake_csv_file)
+    mocker.patch(csv_columnar_parser.__name__ + '.csv.reader', return_value=fake_dataset)
+    mocker.patch.object(pytest.cut, 'columnize', side_effect=lambda rows, width, column_types: (np.array(rows, dtype=float), np.ones((len(rows), width), dtype=bool)))
+
+    # Act
+    result_data, result_mask = pytest.cut.parse_csv_data(arg_data_file)
+
+    # Assert
+    assert pytest.cut.columnize.call_count == -(-fake_num_rows // fake_chunk_rows)
+    for call in pytest.cut.columnize.call_args_list:
+        assert call.args[1] == 2
+        assert call.args[2] == [csv_columnar_parser.FLOAT_COLUMN, csv_columnar_parser.FLOAT_COLUMN]
+    assert result_data.tolist() == [[float(i), float(i * 2)] for i in range(fake_num_rows)]
+    assert result_mask.all()
+
+# columnize tests
+def test_CSV_Columnar_columnize_converts_each_column_with_its_type_and_marks_unparseable_cells_invalid(setup_teardown):
+    # Arrange
+    arg_rows = [['0:01', '1.5', 'abc'],
+                ['0:02', '-2', '3'],
+                ['0:03', '1e3']]
+    arg_width = 3
+    arg_column_types = [csv_columnar_parser.MIN_SEC_COLUMN,
+                        csv_columnar_parser.FLOAT_COLUMN,
+                        csv_columnar_parser.GENERIC_COLUMN]
+
+    pytest.cut.dtype = np.float64
+
+    expected_data = [[csv_columnar_parser.convert_str_to_timestamp('0:01'), 1.5, 0.0],
+                     [csv_columnar_parser.convert_str_to_timestamp('0:02'), -2.0, 3.0],
+                     [csv_columnar_parser.convert_str_to_timestamp('0:03'), 1000.0, 0.0]]
+    expected_mask = [[True, True, False],
+                     [True, True, True],
+                     [True, True, False]]
+
+    # Act
+    result_data, result_mask = pytest.cut.columnize(arg_rows, arg_width, arg_column_types)
+
+    # Assert
+    assert result_data.tolist() == expected_data
+    assert result_mask.tolist() == expected_mask
+
+def test_CSV_Columnar_columnize_uses_class_dtype(setup_teardown):
+    # Arrange
+    pytest.cut.dtype = np.float32
+
+    # Act
+    result_data, result_mask = pytest.cut.columnize([['1', '2']], 2, [csv_columnar_parser.FLOAT_COLUMN] * 2)
+
+    # Assert
+    assert result_data.dtype == np.float32
+    assert result_data.flags['C_CONTIGUOUS']
+
+# get_next tests
+def test_CSV_Columnar_get_next_increments_index_and_returns_row_view(setup_teardown):
+    # Arrange
+    fake_sim_data = np.arange(12, dtype=float).reshape(4, 3)
+    fake_frame_index = pytest.gen.randint(0, 3) # arbitrary, from 0 to 3
+
+    pytest.cut.sim_data = fake_sim_data
+    pytest.cut.frame_index = fake_frame_index
+
+    # Act
+    result = pytest.cut.get_next()
+
+    # Assert
+    assert result.tolist() == fake_sim_data[fake_frame_index].tolist()
+    assert np.shares_memory(result, fake_sim_data)
+    assert pytest.cut.frame_index == fake_frame_index + 1
+
+# get_validity tests
+def test_CSV_Columnar_get_validity_returns_mask_of_last_returned_frame(setup_teardown):
+    # Arrange
+    fake_valid_mask = MagicMock()
+    fake_frame_index = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+
+    pytest.cut.valid_mask = fake_valid_mask
+    pytest.cut.frame_index = fake_frame_index
+
+    # Act
+    result = pytest.cut.get_validity()
+
+    # Assert
+    assert fake_valid_mask.__getitem__.call_args_list[0].args == (fake_frame_index - 1, )
+    assert result == fake_valid_mask.__getitem__.return_value
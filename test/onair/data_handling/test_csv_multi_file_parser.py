@@ -0,0 +1,302 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test CSV Multi-File Parser Functionality """
+import pytest
+from unittest.mock import MagicMock
+
+import onair.data_handling.csv_multi_file_parser as csv_multi_file_parser
+from onair.data_handling.csv_multi_file_parser import DataSource
+
+@pytest.fixture
+def setup_teardown():
+    pytest.cut = DataSource.__new__(DataSource)
+    yield 'setup_teardown'
+
+# process_data_file tests
+def test_CSV_Multi_File_process_data_file_lists_files_starts_prefetcher_and_moves_to_first_file(mocker, setup_teardown):
+    # Arrange
+    arg_data_file = MagicMock()
+    fake_data_files = [MagicMock()]
+    fake_prefetcher = MagicMock()
+
+    mocker.patch.object(pytest.cut, 'list_data_files', return_value=fake_data_files)
+    mocker.patch(csv_multi_file_parser.__name__ + '.ThreadPoolExecutor', return_value=fake_prefetcher)
+    mocker.patch.object(pytest.cut, 'next_file')
+
+    # Act
+    pytest.cut.process_data_file(arg_data_file)
+
+    # Assert
+    assert pytest.cut.list_data_files.call_args_list[0].args == (arg_data_file, )
+    assert pytest.cut.data_files == fake_data_files
+    assert csv_multi_file_parser.ThreadPoolExecutor.call_args_list[0].kwargs == {'max_workers':1}
+    assert pytest.cut.prefetcher == fake_prefetcher
+    assert pytest.cut.pending_file == None
+    assert pytest.cut.file_index == -1
+    assert pytest.cut.file_boundary == False
+    assert pytest.cut.next_file.call_count == 1
+
+def test_CSV_Multi_File_process_data_file_does_not_start_prefetcher_when_prefetch_next_file_is_False(mocker, setup_teardown):
+    # Arrange
+    pytest.cut.prefetch_next_file = False
+
+    mocker.patch.object(pytest.cut, 'list_data_files', return_value=[MagicMock()])
+    mocker.patch(csv_multi_file_parser.__name__ + '.ThreadPoolExecutor')
+    mocker.patch.object(pytest.cut, 'next_file')
+
+    # Act
+    pytest.cut.process_data_file(MagicMock())
+
+    # Assert
+    assert csv_multi_file_parser.ThreadPoolExecutor.call_count == 0
+    assert pytest.cut.prefetcher == None
+
+def test_CSV_Multi_File_process_data_file_raises_FileNotFoundError_when_no_files_are_found(mocker, setup_teardown):
+    # Arrange
+    arg_data_file = str(MagicMock())
+
+    mocker.patch.object(pytest.cut, 'list_data_files', return_value=[])
+
+    # Act
+    with pytest.raises(FileNotFoundError) as e_info:
+        pytest.cut.process_data_file(arg_data_file)
+
+    # Assert
+    assert e_info.match(f"No telemetry files found for '{arg_data_file}'.")
+
+# list_data_files tests
+def test_CSV_Multi_File_list_data_files_returns_sorted_csv_files_of_directory(setup_teardown, tmp_path):
+    # Arrange
+    for name in ['b.csv', 'a.csv', 'c.txt']:
+        (tmp_path / name).write_text('')
+
+    # Act
+    result = pytest.cut.list_data_files(str(tmp_path))
+
+    # Assert
+    assert result == [str(tmp_path / 'a.csv'), str(tmp_path / 'b.csv')]
+
+def test_CSV_Multi_File_list_data_files_returns_sorted_files_matching_glob(setup_teardown, tmp_path):
+    # Arrange
+    for name in ['run_2.csv', 'run_1.csv', 'other_1.csv']:
+        (tmp_path / name).write_text('')
+
+    # Act
+    result = pytest.cut.list_data_files(str(tmp_path / 'run_*.csv'))
+
+    # Assert
+    assert result == [str(tmp_path / 'run_1.csv'), str(tmp_path / 'run_2.csv')]
+
+# next_file tests
+def test_CSV_Multi_File_next_file_skips_empty_files_and_loads_next_file_with_frames(mocker, setup_teardown):
+    # Arrange
+    fake_frames = [MagicMock()]
+    fake_num_empty = pytest.gen.randint(0, 3) # arbitrary, from 0 to 3
+
+    pytest.cut.data_files = [MagicMock() for _ in range(fake_num_empty + 2)]
+    pytest.cut.file_index = -1
+    pytest.cut.frame_index = MagicMock()
+
+    mocker.patch.object(pytest.cut, 'load_file', side_effect=[[]] * fake_num_empty + [fake_frames])
+    mocker.patch.object(pytest.cut, 'close')
+
+    # Act
+    pytest.cut.next_file()
+
+    # Assert
+    assert pytest.cut.load_file.call_count == fake_num_empty + 1
+    for i in range(fake_num_empty + 1):
+        assert pytest.cut.load_file.call_args_list[i].args == (i, )
+    assert pytest.cut.file_index == fake_num_empty
+    assert pytest.cut.sim_data == fake_frames
+    assert pytest.cut.frame_index == 0
+    assert pytest.cut.close.call_count == 0
+
+def test_CSV_Multi_File_next_file_closes_when_no_files_are_left(mocker, setup_teardown):
+    # Arrange
+    pytest.cut.data_files = [MagicMock()]
+    pytest.cut.file_index = 0
+
+    mocker.patch.object(pytest.cut, 'load_file')
+    mocker.patch.object(pytest.cut, 'close')
+
+    # Act
+    pytest.cut.next_file()
+
+    # Assert
+    assert pytest.cut.load_file.call_count == 0
+    assert pytest.cut.sim_data == []
+    assert pytest.cut.close.call_count == 1
+
+# load_file tests
+def test_CSV_Multi_File_load_file_takes_prefetched_frames_and_prefetches_following_file(mocker, setup_teardown):
+    # Arrange
+    fake_pending_file = MagicMock()
+    fake_next_pending_file = MagicMock()
+    fake_prefetcher = MagicMock()
+    fake_prefetcher.submit.return_value = fake_next_pending_file
+
+    pytest.cut.data_files = [MagicMock(), MagicMock()]
+    pytest.cut.pending_file = fake_pending_file
+    pytest.cut.prefetcher = fake_prefetcher
+
+    mocker.patch.object(pytest.cut, 'parse_csv_data')
+
+    # Act
+    result = pytest.cut.load_file(0)
+
+    # Assert
+    assert result == fake_pending_file.result.return_value
+    assert pytest.cut.parse_csv_data.call_count == 0
+    assert fake_prefetcher.submit.call_args_list[0].args == (pytest.cut.parse_csv_data, pytest.cut.data_files[1])
+    assert pytest.cut.pending_file == fake_next_pending_file
+
+def test_CSV_Multi_File_load_file_parses_file_directly_and_does_not_prefetch_without_prefetcher(mocker, setup_teardown):
+    # Arrange
+    fake_frames = MagicMock()
+
+    pytest.cut.data_files = [MagicMock(), MagicMock()]
+    pytest.cut.pending_file = None
+    pytest.cut.prefetcher = None
+
+    mocker.patch.object(pytest.cut, 'parse_csv_data', return_value=fake_frames)
+
+    # Act
+    result = pytest.cut.load_file(0)
+
+    # Assert
+    assert result == fake_frames
+    assert pytest.cut.parse_csv_data.call_args_list[0].args == (pytest.cut.data_files[0], )
+    assert pytest.cut.pending_file == None
+
+def test_CSV_Multi_File_load_file_does_not_prefetch_past_last_file(mocker, setup_teardown):
+    # Arrange
+    fake_prefetcher = MagicMock()
+
+    pytest.cut.data_files = [MagicMock()]
+    pytest.cut.pending_file = None
+    pytest.cut.prefetcher = fake_prefetcher
+
+    mocker.patch.object(pytest.cut, 'parse_csv_data')
+
+    # Act
+    pytest.cut.load_file(0)
+
+    # Assert
+    assert fake_prefetcher.submit.call_count == 0
+    assert pytest.cut.pending_file == None
+
+# close tests
+def test_CSV_Multi_File_close_cancels_pending_file_shuts_down_prefetcher_and_drops_pending_file(setup_teardown):
+    # Arrange
+    fake_prefetcher = MagicMock()
+    fake_pending_file = MagicMock()
+
+    pytest.cut.prefetcher = fake_prefetcher
+    pytest.cut.pending_file = fake_pending_file
+
+    # Act
+    pytest.cut.close()
+
+    # Assert
+    assert fake_pending_file.cancel.call_count == 1
+    assert fake_prefetcher.shutdown.call_count == 1
+    assert fake_prefetcher.shutdown.call_args_list[0].args == ()
+    assert fake_prefetcher.shutdown.call_args_list[0].kwargs == {'wait':False}
+    assert pytest.cut.prefetcher == None
+    assert pytest.cut.pending_file == None
+
+# get_current_file tests
+def test_CSV_Multi_File_get_current_file_returns_file_at_file_index(setup_teardown):
+    # Arrange
+    pytest.cut.data_files = [MagicMock(), MagicMock(), MagicMock()]
+    pytest.cut.file_index = pytest.gen.randint(0, 2)
+
+    # Act
+    result = pytest.cut.get_current_file()
+
+    # Assert
+    assert result == pytest.cut.data_files[pytest.cut.file_index]
+
+# get_next tests
+def test_CSV_Multi_File_get_next_marks_file_boundary_only_on_first_frame_of_file(mocker, setup_teardown):
+    # Arrange
+    fake_frames = [MagicMock(), MagicMock()]
+
+    pytest.cut.sim_data = fake_frames
+    pytest.cut.frame_index = 0
+
+    mocker.patch.object(pytest.cut, 'next_file')
+
+    # Act
+    first_result = pytest.cut.get_next()
+    first_boundary = pytest.cut.file_boundary
+    second_result = pytest.cut.get_next()
+
+    # Assert
+    assert first_result == fake_frames[0]
+    assert first_boundary == True
+    assert second_result == fake_frames[1]
+    assert pytest.cut.file_boundary == False
+    assert pytest.cut.next_file.call_count == 0
+
+def test_CSV_Multi_File_get_next_moves_to_next_file_when_current_file_is_used_up(mocker, setup_teardown):
+    # Arrange
+    fake_frame = MagicMock()
+
+    pytest.cut.sim_data = [MagicMock()]
+    pytest.cut.frame_index = 1
+
+    def fake_next_file():
+        pytest.cut.sim_data = [fake_frame]
+        pytest.cut.frame_index = 0
+    mocker.patch.object(pytest.cut, 'next_file', side_effect=fake_next_file)
+
+    # Act
+    result = pytest.cut.get_next()
+
+    # Assert
+    assert pytest.cut.next_file.call_count == 1
+    assert result == fake_frame
+    assert pytest.cut.file_boundary == True
+
+# has_more tests
+def test_CSV_Multi_File_has_more_returns_true_without_moving_files_when_current_file_has_frames(mocker, setup_teardown):
+    # Arrange
+    pytest.cut.sim_data = [MagicMock(), MagicMock()]
+    pytest.cut.frame_index = 1
+
+    mocker.patch.object(pytest.cut, 'next_file')
+
+    # Act
+    result = pytest.cut.has_more()
+
+    # Assert
+    assert result == True
+    assert pytest.cut.next_file.call_count == 0
+
+def test_CSV_Multi_File_has_more_returns_whether_next_file_has_frames_when_current_file_is_used_up(mocker, setup_teardown):
+    # Arrange
+    fake_next_frames = pytest.gen.choice([[], [MagicMock()]])
+
+    pytest.cut.sim_data = [MagicMock()]
+    pytest.cut.frame_index = 1
+
+    def fake_next_file():
+        pytest.cut.sim_data = fake_next_frames
+        pytest.cut.frame_index = 0
+    mocker.patch.object(pytest.cut, 'next_file', side_effect=fake_next_file)
+
+    # Act
+    result = pytest.cut.has_more()
+
+    # Assert
+    assert pytest.cut.next_file.call_count == 1
+    assert result == (len(fake_next_frames) > 0)
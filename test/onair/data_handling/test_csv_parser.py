@@ -44,16 +44,13 @@ def test_CSV_parse_csv_data_returns_empty_list_when_parsed_dataset_is_empty(mock
     fake_csv_file = MagicMock()
     fake_csv_file.configure_mock(**{'__enter__.return_value': fake_file_iterator})
     fake_dataset = []
-    forced_return_contains = MagicMock()
-    fake_second_data_set = MagicMock()
-    fake_second_data_set.columns = MagicMock()
-    fake_second_data_set.columns.values = set()
 
     expected_result = []
 
     mocker.patch(csv_parser.__name__ + '.open', return_value = fake_csv_file)
     mocker.patch(csv_parser.__name__ + '.csv.reader', return_value = fake_dataset)
-    mocker.patch(csv_parser.__name__ + '.floatify_input')
+    mocker.patch(csv_parser.__name__ + '.infer_column_types')
+    mocker.patch(csv_parser.__name__ + '.floatify_rows')
 
     # Act
     result = pytest.cut.parse_csv_data(arg_dataFile)
@@ -65,7 +62,8 @@ def test_CSV_parse_csv_data_returns_empty_list_when_parsed_dataset_is_empty(mock
     assert csv_parser.csv.reader.call_count == 1
     assert csv_parser.csv.reader.call_args_list[0].args == (fake_file_iterator, )
     assert csv_parser.csv.reader.call_args_list[0].kwargs == ({'delimiter':','})
-    assert csv_parser.floatify_input.call_count == 0
+    assert csv_parser.infer_column_types.call_count == 0
+    assert csv_parser.floatify_rows.call_count == 0
 
     assert result == expected_result
 
@@ -77,16 +75,13 @@ def test_CSV_parse_csv_data_returns_empty_list_when_parsed_dataset_is_just_heade
     fake_csv_file = MagicMock()
     fake_csv_file.configure_mock(**{'__enter__.return_value': fake_file_iterator})
     fake_dataset = [['fake column header', 'another fake column header']]
-    forced_return_contains = MagicMock()
-    fake_second_data_set = MagicMock()
-    fake_second_data_set.columns = MagicMock()
-    fake_second_data_set.columns.values = set()
 
     expected_result = []
 
     mocker.patch(csv_parser.__name__ + '.open', return_value = fake_csv_file)
     mocker.patch(csv_parser.__name__ + '.csv.reader', return_value = fake_dataset)
-    mocker.patch(csv_parser.__name__ + '.floatify_input')
+    mocker.patch(csv_parser.__name__ + '.infer_column_types')
+    mocker.patch(csv_parser.__name__ + '.floatify_rows')
 
     # Act
     result = pytest.cut.parse_csv_data(arg_dataFile)
@@ -97,7 +92,8 @@ def test_CSV_parse_csv_data_returns_empty_list_when_parsed_dataset_is_just_heade
     assert csv_parser.csv.reader.call_count == 1
     assert csv_parser.csv.reader.call_args_list[0].args == (fake_file_iterator, )
     assert csv_parser.csv.reader.call_args_list[0].kwargs == ({'delimiter':','})
-    assert csv_parser.floatify_input.call_count == 0
+    assert csv_parser.infer_column_types.call_count == 0
+    assert csv_parser.floatify_rows.call_count == 0
 
     assert result == expected_result
 
@@ -118,10 +114,16 @@ def test_CSV_parse_csv_data_returns_list_of_row_values_when_parsed_dataset(mocke
             fake_row_values.append(pytest.gen.randint(1, 10)) # arbitrary, from 1 to 10 as a value in row
         fake_dataset.append([i, fake_row_values])
         expected_result_list.append(fake_row_values)
+    fake_chunk_rows = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+    fake_column_types = MagicMock()
+    expected_chunks = [fake_dataset[1:][i:i + fake_chunk_rows] for i in range(0, num_fake_rows, fake_chunk_rows)]
+
+    pytest.cut.chunk_rows = fake_chunk_rows
 
     mocker.patch(csv_parser.__name__ + '.open', return_value = fake_csv_file)
     mocker.patch(csv_parser.__name__ + '.csv.reader', return_value = fake_dataset)
-    mocker.patch(csv_parser.__name__ + '.floatify_input', side_effect = expected_result_list)
+    mocker.patch(csv_parser.__name__ + '.infer_column_types', return_value = fake_column_types)
+    mocker.patch(csv_parser.__name__ + '.floatify_rows', side_effect = [expected_result_list[i:i + fake_chunk_rows] for i in range(0, num_fake_rows, fake_chunk_rows)])
 
     # Act
     result = pytest.cut.parse_csv_data(arg_dataFile)
@@ -132,7 +134,11 @@ def test_CSV_parse_csv_data_returns_list_of_row_values_when_parsed_dataset(mocke
     assert csv_parser.csv.reader.call_count == 1
     assert csv_parser.csv.reader.call_args_list[0].args == (fake_file_iterator, )
     assert csv_parser.csv.reader.call_args_list[0].kwargs == ({'delimiter':','})
-    assert csv_parser.floatify_input.call_count == num_fake_rows
+    assert csv_parser.infer_column_types.call_count == 1
+    assert csv_parser.infer_column_types.call_args_list[0].args == (expected_chunks[0], )
+    assert csv_parser.floatify_rows.call_count == len(expected_chunks)
+    for i in range(len(expected_chunks)):
+        assert csv_parser.floatify_rows.call_args_list[i].args == (expected_chunks[i], fake_column_types)
 
     assert result == expected_result_list
 
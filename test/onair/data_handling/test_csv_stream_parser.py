@@ -0,0 +1,370 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test CSV Stream Parser Functionality """
+import pytest
+from unittest.mock import MagicMock
+from collections import deque
+
+import onair.data_handling.csv_stream_parser as csv_stream_parser
+from onair.data_handling.csv_stream_parser import DataSource
+
+@pytest.fixture
+def setup_teardown():
+    pytest.cut = DataSource.__new__(DataSource)
+    yield 'setup_teardown'
+
+# process_data_file tests
+def test_CSV_Stream_process_data_file_resets_stream_state_and_opens_data_file(mocker, setup_teardown):
+    # Arrange
+    arg_data_file = MagicMock()
+
+    mocker.patch.object(pytest.cut, 'open_data_file')
+
+    # Act
+    pytest.cut.process_data_file(arg_data_file)
+
+    # Assert
+    assert pytest.cut.data_file == arg_data_file
+    assert pytest.cut.column_types == None
+    assert pytest.cut.time_index == None
+    assert pytest.cut.end_time == None
+    assert pytest.cut.open_data_file.call_count == 1
+    assert pytest.cut.open_data_file.call_args_list[0].args == ()
+
+# open_data_file tests
+def test_CSV_Stream_open_data_file_opens_buffered_reader_skips_headers_and_fills_read_ahead_when_offset_not_given(mocker, setup_teardown):
+    # Arrange
+    fake_data_file = MagicMock()
+    fake_csv_file = MagicMock()
+    fake_dataset = iter([['fake column header', 'another fake column header']])
+
+    pytest.cut.data_file = fake_data_file
+
+    mocker.patch(csv_stream_parser.__name__ + '.open', return_value=fake_csv_file)
+    mocker.patch(csv_stream_parser.__name__ + '.csv.reader', return_value=fake_dataset)
+    mocker.patch.object(pytest.cut, 'fill_read_ahead')
+
+    # Act
+    pytest.cut.open_data_file()
+
+    # Assert
+    assert csv_stream_parser.open.call_count == 1
+    assert csv_stream_parser.open.call_args_list[0].args == (fake_data_file, 'r')
+    assert csv_stream_parser.open.call_args_list[0].kwargs == {'newline':'', 'buffering':DataSource.read_buffer_size}
+    assert csv_stream_parser.csv.reader.call_count == 1
+    assert csv_stream_parser.csv.reader.call_args_list[0].args == (fake_csv_file, )
+    assert csv_stream_parser.csv.reader.call_args_list[0].kwargs == {'delimiter':','}
+    assert next(pytest.cut.dataset, None) == None
+    assert fake_csv_file.seek.call_count == 0
+    assert pytest.cut.read_ahead == deque()
+    assert pytest.cut.frame_index == 0
+    assert pytest.cut.fill_read_ahead.call_count == 1
+
+def test_CSV_Stream_open_data_file_seeks_to_offset_without_skipping_a_row_and_sets_frame_index_when_offset_given(mocker, setup_teardown):
+    # Arrange
+    arg_offset = pytest.gen.randint(1, 1000) # arbitrary, from 1 to 1000
+    arg_frame_index = pytest.gen.randint(1, 1000) # arbitrary, from 1 to 1000
+    fake_csv_file = MagicMock()
+    fake_row = MagicMock()
+
+    pytest.cut.data_file = MagicMock()
+
+    mocker.patch(csv_stream_parser.__name__ + '.open', return_value=fake_csv_file)
+    mocker.patch(csv_stream_parser.__name__ + '.csv.reader', return_value=iter([fake_row]))
+    mocker.patch.object(pytest.cut, 'fill_read_ahead')
+
+    # Act
+    pytest.cut.open_data_file(arg_offset, arg_frame_index)
+
+    # Assert
+    assert fake_csv_file.seek.call_count == 1
+    assert fake_csv_file.seek.call_args_list[0].args == (arg_offset, )
+    assert next(pytest.cut.dataset) == fake_row
+    assert pytest.cut.frame_index == arg_frame_index
+    assert pytest.cut.fill_read_ahead.call_count == 1
+
+# fill_read_ahead tests
+def test_CSV_Stream_fill_read_ahead_floatifies_rows_up_to_read_ahead_frames_without_closing(mocker, setup_teardown):
+    # Arrange
+    fake_read_ahead_frames = pytest.gen.randint(2, 10) # arbitrary, from 2 to 10
+    fake_num_buffered = pytest.gen.randint(0, fake_read_ahead_frames - 1)
+    fake_buffered = [MagicMock() for _ in range(fake_num_buffered)]
+    fake_rows = [[str(i)] for i in range(fake_read_ahead_frames + 1)]
+    fake_column_types = MagicMock()
+    fake_floatified = [MagicMock() for _ in range(fake_read_ahead_frames - fake_num_buffered)]
+
+    pytest.cut.read_ahead_frames = fake_read_ahead_frames
+    pytest.cut.read_ahead = deque(fake_buffered)
+    pytest.cut.dataset = iter(fake_rows)
+    pytest.cut.column_types = None
+
+    mocker.patch(csv_stream_parser.__name__ + '.infer_column_types', return_value=fake_column_types)
+    mocker.patch(csv_stream_parser.__name__ + '.floatify_rows', return_value=fake_floatified)
+    mocker.patch.object(pytest.cut, 'close')
+
+    # Act
+    pytest.cut.fill_read_ahead()
+
+    # Assert
+    expected_rows = fake_rows[:fake_read_ahead_frames - fake_num_buffered]
+    assert csv_stream_parser.infer_column_types.call_args_list[0].args == (expected_rows, )
+    assert csv_stream_parser.floatify_rows.call_count == 1
+    assert csv_stream_parser.floatify_rows.call_args_list[0].args == (expected_rows, fake_column_types)
+    assert pytest.cut.column_types == fake_column_types
+    assert list(pytest.cut.read_ahead) == fake_buffered + fake_floatified
+    assert pytest.cut.close.call_count == 0
+
+def test_CSV_Stream_fill_read_ahead_reuses_inferred_column_types(mocker, setup_teardown):
+    # Arrange
+    fake_column_types = MagicMock()
+
+    pytest.cut.read_ahead_frames = 1
+    pytest.cut.read_ahead = deque()
+    pytest.cut.dataset = iter([['1']])
+    pytest.cut.column_types = fake_column_types
+
+    mocker.patch(csv_stream_parser.__name__ + '.infer_column_types')
+    mocker.patch(csv_stream_parser.__name__ + '.floatify_rows', return_value=[[1.0]])
+
+    # Act
+    pytest.cut.fill_read_ahead()
+
+    # Assert
+    assert csv_stream_parser.infer_column_types.call_count == 0
+    assert csv_stream_parser.floatify_rows.call_args_list[0].args == ([['1']], fake_column_types)
+
+def test_CSV_Stream_fill_read_ahead_closes_file_when_rows_run_out(mocker, setup_teardown):
+    # Arrange
+    fake_num_rows = pytest.gen.randint(0, 5) # arbitrary, from 0 to 5
+    fake_rows = [[str(i)] for i in range(fake_num_rows)]
+    fake_csv_file = MagicMock()
+
+    pytest.cut.read_ahead_frames = fake_num_rows + 1
+    pytest.cut.read_ahead = deque()
+    pytest.cut.dataset = iter(fake_rows)
+    pytest.cut.csv_file = fake_csv_file
+    pytest.cut.column_types = None
+
+    mocker.patch(csv_stream_parser.__name__ + '.floatify_rows', side_effect=lambda rows, column_types: rows)
+
+    # Act
+    pytest.cut.fill_read_ahead()
+
+    # Assert
+    assert list(pytest.cut.read_ahead) == fake_rows
+    assert fake_csv_file.close.call_count == 1
+    assert pytest.cut.dataset == None
+
+def test_CSV_Stream_fill_read_ahead_does_nothing_when_already_closed(mocker, setup_teardown):
+    # Arrange
+    pytest.cut.read_ahead_frames = 10
+    pytest.cut.read_ahead = deque()
+    pytest.cut.dataset = None
+
+    mocker.patch(csv_stream_parser.__name__ + '.floatify_rows')
+
+    # Act
+    pytest.cut.fill_read_ahead()
+
+    # Assert
+    assert csv_stream_parser.floatify_rows.call_count == 0
+    assert len(pytest.cut.read_ahead) == 0
+
+# get_next tests
+def test_CSV_Stream_get_next_returns_oldest_frame_and_increments_index_without_refill_when_frames_remain(mocker, setup_teardown):
+    # Arrange
+    fake_frames = [MagicMock(), MagicMock()]
+    fake_frame_index = pytest.gen.randint(0, 100) # arbitrary, from 0 to 100
+
+    pytest.cut.read_ahead = deque(fake_frames)
+    pytest.cut.frame_index = fake_frame_index
+
+    mocker.patch.object(pytest.cut, 'fill_read_ahead')
+
+    # Act
+    result = pytest.cut.get_next()
+
+    # Assert
+    assert result == fake_frames[0]
+    assert pytest.cut.frame_index == fake_frame_index + 1
+    assert pytest.cut.fill_read_ahead.call_count == 0
+
+def test_CSV_Stream_get_next_refills_read_ahead_when_last_frame_is_taken(mocker, setup_teardown):
+    # Arrange
+    fake_frame = MagicMock()
+
+    pytest.cut.read_ahead = deque([fake_frame])
+    pytest.cut.frame_index = 0
+
+    mocker.patch.object(pytest.cut, 'fill_read_ahead')
+
+    # Act
+    result = pytest.cut.get_next()
+
+    # Assert
+    assert result == fake_frame
+    assert pytest.cut.fill_read_ahead.call_count == 1
+
+# seek tests
+def test_CSV_Stream_seek_loads_time_index_once_and_reopens_at_index_entry_then_skips_frames_before_target(mocker, setup_teardown):
+    # Arrange
+    arg_time = MagicMock()
+    fake_target = 5.0
+    fake_entry = pytest.gen.randint(0, 2) # arbitrary, from 0 to 2
+    fake_index = {'times':[0.0, 4.0, 8.0], 'offsets':[10, 20, 30], 'rows':[0, 4, 8]}
+    fake_frames = [[3.0], [4.0], [5.0], [6.0]]
+
+    pytest.cut.data_file = MagicMock()
+    pytest.cut.time_index = None
+    pytest.cut.end_time = None
+
+    def fake_open_data_file(offset, frame_index):
+        pytest.cut.read_ahead = deque(fake_frames)
+    mocker.patch(csv_stream_parser.__name__ + '.to_time', return_value=fake_target)
+    mocker.patch(csv_stream_parser.__name__ + '.load_time_index', return_value=fake_index)
+    mocker.patch(csv_stream_parser.__name__ + '.find_index_entry', return_value=fake_entry)
+    mocker.patch.object(pytest.cut, 'close')
+    mocker.patch.object(pytest.cut, 'open_data_file', side_effect=fake_open_data_file)
+    mocker.patch.object(pytest.cut, 'fill_read_ahead')
+    pytest.cut.frame_index = 0
+
+    # Act
+    pytest.cut.seek(arg_time)
+
+    # Assert
+    assert csv_stream_parser.to_time.call_args_list[0].args == (arg_time, )
+    assert csv_stream_parser.load_time_index.call_count == 1
+    assert csv_stream_parser.load_time_index.call_args_list[0].args == (pytest.cut.data_file, DataSource.time_column, DataSource.index_interval)
+    assert pytest.cut.time_index == fake_index
+    assert pytest.cut.close.call_count == 1
+    assert csv_stream_parser.find_index_entry.call_args_list[0].args == (fake_index, fake_target)
+    assert pytest.cut.open_data_file.call_args_list[0].args == (fake_index['offsets'][fake_entry], fake_index['rows'][fake_entry])
+    assert list(pytest.cut.read_ahead) == [[5.0], [6.0]]
+
+def test_CSV_Stream_seek_reuses_loaded_time_index_and_empties_stream_when_index_has_no_entries(mocker, setup_teardown):
+    # Arrange
+    fake_index = {'times':[], 'offsets':[], 'rows':[]}
+
+    pytest.cut.time_index = fake_index
+    pytest.cut.read_ahead = deque([MagicMock()])
+
+    mocker.patch(csv_stream_parser.__name__ + '.to_time')
+    mocker.patch(csv_stream_parser.__name__ + '.load_time_index')
+    mocker.patch.object(pytest.cut, 'close')
+    mocker.patch.object(pytest.cut, 'open_data_file')
+
+    # Act
+    pytest.cut.seek(MagicMock())
+
+    # Assert
+    assert csv_stream_parser.load_time_index.call_count == 0
+    assert pytest.cut.close.call_count == 1
+    assert pytest.cut.open_data_file.call_count == 0
+    assert pytest.cut.read_ahead == deque()
+
+# set_run_window tests
+def test_CSV_Stream_set_run_window_sets_end_time_and_seeks_to_start_time(mocker, setup_teardown):
+    # Arrange
+    arg_start_time = MagicMock()
+    arg_end_time = MagicMock()
+    fake_end_time = MagicMock()
+
+    mocker.patch(csv_stream_parser.__name__ + '.to_time', return_value=fake_end_time)
+    mocker.patch.object(pytest.cut, 'seek')
+
+    # Act
+    pytest.cut.set_run_window(arg_start_time, arg_end_time)
+
+    # Assert
+    assert csv_stream_parser.to_time.call_args_list[0].args == (arg_end_time, )
+    assert pytest.cut.end_time == fake_end_time
+    assert pytest.cut.seek.call_count == 1
+    assert pytest.cut.seek.call_args_list[0].args == (arg_start_time, )
+
+def test_CSV_Stream_set_run_window_clears_end_time_and_does_not_seek_when_neither_time_given(mocker, setup_teardown):
+    # Arrange
+    pytest.cut.end_time = MagicMock()
+
+    mocker.patch(csv_stream_parser.__name__ + '.to_time')
+    mocker.patch.object(pytest.cut, 'seek')
+
+    # Act
+    pytest.cut.set_run_window()
+
+    # Assert
+    assert pytest.cut.end_time == None
+    assert csv_stream_parser.to_time.call_count == 0
+    assert pytest.cut.seek.call_count == 0
+
+# has_more tests
+def test_CSV_Stream_has_more_returns_true_when_read_ahead_has_frames(mocker, setup_teardown):
+    # Arrange
+    pytest.cut.read_ahead = deque([MagicMock()])
+    pytest.cut.end_time = None
+
+    mocker.patch.object(pytest.cut, 'close')
+
+    # Act
+    result = pytest.cut.has_more()
+
+    # Assert
+    assert result == True
+    assert pytest.cut.close.call_count == 0
+
+def test_CSV_Stream_has_more_returns_false_and_closes_file_when_read_ahead_is_empty(mocker, setup_teardown):
+    # Arrange
+    pytest.cut.read_ahead = deque()
+    pytest.cut.end_time = None
+
+    mocker.patch.object(pytest.cut, 'close')
+
+    # Act
+    result = pytest.cut.has_more()
+
+    # Assert
+    assert result == False
+    assert pytest.cut.close.call_count == 1
+
+@pytest.mark.parametrize('fake_frame_time', [9.0, 10.0, 11.0])
+def test_CSV_Stream_has_more_returns_whether_next_frame_time_is_within_end_time_closing_file_when_past_it(mocker, setup_teardown, fake_frame_time):
+    # Arrange
+    fake_end_time = 10.0
+
+    pytest.cut.read_ahead = deque([[fake_frame_time, MagicMock()]])
+    pytest.cut.end_time = fake_end_time
+
+    mocker.patch.object(pytest.cut, 'close')
+
+    # Act
+    result = pytest.cut.has_more()
+
+    # Assert
+    assert result == (fake_frame_time <= fake_end_time)
+    assert pytest.cut.close.call_count == (0 if fake_frame_time <= fake_end_time else 1)
+
+def test_CSV_Stream_has_more_closes_the_data_file_once_a_run_window_is_exhausted(tmp_path):
+    # Arrange
+    data_file = tmp_path / 'data.csv'
+    data_file.write_text('time,x\n' + ''.join(f'{i},{i * 2}\n' for i in range(10)))
+
+    cut = DataSource.__new__(DataSource)
+    cut.read_ahead_frames = 4
+    cut.process_data_file(str(data_file))
+    cut.set_run_window(end_time=2)
+
+    # Act
+    frames = []
+    while cut.has_more():
+        frames.append(cut.get_next())
+
+    # Assert
+    assert [frame[0] for frame in frames] == [0, 1, 2]
+    assert cut.dataset == None
+    assert cut.csv_file.closed == True
@@ -0,0 +1,116 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test Frame Cache Functionality """
+import pytest
+from unittest.mock import MagicMock
+import os
+import numpy as np
+
+import onair.data_handling.frame_cache as frame_cache
+
+@pytest.fixture
+def fake_files(tmp_path):
+    data_file = tmp_path / 'data.csv'
+    data_file.write_text('a,b\n1,2\n')
+    meta_file = tmp_path / 'meta.json'
+    meta_file.write_text('{}')
+    yield str(data_file), str(meta_file)
+
+# cache_paths tests
+def test_frame_cache_cache_paths_returns_sidecar_paths_next_to_data_file():
+    # Arrange
+    arg_data_file = str(MagicMock())
+
+    # Act
+    result = frame_cache.cache_paths(arg_data_file)
+
+    # Assert
+    assert result == (arg_data_file + '.frames.npy',
+                      arg_data_file + '.valid.npy',
+                      arg_data_file + '.cache.json')
+
+# cache_key tests
+def test_frame_cache_cache_key_changes_when_data_file_meta_file_or_dtype_change(fake_files):
+    # Arrange
+    data_file, meta_file = fake_files
+    original_key = frame_cache.cache_key(data_file, meta_file, np.float64)
+
+    # Act / Assert
+    assert frame_cache.cache_key(data_file, meta_file, np.float64) == original_key
+    assert frame_cache.cache_key(data_file, meta_file, np.float32) != original_key
+
+    with open(meta_file, 'w') as f:
+        f.write('{"changed": true}')
+    assert frame_cache.cache_key(data_file, meta_file, np.float64) != original_key
+
+def test_frame_cache_cache_key_covers_path_size_and_mtime(fake_files):
+    # Arrange
+    data_file, meta_file = fake_files
+
+    # Act
+    result = frame_cache.cache_key(data_file, meta_file, np.float64)
+
+    # Assert
+    assert result['path'] == os.path.abspath(data_file)
+    assert result['size'] == os.stat(data_file).st_size
+    assert result['mtime_ns'] == os.stat(data_file).st_mtime_ns
+
+# load_frame_cache / save_frame_cache tests
+def test_frame_cache_load_frame_cache_returns_None_when_no_cache_exists(fake_files):
+    # Arrange
+    data_file, meta_file = fake_files
+
+    # Act
+    result = frame_cache.load_frame_cache(data_file, meta_file, np.float64)
+
+    # Assert
+    assert result == None
+
+def test_frame_cache_load_frame_cache_returns_memory_mapped_arrays_saved_by_save_frame_cache(fake_files):
+    # Arrange
+    data_file, meta_file = fake_files
+    fake_frames = np.arange(6, dtype=np.float64).reshape(3, 2)
+    fake_valid_mask = np.array([[True, False], [True, True], [False, True]])
+
+    # Act
+    saved = frame_cache.save_frame_cache(data_file, meta_file, fake_frames, fake_valid_mask)
+    result = frame_cache.load_frame_cache(data_file, meta_file, np.float64)
+
+    # Assert
+    assert saved == True
+    assert isinstance(result[0], np.memmap)
+    assert result[0].tolist() == fake_frames.tolist()
+    assert result[1].tolist() == fake_valid_mask.tolist()
+
+def test_frame_cache_load_frame_cache_returns_None_when_data_file_changed_after_save(fake_files):
+    # Arrange
+    data_file, meta_file = fake_files
+    frame_cache.save_frame_cache(data_file, meta_file, np.zeros((1, 2)), np.ones((1, 2), dtype=bool))
+
+    with open(data_file, 'a') as f:
+        f.write('3,4\n')
+
+    # Act
+    result = frame_cache.load_frame_cache(data_file, meta_file, np.float64)
+
+    # Assert
+    assert result == None
+
+def test_frame_cache_save_frame_cache_returns_False_when_cache_cannot_be_written(mocker, fake_files):
+    # Arrange
+    data_file, meta_file = fake_files
+
+    mocker.patch(frame_cache.__name__ + '.write_atomic', side_effect=OSError)
+
+    # Act
+    result = frame_cache.save_frame_cache(data_file, meta_file, np.zeros((1, 2)), np.ones((1, 2), dtype=bool))
+
+    # Assert
+    assert result == False
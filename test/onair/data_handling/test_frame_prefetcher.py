@@ -0,0 +1,212 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test FramePrefetcher Functionality """
+import pytest
+from unittest.mock import MagicMock
+import threading
+
+import onair.data_handling.frame_prefetcher as frame_prefetcher
+from onair.data_handling.frame_prefetcher import FramePrefetcher
+
+class FakeDataSource:
+    """Returns frames in order, reusing one list for each like some DataSources"""
+    file_boundary = False
+    frame_received_time = None
+
+    def __init__(self, frames, error=None, boundaries=()):
+        self.frames = frames
+        self.error = error
+        self.boundaries = boundaries
+        self.index = 0
+        self.frame = []
+
+    def has_more(self):
+        if self.index == len(self.frames) and self.error != None:
+            raise self.error
+        return self.index < len(self.frames)
+
+    def get_next(self):
+        self.frame[:] = self.frames[self.index]
+        self.file_boundary = self.index in self.boundaries
+        # Each frame arrives a second after the one before
+        self.frame_received_time = float(self.index)
+        self.index += 1
+        return self.frame
+
+def fake_frames(num_frames):
+    return [[i, pytest.gen.random()] for i in range(num_frames)]
+
+# __init__ tests
+def test_FramePrefetcher__init__raises_ValueError_when_depth_is_less_than_1():
+    # Act
+    with pytest.raises(ValueError) as e_info:
+        FramePrefetcher(MagicMock(), pytest.gen.randint(-5, 0)) # arbitrary, from -5 to 0
+
+    # Assert
+    assert e_info.match('Prefetch depth must be at least 1')
+
+# has_more/get_next tests
+def test_FramePrefetcher_gives_copy_of_every_frame_of_data_source_in_order():
+    # Arrange
+    frames = fake_frames(pytest.gen.randint(0, 50)) # arbitrary, from 0 to 50
+    arg_depth = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+
+    cut = FramePrefetcher(FakeDataSource(frames), arg_depth)
+
+    # Act
+    result = []
+    while cut.has_more():
+        result.append(cut.get_next())
+
+    # Assert
+    assert result == frames
+    assert cut.has_more() == False
+    assert cut.get_stats()['frames_read'] == len(frames)
+    assert cut.get_stats()['max_occupancy'] <= arg_depth
+
+def test_FramePrefetcher_marks_file_boundary_of_each_frame_as_it_was_when_the_frame_was_read():
+    # Arrange
+    frames = fake_frames(pytest.gen.randint(10, 30)) # arbitrary, from 10 to 30
+    boundaries = set(pytest.gen.sample(range(len(frames)), 3))
+    data_source = FakeDataSource(frames, boundaries=boundaries)
+
+    # Room for every frame and the end, so the producer reads them all before any is taken
+    cut = FramePrefetcher(data_source, len(frames) + 1)
+    cut.producer.join(timeout=5)
+
+    # Act
+    result = []
+    while cut.has_more():
+        cut.get_next()
+        result.append(cut.file_boundary)
+    cut.stop()
+
+    # Assert
+    assert result == [i in boundaries for i in range(len(frames))]
+
+def test_FramePrefetcher_gives_received_time_of_each_frame_as_it_was_when_the_frame_was_read():
+    # Arrange
+    frames = fake_frames(pytest.gen.randint(1, 30)) # arbitrary, from 1 to 30
+    data_source = FakeDataSource(frames)
+
+    # Room for every frame and the end, so the producer reads them all before any is taken
+    cut = FramePrefetcher(data_source, len(frames) + 1)
+    cut.producer.join(timeout=5)
+
+    # Act
+    result = [cut.frame_received_time]
+    while cut.has_more():
+        cut.get_next()
+        result.append(cut.frame_received_time)
+    cut.stop()
+
+    # Assert
+    assert result == [None] + [float(i) for i in range(len(frames))]
+
+def test_FramePrefetcher_get_next_raises_IndexError_when_no_frames_are_left():
+    # Arrange
+    cut = FramePrefetcher(FakeDataSource([]))
+
+    # Act
+    with pytest.raises(IndexError):
+        cut.get_next()
+
+def test_FramePrefetcher_raises_error_of_data_source_after_frames_read_before_it():
+    # Arrange
+    frames = fake_frames(pytest.gen.randint(0, 5)) # arbitrary, from 0 to 5
+
+    cut = FramePrefetcher(FakeDataSource(frames, RuntimeError('fake error')))
+
+    # Act
+    result = []
+    with pytest.raises(RuntimeError) as e_info:
+        while cut.has_more():
+            result.append(cut.get_next())
+
+    # Assert
+    assert result == frames
+    assert e_info.match('fake error')
+
+def test_FramePrefetcher_reads_no_more_than_depth_frames_ahead_while_none_are_taken(mocker):
+    # Arrange
+    arg_depth = pytest.gen.randint(1, 5) # arbitrary, from 1 to 5
+    data_source = FakeDataSource(fake_frames(arg_depth + 10))
+    read_ahead = threading.Event()
+    real_put = FramePrefetcher.put
+
+    def put(self, item):
+        if self.frames.full():
+            read_ahead.set()
+        real_put(self, item)
+
+    mocker.patch.object(FramePrefetcher, 'put', put)
+
+    # Act
+    cut = FramePrefetcher(data_source, arg_depth)
+    read_ahead.wait(timeout=5.0)
+
+    # Assert
+    assert data_source.index == arg_depth + 1
+    assert cut.frames.qsize() == arg_depth
+    cut.stop()
+
+def test_FramePrefetcher_drops_oldest_frames_instead_of_waiting_when_drop_frames():
+    # Arrange
+    frames = fake_frames(pytest.gen.randint(5, 20)) # arbitrary, from 5 to 20
+    data_source = FakeDataSource(frames)
+
+    cut = FramePrefetcher(data_source, 2, drop_frames=True)
+    cut.producer.join(timeout=5.0)
+
+    # Act
+    result = []
+    while cut.has_more():
+        result.append(cut.get_next())
+
+    # Assert
+    assert result == frames[-1:]
+    assert cut.get_stats()['frames_dropped'] == len(frames) - 1
+
+# stop tests
+def test_FramePrefetcher_stop_ends_producer_waiting_for_room():
+    # Arrange
+    cut = FramePrefetcher(FakeDataSource(fake_frames(20)), 1)
+    cut.has_more()
+
+    # Act
+    cut.stop()
+
+    # Assert
+    assert not cut.producer.is_alive()
+
+# get_stats tests
+def test_FramePrefetcher_get_stats_gives_mean_and_max_occupancy_of_queue_when_frames_were_taken():
+    # Arrange
+    cut = FramePrefetcher.__new__(FramePrefetcher)
+    cut.depth = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+    cut.frames_read = 7
+    cut.frames_dropped = 1
+    cut.occupancy_samples = 4
+    cut.occupancy_total = 6
+    cut.occupancy_max = 3
+    cut.full_waits = 2
+    cut.empty_waits = 1
+
+    # Act
+    result = cut.get_stats()
+
+    # Assert
+    assert result == {'depth' : cut.depth,
+                      'frames_read' : 7,
+                      'frames_dropped' : 1,
+                      'mean_occupancy' : 1.5,
+                      'max_occupancy' : 3,
+                      'full_waits' : 2,
+                      'empty_waits' : 1}
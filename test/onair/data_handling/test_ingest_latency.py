@@ -0,0 +1,80 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test IngestLatency Functionality """
+import pytest
+
+import onair.data_handling.ingest_latency as ingest_latency
+from onair.data_handling.ingest_latency import IngestLatency
+
+# record tests
+def test_IngestLatency_record_adds_seconds_since_received_time_to_totals_and_recent_latencies(mocker):
+    # Arrange
+    fake_now = pytest.gen.uniform(100, 200) # arbitrary, from 100 to 200
+    arg_received_times = [fake_now - pytest.gen.uniform(0, 1) for _ in range(pytest.gen.randint(1, 10))] # arbitrary, from 1 to 10
+
+    cut = IngestLatency()
+
+    mocker.patch(ingest_latency.__name__ + '.time.perf_counter', return_value=fake_now)
+
+    # Act
+    for received_time in arg_received_times:
+        cut.record(received_time)
+
+    # Assert
+    expected_seconds = [fake_now - received_time for received_time in arg_received_times]
+    assert cut.frames == len(arg_received_times)
+    assert cut.total_seconds == pytest.approx(sum(expected_seconds))
+    assert cut.max_seconds == max(expected_seconds)
+    assert list(cut.recent) == expected_seconds
+
+def test_IngestLatency_record_keeps_only_the_latest_window_latencies_but_totals_every_frame(mocker):
+    # Arrange
+    cut = IngestLatency(window=3)
+
+    mocker.patch(ingest_latency.__name__ + '.time.perf_counter', return_value=10.0)
+
+    # Act
+    for received_time in [5.0, 6.0, 7.0, 8.0, 9.0]:
+        cut.record(received_time)
+
+    # Assert
+    assert cut.frames == 5
+    assert cut.max_seconds == 5.0
+    assert list(cut.recent) == [3.0, 2.0, 1.0]
+
+# get_stats tests
+def test_IngestLatency_get_stats_returns_zeros_before_any_frame():
+    # Act
+    result = IngestLatency().get_stats()
+
+    # Assert
+    assert result == {'frames' : 0,
+                      'mean_seconds' : 0.0,
+                      'p50_seconds' : 0.0,
+                      'p99_seconds' : 0.0,
+                      'max_seconds' : 0.0}
+
+def test_IngestLatency_get_stats_returns_mean_and_max_of_every_frame_and_percentiles_of_recent_frames():
+    # Arrange
+    cut = IngestLatency(window=2)
+    cut.frames = 4
+    cut.total_seconds = 8.0
+    cut.max_seconds = 4.0
+    cut.recent.extend([1.0, 3.0])
+
+    # Act
+    result = cut.get_stats()
+
+    # Assert
+    assert result['frames'] == 4
+    assert result['mean_seconds'] == 2.0
+    assert result['p50_seconds'] == 2.0
+    assert result['p99_seconds'] == pytest.approx(2.98)
+    assert result['max_seconds'] == 4.0
@@ -9,6 +9,7 @@
 
 """ Test OnAir Parser Functionality """
 import pytest
+import asyncio
 from unittest.mock import MagicMock
 
 from onair.data_handling.on_air_data_source import OnAirDataSource
@@ -144,3 +145,40 @@ def test_OnAirDataSource_raises_error_when_an_inherited_class_calls_abstract_met
     with pytest.raises(NotImplementedError) as e_info:
         cut.has_more()
     assert "NotImplementedError" in e_info.__str__()
+
+# async tests
+def test_OnAirDataSource_get_next_async_and_has_more_async_give_what_get_next_and_has_more_return(setup_teardown, mocker):
+    # Arrange
+    mocker.patch.object(pytest.cut, 'get_next')
+    mocker.patch.object(pytest.cut, 'has_more')
+
+    # Act
+    next_result = asyncio.run(pytest.cut.get_next_async())
+    more_result = asyncio.run(pytest.cut.has_more_async())
+
+    # Assert
+    assert pytest.cut.get_next.call_count == 1
+    assert next_result == pytest.cut.get_next.return_value
+    assert pytest.cut.has_more.call_count == 1
+    assert more_result == pytest.cut.has_more.return_value
+
+def test_OnAirDataSource_async_iteration_gives_frames_until_has_more_async_is_False(setup_teardown, mocker):
+    # Arrange
+    num_frames = pytest.gen.randint(0, 10) # arbitrary, from 0 to 10
+    fake_frames = [MagicMock() for _ in range(num_frames)]
+
+    async def fake_has_more_async():
+        return pytest.cut.get_next.call_count < num_frames
+
+    async def collect():
+        return [frame async for frame in pytest.cut]
+
+    mocker.patch.object(pytest.cut, 'get_next', side_effect=fake_frames)
+    mocker.patch.object(pytest.cut, 'has_more_async', side_effect=fake_has_more_async)
+
+    # Act
+    result = asyncio.run(collect())
+
+    # Assert
+    assert result == fake_frames
+    assert pytest.cut.has_more_async.call_count == num_frames + 1
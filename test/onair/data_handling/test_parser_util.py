@@ -651,3 +651,129 @@ def test_parser_util_convert_str_to_timestamp_raises_error_when_both_strptime_an
 
     # Assert
     assert e_info.match('')
+
+# convert_cell tests
+def test_parser_util_convert_cell_returns_float_and_True_for_numeric_cell():
+    assert parser_util.convert_cell('4.25') == (4.25, True)
+
+def test_parser_util_convert_cell_returns_timestamp_and_True_for_time_cell(mocker):
+    # Arrange
+    fake_timestamp = MagicMock()
+    mocker.patch(parser_util.__name__ + '.convert_str_to_timestamp', return_value=fake_timestamp)
+
+    # Act
+    result = parser_util.convert_cell('0:00')
+
+    # Assert
+    assert result == (fake_timestamp, True)
+
+def test_parser_util_convert_cell_returns_0_pt_0_and_False_for_unparseable_cell():
+    assert parser_util.convert_cell('not a number') == (0.0, False)
+
+# infer_column_types tests
+def test_parser_util_infer_column_types_returns_empty_list_when_given_no_rows():
+    assert parser_util.infer_column_types([]) == []
+
+def test_parser_util_infer_column_types_picks_a_type_per_column_from_sampled_rows():
+    # Arrange
+    arg_rows = [['0:00', '2022-001-00:00:01.5', '1.5', 'label', 'x'],
+                ['0:01', '2022-001-00:00:02.25', '-2', 'label', 'y']]
+
+    # Act
+    result = parser_util.infer_column_types(arg_rows)
+
+    # Assert
+    assert result == [parser_util.MIN_SEC_COLUMN,
+                      parser_util.DAY_OF_YEAR_COLUMN,
+                      parser_util.FLOAT_COLUMN,
+                      parser_util.CONSTANT_COLUMN,
+                      parser_util.GENERIC_COLUMN]
+
+def test_parser_util_infer_column_types_only_samples_the_first_sample_size_rows():
+    # Arrange
+    arg_sample_size = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+    arg_rows = [['1']] * arg_sample_size + [['not a float']]
+
+    # Act
+    result = parser_util.infer_column_types(arg_rows, arg_sample_size)
+
+    # Assert
+    assert result == [parser_util.FLOAT_COLUMN]
+
+# convert_column tests
+def test_parser_util_convert_column_matches_floatify_input_for_every_column_type():
+    # Arrange
+    arg_cells = ['0:00', '59:59', '60:00', '1:2:3', '12.5', '-3', '', 'abc',
+                 '2020-001-00:00:05.5', '2020-366-23:59:59.999999',
+                 '2020-000-00:00:00.0', '2020-001-24:00:00.0',
+                 '2020-001-00:00:60.0', '2020-001-00:00:05']
+    expected_values = parser_util.floatify_input(arg_cells)
+    expected_invalid = [i for i in range(len(arg_cells)) if parser_util.convert_cell(arg_cells[i])[1] == False]
+
+    for column_type in [parser_util.FLOAT_COLUMN, parser_util.MIN_SEC_COLUMN,
+                        parser_util.DAY_OF_YEAR_COLUMN, parser_util.CONSTANT_COLUMN,
+                        parser_util.GENERIC_COLUMN]:
+        # Act
+        result_values, result_invalid = parser_util.convert_column(arg_cells, column_type)
+
+        # Assert
+        assert result_values == expected_values
+        assert result_invalid == expected_invalid
+
+def test_parser_util_convert_column_converts_each_distinct_non_float_cell_once(mocker):
+    # Arrange
+    arg_cells = ['0:01', '0:02', '0:01', '0:02', '0:01']
+
+    mocker.patch(parser_util.__name__ + '.convert_cell', side_effect=lambda cell: (float(cell[-1]), True))
+
+    # Act
+    result_values, result_invalid = parser_util.convert_column(arg_cells, parser_util.MIN_SEC_COLUMN)
+
+    # Assert
+    assert parser_util.convert_cell.call_count == 2
+    assert result_values == [1.0, 2.0, 1.0, 2.0, 1.0]
+    assert result_invalid == []
+
+# convert_day_of_year_cell tests
+def test_parser_util_convert_day_of_year_cell_parses_each_minute_prefix_once(mocker):
+    # Arrange
+    arg_prefix_memo = {}
+    arg_cells = ['2022-100-12:30:%02d.%d' % (s, s) for s in range(60)]
+    expected_result = [(parser_util.convert_str_to_timestamp(cell), True) for cell in arg_cells]
+
+    # Act
+    result = [parser_util.convert_day_of_year_cell(cell, arg_prefix_memo) for cell in arg_cells]
+
+    # Assert
+    assert result == expected_result
+    assert list(arg_prefix_memo.keys()) == ['2022-100-12:30']
+
+# floatify_rows tests
+def test_parser_util_floatify_rows_returns_empty_list_when_given_no_rows():
+    assert parser_util.floatify_rows([]) == []
+
+def test_parser_util_floatify_rows_matches_floatify_input_per_row():
+    # Arrange
+    arg_rows = [['0:%02d' % i, str(i * 1.5), 'label', '2022-001-00:00:%02d.5' % i] for i in range(60)]
+    expected_result = [parser_util.floatify_input(row) for row in arg_rows]
+
+    # Act
+    result = parser_util.floatify_rows(arg_rows)
+
+    # Assert
+    assert result == expected_result
+
+def test_parser_util_floatify_rows_falls_back_to_floatify_input_when_rows_are_ragged(mocker):
+    # Arrange
+    arg_rows = [['1', '2'], ['3']]
+    arg_column_types = [parser_util.FLOAT_COLUMN, parser_util.FLOAT_COLUMN]
+    forced_returns = [MagicMock(), MagicMock()]
+
+    mocker.patch(parser_util.__name__ + '.floatify_input', side_effect=forced_returns)
+
+    # Act
+    result = parser_util.floatify_rows(arg_rows, arg_column_types)
+
+    # Assert
+    assert parser_util.floatify_input.call_count == 2
+    assert result == forced_returns
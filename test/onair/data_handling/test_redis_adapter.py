@@ -7,6 +7,7 @@
 # Licensed under the NASA Open Source Agreement version 1.3
 # See "NOSA GSC-19165-1 OnAIR.pdf"
 import pytest
+import asyncio
 from unittest.mock import MagicMock
 
 import onair.data_handling.redis_adapter as redis_adapter
@@ -36,7 +37,7 @@ def test_redis_adapter_DataSource__init__sets_redis_values_then_connects(mocker)
     cut.order = fake_order
 
     mocker.patch.object(OnAirDataSource, '__init__', new=MagicMock())
-    mocker.patch('threading.Lock', return_value=fake_new_data_lock)
+    mocker.patch('threading.Condition', return_value=fake_new_data_lock)
     mocker.patch.object(cut, 'connect')
 
     # Act
@@ -47,7 +48,7 @@ def test_redis_adapter_DataSource__init__sets_redis_values_then_connects(mocker)
     assert OnAirDataSource.__init__.call_args_list[0].args == (arg_data_file, arg_meta_file, arg_ss_breakdown)
     assert cut.servers == expected_server
     assert cut.new_data_lock == fake_new_data_lock
-    assert threading.Lock.call_count == 1
+    assert threading.Condition.call_count == 1
     assert cut.new_data == False
     assert cut.currentData == [{'headers':fake_order,
                                 'data':list('-' * len(fake_order))},
@@ -293,45 +294,75 @@ def test_redis_adapter_DataSource_get_next_when_called_multiple_times_when_new_d
         results[i] = expected_data[i]
     assert cut.double_buffer_read_index == (num_calls + pre_call_index) % 2
 
-def test_redis_adapter_DataSource_get_next_waits_until_data_is_available(mocker):
+def test_redis_adapter_DataSource_get_next_waits_until_a_listener_thread_signals_data_is_available():
     # Arrange
     # Renew DataSource to ensure test independence
     cut = DataSource.__new__(DataSource)
-    cut.new_data_lock = MagicMock()
+    cut.new_data_lock = threading.Condition()
+    cut.new_data = False
     cut.double_buffer_read_index = pytest.gen.randint(0,1)
     pre_call_index = cut.double_buffer_read_index
     expected_result = MagicMock()
-    cut.new_data = None
-    cut.currentData = []
-    if pre_call_index == 0:
-        cut.currentData.append({'data': MagicMock()})
-        cut.currentData.append({'data': expected_result})
-    else:
-        cut.currentData.append({'data': expected_result})
-        cut.currentData.append({'data': MagicMock()})
+    cut.currentData = [{'data': MagicMock()}, {'data': MagicMock()}]
+    cut.currentData[(pre_call_index + 1) % 2] = {'data': expected_result}
+    fake_received_time = MagicMock()
 
-    num_falses = pytest.gen.randint(1, 10)
-    side_effect_list = [False] * num_falses
-    side_effect_list.append(True)
+    def listener():
+        with cut.new_data_lock:
+            cut.new_data = True
+            cut.received_time = fake_received_time
+            cut.new_data_lock.notify_all()
 
-    mocker.patch.object(cut, 'has_data', side_effect=side_effect_list)
-    mocker.patch(redis_adapter.__name__ + '.time.sleep')
+    # Only signals once get_next waits, as the wait gives up the lock
+    with cut.new_data_lock:
+        listen_thread = threading.Thread(target=listener)
+        listen_thread.start()
 
     # Act
     result = cut.get_next()
+    listen_thread.join()
 
     # Assert
-    assert cut.has_data.call_count == num_falses + 1
-    assert redis_adapter.time.sleep.call_count == num_falses
     assert cut.new_data == False
-    if pre_call_index == 0:
-        assert cut.double_buffer_read_index == 1
-    elif pre_call_index == 1:
-        assert cut.double_buffer_read_index == 0
-    else:
-        assert False
-
+    assert cut.double_buffer_read_index == (pre_call_index + 1) % 2
     assert result == expected_result
+    assert cut.frame_received_time == fake_received_time
+
+def test_redis_adapter_DataSource_get_next_raises_TimeoutError_when_no_data_arrives_within_frame_timeout():
+    # Arrange
+    cut = DataSource.__new__(DataSource)
+    cut.new_data_lock = threading.Condition()
+    cut.new_data = False
+    cut.frame_timeout = 0.01
+    cut.double_buffer_read_index = 0
+
+    # Act
+    with pytest.raises(TimeoutError) as e_info:
+        cut.get_next()
+
+    # Assert
+    assert e_info.match('Redis adapter received no data in 0.01 seconds')
+    assert cut.double_buffer_read_index == 0
+
+# get_next_async tests
+def test_redis_adapter_DataSource_get_next_async_waits_for_get_next_on_a_worker_thread(mocker):
+    # Arrange
+    cut = DataSource.__new__(DataSource)
+    callers = []
+
+    def fake_get_next():
+        callers.append(threading.current_thread())
+        return callers
+
+    mocker.patch.object(cut, 'get_next', side_effect=fake_get_next)
+
+    # Act
+    result = asyncio.run(cut.get_next_async())
+
+    # Assert
+    assert cut.get_next.call_count == 1
+    assert result == callers
+    assert callers[0] != threading.main_thread()
 
 # has_more tests
 def test_redis_adapter_DataSource_has_more_always_returns_True():
@@ -559,9 +590,11 @@ def test_redis_adapter_DataSource_message_listener_updates_new_data_with_receive
         'time': pytest.gen.randint(1, 100), # from 1 to 100 arbitrary
         'correct_key': pytest.gen.randint(1, 100), # from 1 to 100 arbitrary
     }
+    fake_received_time = MagicMock()
     mocker.patch(redis_adapter.__name__ + '.json.loads',
                  return_value=fake_data)
     mocker.patch(redis_adapter.__name__ + '.print_msg')
+    mocker.patch(redis_adapter.__name__ + '.IngestLatency.now', return_value=fake_received_time)
 
     # Act
     cut.message_listener(fake_server.fake_pubsub)
@@ -571,6 +604,8 @@ def test_redis_adapter_DataSource_message_listener_updates_new_data_with_receive
     assert redis_adapter.json.loads.call_args_list[0].args == (
         fake_message['data'], )
     assert cut.new_data == True
+    assert cut.received_time == fake_received_time
+    assert cut.new_data_lock.notify_all.call_count == 1
     print(cut.currentData[cut.double_buffer_read_index])
     assert cut.currentData[(cut.double_buffer_read_index + 1) % 2]['data'] == \
         [fake_data['time'], fake_data['correct_key'], '-']
@@ -0,0 +1,222 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+import pytest
+import asyncio
+from unittest.mock import MagicMock, AsyncMock
+
+import onair.data_handling.redis_async_adapter as redis_async_adapter
+from onair.data_handling.redis_async_adapter import DataSource
+from onair.data_handling import redis_adapter
+
+# connect tests
+def test_redis_async_adapter_DataSource_connect_creates_an_asyncio_client_for_each_server_with_subscriptions(mocker):
+    # Arrange
+    fake_subscriptions = [MagicMock()]
+    fake_client = MagicMock()
+
+    cut = DataSource.__new__(DataSource)
+    cut.server_configs = [{'address':'fake_address', 'port':1234, 'db':1, 'password':'fake', 'subscriptions':fake_subscriptions},
+                          {'subscriptions':[]}]
+
+    mocker.patch(redis_async_adapter.__name__ + '.redis.asyncio.Redis', return_value=fake_client)
+    mocker.patch(redis_async_adapter.__name__ + '.print_msg')
+
+    # Act
+    cut.connect()
+
+    # Assert
+    assert redis_async_adapter.redis.asyncio.Redis.call_count == 1
+    assert redis_async_adapter.redis.asyncio.Redis.call_args_list[0].args == ('fake_address', 1234, 1, 'fake')
+    assert cut.clients == [(0, fake_client, fake_subscriptions)]
+    assert cut.listeners == []
+    assert cut.listening == False
+    assert cut.data_event == None
+    assert redis_async_adapter.print_msg.call_args_list[0].args == ("No subscriptions given! Redis server not created", )
+
+# listen_async tests
+def test_redis_async_adapter_DataSource_listen_async_subscribes_and_listens_on_a_task_of_each_server_it_can_ping(mocker):
+    # Arrange
+    fake_pubsub = MagicMock()
+    fake_pubsub.subscribe = AsyncMock()
+    fake_client = MagicMock()
+    fake_client.ping = AsyncMock()
+    fake_client.pubsub.return_value = fake_pubsub
+    fake_bad_client = MagicMock()
+    fake_bad_client.ping = AsyncMock(side_effect=ConnectionError)
+
+    cut = DataSource.__new__(DataSource)
+    cut.servers = []
+    cut.listeners = []
+    cut.clients = [(0, fake_client, ['state_0', 'state_1']), (1, fake_bad_client, ['state_2'])]
+
+    mocker.patch.object(cut, 'message_listener_async', AsyncMock())
+    mocker.patch(redis_async_adapter.__name__ + '.print_msg')
+
+    async def listen():
+        await cut.listen_async()
+        await asyncio.gather(*cut.listeners)
+
+    # Act
+    asyncio.run(listen())
+
+    # Assert
+    assert cut.listening == True
+    assert isinstance(cut.data_event, asyncio.Event)
+    assert [call.args for call in fake_pubsub.subscribe.call_args_list] == [('state_0', ), ('state_1', )]
+    assert cut.servers == [fake_client]
+    assert len(cut.listeners) == 1
+    assert cut.message_listener_async.call_args_list[0].args == (fake_pubsub, )
+    assert redis_async_adapter.print_msg.call_args_list[-1].args == ('Did not connect to server # 1. Not setting up subscriptions.', 'RED')
+
+# message_listener_async tests
+def test_redis_async_adapter_DataSource_message_listener_async_receives_each_message_then_warns_of_exit(mocker):
+    # Arrange
+    fake_messages = [MagicMock() for _ in range(pytest.gen.randint(0, 5))] # arbitrary, from 0 to 5
+    fake_pubsub = MagicMock()
+
+    async def fake_listen():
+        for message in fake_messages:
+            yield message
+
+    fake_pubsub.listen = fake_listen
+
+    cut = DataSource.__new__(DataSource)
+
+    mocker.patch.object(cut, 'receive_message')
+    mocker.patch(redis_async_adapter.__name__ + '.print_msg')
+
+    # Act
+    asyncio.run(cut.message_listener_async(fake_pubsub))
+
+    # Assert
+    assert [call.args for call in cut.receive_message.call_args_list] == [(message, ) for message in fake_messages]
+    assert redis_async_adapter.print_msg.call_args_list[0].args == ("Redis subscription listener exited.", ['WARNING'])
+
+# receive_message tests
+@pytest.mark.parametrize('arg_new_data', [True, False])
+def test_redis_async_adapter_DataSource_receive_message_sets_data_event_only_when_a_frame_was_received(mocker, arg_new_data):
+    # Arrange
+    arg_message = MagicMock()
+
+    cut = DataSource.__new__(DataSource)
+    cut.data_event = MagicMock()
+    cut.new_data = arg_new_data
+
+    mocker.patch.object(redis_adapter.DataSource, 'receive_message')
+
+    # Act
+    cut.receive_message(arg_message)
+
+    # Assert
+    assert redis_adapter.DataSource.receive_message.call_args_list[0].args == (arg_message, )
+    assert cut.data_event.set.call_count == (1 if arg_new_data else 0)
+
+def test_redis_async_adapter_DataSource_receive_message_does_not_signal_before_listening(mocker):
+    # Arrange
+    cut = DataSource.__new__(DataSource)
+    cut.new_data = True
+
+    mocker.patch.object(redis_adapter.DataSource, 'receive_message')
+
+    # Act
+    cut.receive_message(MagicMock())
+
+    # Assert
+    assert cut.data_event == None
+
+# get_next tests
+def test_redis_async_adapter_DataSource_get_next_raises_RuntimeError():
+    # Arrange
+    cut = DataSource.__new__(DataSource)
+
+    # Act
+    with pytest.raises(RuntimeError) as e_info:
+        cut.get_next()
+
+    # Assert
+    assert e_info.match('AsyncRun = true')
+
+# get_next_async tests
+def test_redis_async_adapter_DataSource_get_next_async_listens_then_wakes_when_a_message_fills_a_frame(mocker):
+    # Arrange
+    fake_data = MagicMock()
+
+    cut = DataSource.__new__(DataSource)
+    cut.listening = False
+    cut.new_data = False
+    cut.new_data_lock = MagicMock()
+    cut.double_buffer_read_index = 0
+    cut.currentData = [{'data':MagicMock()}, {'data':fake_data}]
+
+    def fake_receive_message(message):
+        cut.new_data = True
+
+    async def fake_listen_async():
+        cut.listening = True
+
+    mocker.patch.object(cut, 'listen_async', side_effect=fake_listen_async)
+    mocker.patch.object(redis_adapter.DataSource, 'receive_message', side_effect=fake_receive_message)
+
+    async def run():
+        cut.data_event = asyncio.Event()
+        reader = asyncio.create_task(cut.get_next_async())
+        await asyncio.sleep(0)
+        assert not reader.done()
+        cut.receive_message(MagicMock())
+        return await reader
+
+    # Act
+    result = asyncio.run(run())
+
+    # Assert
+    assert cut.listen_async.call_count == 1
+    assert result == fake_data
+    assert cut.new_data == False
+    assert cut.double_buffer_read_index == 1
+
+def test_redis_async_adapter_DataSource_made_outside_the_loop_gives_frames_published_to_it_under_asyncio_run(mocker):
+    # Arrange
+    fake_messages = [{'type':'message', 'channel':b'state', 'data':f'{{"time": {i}, "x": {i * 2}}}'} for i in range(3)]
+
+    class FakePubSub:
+        def __init__(self):
+            self.subscribe = AsyncMock()
+
+        async def listen(self):
+            for message in fake_messages:
+                # One message at a time, each after get_next_async waits
+                await asyncio.sleep(0.01)
+                yield message
+
+    fake_client = MagicMock()
+    fake_client.ping = AsyncMock()
+    fake_client.pubsub.return_value = FakePubSub()
+
+    def fake_init(self, data_file, meta_file, ss_breakdown):
+        self.order = ['time', 'state.x']
+        self.server_configs = [{'subscriptions':['state']}]
+
+    mocker.patch.object(redis_adapter.OnAirDataSource, '__init__', fake_init)
+    mocker.patch(redis_async_adapter.__name__ + '.redis.asyncio.Redis', return_value=fake_client)
+    mocker.patch(redis_async_adapter.__name__ + '.print_msg')
+
+    # Made before asyncio.run starts a loop, as the execution engine does
+    cut = DataSource('fake_data_file', 'fake_meta_file')
+
+    async def run():
+        frames = [list(await cut.get_next_async()) for _ in fake_messages]
+        for listener in cut.listeners:
+            listener.cancel()
+        return frames
+
+    # Act
+    result = asyncio.run(run())
+
+    # Assert
+    assert result == [[i, i * 2] for i in range(3)]
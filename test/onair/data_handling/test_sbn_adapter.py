@@ -9,6 +9,7 @@
 
 # testing packages
 import pytest
+import asyncio
 from unittest.mock import MagicMock, PropertyMock
 
 # mock dependencies of sbn_adapter.py
@@ -38,7 +39,7 @@ def test_sbn_adapter_DataSource__init__sets_values_then_connects(mocker):
     cut = DataSource.__new__(DataSource)
 
     mocker.patch.object(OnAirDataSource, '__init__', new=MagicMock())
-    mocker.patch('threading.Lock', return_value=fake_new_data_lock)
+    mocker.patch('threading.Condition', return_value=fake_new_data_lock)
     mocker.patch.object(cut, 'connect')
 
     # Act
@@ -48,6 +49,7 @@ def test_sbn_adapter_DataSource__init__sets_values_then_connects(mocker):
     assert OnAirDataSource.__init__.call_count == 1
     assert OnAirDataSource.__init__.call_args_list[0].args == (arg_data_file, arg_meta_file, arg_ss_breakdown)
     assert cut.new_data_lock == fake_new_data_lock
+    assert threading.Condition.call_count == 1
     assert cut.new_data == False
     assert cut.double_buffer_read_index == 0
     assert cut.connect.call_count == 1
@@ -328,48 +330,78 @@ def test_sbn_adapter_DataSource_get_next_when_called_multiple_times_when_new_dat
         results[i] = expected_data[i]
     assert cut.double_buffer_read_index == (num_calls + pre_call_index) % 2
 
-def test_sbn_adapter_DataSource_get_next_waits_until_new_data_is_available(mocker):
+def test_sbn_adapter_DataSource_get_next_waits_until_the_listener_thread_signals_new_data_is_available():
     # copied from test_redis_adapter.py
-    # test_redis_adapter_DataSource_get_next_waits_until_new_data_is_available
-    
+    # test_redis_adapter_DataSource_get_next_waits_until_a_listener_thread_signals_data_is_available
+
     # Arrange
     # Renew DataSource to ensure test independence
     cut = DataSource.__new__(DataSource)
-    cut.new_data_lock = MagicMock()
+    cut.new_data_lock = threading.Condition()
+    cut.new_data = False
     cut.double_buffer_read_index = pytest.gen.randint(0,1)
     pre_call_index = cut.double_buffer_read_index
     expected_result = MagicMock()
-    cut.new_data = None
-    cut.currentData = []
-    if pre_call_index == 0:
-        cut.currentData.append({'data': MagicMock()})
-        cut.currentData.append({'data': expected_result})
-    else:
-        cut.currentData.append({'data': expected_result})
-        cut.currentData.append({'data': MagicMock()})
+    cut.currentData = [{'data': MagicMock()}, {'data': MagicMock()}]
+    cut.currentData[(pre_call_index + 1) % 2] = {'data': expected_result}
+    fake_received_time = MagicMock()
 
-    num_falses = pytest.gen.randint(1, 10)
-    side_effect_list = [False] * num_falses
-    side_effect_list.append(True)
+    def listener():
+        with cut.new_data_lock:
+            cut.new_data = True
+            cut.received_time = fake_received_time
+            cut.new_data_lock.notify_all()
 
-    mocker.patch.object(cut, 'has_data', side_effect=side_effect_list)
-    mocker.patch(sbn_adapter.__name__ + '.time.sleep')
+    # Only signals once get_next waits, as the wait gives up the lock
+    with cut.new_data_lock:
+        listen_thread = threading.Thread(target=listener)
+        listen_thread.start()
 
     # Act
     result = cut.get_next()
+    listen_thread.join()
 
     # Assert
-    assert cut.has_data.call_count == num_falses + 1
-    assert sbn_adapter.time.sleep.call_count == num_falses
     assert cut.new_data == False
-    if pre_call_index == 0:
-        assert cut.double_buffer_read_index == 1
-    elif pre_call_index == 1:
-        assert cut.double_buffer_read_index == 0
-    else:
-        assert False
-
+    assert cut.double_buffer_read_index == (pre_call_index + 1) % 2
     assert result == expected_result
+    assert cut.frame_received_time == fake_received_time
+
+def test_sbn_adapter_DataSource_get_next_raises_TimeoutError_when_no_data_arrives_within_frame_timeout():
+    # Arrange
+    cut = DataSource.__new__(DataSource)
+    cut.new_data_lock = threading.Condition()
+    cut.new_data = False
+    cut.frame_timeout = 0.01
+    cut.double_buffer_read_index = 0
+
+    # Act
+    with pytest.raises(TimeoutError) as e_info:
+        cut.get_next()
+
+    # Assert
+    assert e_info.match('SBN adapter received no data in 0.01 seconds')
+    assert cut.double_buffer_read_index == 0
+
+# get_next_async tests
+def test_sbn_adapter_DataSource_get_next_async_waits_for_get_next_on_a_worker_thread(mocker):
+    # Arrange
+    cut = DataSource.__new__(DataSource)
+    callers = []
+
+    def fake_get_next():
+        callers.append(threading.current_thread())
+        return callers
+
+    mocker.patch.object(cut, 'get_next', side_effect=fake_get_next)
+
+    # Act
+    result = asyncio.run(cut.get_next_async())
+
+    # Assert
+    assert cut.get_next.call_count == 1
+    assert result == callers
+    assert callers[0] != threading.main_thread()
 
 # has_more tests
 def test_sbn_adapter_DataSource_has_more_always_returns_True():
@@ -411,6 +443,8 @@ def test_sbn_adapter_message_listener_thread_calls_get_current_data(mocker):
         return return_func #return pointers wrapped in a function b/c that's how ctypes does it
     
     mocker.patch(sbn_adapter.__name__ + ".POINTER", side_effect = mock_POINTER_func)
+    fake_received_time = MagicMock()
+    mocker.patch(sbn_adapter.__name__ + '.IngestLatency.now', return_value=fake_received_time)
 
     # for exiting the while loop
     intentional_exception = KeyboardInterrupt('[TEST]: Exiting infinite loop')
@@ -424,7 +458,7 @@ def test_sbn_adapter_message_listener_thread_calls_get_current_data(mocker):
     assert cut.get_current_data.call_count == 1
     assert fake_recv_msg_p.contents == fake_generic_recv_msg_p.contents
     assert cut.get_current_data.call_args_list
-    expected_call = (fake_recv_msg_p.contents, expected_data_struct, expected_app_name)
+    expected_call = (fake_recv_msg_p.contents, expected_data_struct, expected_app_name, fake_received_time)
     assert cut.get_current_data.call_args_list[0].args == expected_call
 
 # get_current_data tests
@@ -500,13 +534,16 @@ def test_sbn_adapter_DataSource_get_current_data_unpacks_sub_fields_correctly(mo
                      'data':['89','5','1','2'] }
     
     arg_data_struct = MagicMock()
+    arg_received_time = MagicMock()
 
     # Act
-    cut.get_current_data(arg_recv_msg, arg_data_struct, arg_app_name)
+    cut.get_current_data(arg_recv_msg, arg_data_struct, arg_app_name, arg_received_time)
 
     # Assert
     assert cut.currentData[(cut.double_buffer_read_index + 1) %2] == expected_data
     assert cut.new_data == True
+    assert cut.received_time == arg_received_time
+    assert cut.new_data_lock.notify_all.call_count == 1
 
 # has_data tests
 def test_sbn_adapter_DataSource_has_data_returns_instance_new_data():
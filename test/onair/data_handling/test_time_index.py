@@ -0,0 +1,161 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test Time Index Functionality """
+import pytest
+from unittest.mock import MagicMock
+import os
+import json
+
+import onair.data_handling.time_index as time_index
+
+@pytest.fixture
+def fake_data_file(tmp_path):
+    data_file = tmp_path / 'data.csv'
+    data_file.write_text('time,value\n0,a\n1,b\n2,c\n3,d\n4,e\n')
+    yield str(data_file)
+
+# index_path tests
+def test_time_index_index_path_returns_sidecar_path_next_to_data_file():
+    # Arrange
+    arg_data_file = str(MagicMock())
+
+    # Act
+    result = time_index.index_path(arg_data_file)
+
+    # Assert
+    assert result == arg_data_file + '.index.json'
+
+# index_key tests
+def test_time_index_index_key_covers_path_size_mtime_time_column_and_interval(fake_data_file):
+    # Arrange
+    arg_time_column = pytest.gen.randint(0, 10) # arbitrary, from 0 to 10
+    arg_interval = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+
+    # Act
+    result = time_index.index_key(fake_data_file, arg_time_column, arg_interval)
+
+    # Assert
+    stat = os.stat(fake_data_file)
+    assert result == {'path':os.path.abspath(fake_data_file),
+                      'size':stat.st_size,
+                      'mtime_ns':stat.st_mtime_ns,
+                      'time_column':arg_time_column,
+                      'interval':arg_interval}
+
+# build_time_index tests
+def test_time_index_build_time_index_records_time_offset_and_row_of_every_interval_th_row(fake_data_file):
+    # Act
+    result = time_index.build_time_index(fake_data_file, 0, 2)
+
+    # Assert
+    assert result['times'] == [0.0, 2.0, 4.0]
+    assert result['rows'] == [0, 2, 4]
+    with open(fake_data_file, 'rb') as f:
+        contents = f.read()
+    assert [contents[offset:offset + 2] for offset in result['offsets']] == [b'0,', b'2,', b'4,']
+
+def test_time_index_build_time_index_returns_empty_index_when_file_has_only_headers(tmp_path):
+    # Arrange
+    data_file = tmp_path / 'headers.csv'
+    data_file.write_text('time,value\n')
+
+    # Act
+    result = time_index.build_time_index(str(data_file), 0, 1)
+
+    # Assert
+    assert result == {'times':[], 'offsets':[], 'rows':[]}
+
+# load_time_index tests
+def test_time_index_load_time_index_builds_and_persists_index_when_missing(mocker, fake_data_file):
+    # Arrange
+    mocker.spy(time_index, 'build_time_index')
+
+    # Act
+    result = time_index.load_time_index(fake_data_file, 0, 2)
+
+    # Assert
+    assert time_index.build_time_index.call_count == 1
+    assert result['key'] == time_index.index_key(fake_data_file, 0, 2)
+    with open(time_index.index_path(fake_data_file), 'r') as f:
+        assert json.load(f) == result
+
+def test_time_index_load_time_index_reuses_persisted_index_when_key_matches(mocker, fake_data_file):
+    # Arrange
+    expected_result = time_index.load_time_index(fake_data_file, 0, 2)
+    mocker.patch(time_index.__name__ + '.build_time_index')
+
+    # Act
+    result = time_index.load_time_index(fake_data_file, 0, 2)
+
+    # Assert
+    assert time_index.build_time_index.call_count == 0
+    assert result == expected_result
+
+def test_time_index_load_time_index_rebuilds_index_when_interval_changes(mocker, fake_data_file):
+    # Arrange
+    time_index.load_time_index(fake_data_file, 0, 2)
+    mocker.spy(time_index, 'build_time_index')
+
+    # Act
+    result = time_index.load_time_index(fake_data_file, 0, 1)
+
+    # Assert
+    assert time_index.build_time_index.call_count == 1
+    assert result['rows'] == [0, 1, 2, 3, 4]
+
+# find_index_entry tests
+def test_time_index_find_index_entry_returns_last_entry_strictly_before_time():
+    # Arrange
+    fake_index = {'times':[0.0, 10.0, 20.0]}
+
+    # Act / Assert
+    assert time_index.find_index_entry(fake_index, -5.0) == 0
+    assert time_index.find_index_entry(fake_index, 0.0) == 0
+    assert time_index.find_index_entry(fake_index, 10.0) == 0
+    assert time_index.find_index_entry(fake_index, 15.0) == 1
+    assert time_index.find_index_entry(fake_index, 25.0) == 2
+
+# to_time tests
+def test_time_index_to_time_returns_float_of_number():
+    # Arrange
+    arg_value = pytest.gen.randint(0, 1000) # arbitrary, from 0 to 1000
+
+    # Act
+    result = time_index.to_time(arg_value)
+
+    # Assert
+    assert result == float(arg_value)
+
+def test_time_index_to_time_converts_string_with_convert_cell(mocker):
+    # Arrange
+    arg_value = str(MagicMock())
+    fake_time = MagicMock()
+
+    mocker.patch(time_index.__name__ + '.convert_cell', return_value=(fake_time, True))
+
+    # Act
+    result = time_index.to_time(arg_value)
+
+    # Assert
+    assert time_index.convert_cell.call_args_list[0].args == (arg_value, )
+    assert result == fake_time
+
+def test_time_index_to_time_raises_ValueError_when_string_is_not_a_time(mocker):
+    # Arrange
+    arg_value = str(MagicMock())
+
+    mocker.patch(time_index.__name__ + '.convert_cell', return_value=(0.0, False))
+
+    # Act
+    with pytest.raises(ValueError) as e_info:
+        time_index.to_time(arg_value)
+
+    # Assert
+    assert e_info.match(f"Time '{arg_value}' is not in a recognized time format")
@@ -119,3 +119,30 @@ def test_AIPlugin__init__sets_instance_values_to_given_args_when_given__headers_
     assert ai_plugin.len.call_args_list[0].args == (arg__headers,)
     assert cut.component_name == arg__name
     assert cut.headers == arg__headers
+
+def test_AIPlugin_lets_interfaces_cache_reasoning_by_default():
+    # Arrange
+    cut = FakeAIPlugin.__new__(FakeAIPlugin)
+
+    # Assert
+    assert cut.cache_reasoning == True
+
+def test_AIPlugin_reset_does_nothing_by_default():
+    # Arrange
+    cut = FakeAIPlugin.__new__(FakeAIPlugin)
+
+    # Act
+    result = cut.reset()
+
+    # Assert
+    assert result == None
+
+def test_AIPlugin_finish_does_nothing_by_default():
+    # Arrange
+    cut = FakeAIPlugin.__new__(FakeAIPlugin)
+
+    # Act
+    result = cut.finish()
+
+    # Assert
+    assert result == None
@@ -10,9 +10,12 @@
 """ Test LearnersInterface Functionality """
 import pytest
 from unittest.mock import MagicMock
+import threading
+import asyncio
 
 import onair.src.ai_components.learners_interface as learners_interface
 from onair.src.ai_components.learners_interface import LearnersInterface
+from onair.src.ai_components.plugin_executor import PluginExecutor
 
 # __init__ tests
 def test_LearnersInterface__init__raises_AssertionError_when_given_headers_len_is_0():
@@ -38,8 +41,10 @@ def test_LearnersInterface__init__sets_self_headers_to_given_headers_and_sets_se
     arg_headers.__len__.return_value = 1
 
     forced_return_learner_constructs = MagicMock()
+    fake_reasoning_cache = MagicMock()
 
     mocker.patch(learners_interface.__name__ + '.import_plugins', return_value=forced_return_learner_constructs)
+    mocker.patch(learners_interface.__name__ + '.ReasoningCache', return_value=fake_reasoning_cache)
 
 
     cut = LearnersInterface.__new__(LearnersInterface)
@@ -52,6 +57,7 @@ def test_LearnersInterface__init__sets_self_headers_to_given_headers_and_sets_se
     assert learners_interface.import_plugins.call_count == 1
     assert learners_interface.import_plugins.call_args_list[0].args == (arg_headers, arg__learner_plugins)
     assert cut.learner_constructs == forced_return_learner_constructs
+    assert cut.reasoning_cache == fake_reasoning_cache
 
 # update tests
 def test_LearnersInterface_update_does_nothing_when_instance_learner_constructs_is_empty():
@@ -88,6 +94,24 @@ def test_LearnersInterface_update_calls_update_with_given_low_level_and_high_lev
         assert cut.learner_constructs[i].update.call_count == 1
         assert cut.learner_constructs[i].update.call_args_list[0].args == (arg_low_level_data, arg_high_level_data)
 
+def test_LearnersInterface_update_starts_new_frame_of_reasoning_cache_before_updating_plugins():
+    # Arrange
+    arg_low_level_data = MagicMock()
+    arg_high_level_data = MagicMock()
+    fake_plugin = MagicMock()
+
+    cut = LearnersInterface.__new__(LearnersInterface)
+    cut.learner_constructs = [fake_plugin]
+    cut.reasoning_cache = MagicMock()
+    cut.reasoning_cache.new_frame.side_effect = lambda: fake_plugin.update.assert_not_called()
+
+    # Act
+    cut.update(arg_low_level_data, arg_high_level_data)
+
+    # Assert
+    assert cut.reasoning_cache.new_frame.call_count == 1
+    assert fake_plugin.update.call_count == 1
+
 # check_for_salient_event
 def test_LearnersInterface_salient_event_does_nothing():
     # Arrange
@@ -99,6 +123,34 @@ def test_LearnersInterface_salient_event_does_nothing():
     # Assert
     assert result == None
 
+# reset tests
+def test_LearnersInterface_reset_resets_each_plugin():
+    # Arrange
+    cut = LearnersInterface.__new__(LearnersInterface)
+    cut.learner_constructs = [MagicMock() for _ in range(pytest.gen.randint(0, 5))] # arbitrary, from 0 to 5
+
+    # Act
+    cut.reset()
+
+    # Assert
+    for plugin in cut.learner_constructs:
+        assert plugin.reset.call_count == 1
+        assert plugin.reset.call_args_list[0].args == ()
+
+# finish tests
+def test_LearnersInterface_finish_finishes_each_plugin():
+    # Arrange
+    cut = LearnersInterface.__new__(LearnersInterface)
+    cut.learner_constructs = [MagicMock() for _ in range(pytest.gen.randint(0, 5))] # arbitrary, from 0 to 5
+
+    # Act
+    cut.finish()
+
+    # Assert
+    for plugin in cut.learner_constructs:
+        assert plugin.finish.call_count == 1
+        assert plugin.finish.call_args_list[0].args == ()
+
 # render_reasoning tests
 def test_LearnersInterface_render_reasoning_returns_empty_dict_when_instance_learner_constructs_is_empty(mocker):
     # Arrange
@@ -134,4 +186,160 @@ def test_LearnersInterface_render_reasoning_returns_dict_of_each_ai_construct_as
     for i in range(num_fake_learner_constructs):
         assert cut.learner_constructs[i].render_reasoning.call_count == 1
         assert cut.learner_constructs[i].render_reasoning.call_args_list[0].args == ()
-    assert result == expected_result
\ No newline at end of file
+    assert result == expected_result
+def test_LearnersInterface_render_reasoning_renders_each_plugin_through_reasoning_cache_when_there_is_one():
+    # Arrange
+    cut = LearnersInterface.__new__(LearnersInterface)
+    cut.learner_constructs = []
+    cut.reasoning_cache = MagicMock()
+
+    expected_result = {}
+
+    num_fake_learner_constructs = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10 (0 has own test)
+    for i in range(num_fake_learner_constructs):
+        fake_ai_construct = MagicMock()
+        fake_ai_construct.component_name = MagicMock()
+        cut.learner_constructs.append(fake_ai_construct)
+        expected_result[fake_ai_construct.component_name] = cut.reasoning_cache.render.return_value
+
+    # Act
+    result = cut.render_reasoning()
+
+    # Assert
+    assert result == expected_result
+    assert [call.args for call in cut.reasoning_cache.render.call_args_list] == [(plugin, ) for plugin in cut.learner_constructs]
+    for plugin in cut.learner_constructs:
+        assert plugin.render_reasoning.call_count == 0
+
+# parallel tests
+def test_LearnersInterface__init__runs_plugins_on_a_PluginExecutor_with_a_worker_for_each_plugin_when_parallel(mocker):
+    # Arrange
+    arg_headers = MagicMock()
+    arg_headers.__len__.return_value = 1
+    fake_constructs = [MagicMock() for _ in range(pytest.gen.randint(2, 10))] # arbitrary, from 2 to 10
+    fake_executor = MagicMock()
+
+    mocker.patch(learners_interface.__name__ + '.import_plugins', return_value=fake_constructs)
+    mocker.patch(learners_interface.__name__ + '.PluginExecutor', return_value=fake_executor)
+
+    cut = LearnersInterface.__new__(LearnersInterface)
+
+    # Act
+    cut.__init__(arg_headers, MagicMock(), parallel=True)
+
+    # Assert
+    assert learners_interface.PluginExecutor.call_count == 1
+    assert learners_interface.PluginExecutor.call_args_list[0].args == (len(fake_constructs), )
+    assert cut.executor == fake_executor
+
+@pytest.mark.parametrize('arg_parallel, arg_num_plugins', [(False, 2), (True, 1), (True, 0)])
+def test_LearnersInterface__init__has_no_executor_unless_parallel_with_more_than_one_plugin(mocker, arg_parallel, arg_num_plugins):
+    # Arrange
+    arg_headers = MagicMock()
+    arg_headers.__len__.return_value = 1
+
+    mocker.patch(learners_interface.__name__ + '.import_plugins', return_value=[MagicMock() for _ in range(arg_num_plugins)])
+    mocker.patch(learners_interface.__name__ + '.PluginExecutor')
+
+    cut = LearnersInterface.__new__(LearnersInterface)
+
+    # Act
+    cut.__init__(arg_headers, MagicMock(), parallel=arg_parallel)
+
+    # Assert
+    assert learners_interface.PluginExecutor.call_count == 0
+    assert cut.executor == None
+
+def test_LearnersInterface_update_and_render_reasoning_run_every_plugin_at_once_and_keep_plugin_order_with_an_executor():
+    # Arrange
+    num_plugins = pytest.gen.randint(2, 6) # arbitrary, from 2 to 6
+    # Every plugin waits for all the others, which only finishes when they run at once
+    barrier = threading.Barrier(num_plugins, timeout=5)
+
+    cut = LearnersInterface.__new__(LearnersInterface)
+    cut.learner_constructs = []
+    cut.executor = PluginExecutor(num_plugins)
+
+    for i in range(num_plugins):
+        fake_plugin = MagicMock()
+        fake_plugin.component_name = f'plugin_{i}'
+        fake_plugin.update.side_effect = lambda *args, **kwargs: barrier.wait()
+        fake_plugin.render_reasoning.side_effect = lambda i=i: (barrier.wait(), i)[1]
+        cut.learner_constructs.append(fake_plugin)
+
+    # Act
+    cut.update(MagicMock(), MagicMock())
+    result = cut.render_reasoning()
+    cut.executor.shutdown()
+
+    # Assert
+    assert list(result.items()) == [(f'plugin_{i}', i) for i in range(num_plugins)]
+    for i in range(num_plugins):
+        assert cut.learner_constructs[i].update.call_count == 1
+
+# async tests
+def test_LearnersInterface_update_async_and_render_reasoning_async_await_coroutine_hooks_and_keep_plugin_order():
+    # Arrange
+    num_plugins = pytest.gen.randint(1, 6) # arbitrary, from 1 to 6
+    arg_low_level_data = MagicMock()
+    arg_high_level_data = MagicMock()
+    updates = []
+
+    cut = LearnersInterface.__new__(LearnersInterface)
+    cut.learner_constructs = []
+
+    for i in range(num_plugins):
+        fake_plugin = MagicMock()
+        fake_plugin.component_name = f'plugin_{i}'
+        # Even plugins have coroutine hooks
+        if i % 2 == 0:
+            async def update(*args, i=i, **kwargs):
+                updates.append((i, args, kwargs))
+            async def render_reasoning(i=i):
+                return i
+            fake_plugin.update = update
+            fake_plugin.render_reasoning = render_reasoning
+        else:
+            fake_plugin.update.side_effect = lambda *args, i=i, **kwargs: updates.append((i, args, kwargs))
+            fake_plugin.render_reasoning.return_value = i
+        cut.learner_constructs.append(fake_plugin)
+
+    async def reason():
+        await cut.update_async(arg_low_level_data, arg_high_level_data)
+        return await cut.render_reasoning_async()
+
+    # Act
+    result = asyncio.run(reason())
+
+    # Assert
+    assert list(result.items()) == [(f'plugin_{i}', i) for i in range(num_plugins)]
+    assert sorted(i for i, _, _ in updates) == list(range(num_plugins))
+    for _, args, kwargs in updates:
+        assert (args, kwargs) == ((arg_low_level_data, arg_high_level_data), {})
+
+def test_LearnersInterface_update_async_starts_new_frame_and_render_reasoning_async_renders_through_reasoning_cache():
+    # Arrange
+    fake_plugin = MagicMock()
+    fake_plugin.component_name = 'plugin'
+    fake_reasoning = MagicMock()
+
+    async def render_async(plugin):
+        return fake_reasoning
+
+    cut = LearnersInterface.__new__(LearnersInterface)
+    cut.learner_constructs = [fake_plugin]
+    cut.reasoning_cache = MagicMock()
+    cut.reasoning_cache.render_async = MagicMock(side_effect=render_async)
+
+    async def reason():
+        await cut.update_async(MagicMock(), MagicMock())
+        return await cut.render_reasoning_async()
+
+    # Act
+    result = asyncio.run(reason())
+
+    # Assert
+    assert cut.reasoning_cache.new_frame.call_count == 1
+    assert cut.reasoning_cache.render_async.call_args_list[0].args == (fake_plugin, )
+    assert fake_plugin.render_reasoning.call_count == 0
+    assert result == {'plugin':fake_reasoning}
@@ -0,0 +1,135 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test PluginExecutor Functionality """
+import pytest
+from unittest.mock import MagicMock
+import threading
+import asyncio
+
+import onair.src.ai_components.plugin_executor as plugin_executor
+from onair.src.ai_components.plugin_executor import PluginExecutor
+
+# map_plugins tests
+def test_plugin_executor_map_plugins_calls_each_plugin_in_order_without_an_executor():
+    # Arrange
+    arg_plugins = [MagicMock() for _ in range(pytest.gen.randint(0, 10))] # arbitrary, from 0 to 10
+    arg_call = MagicMock(side_effect=lambda plugin: plugin.result)
+
+    # Act
+    result = plugin_executor.map_plugins(None, arg_call, arg_plugins)
+
+    # Assert
+    assert [call.args for call in arg_call.call_args_list] == [(plugin, ) for plugin in arg_plugins]
+    assert result == [plugin.result for plugin in arg_plugins]
+
+def test_plugin_executor_map_plugins_maps_on_the_executor_when_there_is_one():
+    # Arrange
+    arg_executor = MagicMock()
+    arg_call = MagicMock()
+    arg_plugins = MagicMock()
+
+    # Act
+    result = plugin_executor.map_plugins(arg_executor, arg_call, arg_plugins)
+
+    # Assert
+    assert arg_executor.map.call_count == 1
+    assert arg_executor.map.call_args_list[0].args == (arg_call, arg_plugins)
+    assert arg_call.call_count == 0
+    assert result == arg_executor.map.return_value
+
+# PluginExecutor tests
+def test_PluginExecutor_map_returns_results_in_plugin_order_not_finishing_order():
+    # Arrange
+    num_plugins = pytest.gen.randint(2, 8) # arbitrary, from 2 to 8
+    turns = [threading.Event() for _ in range(num_plugins)]
+    arg_plugins = list(range(num_plugins))
+
+    def call(plugin):
+        # Plugins finish last to first
+        turns[plugin].wait(5)
+        if plugin > 0:
+            turns[plugin - 1].set()
+        return plugin * 2
+
+    cut = PluginExecutor(num_plugins)
+    turns[-1].set()
+
+    # Act
+    result = cut.map(call, arg_plugins)
+    cut.shutdown()
+
+    # Assert
+    assert result == [plugin * 2 for plugin in arg_plugins]
+
+def test_PluginExecutor_map_joins_every_call_before_raising_the_first_error():
+    # Arrange
+    release = threading.Event()
+    finished = []
+
+    def call(plugin):
+        if plugin == 0:
+            raise ValueError('plugin 0 failed')
+        release.wait(0.2)
+        finished.append(plugin)
+
+    cut = PluginExecutor(3)
+
+    # Act
+    with pytest.raises(ValueError) as e_info:
+        cut.map(call, [0, 1, 2])
+    cut.shutdown()
+
+    # Assert
+    assert e_info.match('plugin 0 failed')
+    assert sorted(finished) == [1, 2]
+
+# settle tests
+def test_plugin_executor_settle_awaits_coroutines_and_gives_other_results_as_they_are():
+    # Arrange
+    fake_result = MagicMock()
+
+    async def coroutine():
+        return fake_result
+
+    async def settle_both():
+        return await plugin_executor.settle(coroutine()), await plugin_executor.settle(fake_result)
+
+    # Act
+    result = asyncio.run(settle_both())
+
+    # Assert
+    assert result == (fake_result, fake_result)
+
+# gather_plugins tests
+def test_plugin_executor_gather_plugins_awaits_coroutine_hooks_together_and_returns_results_in_plugin_order():
+    # Arrange
+    arg_plugins = list(range(pytest.gen.randint(2, 6))) # arbitrary, from 2 to 6
+    started = []
+
+    async def call_async(plugin):
+        started.append(plugin)
+        # Every hook has started before any finishes only when they run together
+        while len(started) < len(arg_plugins):
+            await asyncio.sleep(0)
+        return plugin * 2
+
+    # Odd plugins have plain hooks
+    def call(plugin):
+        if plugin % 2 == 0:
+            return call_async(plugin)
+        started.append(plugin)
+        return plugin * 2
+
+    # Act
+    result = asyncio.run(plugin_executor.gather_plugins(None, call, arg_plugins))
+
+    # Assert
+    assert result == [plugin * 2 for plugin in arg_plugins]
+    assert sorted(started) == arg_plugins
@@ -0,0 +1,294 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test ProcessPlugin Functionality """
+import pytest
+from unittest.mock import MagicMock
+from multiprocessing import shared_memory
+
+import onair.src.ai_components.process_plugin as process_plugin
+import onair.src.util.plugin_import as plugin_import
+from onair.src.ai_components.process_plugin import FrameRing, ProcessPlugin
+
+ECHO_PLUGIN = '''
+from onair.src.ai_components.ai_plugin_abstract.ai_plugin import AIPlugin
+
+class Plugin(AIPlugin):
+    cache_reasoning = False
+
+    def update(self, low_level_data=[], high_level_data={}):
+        self.frame = low_level_data
+        self.high_level_data = high_level_data
+
+    def render_reasoning(self):
+        if self.high_level_data.get('fail'):
+            raise ValueError('echo failed')
+        return self.frame, self.high_level_data
+'''
+
+@pytest.fixture
+def shared_ring():
+    memory = shared_memory.SharedMemory(create=True, size=FrameRing.size_of(3, 4))
+    yield memory
+    memory.close()
+    memory.unlink()
+
+# FrameRing tests
+def test_FrameRing_reads_back_each_written_frame_in_order_and_is_full_after_num_slots_unread_frames(shared_ring):
+    # Arrange
+    fake_frames = [[pytest.gen.uniform(-100, 100) for _ in range(4)] for _ in range(3)] # arbitrary floats
+
+    writer = FrameRing(shared_ring, 3, 4)
+    writer.counts[:] = 0
+    reader = FrameRing(shared_ring, 3, 4)
+
+    # Act
+    for frame in fake_frames:
+        assert writer.is_full() == False
+        writer.write(frame)
+
+    # Assert
+    assert writer.is_full() == True
+    assert reader.read() == fake_frames[0]
+    assert writer.is_full() == False
+    writer.write(fake_frames[0])
+    assert [reader.read() for _ in range(3)] == fake_frames[1:] + fake_frames[:1]
+    del writer, reader
+
+# is_float_frame tests
+@pytest.mark.parametrize('arg_frame, expected_result', [([1.0, 2.5, -3.0], True),
+                                                        ([1.0, 2.5], False),
+                                                        ([1.0, 2, 3.0], False),
+                                                        ([1.0, '-', 3.0], False),
+                                                        ([1.0, True, 3.0], False)])
+def test_process_plugin_is_float_frame_only_accepts_full_frames_of_floats(arg_frame, expected_result):
+    assert process_plugin.is_float_frame(arg_frame, 3) == expected_result
+
+# serve_plugin tests
+def test_process_plugin_serve_plugin_updates_with_frames_from_the_ring_or_the_pipe_and_answers_renders(mocker, shared_ring):
+    # Arrange
+    fake_plugin = MagicMock()
+    fake_ring_frame = [1.0, 2.0, 3.0, 4.0]
+    fake_pipe_frame = MagicMock()
+    fake_high_level_data = MagicMock()
+    arg_connection = MagicMock()
+    arg_connection.recv.side_effect = [('update', None, fake_high_level_data),
+                                       ('update', fake_pipe_frame, fake_high_level_data),
+                                       ('reset', ),
+                                       ('render', ),
+                                       ('stop', )]
+
+    writer = FrameRing(shared_ring, 3, 4)
+    writer.counts[:] = 0
+    writer.write(fake_ring_frame)
+
+    mocker.patch(plugin_import.__name__ + '.import_plugins', return_value=[fake_plugin])
+
+    # Act
+    process_plugin.serve_plugin('fake_name', 'fake_path', ['a', 'b', 'c', 'd'], arg_connection, shared_ring.name, 3)
+
+    # Assert
+    assert plugin_import.import_plugins.call_args_list[0].args == (['a', 'b', 'c', 'd'], {'fake_name':'fake_path'})
+    assert fake_plugin.update.call_args_list[0].args == (fake_ring_frame, fake_high_level_data)
+    assert fake_plugin.update.call_args_list[1].args == (fake_pipe_frame, fake_high_level_data)
+    assert fake_plugin.reset.call_count == 1
+    assert arg_connection.send.call_args_list[0].args == (('ready', fake_plugin.cache_reasoning), )
+    assert arg_connection.send.call_args_list[1].args == (('result', fake_plugin.render_reasoning.return_value), )
+    assert writer.counts[1] == 1
+    assert arg_connection.close.call_count == 1
+    del writer
+
+def test_process_plugin_serve_plugin_answers_the_render_after_a_failed_update_with_its_error_and_skips_updates_until_then(mocker, shared_ring):
+    # Arrange
+    fake_plugin = MagicMock()
+    fake_plugin.update.side_effect = [ValueError('update failed'), None]
+    arg_connection = MagicMock()
+    arg_connection.recv.side_effect = [('update', [], {}),
+                                       ('update', [], {}),
+                                       ('render', ),
+                                       ('update', [], {}),
+                                       ('render', ),
+                                       ('stop', )]
+
+    mocker.patch(plugin_import.__name__ + '.import_plugins', return_value=[fake_plugin])
+
+    # Act
+    process_plugin.serve_plugin('fake_name', 'fake_path', ['a'], arg_connection, shared_ring.name, 3)
+
+    # Assert
+    assert fake_plugin.update.call_count == 2
+    assert arg_connection.send.call_args_list[1].args[0][0] == 'error'
+    assert 'update failed' in arg_connection.send.call_args_list[1].args[0][1]
+    assert arg_connection.send.call_args_list[2].args == (('result', fake_plugin.render_reasoning.return_value), )
+
+def test_process_plugin_serve_plugin_answers_finish_once_the_plugin_is_finished_or_with_the_error_of_a_failed_update(mocker, shared_ring):
+    # Arrange
+    fake_plugin = MagicMock()
+    fake_plugin.update.side_effect = ValueError('update failed')
+    arg_connection = MagicMock()
+    arg_connection.recv.side_effect = [('finish', ),
+                                       ('update', [], {}),
+                                       ('finish', ),
+                                       ('stop', )]
+
+    mocker.patch(plugin_import.__name__ + '.import_plugins', return_value=[fake_plugin])
+
+    # Act
+    process_plugin.serve_plugin('fake_name', 'fake_path', ['a'], arg_connection, shared_ring.name, 3)
+
+    # Assert
+    assert fake_plugin.finish.call_count == 1
+    assert arg_connection.send.call_args_list[1].args == (('result', None), )
+    assert arg_connection.send.call_args_list[2].args[0][0] == 'error'
+    assert 'update failed' in arg_connection.send.call_args_list[2].args[0][1]
+
+def test_process_plugin_serve_plugin_sends_the_error_and_returns_when_the_plugin_cannot_be_built(mocker, shared_ring):
+    # Arrange
+    arg_connection = MagicMock()
+
+    mocker.patch(plugin_import.__name__ + '.import_plugins', side_effect=ImportError('no such plugin'))
+
+    # Act
+    process_plugin.serve_plugin('fake_name', 'fake_path', ['a'], arg_connection, shared_ring.name, 3)
+
+    # Assert
+    assert arg_connection.send.call_count == 1
+    assert arg_connection.send.call_args_list[0].args[0][0] == 'error'
+    assert 'no such plugin' in arg_connection.send.call_args_list[0].args[0][1]
+    assert arg_connection.recv.call_count == 0
+
+# ProcessPlugin tests
+def test_ProcessPlugin_update_writes_float_frames_to_the_ring_and_sends_other_frames_over_the_pipe():
+    # Arrange
+    arg_float_frame = [1.0, 2.0]
+    arg_other_frame = ['-', 2.0]
+    arg_high_level_data = MagicMock()
+
+    cut = ProcessPlugin.__new__(ProcessPlugin)
+    cut.ring = MagicMock()
+    cut.ring.frame_size = 2
+    cut.ring.is_full.return_value = False
+    cut.connection = MagicMock()
+
+    # Act
+    cut.update(arg_float_frame, arg_high_level_data)
+    cut.update(arg_other_frame, arg_high_level_data)
+
+    # Assert
+    assert cut.ring.write.call_count == 1
+    assert cut.ring.write.call_args_list[0].args == (arg_float_frame, )
+    assert cut.connection.send.call_args_list[0].args == (('update', None, arg_high_level_data), )
+    assert cut.connection.send.call_args_list[1].args == (('update', arg_other_frame, arg_high_level_data), )
+
+def test_ProcessPlugin_update_raises_RuntimeError_when_the_ring_is_full_and_the_worker_has_exited():
+    # Arrange
+    cut = ProcessPlugin.__new__(ProcessPlugin)
+    cut.component_name = 'fake_name'
+    cut.ring = MagicMock()
+    cut.ring.frame_size = 1
+    cut.ring.is_full.return_value = True
+    cut.process = MagicMock()
+    cut.process.is_alive.return_value = False
+    cut.connection = MagicMock()
+
+    # Act
+    with pytest.raises(RuntimeError) as e_info:
+        cut.update([1.0])
+
+    # Assert
+    assert e_info.match("Plugin 'fake_name' worker process has exited")
+    assert cut.connection.send.call_count == 0
+
+def test_ProcessPlugin_reset_tells_the_worker_to_reset_without_waiting_for_an_answer():
+    # Arrange
+    cut = ProcessPlugin.__new__(ProcessPlugin)
+    cut.connection = MagicMock()
+
+    # Act
+    cut.reset()
+
+    # Assert
+    assert cut.connection.send.call_args_list[0].args == (('reset', ), )
+    assert cut.connection.recv.call_count == 0
+
+def test_ProcessPlugin_finish_tells_the_worker_to_finish_and_waits_for_its_answer():
+    # Arrange
+    cut = ProcessPlugin.__new__(ProcessPlugin)
+    cut.connection = MagicMock()
+    cut.connection.recv.return_value = ('result', None)
+
+    # Act
+    result = cut.finish()
+
+    # Assert
+    assert cut.connection.send.call_args_list[0].args == (('finish', ), )
+    assert cut.connection.recv.call_count == 1
+    assert result == None
+
+def test_ProcessPlugin_render_reasoning_asks_the_worker_and_returns_its_result():
+    # Arrange
+    fake_result = MagicMock()
+
+    cut = ProcessPlugin.__new__(ProcessPlugin)
+    cut.connection = MagicMock()
+    cut.connection.recv.return_value = ('result', fake_result)
+
+    # Act
+    result = cut.render_reasoning()
+
+    # Assert
+    assert cut.connection.send.call_args_list[0].args == (('render', ), )
+    assert result == fake_result
+
+@pytest.mark.parametrize('arg_recv, expected_message', [({'return_value':('error', 'fake traceback')}, 'failed in its worker process:\nfake traceback'),
+                                                        ({'side_effect':EOFError}, 'worker process has exited')])
+def test_ProcessPlugin_receive_raises_RuntimeError_for_an_error_or_a_closed_pipe(arg_recv, expected_message):
+    # Arrange
+    cut = ProcessPlugin.__new__(ProcessPlugin)
+    cut.component_name = 'fake_name'
+    cut.connection = MagicMock(**{'recv.' + key : value for key, value in arg_recv.items()})
+
+    # Act
+    with pytest.raises(RuntimeError) as e_info:
+        cut.receive()
+
+    # Assert
+    assert str(e_info.value) == f"Plugin 'fake_name' {expected_message}"
+
+def test_ProcessPlugin_runs_the_plugin_in_a_worker_process_giving_it_the_same_frames(tmp_path):
+    # Arrange
+    plugin_dir = tmp_path / 'process_echo'
+    plugin_dir.mkdir()
+    (plugin_dir / '__init__.py').write_text('')
+    (plugin_dir / 'process_echo_plugin.py').write_text(ECHO_PLUGIN)
+    fake_frames = [[pytest.gen.uniform(-100, 100) for _ in range(3)] for _ in range(6)] # arbitrary floats
+    fake_frames.append(['-', 1, 2.0])
+
+    cut = ProcessPlugin('echo', ['a', 'b', 'c'], str(plugin_dir))
+
+    try:
+        # Act
+        results = []
+        for i, frame in enumerate(fake_frames):
+            cut.update(frame, {'frame':i})
+            results.append(cut.render_reasoning())
+        cut.update([], {'fail':True})
+        with pytest.raises(RuntimeError) as e_info:
+            cut.render_reasoning()
+
+        # Assert
+        assert cut.cache_reasoning == False
+        assert results == [(frame, {'frame':i}) for i, frame in enumerate(fake_frames)]
+        assert 'echo failed' in str(e_info.value)
+    finally:
+        cut.close()
+
+    assert cut.memory == None
+    assert cut.process.is_alive() == False
+    cut.close()
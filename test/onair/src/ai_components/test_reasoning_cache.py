@@ -0,0 +1,155 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test ReasoningCache Functionality """
+import pytest
+from unittest.mock import MagicMock
+import asyncio
+
+from onair.src.ai_components.reasoning_cache import ReasoningCache
+
+# __init__ tests
+def test_ReasoningCache__init__starts_at_epoch_0_with_no_results():
+    # Arrange
+    cut = ReasoningCache.__new__(ReasoningCache)
+
+    # Act
+    cut.__init__()
+
+    # Assert
+    assert cut.epoch == 0
+    assert cut.results == {}
+
+# new_frame tests
+def test_ReasoningCache_new_frame_moves_to_next_epoch():
+    # Arrange
+    fake_epoch = pytest.gen.randint(0, 100) # arbitrary, from 0 to 100
+
+    cut = ReasoningCache.__new__(ReasoningCache)
+    cut.epoch = fake_epoch
+
+    # Act
+    cut.new_frame()
+
+    # Assert
+    assert cut.epoch == fake_epoch + 1
+
+# render tests
+def test_ReasoningCache_render_renders_plugin_once_per_epoch():
+    # Arrange
+    arg_plugin = MagicMock()
+    arg_plugin.cache_reasoning = True
+    forced_reasonings = [MagicMock(), MagicMock()]
+    arg_plugin.render_reasoning.side_effect = forced_reasonings
+
+    cut = ReasoningCache()
+
+    # Act
+    first_results = [cut.render(arg_plugin) for _ in range(pytest.gen.randint(1, 5))] # arbitrary, from 1 to 5
+    cut.new_frame()
+    second_results = [cut.render(arg_plugin) for _ in range(pytest.gen.randint(1, 5))] # arbitrary, from 1 to 5
+
+    # Assert
+    assert arg_plugin.render_reasoning.call_count == 2
+    assert all(result == forced_reasonings[0] for result in first_results)
+    assert all(result == forced_reasonings[1] for result in second_results)
+
+def test_ReasoningCache_render_keeps_results_of_each_plugin_apart():
+    # Arrange
+    arg_plugins = [MagicMock(), MagicMock()]
+    for plugin in arg_plugins:
+        plugin.cache_reasoning = True
+
+    cut = ReasoningCache()
+
+    # Act
+    results = [cut.render(plugin) for plugin in arg_plugins + arg_plugins]
+
+    # Assert
+    assert results == [plugin.render_reasoning.return_value for plugin in arg_plugins + arg_plugins]
+    for plugin in arg_plugins:
+        assert plugin.render_reasoning.call_count == 1
+
+def test_ReasoningCache_render_renders_every_time_when_plugin_opts_out():
+    # Arrange
+    arg_plugin = MagicMock()
+    arg_plugin.cache_reasoning = False
+    num_renders = pytest.gen.randint(1, 5) # arbitrary, from 1 to 5
+
+    cut = ReasoningCache()
+
+    # Act
+    for _ in range(num_renders):
+        cut.render(arg_plugin)
+
+    # Assert
+    assert arg_plugin.render_reasoning.call_count == num_renders
+    assert cut.results == {}
+
+def test_ReasoningCache_render_caches_plugins_without_cache_reasoning_attribute():
+    # Arrange
+    class FakePlugin:
+        renders = 0
+        def render_reasoning(self):
+            self.renders += 1
+            return self.renders
+
+    arg_plugin = FakePlugin()
+
+    cut = ReasoningCache()
+
+    # Act
+    results = [cut.render(arg_plugin), cut.render(arg_plugin)]
+
+    # Assert
+    assert results == [1, 1]
+
+# render_async tests
+def test_ReasoningCache_render_async_awaits_a_coroutine_render_reasoning_once_per_epoch():
+    # Arrange
+    fake_reasoning = MagicMock()
+    arg_plugin = MagicMock()
+    arg_plugin.cache_reasoning = True
+    renders = []
+
+    async def render_reasoning():
+        renders.append(True)
+        return fake_reasoning
+
+    arg_plugin.render_reasoning = render_reasoning
+
+    cut = ReasoningCache()
+
+    async def render_twice():
+        return await cut.render_async(arg_plugin), await cut.render_async(arg_plugin)
+
+    # Act
+    result = asyncio.run(render_twice())
+
+    # Assert
+    assert result == (fake_reasoning, fake_reasoning)
+    assert len(renders) == 1
+
+def test_ReasoningCache_render_async_renders_every_time_for_plugin_opted_out_of_caching():
+    # Arrange
+    arg_plugin = MagicMock()
+    arg_plugin.cache_reasoning = False
+
+    cut = ReasoningCache()
+
+    async def render_twice():
+        return await cut.render_async(arg_plugin), await cut.render_async(arg_plugin)
+
+    # Act
+    result = asyncio.run(render_twice())
+
+    # Assert
+    assert result == (arg_plugin.render_reasoning.return_value, arg_plugin.render_reasoning.return_value)
+    assert arg_plugin.render_reasoning.call_count == 2
+    assert cut.results == {}
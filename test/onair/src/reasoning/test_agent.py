@@ -9,7 +9,8 @@
 
 """ Test Agent Functionality """
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, AsyncMock
+import asyncio
 
 import onair.src.reasoning.agent as agent
 from onair.src.reasoning.agent import Agent
@@ -48,12 +49,15 @@ def test_Agent__init__sets_vehicle_rep_to_given_vehicle_and_learning_systems_and
     assert arg_vehicle.get_headers.call_args_list[0].args == ()
     assert agent.LearnersInterface.call_count == 1
     assert agent.LearnersInterface.call_args_list[0].args == (fake_headers, arg_learners_plugin_dict)
+    assert agent.LearnersInterface.call_args_list[0].kwargs == {'parallel':False, 'process_plugins':()}
     assert cut.learning_systems == fake_learning_systems
     assert agent.PlannersInterface.call_count == 1
     assert agent.PlannersInterface.call_args_list[0].args == (fake_headers, arg_planners_plugin_dict)
+    assert agent.PlannersInterface.call_args_list[0].kwargs == {'parallel':False, 'process_plugins':()}
     assert cut.planning_systems == fake_planning_systems
     assert agent.ComplexReasoningInterface.call_count == 1
     assert agent.ComplexReasoningInterface.call_args_list[0].args == (fake_headers, arg_complex_plugin_dict)
+    assert agent.ComplexReasoningInterface.call_args_list[0].kwargs == {'parallel':False, 'process_plugins':()}
     assert cut.complex_reasoning_systems == fake_complex_systems
     assert arg_vehicle.get_status.call_count == 1
     assert arg_vehicle.get_status.call_args_list[0].args == ()
@@ -125,6 +129,78 @@ def test_Agent_reason_updates_vehicle_rep_with_given_frame_learners_with_frame_a
     ], any_order=False)
 
 
+# reason_async tests
+def test_Agent_reason_async_awaits_each_layer_in_turn_passing_on_aggregated_high_level_data():
+    # Arrange
+    arg_frame = MagicMock()
+    fake_vehicle_rep_state = MagicMock()
+    fake_learning_systems_reasoning = MagicMock()
+    fake_planning_systems_reasoning = MagicMock()
+    seen_high_level_data = []
+
+    cut = Agent.__new__(Agent)
+    cut.vehicle_rep = MagicMock()
+    cut.vehicle_rep.get_state_information.return_value = fake_vehicle_rep_state
+    cut.learning_systems = MagicMock()
+    cut.learning_systems.update_async = AsyncMock(side_effect=lambda low_level_data, high_level_data: seen_high_level_data.append(dict(high_level_data)))
+    cut.learning_systems.render_reasoning_async = AsyncMock(return_value=fake_learning_systems_reasoning)
+    cut.planning_systems = MagicMock()
+    cut.planning_systems.update_async = AsyncMock(side_effect=lambda high_level_data: seen_high_level_data.append(dict(high_level_data)))
+    cut.planning_systems.render_reasoning_async = AsyncMock(return_value=fake_planning_systems_reasoning)
+    cut.complex_reasoning_systems = MagicMock()
+    cut.complex_reasoning_systems.update_and_render_reasoning_async = AsyncMock(side_effect=lambda high_level_data: dict(high_level_data))
+
+    # Act
+    result = asyncio.run(cut.reason_async(arg_frame))
+
+    # Assert
+    assert cut.vehicle_rep.update.call_args_list[0].args == (arg_frame, )
+    assert cut.learning_systems.update_async.call_args_list[0].args[0] == cut.vehicle_rep.curr_data
+    assert seen_high_level_data == [{'vehicle_rep':fake_vehicle_rep_state},
+                                    {'vehicle_rep':fake_vehicle_rep_state,
+                                     'learning_systems':fake_learning_systems_reasoning}]
+    assert result == {'vehicle_rep':fake_vehicle_rep_state,
+                      'learning_systems':fake_learning_systems_reasoning,
+                      'planning_systems':fake_planning_systems_reasoning}
+    assert cut.learning_systems.update.call_count == 0
+    assert cut.complex_reasoning_systems.update_and_render_reasoning.call_count == 0
+
+# reset tests
+def test_Agent_reset_resets_vehicle_rep_and_every_layer():
+    # Arrange
+    cut = Agent.__new__(Agent)
+    cut.vehicle_rep = MagicMock()
+    cut.learning_systems = MagicMock()
+    cut.planning_systems = MagicMock()
+    cut.complex_reasoning_systems = MagicMock()
+
+    # Act
+    cut.reset()
+
+    # Assert
+    assert cut.vehicle_rep.reset.call_count == 1
+    assert cut.learning_systems.reset.call_count == 1
+    assert cut.planning_systems.reset.call_count == 1
+    assert cut.complex_reasoning_systems.reset.call_count == 1
+
+# finish tests
+def test_Agent_finish_finishes_vehicle_rep_and_every_layer():
+    # Arrange
+    cut = Agent.__new__(Agent)
+    cut.vehicle_rep = MagicMock()
+    cut.learning_systems = MagicMock()
+    cut.planning_systems = MagicMock()
+    cut.complex_reasoning_systems = MagicMock()
+
+    # Act
+    cut.finish()
+
+    # Assert
+    assert cut.vehicle_rep.finish.call_count == 1
+    assert cut.learning_systems.finish.call_count == 1
+    assert cut.planning_systems.finish.call_count == 1
+    assert cut.complex_reasoning_systems.finish.call_count == 1
+
 # diagnose tests
 def test_Agent_diagnose_returns_empty_Dict():
     # Arrange
@@ -10,9 +10,12 @@
 """ Test PlannersInterface Functionality """
 import pytest
 from unittest.mock import MagicMock
+import threading
+import asyncio
 
 import onair.src.reasoning.complex_reasoning_interface as complex_reasoning_interface
 from onair.src.reasoning.complex_reasoning_interface import ComplexReasoningInterface
+from onair.src.ai_components.plugin_executor import PluginExecutor
 
 # __init__ tests
 def test_ComplexReasoningInterface__init__raises_AssertionError_when_given_headers_len_is_0():
@@ -38,8 +41,10 @@ def test_ComplexReasoningInterface__init__sets_self_headers_to_given_headers_and
     arg_headers.__len__.return_value = 1
 
     forced_return_reasoning_constructs = MagicMock()
+    fake_reasoning_cache = MagicMock()
 
     mocker.patch(complex_reasoning_interface.__name__ + '.import_plugins', return_value=forced_return_reasoning_constructs)
+    mocker.patch(complex_reasoning_interface.__name__ + '.ReasoningCache', return_value=fake_reasoning_cache)
 
 
     cut = ComplexReasoningInterface.__new__(ComplexReasoningInterface)
@@ -52,6 +57,7 @@ def test_ComplexReasoningInterface__init__sets_self_headers_to_given_headers_and
     assert complex_reasoning_interface.import_plugins.call_count == 1
     assert complex_reasoning_interface.import_plugins.call_args_list[0].args == (arg_headers, arg__reasoning_plugins)
     assert cut.reasoning_constructs == forced_return_reasoning_constructs
+    assert cut.reasoning_cache == fake_reasoning_cache
 
 # update_and_render_reasoning
 def test_ComplexReasoningInterface_update_and_render_reasoning_returns_given_high_level_data_with_complex_systems_as_empty_dict_when_no_reasoning_constructs(mocker):
@@ -96,6 +102,25 @@ def test_ComplexReasoningInterface_update_and_render_reasoning_invokes_on_all_re
     assert result == expected_result
     assert cut.reasoning_constructs[0].update.call_count == 1
 
+def test_ComplexReasoningInterface_update_and_render_reasoning_starts_new_frame_of_reasoning_cache_and_renders_through_it(mocker):
+    # Arrange
+    arg_high_level_data = {}
+    fake_plugin = MagicMock()
+    fake_plugin.component_name = MagicMock()
+
+    cut = ComplexReasoningInterface.__new__(ComplexReasoningInterface)
+    cut.reasoning_constructs = [fake_plugin]
+    cut.reasoning_cache = MagicMock()
+
+    # Act
+    result = cut.update_and_render_reasoning(arg_high_level_data)
+
+    # Assert
+    assert cut.reasoning_cache.new_frame.call_count == 1
+    assert cut.reasoning_cache.render.call_args_list[0].args == (fake_plugin, )
+    assert result['complex_systems'] == {fake_plugin.component_name : cut.reasoning_cache.render.return_value}
+    assert fake_plugin.render_reasoning.call_count == 0
+
 # check_for_salient_event tests
 def test_ComplexReasoningInterface_salient_event_does_nothing():
     # Arrange
@@ -106,3 +131,164 @@ def test_ComplexReasoningInterface_salient_event_does_nothing():
 
     # Assert
     assert result == None
+
+# reset tests
+def test_ComplexReasoningInterface_reset_resets_each_plugin():
+    # Arrange
+    cut = ComplexReasoningInterface.__new__(ComplexReasoningInterface)
+    cut.reasoning_constructs = [MagicMock() for _ in range(pytest.gen.randint(0, 5))] # arbitrary, from 0 to 5
+
+    # Act
+    cut.reset()
+
+    # Assert
+    for plugin in cut.reasoning_constructs:
+        assert plugin.reset.call_count == 1
+        assert plugin.reset.call_args_list[0].args == ()
+
+# finish tests
+def test_ComplexReasoningInterface_finish_finishes_each_plugin():
+    # Arrange
+    cut = ComplexReasoningInterface.__new__(ComplexReasoningInterface)
+    cut.reasoning_constructs = [MagicMock() for _ in range(pytest.gen.randint(0, 5))] # arbitrary, from 0 to 5
+
+    # Act
+    cut.finish()
+
+    # Assert
+    for plugin in cut.reasoning_constructs:
+        assert plugin.finish.call_count == 1
+        assert plugin.finish.call_args_list[0].args == ()
+
+# parallel tests
+def test_ComplexReasoningInterface__init__runs_plugins_on_a_PluginExecutor_with_a_worker_for_each_plugin_when_parallel(mocker):
+    # Arrange
+    arg_headers = MagicMock()
+    arg_headers.__len__.return_value = 1
+    fake_constructs = [MagicMock() for _ in range(pytest.gen.randint(2, 10))] # arbitrary, from 2 to 10
+    fake_executor = MagicMock()
+
+    mocker.patch(complex_reasoning_interface.__name__ + '.import_plugins', return_value=fake_constructs)
+    mocker.patch(complex_reasoning_interface.__name__ + '.PluginExecutor', return_value=fake_executor)
+
+    cut = ComplexReasoningInterface.__new__(ComplexReasoningInterface)
+
+    # Act
+    cut.__init__(arg_headers, MagicMock(), parallel=True)
+
+    # Assert
+    assert complex_reasoning_interface.PluginExecutor.call_count == 1
+    assert complex_reasoning_interface.PluginExecutor.call_args_list[0].args == (len(fake_constructs), )
+    assert cut.executor == fake_executor
+
+@pytest.mark.parametrize('arg_parallel, arg_num_plugins', [(False, 2), (True, 1), (True, 0)])
+def test_ComplexReasoningInterface__init__has_no_executor_unless_parallel_with_more_than_one_plugin(mocker, arg_parallel, arg_num_plugins):
+    # Arrange
+    arg_headers = MagicMock()
+    arg_headers.__len__.return_value = 1
+
+    mocker.patch(complex_reasoning_interface.__name__ + '.import_plugins', return_value=[MagicMock() for _ in range(arg_num_plugins)])
+    mocker.patch(complex_reasoning_interface.__name__ + '.PluginExecutor')
+
+    cut = ComplexReasoningInterface.__new__(ComplexReasoningInterface)
+
+    # Act
+    cut.__init__(arg_headers, MagicMock(), parallel=arg_parallel)
+
+    # Assert
+    assert complex_reasoning_interface.PluginExecutor.call_count == 0
+    assert cut.executor == None
+
+def test_ComplexReasoningInterface_update_and_render_reasoning_runs_every_plugin_at_once_without_each_others_reasoning_with_an_executor():
+    # Arrange
+    num_plugins = pytest.gen.randint(2, 6) # arbitrary, from 2 to 6
+    # Every plugin waits for all the others, which only finishes when they run at once
+    barrier = threading.Barrier(num_plugins, timeout=5)
+    arg_high_level_data = {'vehicle_rep':MagicMock()}
+    seen_complex_systems = []
+
+    cut = ComplexReasoningInterface.__new__(ComplexReasoningInterface)
+    cut.reasoning_constructs = []
+    cut.executor = PluginExecutor(num_plugins)
+
+    def update(high_level_data):
+        seen_complex_systems.append(dict(high_level_data['complex_systems']))
+        barrier.wait()
+
+    for i in range(num_plugins):
+        fake_plugin = MagicMock()
+        fake_plugin.component_name = f'plugin_{i}'
+        fake_plugin.update.side_effect = update
+        fake_plugin.render_reasoning.side_effect = lambda i=i: (barrier.wait(), i)[1]
+        cut.reasoning_constructs.append(fake_plugin)
+
+    # Act
+    result = cut.update_and_render_reasoning(arg_high_level_data)
+    cut.executor.shutdown()
+
+    # Assert
+    assert result is arg_high_level_data
+    assert list(result['complex_systems'].items()) == [(f'plugin_{i}', i) for i in range(num_plugins)]
+    assert seen_complex_systems == [{}] * num_plugins
+
+# update_and_render_reasoning_async tests
+@pytest.mark.parametrize('arg_parallel', [False, True])
+def test_ComplexReasoningInterface_update_and_render_reasoning_async_awaits_coroutine_hooks_and_keeps_plugin_order(arg_parallel):
+    # Arrange
+    num_plugins = pytest.gen.randint(2, 6) # arbitrary, from 2 to 6
+    arg_high_level_data = {'vehicle_rep':MagicMock()}
+    seen_complex_systems = []
+
+    cut = ComplexReasoningInterface.__new__(ComplexReasoningInterface)
+    cut.reasoning_constructs = []
+    cut.executor = MagicMock() if arg_parallel else None
+
+    for i in range(num_plugins):
+        fake_plugin = MagicMock()
+        fake_plugin.component_name = f'plugin_{i}'
+        # Even plugins have coroutine hooks
+        if i % 2 == 0:
+            async def update(high_level_data):
+                seen_complex_systems.append(dict(high_level_data['complex_systems']))
+            async def render_reasoning(i=i):
+                return i
+            fake_plugin.update = update
+            fake_plugin.render_reasoning = render_reasoning
+        else:
+            fake_plugin.update.side_effect = lambda high_level_data: seen_complex_systems.append(dict(high_level_data['complex_systems']))
+            fake_plugin.render_reasoning.return_value = i
+        cut.reasoning_constructs.append(fake_plugin)
+
+    # Act
+    result = asyncio.run(cut.update_and_render_reasoning_async(arg_high_level_data))
+
+    # Assert
+    assert result is arg_high_level_data
+    assert list(result['complex_systems'].items()) == [(f'plugin_{i}', i) for i in range(num_plugins)]
+    if arg_parallel:
+        assert seen_complex_systems == [{}] * num_plugins
+    else:
+        assert seen_complex_systems == [{f'plugin_{j}':j for j in range(i)} for i in range(num_plugins)]
+
+def test_ComplexReasoningInterface_update_and_render_reasoning_async_starts_new_frame_of_reasoning_cache_and_renders_through_it():
+    # Arrange
+    fake_plugin = MagicMock()
+    fake_plugin.component_name = 'plugin'
+    fake_reasoning = MagicMock()
+
+    async def render_async(plugin):
+        return fake_reasoning
+
+    cut = ComplexReasoningInterface.__new__(ComplexReasoningInterface)
+    cut.reasoning_constructs = [fake_plugin]
+    cut.reasoning_cache = MagicMock()
+    cut.reasoning_cache.render_async = MagicMock(side_effect=render_async)
+
+    # Act
+    result = asyncio.run(cut.update_and_render_reasoning_async({}))
+
+    # Assert
+    assert cut.reasoning_cache.new_frame.call_count == 1
+    assert cut.reasoning_cache.render_async.call_args_list[0].args == (fake_plugin, )
+    assert fake_plugin.render_reasoning.call_count == 0
+    assert result == {'complex_systems':{'plugin':fake_reasoning}}
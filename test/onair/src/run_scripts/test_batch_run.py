@@ -0,0 +1,163 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test Batch Run Functionality """
+import pytest
+from unittest.mock import MagicMock
+import json
+
+import onair.src.run_scripts.batch_run as batch_run
+
+# run_batch tests
+def test_batch_run_run_batch_runs_files_in_order_without_pool_when_max_workers_is_1(mocker):
+    # Arrange
+    arg_config_file = MagicMock()
+    arg_telemetry_files = [MagicMock() for _ in range(pytest.gen.randint(0, 5))] # arbitrary, from 0 to 5
+    fake_results = [MagicMock() for _ in arg_telemetry_files]
+    fake_summary = MagicMock()
+
+    arg_run_params = MagicMock()
+
+    mocker.patch(batch_run.__name__ + '.ExecutionEngine')
+    mocker.patch(batch_run.__name__ + '.run_telemetry_file', side_effect=fake_results)
+    mocker.patch(batch_run.__name__ + '.ProcessPoolExecutor')
+    mocker.patch(batch_run.__name__ + '.time.perf_counter', side_effect=[1.0, 3.5])
+    mocker.patch(batch_run.__name__ + '.summarize_batch', return_value=fake_summary)
+
+    # Act
+    result = batch_run.run_batch(arg_config_file, arg_telemetry_files, 1, arg_run_params)
+
+    # Assert
+    assert batch_run.ExecutionEngine.call_args_list[0].args == ()
+    assert batch_run.ExecutionEngine.return_value.init_save_paths.call_count == 1
+    assert batch_run.ProcessPoolExecutor.call_count == 0
+    assert batch_run.run_telemetry_file.call_count == len(arg_telemetry_files)
+    for i in range(len(arg_telemetry_files)):
+        assert batch_run.run_telemetry_file.call_args_list[i].args == (arg_config_file, arg_telemetry_files[i], arg_run_params)
+    assert batch_run.summarize_batch.call_args_list[0].args == (fake_results, 2.5)
+    assert result == fake_summary
+
+def test_batch_run_run_batch_maps_files_over_process_pool_when_max_workers_is_not_1(mocker):
+    # Arrange
+    arg_config_file = MagicMock()
+    arg_telemetry_files = [MagicMock(), MagicMock()]
+    arg_max_workers = pytest.gen.choice([None, 2, 8])
+    arg_run_params = MagicMock()
+    fake_pool = MagicMock()
+    fake_results = [MagicMock(), MagicMock()]
+
+    mock_manager = mocker.MagicMock()
+    mock_manager.attach_mock(mocker.patch(batch_run.__name__ + '.ExecutionEngine'), 'ExecutionEngine')
+    mock_manager.attach_mock(mocker.patch(batch_run.__name__ + '.ProcessPoolExecutor'), 'ProcessPoolExecutor')
+    batch_run.ProcessPoolExecutor.return_value.__enter__.return_value = fake_pool
+    fake_pool.map.return_value = iter(fake_results)
+    mocker.patch(batch_run.__name__ + '.summarize_batch')
+
+    # Act
+    batch_run.run_batch(arg_config_file, arg_telemetry_files, arg_max_workers, arg_run_params)
+
+    # Assert
+    # Save paths are made before any worker starts
+    mock_manager.assert_has_calls([
+        mocker.call.ExecutionEngine(),
+        mocker.call.ExecutionEngine().init_save_paths(),
+        mocker.call.ProcessPoolExecutor(max_workers=arg_max_workers),
+    ], any_order=False)
+    assert fake_pool.map.call_args_list[0].args == (batch_run.run_telemetry_file,
+                                                    [arg_config_file] * 2,
+                                                    arg_telemetry_files,
+                                                    [arg_run_params] * 2)
+    assert batch_run.summarize_batch.call_args_list[0].args[0] == fake_results
+
+# run_telemetry_file tests
+def test_batch_run_run_telemetry_file_runs_new_engine_on_telemetry_file_and_returns_its_results(mocker):
+    # Arrange
+    arg_config_file = MagicMock()
+    arg_telemetry_file = str(MagicMock())
+    fake_engine = MagicMock()
+    fake_timeline = [MagicMock() for _ in range(pytest.gen.randint(0, 10))] # arbitrary, from 0 to 10
+
+    mocker.patch(batch_run.__name__ + '.random.seed')
+    mocker.patch(batch_run.__name__ + '.ExecutionEngine', return_value=fake_engine)
+    mocker.patch(batch_run.__name__ + '.time.perf_counter', side_effect=[2.0, 5.0])
+    fake_engine.sim.status_timeline = fake_timeline
+
+    # Act
+    result = batch_run.run_telemetry_file(arg_config_file, arg_telemetry_file)
+
+    # Assert
+    assert batch_run.random.seed.call_args_list[0].args == (arg_telemetry_file, )
+    assert batch_run.ExecutionEngine.call_args_list[0].args == ()
+    assert fake_engine.config_filepath == arg_config_file
+    assert fake_engine.parse_configs.call_args_list[0].args == (arg_config_file, )
+    assert fake_engine.set_run_param.call_count == 0
+    assert fake_engine.fullTelemetryFile == arg_telemetry_file
+    assert fake_engine.parse_data.call_args_list[0].args == (fake_engine.data_source_file, arg_telemetry_file, fake_engine.fullMetaFile, fake_engine.subsystems_breakdown)
+    assert fake_engine.setup_sim.call_count == 1
+    assert fake_engine.sim.record_statuses == True
+    assert fake_engine.run_sim.call_count == 1
+    assert result == {'telemetry_file':arg_telemetry_file,
+                      'diagnosis':fake_engine.run_sim.return_value,
+                      'status_timeline':fake_timeline,
+                      'frames':len(fake_timeline),
+                      'seconds':3.0}
+
+def test_batch_run_run_telemetry_file_sets_run_params_over_those_of_the_config_file(mocker):
+    # Arrange
+    arg_run_params = {'run_start_time' : '45:00', 'run_end_time' : '50:00', 'run_max_frames' : 100}
+    fake_engine = MagicMock()
+    fake_engine.sim.status_timeline = []
+
+    mocker.patch(batch_run.__name__ + '.random.seed')
+    mocker.patch(batch_run.__name__ + '.ExecutionEngine', return_value=fake_engine)
+
+    # Act
+    batch_run.run_telemetry_file(MagicMock(), 'fake_file', arg_run_params)
+
+    # Assert
+    assert [call.args for call in fake_engine.set_run_param.call_args_list] == list(arg_run_params.items())
+    assert fake_engine.method_calls.index(mocker.call.parse_configs(mocker.ANY)) < \
+           fake_engine.method_calls.index(mocker.call.set_run_param('run_start_time', '45:00'))
+
+# summarize_batch tests
+def test_batch_run_summarize_batch_totals_frames_and_rate():
+    # Arrange
+    arg_results = [{'frames':pytest.gen.randint(0, 100)} for _ in range(3)] # arbitrary, from 0 to 100
+    arg_seconds = 2.0
+
+    # Act
+    result = batch_run.summarize_batch(arg_results, arg_seconds)
+
+    # Assert
+    total_frames = sum(r['frames'] for r in arg_results)
+    assert result == {'files':arg_results,
+                      'total_frames':total_frames,
+                      'seconds':arg_seconds,
+                      'frames_per_second':total_frames / arg_seconds}
+
+def test_batch_run_summarize_batch_rate_is_zero_when_no_time_has_passed():
+    # Act
+    result = batch_run.summarize_batch([], 0)
+
+    # Assert
+    assert result['total_frames'] == 0
+    assert result['frames_per_second'] == 0.0
+
+# save_batch_summary tests
+def test_batch_run_save_batch_summary_writes_summary_as_json(tmp_path):
+    # Arrange
+    arg_summary = {'files':[{'telemetry_file':'a.csv', 'status_timeline':['GREEN']}], 'total_frames':1}
+    arg_save_file = str(tmp_path / 'summary.json')
+
+    # Act
+    batch_run.save_batch_summary(arg_summary, arg_save_file)
+
+    # Assert
+    with open(arg_save_file, 'r') as f:
+        assert json.load(f) == arg_summary
@@ -36,6 +36,17 @@ def test_ExecutionEngine__init__sets_expected_values_but_does_no_calls_when_conf
     # Assert
     assert cut.run_name == arg_run_name
     assert cut.IO_Enabled == False
+    assert cut.run_start_time == None
+    assert cut.run_end_time == None
+    assert cut.run_max_frames == None
+    assert cut.subsystems_breakdown == False
+    assert cut.prefetch_depth == 0
+    assert cut.prefetch_drop_frames == False
+    assert cut.async_run == False
+    assert cut.evidence_confidence == False
+    assert cut.subsystem_rollup_mode == 'strict'
+    assert cut.parallel_layers == []
+    assert cut.process_plugins == []
     assert cut.dataFilePath == ''
     assert cut.telemetryFile == ''
     assert cut.fullTelemetryFile == ''
@@ -75,7 +86,7 @@ def test_ExecutionEngine__init__does_calls_when_config_file_is_an_occupied_strin
     assert cut.parse_configs.call_args_list[0].args == (arg_config_file, )
     assert cut.parse_data.call_count == 1
     assert cut.parse_data.call_args_list[0].args == (
-        cut.data_source_file, cut.dataFilePath, cut.metadataFilePath, )
+        cut.data_source_file, cut.dataFilePath, cut.metadataFilePath, cut.subsystems_breakdown, )
     assert cut.setup_sim.call_count == 1
 
 
@@ -261,6 +272,7 @@ def test_ExecutionEngine_parse_configs_skips_OPTIONS_when_the_required_section_O
                         return_value=fake_config_read_result)
     mocker.patch.object(fake_config, "has_section", return_value=False)
     mocker.patch.object(cut, 'parse_plugins_dict', side_effect=fake_plugins)
+    mocker.patch.object(cut, 'parse_plugin_names')
     mocker.patch(execution_engine.__name__ + '.isinstance', return_value=True)
     mocker.patch(execution_engine.__name__ +
                  '.os.path.exists', return_value=True)
@@ -287,6 +299,40 @@ def test_ExecutionEngine_parse_configs_skips_OPTIONS_when_the_required_section_O
     assert cut.IO_Enabled == False
 
 
+def test_ExecutionEngine_parse_configs_sets_parallel_layers_to_the_layers_whose_PLUGINS_key_is_true(mocker):
+    # Arrange
+    arg_config_filepath = MagicMock()
+    fake_dict_for_Config = {
+        "FILES": MagicMock(),
+        "DATA_HANDLING": MagicMock(),
+        "PLUGINS": MagicMock()
+    }
+    fake_config = MagicMock()
+    fake_config.__getitem__.side_effect = fake_dict_for_Config.__getitem__
+    fake_config_read_result = MagicMock()
+    fake_config_read_result.__len__.return_value = 1
+    fake_parallel_keys = {'LearnersParallel':False, 'PlannersParallel':True, 'ComplexParallel':True}
+
+    cut = ExecutionEngine.__new__(ExecutionEngine)
+
+    mocker.patch(execution_engine.__name__ +
+                 '.configparser.ConfigParser', return_value=fake_config)
+    mocker.patch.object(fake_config, 'read',
+                        return_value=fake_config_read_result)
+    mocker.patch.object(fake_config, "has_section", return_value=False)
+    mocker.patch.object(fake_config, 'getboolean',
+                        side_effect=lambda section, key, fallback: fake_parallel_keys[key])
+    mocker.patch.object(cut, 'parse_plugins_dict')
+    mocker.patch.object(cut, 'parse_plugin_names')
+    mocker.patch(execution_engine.__name__ + '.os.path.join')
+
+    # Act
+    cut.parse_configs(arg_config_filepath)
+
+    # Assert
+    assert cut.parallel_layers == ['planners', 'complex']
+
+
 def test_ExecutionEngine_parse_configs_sets_all_items_without_error(mocker):
     # Arrange
     arg_config_filepath = MagicMock()
@@ -345,6 +391,7 @@ def test_ExecutionEngine_parse_configs_sets_all_items_without_error(mocker):
                         return_value=fake_config_read_result)
     mocker.patch.object(fake_config, "has_section", return_value=True)
     mocker.patch.object(cut, 'parse_plugins_dict', side_effect=fake_plugins)
+    mocker.patch.object(cut, 'parse_plugin_names')
     mocker.patch.object(fake_options, 'getboolean',
                         return_value=fake_IO_enabled)
     mocker.patch(execution_engine.__name__ + '.isinstance', return_value=True)
@@ -353,6 +400,7 @@ def test_ExecutionEngine_parse_configs_sets_all_items_without_error(mocker):
     mocker.patch.object(fake_plugin_dict, 'keys', return_value=fake_keys)
     mocker.patch.object(fake_plugin_dict, '__getitem__',
                         return_value=fake_path)
+    mocker.patch(execution_engine.__name__ + '.SUBSYSTEM_ROLLUP_MODES', [fake_options.get.return_value])
 
     # Act
     cut.parse_configs(arg_config_filepath)
@@ -370,9 +418,70 @@ def test_ExecutionEngine_parse_configs_sets_all_items_without_error(mocker):
     assert cut.learners_plugin_dict == fake_learners_plugin_list
     assert cut.planners_plugin_dict == fake_planners_plugin_list
     assert cut.complex_plugin_dict == fake_complex_plugin_list
-    assert fake_options.getboolean.call_count == 1
+    assert fake_options.getboolean.call_count == 5
     assert fake_options.getboolean.call_args_list[0].args == ('IO_Enabled', )
+    assert fake_options.getboolean.call_args_list[1].args == ('SubsystemBreakdown', )
+    assert fake_options.getboolean.call_args_list[1].kwargs == {'fallback':False}
+    assert fake_options.getboolean.call_args_list[2].args == ('PrefetchDropFrames', )
+    assert fake_options.getboolean.call_args_list[2].kwargs == {'fallback':False}
+    assert fake_options.getboolean.call_args_list[3].args == ('AsyncRun', )
+    assert fake_options.getboolean.call_args_list[3].kwargs == {'fallback':False}
+    assert fake_options.getboolean.call_args_list[4].args == ('EvidenceConfidence', )
+    assert fake_options.getboolean.call_args_list[4].kwargs == {'fallback':False}
     assert cut.IO_Enabled == fake_IO_enabled
+    assert cut.async_run == fake_IO_enabled
+    assert cut.evidence_confidence == fake_IO_enabled
+    assert cut.subsystems_breakdown == fake_IO_enabled
+    assert cut.prefetch_drop_frames == fake_IO_enabled
+    assert fake_options.get.call_count == 3
+    assert fake_options.get.call_args_list[0].args == ('StartTime', )
+    assert fake_options.get.call_args_list[0].kwargs == {'fallback':None}
+    assert fake_options.get.call_args_list[1].args == ('EndTime', )
+    assert fake_options.get.call_args_list[1].kwargs == {'fallback':None}
+    assert fake_options.get.call_args_list[2].args == ('SubsystemRollupMode', )
+    assert fake_options.get.call_args_list[2].kwargs == {'fallback':'strict'}
+    assert cut.subsystem_rollup_mode == fake_options.get.return_value
+    assert cut.run_start_time == fake_options.get.return_value
+    assert cut.run_end_time == fake_options.get.return_value
+    assert fake_options.getint.call_count == 2
+    assert fake_options.getint.call_args_list[0].args == ('MaxFrames', )
+    assert fake_options.getint.call_args_list[0].kwargs == {'fallback':None}
+    assert fake_options.getint.call_args_list[1].args == ('PrefetchDepth', )
+    assert fake_options.getint.call_args_list[1].kwargs == {'fallback':0}
+    assert cut.run_max_frames == fake_options.getint.return_value
+    assert cut.prefetch_depth == fake_options.getint.return_value
+    assert fake_config.getboolean.call_count == 3
+    assert fake_config.getboolean.call_args_list[0].args == ('PLUGINS', 'LearnersParallel')
+    assert fake_config.getboolean.call_args_list[1].args == ('PLUGINS', 'PlannersParallel')
+    assert fake_config.getboolean.call_args_list[2].args == ('PLUGINS', 'ComplexParallel')
+    assert fake_config.getboolean.call_args_list[2].kwargs == {'fallback':False}
+    assert cut.parallel_layers == ['learners', 'planners', 'complex']
+    assert fake_config.get.call_count == 1
+    assert fake_config.get.call_args_list[0].args == ('PLUGINS', 'ProcessPlugins')
+    assert fake_config.get.call_args_list[0].kwargs == {'fallback':'[]'}
+    assert cut.parse_plugin_names.call_count == 1
+    assert cut.parse_plugin_names.call_args_list[0].args == (fake_config.get.return_value, )
+    assert cut.process_plugins == cut.parse_plugin_names.return_value
+
+def test_ExecutionEngine_parse_configs_raises_ValueError_when_SubsystemRollupMode_is_not_a_mode(mocker, tmp_path):
+    # Arrange
+    arg_config_filepath = tmp_path / 'config.ini'
+    arg_config_filepath.write_text('[FILES]\nTelemetryFilePath = a\nTelemetryFile = b\nMetaFilePath = c\nMetaFile = d\n'
+                                   '[DATA_HANDLING]\nDataSourceFile = e\n'
+                                   '[PLUGINS]\nKnowledgeRepPluginDict = {}\nLearnersPluginDict = {}\n'
+                                   'PlannersPluginDict = {}\nComplexPluginDict = {}\n'
+                                   '[OPTIONS]\nIO_Enabled = false\nSubsystemRollupMode = median\n')
+
+    cut = ExecutionEngine.__new__(ExecutionEngine)
+
+    mocker.patch.object(cut, 'parse_plugins_dict')
+
+    # Act
+    with pytest.raises(ValueError) as e_info:
+        cut.parse_configs(str(arg_config_filepath))
+
+    # Assert
+    assert e_info.match('SubsystemRollupMode median')
 
 # parse_plugins_dict
 
@@ -589,6 +698,34 @@ def test_ExecutionEngine_returns_expected_dict_when_all_mapped_files_exist(mocke
         assert execution_engine.os.path.exists.call_args_list[i].args == (
             fake_path, )
 
+# parse_plugin_names tests
+
+
+def test_ExecutionEngine_parse_plugin_names_returns_the_names_of_a_list_of_strings():
+    # Arrange
+    cut = ExecutionEngine.__new__(ExecutionEngine)
+    cut.config_filepath = MagicMock()
+
+    # Act
+    result = cut.parse_plugin_names("['Learner 1', 'Planner 1']")
+
+    # Assert
+    assert result == ['Learner 1', 'Planner 1']
+
+
+@pytest.mark.parametrize('arg_config_plugin_names', ["{'Learner 1':'plugins/generic'}", "'Learner 1'", "['Learner 1', 2]"])
+def test_ExecutionEngine_parse_plugin_names_raises_ValueError_when_config_plugin_names_are_not_a_list_of_strings(arg_config_plugin_names):
+    # Arrange
+    cut = ExecutionEngine.__new__(ExecutionEngine)
+    cut.config_filepath = MagicMock()
+
+    # Act
+    with pytest.raises(ValueError) as e_info:
+        cut.parse_plugin_names(arg_config_plugin_names)
+
+    # Assert
+    assert str(cut.config_filepath) in str(e_info.value)
+
 # parse_data tests
 
 
@@ -680,6 +817,12 @@ def test_ExecutionEngine_setup_sim_sets_self_sim_to_new_Simulator(mocker):
     cut.learners_plugin_dict = MagicMock()
     cut.planners_plugin_dict = MagicMock()
     cut.complex_plugin_dict = MagicMock()
+    cut.prefetch_depth = MagicMock()
+    cut.prefetch_drop_frames = MagicMock()
+    cut.evidence_confidence = MagicMock()
+    cut.subsystem_rollup_mode = MagicMock()
+    cut.parallel_layers = MagicMock()
+    cut.process_plugins = MagicMock()
 
     fake_sim = MagicMock()
 
@@ -696,7 +839,13 @@ def test_ExecutionEngine_setup_sim_sets_self_sim_to_new_Simulator(mocker):
                                                                  cut.learners_plugin_dict,
                                                                  cut.planners_plugin_dict,
                                                                  cut.complex_plugin_dict)
+    assert execution_engine.Simulator.call_args_list[0].kwargs == {'parallel_layers':cut.parallel_layers,
+                                                                   'process_plugins':cut.process_plugins}
     assert cut.sim == fake_sim
+    assert fake_sim.prefetch_depth == cut.prefetch_depth
+    assert fake_sim.prefetch_drop_frames == cut.prefetch_drop_frames
+    assert fake_sim.agent.vehicle_rep.evidence_confidence == cut.evidence_confidence
+    assert fake_sim.agent.vehicle_rep.subsystem_rollup_mode == cut.subsystem_rollup_mode
 
 # run_sim tests
 
@@ -706,18 +855,65 @@ def test_ExecutionEngine_run_sim_runs_but_does_not_save_results_when_save_flag_i
     cut = ExecutionEngine.__new__(ExecutionEngine)
     cut.sim = MagicMock()
     cut.IO_Enabled = MagicMock()
+    cut.async_run = False
     cut.save_flag = False
+    cut.run_start_time = None
+    cut.run_end_time = None
+    cut.run_max_frames = MagicMock()
 
     mocker.patch.object(cut.sim, 'run_sim')
     mocker.patch.object(cut, 'save_results')
 
     # Act
-    cut.run_sim()
+    result = cut.run_sim()
 
     # Assert
     assert cut.sim.run_sim.call_count == 1
     assert cut.sim.run_sim.call_args_list[0].args == (cut.IO_Enabled, )
+    assert cut.sim.run_sim.call_args_list[0].kwargs == {'max_frames':cut.run_max_frames}
     assert cut.save_results.call_count == 0
+    assert result == cut.sim.run_sim.return_value
+
+
+def test_ExecutionEngine_run_sim_sets_data_source_run_window_when_start_or_end_time_given(mocker):
+    # Arrange
+    cut = ExecutionEngine.__new__(ExecutionEngine)
+    cut.sim = MagicMock()
+    cut.simDataSource = MagicMock()
+    cut.IO_Enabled = MagicMock()
+    cut.async_run = False
+    cut.save_flag = False
+    cut.run_start_time = pytest.gen.choice([None, MagicMock()])
+    cut.run_end_time = MagicMock() if cut.run_start_time == None else pytest.gen.choice([None, MagicMock()])
+    cut.run_max_frames = None
+
+    mocker.patch.object(cut.sim, 'run_sim')
+
+    # Act
+    cut.run_sim()
+
+    # Assert
+    assert cut.simDataSource.set_run_window.call_count == 1
+    assert cut.simDataSource.set_run_window.call_args_list[0].args == (cut.run_start_time, cut.run_end_time)
+    assert cut.sim.run_sim.call_count == 1
+
+
+def test_ExecutionEngine_run_sim_raises_ValueError_when_run_window_given_but_data_source_cannot_seek(mocker):
+    # Arrange
+    cut = ExecutionEngine.__new__(ExecutionEngine)
+    cut.sim = MagicMock()
+    cut.simDataSource = MagicMock(spec=[])
+    cut.data_source_file = str(MagicMock())
+    cut.run_start_time = MagicMock()
+    cut.run_end_time = None
+
+    # Act
+    with pytest.raises(ValueError) as e_info:
+        cut.run_sim()
+
+    # Assert
+    assert e_info.match(f"DataSource '{cut.data_source_file}' does not support StartTime/EndTime run windows.")
+    assert cut.sim.run_sim.call_count == 0
 
 
 def test_ExecutionEngine_run_sim_runs_and_saves_results_when_save_flag_is_True(mocker):
@@ -725,8 +921,12 @@ def test_ExecutionEngine_run_sim_runs_and_saves_results_when_save_flag_is_True(m
     cut = ExecutionEngine.__new__(ExecutionEngine)
     cut.sim = MagicMock()
     cut.IO_Enabled = MagicMock()
+    cut.async_run = False
     cut.save_flag = True
     cut.save_name = MagicMock()
+    cut.run_start_time = None
+    cut.run_end_time = None
+    cut.run_max_frames = None
 
     mocker.patch.object(cut.sim, 'run_sim')
     mocker.patch.object(cut, 'save_results')
@@ -740,6 +940,34 @@ def test_ExecutionEngine_run_sim_runs_and_saves_results_when_save_flag_is_True(m
     assert cut.save_results.call_count == 1
     assert cut.save_results.call_args_list[0].args == (cut.save_name, )
 
+
+def test_ExecutionEngine_run_sim_runs_run_sim_async_on_an_event_loop_when_async_run_is_True(mocker):
+    # Arrange
+    cut = ExecutionEngine.__new__(ExecutionEngine)
+    cut.sim = MagicMock()
+    cut.IO_Enabled = MagicMock()
+    cut.async_run = True
+    cut.save_flag = False
+    cut.run_start_time = None
+    cut.run_end_time = None
+    cut.run_max_frames = MagicMock()
+    fake_diagnosis = MagicMock()
+
+    async def fake_run_sim_async(IO_Flag, max_frames):
+        return fake_diagnosis
+
+    mocker.patch.object(cut.sim, 'run_sim_async', side_effect=fake_run_sim_async)
+
+    # Act
+    result = cut.run_sim()
+
+    # Assert
+    assert cut.sim.run_sim_async.call_count == 1
+    assert cut.sim.run_sim_async.call_args_list[0].args == (cut.IO_Enabled, )
+    assert cut.sim.run_sim_async.call_args_list[0].kwargs == {'max_frames':cut.run_max_frames}
+    assert cut.sim.run_sim.call_count == 0
+    assert result == fake_diagnosis
+
 # init_save_paths tests
 
 
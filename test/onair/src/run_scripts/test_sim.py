@@ -9,7 +9,8 @@
 
 """ Test Simulator Functionality """
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, AsyncMock
+import asyncio
 
 import onair.src.run_scripts.sim as sim
 from onair.src.run_scripts.sim import Simulator
@@ -40,6 +41,7 @@ def test_Simulator__init__creates_Vehicle_and_Agent(mocker):
     mocker.patch.object(arg_dataSource, 'get_vehicle_metadata', return_value=fake_vehicle_metadata)
     mocker.patch(sim.__name__ + '.VehicleRepresentation', return_value=fake_vehicle)
     mocker.patch(sim.__name__ + '.Agent', return_value=fake_agent)
+    mocker.patch(sim.__name__ + '.IngestLatency')
 
     # Act
     cut.__init__(arg_dataSource,
@@ -51,25 +53,45 @@ def test_Simulator__init__creates_Vehicle_and_Agent(mocker):
     # Assert
     assert cut.simData == arg_dataSource
     assert sim.VehicleRepresentation.call_count == 1
-    assert sim.VehicleRepresentation.call_args_list[0].args == (fake_headers, fake_tests, arg_knowledge_rep_plugin_list)
+    assert sim.VehicleRepresentation.call_args_list[0].args == (fake_headers, fake_tests, arg_knowledge_rep_plugin_list, arg_dataSource.binning_configs['subsystem_assignments'])
     assert sim.Agent.call_count == 1
     assert sim.Agent.call_args_list[0].args == (fake_vehicle, arg_learners_plugin_list, arg_planners_plugin_list, arg_complex_plugin_list)
+    assert sim.Agent.call_args_list[0].kwargs == {'parallel_layers':(), 'process_plugins':()}
     assert cut.agent == fake_agent
+    assert cut.ingest_latency == sim.IngestLatency.return_value
+
+def test_Simulator__init__passes_parallel_layers_and_process_plugins_to_Agent(mocker):
+    # Arrange
+    arg_dataSource = MagicMock()
+    arg_parallel_layers = MagicMock()
+    arg_process_plugins = MagicMock()
+
+    cut = Simulator.__new__(Simulator)
+
+    mocker.patch.object(arg_dataSource, 'get_vehicle_metadata', return_value=[MagicMock(), MagicMock()])
+    mocker.patch(sim.__name__ + '.VehicleRepresentation')
+    mocker.patch(sim.__name__ + '.Agent')
+    mocker.patch(sim.__name__ + '.IngestLatency')
+
+    # Act
+    cut.__init__(arg_dataSource, MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                 parallel_layers=arg_parallel_layers, process_plugins=arg_process_plugins)
+
+    # Assert
+    assert sim.Agent.call_args_list[0].kwargs == {'parallel_layers':arg_parallel_layers,
+                                                  'process_plugins':arg_process_plugins}
 
 # run_sim tests
-def test_Simulator_run_sim_simData_never_has_more_so_loop_does_not_run_and_diagnosis_list_is_empty_but_filled_with_agent_diagnose_and_returns_last_diagnosis(mocker):
+def test_Simulator_run_sim_simData_never_has_more_so_loop_does_not_run_and_returns_None_without_diagnosing(mocker):
     # Arrange
     cut = Simulator.__new__(Simulator)
     cut.simData = MagicMock()
     cut.agent = MagicMock()
-
-    fake_diagnosis = MagicMock()
-    fake_time_step = 0
+    cut.ingest_latency = MagicMock()
 
     mocker.patch(sim.__name__ + '.print_sim_header')
     mocker.patch(sim.__name__ + '.print_msg')
     mocker.patch.object(cut.simData, 'has_more', return_value=False)
-    mocker.patch.object(cut.agent, 'diagnose', return_value=fake_diagnosis)
 
     # Act
     result = cut.run_sim()
@@ -79,15 +101,38 @@ def test_Simulator_run_sim_simData_never_has_more_so_loop_does_not_run_and_diagn
     assert sim.print_msg.call_count == 0
     assert cut.simData.has_more.call_count == 1
     assert cut.simData.has_more.call_args_list[0].args == ()
-    assert cut.agent.diagnose.call_count == 1
-    assert cut.agent.diagnose.call_args_list[0].args == (fake_time_step, )
-    assert result == fake_diagnosis
+    assert cut.agent.diagnose.call_count == 0
+    assert result == None
+
+@pytest.mark.parametrize('arg_async', [False, True])
+def test_Simulator_run_sim_and_run_sim_async_return_None_without_diagnosing_when_max_frames_is_0(mocker, arg_async):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+
+    mocker.patch.object(cut.simData, 'has_more', return_value=True)
+    mocker.patch.object(cut.simData, 'has_more_async', AsyncMock(return_value=True))
+
+    # Act
+    if arg_async:
+        result = asyncio.run(cut.run_sim_async(False, max_frames=0))
+    else:
+        result = cut.run_sim(False, max_frames=0)
+
+    # Assert
+    assert cut.agent.reason.call_count == 0
+    assert cut.agent.diagnose.call_count == 0
+    assert cut.agent.finish.call_count == 1
+    assert result == None
 
 def test_Simulator_run_sim_prints_header_when_given_IO_Flag_is_equal_to_True(mocker):
     # Arrange
     cut = Simulator.__new__(Simulator)
     cut.simData = MagicMock()
     cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
 
     fake_diagnosis = MagicMock()
 
@@ -95,6 +140,7 @@ def test_Simulator_run_sim_prints_header_when_given_IO_Flag_is_equal_to_True(moc
     mocker.patch(sim.__name__ + '.print_msg')
     mocker.patch.object(cut.simData, 'has_more', return_value=False)
     mocker.patch.object(cut.agent, 'diagnose', return_value=fake_diagnosis)
+    mocker.patch.object(cut, 'print_run_stats')
 
     # Act
     result = cut.run_sim(True)
@@ -103,13 +149,15 @@ def test_Simulator_run_sim_prints_header_when_given_IO_Flag_is_equal_to_True(moc
     assert sim.print_sim_header.call_count == 1
     assert sim.print_sim_header.call_args_list[0].args == ()
     assert sim.print_msg.call_count == 0
-    assert result == fake_diagnosis # check we ran through the method correctly
+    assert cut.print_run_stats.call_count == 1
+    assert result == None # check we ran through the method correctly
 
 def test_Simulator_run_sim_runs_until_has_more_is_false(mocker):
     # Arrange
     cut = Simulator.__new__(Simulator)
     cut.simData = MagicMock()
     cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
 
     num_fake_steps = pytest.gen.randint(1, 100) # from 1 to 100 arbitrary for fast test
     fake_diagnosis = MagicMock()
@@ -145,11 +193,252 @@ def test_Simulator_run_sim_runs_until_has_more_is_false(mocker):
     assert cut.agent.diagnose.call_args_list[0].args == (num_fake_steps, )
     assert result == fake_diagnosis
 
+def test_Simulator_run_sim_records_latency_of_each_frame_after_reasoning_on_it(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+
+    num_fake_steps = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+    mock_manager = MagicMock()
+
+    mocker.patch.object(cut.simData, 'has_more', side_effect=[True] * num_fake_steps + [False])
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+    mock_manager.attach_mock(mocker.patch.object(cut.agent, 'reason'), 'reason')
+    mock_manager.attach_mock(mocker.patch.object(cut, 'record_latency'), 'record_latency')
+
+    # Act
+    cut.run_sim()
+
+    # Assert
+    assert mock_manager.mock_calls == [call for _ in range(num_fake_steps)
+                                       for call in [mocker.call.reason(cut.simData.get_next.return_value),
+                                                    mocker.call.record_latency(cut.simData)]]
+
+def test_Simulator_run_sim_stops_after_max_frames_when_given(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+
+    arg_max_frames = pytest.gen.randint(0, 50) # from 0 to 50 arbitrary for fast test
+    fake_diagnosis = MagicMock()
+
+    mocker.patch.object(cut.simData, 'has_more', return_value=True)
+    mocker.patch.object(cut.agent, 'reason')
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+    mocker.patch.object(cut.agent, 'diagnose', return_value=fake_diagnosis)
+
+    # Act
+    result = cut.run_sim(False, max_frames=arg_max_frames)
+
+    # Assert
+    assert cut.simData.get_next.call_count == arg_max_frames
+    assert cut.agent.reason.call_count == arg_max_frames
+    assert cut.agent.diagnose.call_args_list[0].args == (arg_max_frames, )
+    assert result == fake_diagnosis
+
+def test_Simulator_run_sim_reasons_on_frames_of_a_FramePrefetcher_when_prefetch_depth_is_set_then_stops_it(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+    cut.prefetch_depth = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+    cut.prefetch_drop_frames = MagicMock()
+
+    num_fake_steps = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+    fake_frames = [MagicMock() for _ in range(num_fake_steps)]
+    fake_prefetcher = MagicMock()
+    fake_prefetcher.has_more.side_effect = [True] * num_fake_steps + [False]
+    fake_prefetcher.get_next.side_effect = fake_frames
+
+    mocker.patch(sim.__name__ + '.FramePrefetcher', return_value=fake_prefetcher)
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+
+    # Act
+    cut.run_sim(False)
+
+    # Assert
+    assert sim.FramePrefetcher.call_args_list[0].args == (cut.simData, cut.prefetch_depth, cut.prefetch_drop_frames)
+    assert cut.prefetcher == fake_prefetcher
+    assert [call.args for call in cut.agent.reason.call_args_list] == [(frame, ) for frame in fake_frames]
+    assert cut.simData.get_next.call_count == 0
+    assert fake_prefetcher.stop.call_count == 1
+
+@pytest.mark.parametrize('arg_prefetch_depth', [0, 4])
+def test_Simulator_run_sim_resets_agent_before_reasoning_on_the_first_frame_of_each_file_after_the_first(mocker, arg_prefetch_depth):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+    cut.prefetch_depth = arg_prefetch_depth
+
+    num_fake_steps = pytest.gen.randint(3, 20) # arbitrary, from 3 to 20
+    fake_boundaries = {0, pytest.gen.randint(1, num_fake_steps - 1)}
+    fake_frames = [MagicMock() for _ in range(num_fake_steps)]
+    # The flag only holds for the frame just got, as the prefetcher's does
+    fake_frame_source = MagicMock()
+    fake_frame_source.has_more.side_effect = [True] * num_fake_steps + [False]
+    def fake_get_next():
+        index = fake_frame_source.get_next.call_count - 1
+        fake_frame_source.file_boundary = index in fake_boundaries
+        return fake_frames[index]
+    fake_frame_source.get_next.side_effect = fake_get_next
+    if arg_prefetch_depth > 0:
+        mocker.patch(sim.__name__ + '.FramePrefetcher', return_value=fake_frame_source)
+    else:
+        cut.simData = fake_frame_source
+
+    mock_manager = mocker.MagicMock()
+    mock_manager.attach_mock(cut.agent.reset, 'reset')
+    mock_manager.attach_mock(cut.agent.reason, 'reason')
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+
+    # Act
+    cut.run_sim(False)
+
+    # Assert
+    expected_calls = []
+    for i, frame in enumerate(fake_frames):
+        if i in fake_boundaries and i > 0:
+            expected_calls.append(mocker.call.reset())
+        expected_calls.append(mocker.call.reason(frame))
+    assert mock_manager.mock_calls == expected_calls
+
+def test_Simulator_run_sim_stops_FramePrefetcher_when_reasoning_raises(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+    cut.prefetch_depth = 1
+    fake_prefetcher = MagicMock()
+    fake_prefetcher.has_more.return_value = True
+
+    mocker.patch(sim.__name__ + '.FramePrefetcher', return_value=fake_prefetcher)
+    mocker.patch.object(cut.agent, 'reason', side_effect=RuntimeError('fake error'))
+
+    # Act
+    with pytest.raises(RuntimeError):
+        cut.run_sim(False)
+
+    # Assert
+    assert fake_prefetcher.stop.call_count == 1
+    assert cut.agent.finish.call_count == 1
+
+@pytest.mark.parametrize('arg_async', [False, True])
+def test_Simulator_run_sim_and_run_sim_async_finish_agent_after_the_final_diagnosis(mocker, arg_async):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+
+    num_fake_steps = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+    side_effects_for_has_more = [True] * num_fake_steps + [False]
+    mock_manager = MagicMock()
+
+    mocker.patch.object(cut.simData, 'has_more', side_effect=side_effects_for_has_more)
+    mocker.patch.object(cut.simData, 'has_more_async', AsyncMock(side_effect=side_effects_for_has_more))
+    mocker.patch.object(cut.simData, 'get_next_async', AsyncMock())
+    mocker.patch.object(cut.agent, 'reason_async', AsyncMock())
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+    mock_manager.attach_mock(mocker.patch.object(cut.agent, 'diagnose'), 'diagnose')
+    mock_manager.attach_mock(mocker.patch.object(cut.agent, 'finish'), 'finish')
+
+    # Act
+    if arg_async:
+        result = asyncio.run(cut.run_sim_async(False))
+    else:
+        result = cut.run_sim(False)
+
+    # Assert
+    assert mock_manager.mock_calls == [mocker.call.diagnose(num_fake_steps), mocker.call.finish()]
+    assert result == cut.agent.diagnose.return_value
+
+@pytest.mark.parametrize('arg_async', [False, True])
+@pytest.mark.parametrize('arg_IO_Flag', [False, True])
+def test_Simulator_run_sim_and_run_sim_async_print_run_stats_only_when_IO_Flag_is_True(mocker, arg_async, arg_IO_Flag):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+
+    mocker.patch(sim.__name__ + '.print_sim_header')
+    mocker.patch.object(cut.simData, 'has_more', side_effect=[True, False])
+    mocker.patch.object(cut.simData, 'has_more_async', AsyncMock(side_effect=[True, False]))
+    mocker.patch.object(cut.simData, 'get_next_async', AsyncMock())
+    mocker.patch.object(cut.agent, 'reason_async', AsyncMock())
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+    mocker.patch.object(cut, 'print_run_stats')
+
+    # Act
+    if arg_async:
+        asyncio.run(cut.run_sim_async(arg_IO_Flag))
+    else:
+        cut.run_sim(arg_IO_Flag)
+
+    # Assert
+    assert cut.print_run_stats.call_count == (1 if arg_IO_Flag else 0)
+
+def test_Simulator_run_sim_records_vehicle_status_of_every_frame_when_record_statuses_is_True(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+    cut.record_statuses = True
+
+    num_fake_steps = pytest.gen.randint(0, 50) # from 0 to 50 arbitrary for fast test
+    fake_statuses = [MagicMock() for _ in range(num_fake_steps)]
+
+    mocker.patch.object(cut.simData, 'has_more', side_effect=[True] * num_fake_steps + [False])
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+    mocker.patch.object(cut.agent.vehicle_rep, 'get_status', side_effect=fake_statuses)
+
+    # Act
+    cut.run_sim()
+
+    # Assert
+    assert cut.status_timeline == fake_statuses
+
+def test_Simulator_run_sim_does_not_record_vehicle_status_by_default(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+
+    mocker.patch.object(cut.simData, 'has_more', side_effect=[True, False])
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+
+    # Act
+    cut.run_sim()
+
+    # Assert
+    assert Simulator.record_statuses == False
+    assert cut.agent.vehicle_rep.get_status.call_count == 0
+    assert cut.status_timeline == []
+
 def test_Simulator_run_sim_diagnose_always_performed_when_fault_is_on_first_time_step(mocker):
     # Arrange
     cut = Simulator.__new__(Simulator)
     cut.simData = MagicMock()
     cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
 
     fake_diagnosis = MagicMock()
     fake_next = MagicMock()
@@ -180,6 +469,7 @@ def test_Simulator_run_sim_diagnose_is_not_performed_again_when_faults_are_conse
     cut = Simulator.__new__(Simulator)
     cut.simData = MagicMock()
     cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
 
     num_fake_steps = pytest.gen.randint(sim.DIAGNOSIS_INTERVAL, sim.DIAGNOSIS_INTERVAL * 10) # from interval to (10 * interval) arbitrary
     fake_diagnoses = [MagicMock()] * (floor(num_fake_steps/sim.DIAGNOSIS_INTERVAL) + 1) # + 1 is for last diagnosis
@@ -214,6 +504,228 @@ def test_Simulator_run_sim_diagnose_is_not_performed_again_when_faults_are_conse
         assert cut.agent.diagnose.call_args_list[i].args == (i * sim.DIAGNOSIS_INTERVAL, )
     assert result == fake_diagnoses[-1] # check we actually got the last diagnosis
 
+# run_sim_async tests
+def test_Simulator_run_sim_async_awaits_frames_and_reasoning_until_has_more_async_is_false(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+
+    num_fake_steps = pytest.gen.randint(1, 100) # from 1 to 100 arbitrary for fast test
+    fake_diagnosis = MagicMock()
+    fake_next = MagicMock()
+    fake_IO_Flag = MagicMock()
+    side_effects_for_has_more = [True] * (num_fake_steps) + [False]
+
+    mocker.patch(sim.__name__ + '.print_sim_header')
+    mocker.patch.object(cut.simData, 'has_more_async', AsyncMock(side_effect=side_effects_for_has_more))
+    mocker.patch.object(cut.simData, 'get_next_async', AsyncMock(return_value=fake_next))
+    mocker.patch.object(cut.agent, 'reason_async', AsyncMock())
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+    mocker.patch.object(cut.agent, 'diagnose', return_value=fake_diagnosis)
+
+    # Act
+    result = asyncio.run(cut.run_sim_async(fake_IO_Flag))
+
+    # Assert
+    assert sim.print_sim_header.call_count == 0
+    assert cut.simData.get_next_async.await_count == num_fake_steps
+    assert cut.simData.get_next.call_count == 0
+    assert cut.agent.reason_async.await_count == num_fake_steps
+    for i in range(num_fake_steps):
+        assert cut.agent.reason_async.call_args_list[i].args == (fake_next, )
+    assert cut.agent.reason.call_count == 0
+    for i in range(num_fake_steps):
+        assert cut.IO_check.call_args_list[i].args == (i, fake_IO_Flag, )
+    assert cut.agent.diagnose.call_count == 1
+    assert cut.agent.diagnose.call_args_list[0].args == (num_fake_steps, )
+    assert result == fake_diagnosis
+
+def test_Simulator_run_sim_async_stops_after_max_frames_and_diagnoses_like_run_sim(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+
+    arg_max_frames = pytest.gen.randint(sim.DIAGNOSIS_INTERVAL, sim.DIAGNOSIS_INTERVAL * 3) # from interval to (3 * interval) arbitrary
+    fake_diagnoses = [MagicMock() for _ in range(ceil(arg_max_frames/sim.DIAGNOSIS_INTERVAL))]
+
+    mocker.patch.object(cut.simData, 'has_more_async', AsyncMock(return_value=True))
+    mocker.patch.object(cut.simData, 'get_next_async', AsyncMock())
+    mocker.patch.object(cut.agent, 'reason_async', AsyncMock())
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', 'RED')
+    mocker.patch.object(cut.agent, 'diagnose', side_effect=fake_diagnoses)
+
+    # Act
+    result = asyncio.run(cut.run_sim_async(False, max_frames=arg_max_frames))
+
+    # Assert
+    assert cut.simData.get_next_async.await_count == arg_max_frames
+    for i in range(cut.agent.diagnose.call_count):
+        assert cut.agent.diagnose.call_args_list[i].args == (i * sim.DIAGNOSIS_INTERVAL, )
+    assert result == fake_diagnoses[-1]
+
+def test_Simulator_run_sim_async_resets_agent_before_reasoning_on_the_first_frame_of_each_file_after_the_first(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+
+    num_fake_steps = pytest.gen.randint(3, 20) # arbitrary, from 3 to 20
+    fake_boundaries = {0, pytest.gen.randint(1, num_fake_steps - 1)}
+    boundaries_seen = []
+
+    async def fake_get_next_async():
+        index = cut.simData.get_next_async.await_count - 1
+        cut.simData.file_boundary = index in fake_boundaries
+        return index
+
+    async def fake_reason_async(frame):
+        boundaries_seen.append((frame, cut.agent.reset.call_count))
+
+    mocker.patch.object(cut.simData, 'has_more_async', AsyncMock(side_effect=[True] * num_fake_steps + [False]))
+    mocker.patch.object(cut.simData, 'get_next_async', AsyncMock(side_effect=fake_get_next_async))
+    mocker.patch.object(cut.agent, 'reason_async', side_effect=fake_reason_async)
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+
+    # Act
+    asyncio.run(cut.run_sim_async(False))
+
+    # Assert
+    later_boundary = max(fake_boundaries)
+    assert boundaries_seen == [(i, 0 if i < later_boundary else 1) for i in range(num_fake_steps)]
+
+def test_Simulator_run_sim_async_records_latency_of_each_frame_after_reasoning_on_it(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.simData = MagicMock()
+    cut.agent = MagicMock()
+    cut.ingest_latency = MagicMock()
+
+    num_fake_steps = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+    mock_manager = MagicMock()
+
+    mocker.patch.object(cut.simData, 'has_more_async', AsyncMock(side_effect=[True] * num_fake_steps + [False]))
+    mocker.patch.object(cut.simData, 'get_next_async', AsyncMock())
+    mocker.patch.object(cut, 'IO_check')
+    mocker.patch.object(cut.agent, 'mission_status', MagicMock()) # never equals 'RED'
+    mock_manager.attach_mock(mocker.patch.object(cut.agent, 'reason_async', AsyncMock()), 'reason_async')
+    mock_manager.attach_mock(mocker.patch.object(cut, 'record_latency'), 'record_latency')
+
+    # Act
+    asyncio.run(cut.run_sim_async(False))
+
+    # Assert
+    assert mock_manager.mock_calls == [call for _ in range(num_fake_steps)
+                                       for call in [mocker.call.reason_async(cut.simData.get_next_async.return_value),
+                                                    mocker.call.record_latency(cut.simData)]]
+
+# record_latency tests
+def test_Simulator_record_latency_records_received_time_of_the_frame_reasoned_on():
+    # Arrange
+    arg_frames = MagicMock()
+
+    cut = Simulator.__new__(Simulator)
+    cut.ingest_latency = MagicMock()
+
+    # Act
+    cut.record_latency(arg_frames)
+
+    # Assert
+    assert cut.ingest_latency.record.call_count == 1
+    assert cut.ingest_latency.record.call_args_list[0].args == (arg_frames.frame_received_time, )
+
+def test_Simulator_record_latency_does_nothing_when_frames_do_not_time_their_arrival():
+    # Arrange
+    arg_frames = MagicMock()
+    arg_frames.frame_received_time = None
+
+    cut = Simulator.__new__(Simulator)
+    cut.ingest_latency = MagicMock()
+
+    # Act
+    cut.record_latency(arg_frames)
+
+    # Assert
+    assert cut.ingest_latency.record.call_count == 0
+
+# get_latency_stats tests
+def test_Simulator_get_latency_stats_returns_stats_of_ingest_latency():
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.ingest_latency = MagicMock()
+
+    # Act
+    result = cut.get_latency_stats()
+
+    # Assert
+    assert result == cut.ingest_latency.get_stats.return_value
+
+# print_run_stats tests
+def test_Simulator_print_run_stats_prints_nothing_when_no_frame_was_timed_and_there_is_no_prefetcher(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.ingest_latency = MagicMock()
+    cut.ingest_latency.get_stats.return_value = {'frames' : 0}
+
+    mocker.patch(sim.__name__ + '.print_msg')
+
+    # Act
+    cut.print_run_stats()
+
+    # Assert
+    assert sim.print_msg.call_count == 0
+
+def test_Simulator_print_run_stats_prints_ingest_latency_of_timed_frames(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.ingest_latency = MagicMock()
+    cut.ingest_latency.get_stats.return_value = {'frames' : 12,
+                                                 'mean_seconds' : 0.002,
+                                                 'p50_seconds' : 0.001,
+                                                 'p99_seconds' : 0.009,
+                                                 'max_seconds' : 0.01}
+
+    mocker.patch(sim.__name__ + '.print_msg')
+
+    # Act
+    cut.print_run_stats()
+
+    # Assert
+    assert sim.print_msg.call_count == 1
+    assert sim.print_msg.call_args_list[0].args == ('Ingest to reason latency of 12 frames: mean 0.002000 s, '
+                                                    'p50 0.001000 s, p99 0.009000 s, max 0.010000 s', )
+
+def test_Simulator_print_run_stats_prints_prefetch_queue_stats_when_frames_were_prefetched(mocker):
+    # Arrange
+    cut = Simulator.__new__(Simulator)
+    cut.ingest_latency = MagicMock()
+    cut.ingest_latency.get_stats.return_value = {'frames' : 0}
+    cut.prefetcher = MagicMock()
+    cut.prefetcher.get_stats.return_value = {'depth' : 4,
+                                             'frames_read' : 12,
+                                             'frames_dropped' : 1,
+                                             'mean_occupancy' : 2.5,
+                                             'max_occupancy' : 4,
+                                             'full_waits' : 3,
+                                             'empty_waits' : 0}
+
+    mocker.patch(sim.__name__ + '.print_msg')
+
+    # Act
+    cut.print_run_stats()
+
+    # Assert
+    assert sim.print_msg.call_count == 1
+    assert sim.print_msg.call_args_list[0].args == ('Prefetch queue of depth 4: 12 frames read, 1 dropped, '
+                                                    'mean occupancy 2.50, max occupancy 4, 3 full waits, 0 empty waits', )
+
 # IO_check tests
 def test_Simulator_IO_check_prints_sim_step_and_mission_status_when_given_IO_Flag_is_True(mocker):
     # Arrange
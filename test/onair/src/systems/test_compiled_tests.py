@@ -0,0 +1,174 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test Compiled Tests Functionality """
+import pytest
+from unittest.mock import MagicMock
+
+import onair.src.systems.compiled_tests as compiled_tests
+from onair.src.systems.compiled_tests import CompiledFeasibility, CompiledState, CompiledNoop, ScalarTest
+from onair.src.systems.telemetry_test_suite import TelemetryTestSuite
+
+EPSILON = 0.00001
+
+def scalar_suite():
+    suite = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    suite.__init__()
+    return suite
+
+# compile_test tests
+def test_compiled_tests_compile_test_returns_CompiledFeasibility_for_sorted_numeric_FEASIBILITY_test():
+    # Act
+    result = compiled_tests.compile_test(['FEASIBILITY', 0, 1, 2, 3], MagicMock(), EPSILON)
+
+    # Assert
+    assert isinstance(result, CompiledFeasibility)
+
+def test_compiled_tests_compile_test_returns_CompiledState_for_STATE_test_of_hashable_collections():
+    # Act
+    result = compiled_tests.compile_test(['STATE', [1], [2], [3]], MagicMock(), EPSILON)
+
+    # Assert
+    assert isinstance(result, CompiledState)
+
+def test_compiled_tests_compile_test_returns_CompiledNoop_for_NOOP_test():
+    # Act
+    result = compiled_tests.compile_test(['NOOP'], MagicMock(), EPSILON)
+
+    # Assert
+    assert isinstance(result, CompiledNoop)
+
+@pytest.mark.parametrize('arg_test', [['FEASIBILITY', 1, 0],
+                                      ['FEASIBILITY', 0, 1, 2],
+                                      ['FEASIBILITY', 0, float('nan')],
+                                      ['FEASIBILITY', '0', '1'],
+                                      ['STATE', [1], [2]],
+                                      ['STATE', [[1]], [2], [3]],
+                                      ['STATE', '1', [2], [3]],
+                                      ['STATE', 1, [2], [3]]])
+def test_compiled_tests_compile_test_returns_ScalarTest_of_suite_test_function_when_test_cannot_be_compiled(arg_test):
+    # Arrange
+    arg_all_tests = {arg_test[0] : MagicMock()}
+
+    # Act
+    result = compiled_tests.compile_test(arg_test, arg_all_tests, EPSILON)
+
+    # Assert
+    assert isinstance(result, ScalarTest)
+    assert result.test_function == arg_all_tests[arg_test[0]]
+    assert result.test_params == arg_test[1:]
+    assert result.epsilon == EPSILON
+
+def test_compiled_tests_compile_test_raises_KeyError_for_unknown_test():
+    # Act
+    with pytest.raises(KeyError):
+        compiled_tests.compile_test(['UNKNOWN'], {}, EPSILON)
+
+# CompiledFeasibility tests
+def test_CompiledFeasibility__init__precomputes_delta_statuses_and_buffers():
+    # Act
+    cut = CompiledFeasibility([0, 1, 3, 7], EPSILON)
+
+    # Assert
+    assert cut.bounds == [0, 1, 3, 7]
+    assert cut.delta == EPSILON * 1
+    assert cut.statuses == ['RED', 'YELLOW', 'GREEN', 'YELLOW', 'RED']
+    assert cut.l_range == 0 - cut.delta
+    assert cut.u_range == 7 + cut.delta
+    assert cut.lb_buffers == [bound + cut.delta for bound in cut.bounds]
+    assert cut.ub_buffers == [bound - cut.delta for bound in cut.bounds]
+
+def test_CompiledFeasibility__init__uses_three_statuses_for_two_thresholds():
+    # Act
+    cut = CompiledFeasibility([-1, 1], EPSILON)
+
+    # Assert
+    assert cut.statuses == ['RED', 'GREEN', 'RED']
+
+@pytest.mark.parametrize('arg_test_params', [[0, 10], [0, 1, 3, 7], [0, 5, 5, 10], [-5, -5], [0.5, 2.25, 2.5, 9.75]])
+def test_CompiledFeasibility_status_and_mass_assignments_match_suite_feasibility(arg_test_params):
+    # Arrange
+    cut = CompiledFeasibility(arg_test_params, EPSILON)
+    suite = scalar_suite()
+    delta = cut.delta if cut.delta > 0 else EPSILON
+    values = [float('nan'), -100.0, 100.0, pytest.gen.uniform(-20, 20)]
+    for bound in arg_test_params:
+        values += [bound, bound - delta / 2, bound + delta / 2, bound - 2 * delta, bound + 2 * delta]
+
+    for val in values:
+        # Act
+        stat = cut.status(val)
+        mass_assignments = cut.mass_assignments(val)
+
+        # Assert
+        expected_stat, expected_mass_assignments = suite.feasibility(val, arg_test_params, EPSILON)
+        assert stat == expected_stat
+        assert mass_assignments == expected_mass_assignments
+
+# CompiledState tests
+def test_CompiledState__init__builds_lookup_where_GREEN_beats_YELLOW_beats_RED():
+    # Act
+    cut = CompiledState([[1, 2], [2, 3], [3, 4, 1]])
+
+    # Assert
+    assert cut.lookup == {1 : 'GREEN', 2 : 'GREEN', 3 : 'YELLOW', 4 : 'RED'}
+
+@pytest.mark.parametrize('arg_val', [-1, 0, 1, 1.9, 2.0, 3, 4.5, '2'])
+def test_CompiledState_status_and_mass_assignments_match_suite_state(arg_val):
+    # Arrange
+    arg_test_params = [[0, 1.0], [2, 1.5], (4, 5)]
+    cut = CompiledState(arg_test_params)
+    suite = scalar_suite()
+
+    # Act
+    stat = cut.status(arg_val)
+    mass_assignments = cut.mass_assignments(arg_val)
+
+    # Assert
+    expected_stat, expected_mass_assignments = suite.state(arg_val, arg_test_params, EPSILON)
+    assert stat == expected_stat
+    assert mass_assignments == expected_mass_assignments
+
+def test_CompiledState_status_raises_ValueError_like_suite_state_for_nan():
+    # Arrange
+    cut = CompiledState([[1], [2], [3]])
+
+    # Act
+    with pytest.raises(ValueError):
+        cut.status(float('nan'))
+
+# CompiledNoop tests
+def test_CompiledNoop_status_and_mass_assignments_match_suite_noop():
+    # Arrange
+    arg_val = MagicMock()
+    cut = CompiledNoop()
+
+    # Act / Assert
+    assert (cut.status(arg_val), cut.mass_assignments(arg_val)) == scalar_suite().noop(arg_val, [], EPSILON)
+
+# ScalarTest tests
+def test_ScalarTest_status_and_mass_assignments_return_parts_of_test_function_result():
+    # Arrange
+    arg_val = MagicMock()
+    fake_result = (MagicMock(), MagicMock())
+    fake_test_function = MagicMock(return_value=fake_result)
+    fake_test_params = MagicMock()
+
+    cut = ScalarTest(fake_test_function, fake_test_params, EPSILON)
+
+    # Act
+    stat = cut.status(arg_val)
+    mass_assignments = cut.mass_assignments(arg_val)
+
+    # Assert
+    assert stat == fake_result[0]
+    assert mass_assignments == fake_result[1]
+    assert fake_test_function.call_count == 2
+    for call in fake_test_function.call_args_list:
+        assert call.args == (arg_val, fake_test_params, EPSILON)
@@ -0,0 +1,173 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test Evidence Functionality """
+import pytest
+import numpy as np
+
+import onair.src.systems.evidence as evidence
+from onair.src.systems.evidence import Evidence
+from onair.src.systems.status import NO_STATUS, GREEN, YELLOW, RED
+
+def dempster(first, second):
+    """Dempster's rule for two mass vectors, written out set by set"""
+    combined = np.zeros(evidence.NUM_SETS)
+    for a in range(evidence.NUM_SETS):
+        for b in range(evidence.NUM_SETS):
+            combined[a & b] += first[a] * second[b]
+    conflict = combined[evidence.EMPTY]
+    combined[evidence.EMPTY] = 0.0
+    return combined / combined.sum(), conflict
+
+def random_masses(count):
+    masses = np.array([[pytest.gen.random() for _ in range(evidence.NUM_SETS)] for _ in range(count)])
+    masses[:, evidence.EMPTY] = 0.0
+    return masses / masses.sum(axis=1, keepdims=True)
+
+# to_bitmask tests
+def test_evidence_to_bitmask_sets_a_bit_for_each_status():
+    assert evidence.to_bitmask([]) == evidence.EMPTY
+    assert evidence.to_bitmask(['GREEN']) == 1
+    assert evidence.to_bitmask({'YELLOW', 'RED'}) == 6
+    assert evidence.to_bitmask({'GREEN', 'YELLOW', 'RED'}) == evidence.THETA
+
+def test_evidence_to_bitmask_raises_KeyError_for_unknown_status():
+    with pytest.raises(KeyError):
+        evidence.to_bitmask(['---'])
+
+# mass_vector tests
+def test_evidence_mass_vector_puts_each_mass_at_bitmask_of_its_statuses():
+    # Act
+    result = evidence.mass_vector([({'RED'}, 0.25), ({'RED', 'YELLOW'}, 0.75)])
+
+    # Assert
+    assert result.tolist() == [0.0, 0.0, 0.0, 0.0, 0.25, 0.0, 0.75, 0.0]
+
+def test_evidence_mass_vector_normalizes_masses_adding_up_past_one():
+    # Act
+    result = evidence.mass_vector([({'GREEN', 'YELLOW'}, 1.0), ({'YELLOW', 'RED'}, 1.0)])
+
+    # Assert
+    assert result[3] == 0.5
+    assert result[6] == 0.5
+
+def test_evidence_mass_vector_is_vacuous_without_mass_assignments():
+    assert evidence.mass_vector([]).tolist() == evidence.VACUOUS.tolist()
+
+# status_masses tests
+def test_evidence_status_masses_puts_all_mass_on_status_or_on_THETA_for_no_status():
+    # Act
+    result = evidence.status_masses(np.array([evidence.GREEN, evidence.RED, evidence.NO_STATUS]))
+
+    # Assert
+    assert result[0].tolist() == evidence.mass_vector([({'GREEN'}, 1.0)]).tolist()
+    assert result[1].tolist() == evidence.mass_vector([({'RED'}, 1.0)]).tolist()
+    assert result[2].tolist() == evidence.VACUOUS.tolist()
+
+# discount tests
+def test_evidence_discount_moves_the_unreliable_part_of_each_mass_onto_THETA():
+    # Arrange
+    arg_masses = np.array([evidence.mass_vector([({'RED'}, 1.0)])])
+
+    # Act
+    result = evidence.discount(arg_masses, 0.75)
+
+    # Assert
+    assert result[0, 4] == 0.75
+    assert result[0, evidence.THETA] == 0.25
+    assert arg_masses[0, 4] == 1.0
+
+# combine tests
+def test_evidence_combine_matches_Dempsters_rule_applied_pairwise():
+    for _ in range(20):
+        # Arrange
+        arg_masses = random_masses(pytest.gen.randint(1, 4)) # arbitrary, from 1 to 4
+        expected_masses = arg_masses[0]
+        unnormalized = arg_masses[0]
+        for masses in arg_masses[1:]:
+            expected_masses, _ = dempster(expected_masses, masses)
+            unnormalized = np.array([sum(unnormalized[a] * masses[b] for a in range(8) for b in range(8) if a & b == c)
+                                     for c in range(8)])
+
+        # Act
+        result_masses, result_conflict = evidence.combine(arg_masses[np.newaxis], axis=1)
+
+        # Assert
+        assert np.allclose(result_masses[0], expected_masses)
+        assert np.isclose(result_conflict[0], unnormalized[evidence.EMPTY])
+
+def test_evidence_combine_is_vacuous_with_conflict_of_one_when_evidence_totally_conflicts():
+    # Arrange
+    arg_masses = np.array([[evidence.mass_vector([({'GREEN'}, 1.0)]), evidence.mass_vector([({'RED'}, 1.0)])]])
+
+    # Act
+    result_masses, result_conflict = evidence.combine(arg_masses, axis=1)
+
+    # Assert
+    assert result_masses[0].tolist() == evidence.VACUOUS.tolist()
+    assert result_conflict[0] == 1.0
+
+# combine_groups tests
+def test_evidence_combine_groups_combines_the_masses_of_each_group_and_leaves_empty_groups_vacuous():
+    # Arrange
+    arg_masses = random_masses(5)
+    arg_groups = np.array([2, 0, 2, 2, 0])
+
+    # Act
+    result_masses, result_conflict = evidence.combine_groups(arg_masses, arg_groups, 4)
+
+    # Assert
+    for group in range(4):
+        expected_masses, expected_conflict = evidence.combine(arg_masses[arg_groups == group][np.newaxis], axis=1)
+        assert np.allclose(result_masses[group], expected_masses[0])
+        assert np.isclose(result_conflict[group], expected_conflict[0])
+    assert result_masses[1].tolist() == evidence.VACUOUS.tolist()
+
+# combine_lists tests
+def test_evidence_combine_lists_combines_each_list_and_leaves_empty_lists_vacuous():
+    # Arrange
+    arg_masses = random_masses(3)
+
+    # Act
+    result_masses, _ = evidence.combine_lists([list(arg_masses[:2]), [], [arg_masses[2]]])
+
+    # Assert
+    assert np.allclose(result_masses[0], dempster(arg_masses[0], arg_masses[1])[0])
+    assert result_masses[1].tolist() == evidence.VACUOUS.tolist()
+    assert np.allclose(result_masses[2], arg_masses[2])
+
+# Evidence tests
+def test_Evidence_belief_and_plausibility_sum_masses_of_subsets_and_of_meeting_sets():
+    # Arrange
+    arg_masses = np.array([evidence.mass_vector([({'RED'}, 0.5), ({'RED', 'YELLOW'}, 0.25), ({'GREEN'}, 0.25)])])
+
+    cut = Evidence(['a'], arg_masses, np.array([0.0]))
+
+    # Act / Assert
+    assert cut.get_belief(['RED']).tolist() == [0.5]
+    assert cut.get_plausibility(['RED']).tolist() == [0.75]
+    assert cut.get_belief(['RED', 'YELLOW']).tolist() == [0.75]
+    assert cut.get_plausibility(['GREEN']).tolist() == [0.25]
+    assert cut.get_interval('a', 'YELLOW') == (0.0, 0.25)
+
+def test_Evidence_get_code_belief_gives_each_name_its_belief_in_the_status_of_its_code():
+    # Arrange
+    arg_masses = random_masses(4)
+    arg_codes = np.array([RED, GREEN, YELLOW, NO_STATUS])
+
+    cut = Evidence(['a', 'b', 'c', 'd'], arg_masses, np.zeros(4))
+
+    # Act
+    result = cut.get_code_belief(arg_codes)
+
+    # Assert
+    assert result.tolist() == pytest.approx([cut.get_belief(['RED'])[0],
+                                             cut.get_belief(['GREEN'])[1],
+                                             cut.get_belief(['YELLOW'])[2],
+                                             0.0])
@@ -11,7 +11,11 @@
 import pytest
 from unittest.mock import MagicMock
 
-from onair.src.systems.status import Status
+import numpy as np
+
+import onair.src.systems.status as status
+from onair.src.systems.status import Status, StatusArray
+from onair.src.systems.telemetry_test_suite import TelemetryTestSuite
 
 # tests for init
 def test_Status__init__with_empty_args_initializes_name_and_calls_set_status_with_default_values(mocker):
@@ -186,3 +190,129 @@ def test_Status_get_name_returns_expected_value():
 
     # Assert
     assert result == fake_name
+
+# StatusArray tests
+def test_StatusArray__init__sets_names_and_preallocates_unknown_statuses():
+    # Arrange
+    arg_names = [str(MagicMock()) for _ in range(pytest.gen.randint(0, 10))] # arbitrary, from 0 to 10
+
+    # Act
+    cut = StatusArray(arg_names)
+
+    # Assert
+    assert cut.names == arg_names
+    assert cut.codes.tolist() == [status.NO_STATUS] * len(arg_names)
+    assert cut.confidences.tolist() == [-1.0] * len(arg_names)
+    assert cut.counts.tolist() == [len(arg_names), 0, 0, 0]
+    assert cut.status_indices == {}
+    assert len(cut) == len(arg_names)
+
+def test_StatusArray_set_status_sets_code_and_confidence_at_index():
+    # Arrange
+    cut = StatusArray(['a', 'b', 'c'])
+    arg_index = pytest.gen.randint(0, 2) # arbitrary, from 0 to 2
+    arg_stat = pytest.gen.choice(status.STATUSES)
+    arg_conf = pytest.gen.uniform(-1.0, 1.0)
+
+    # Act
+    cut.set_status(arg_index, arg_stat, arg_conf)
+
+    # Assert
+    assert cut.codes[arg_index] == status.STATUSES.index(arg_stat)
+    assert cut.confidences[arg_index] == arg_conf
+
+def test_StatusArray__getitem__returns_Status_of_name_status_and_confidence_at_index():
+    # Arrange
+    cut = StatusArray(['a', 'b'])
+    cut.set_status(1, 'YELLOW', 0.25)
+
+    # Act
+    result = cut[1]
+
+    # Assert
+    assert isinstance(result, Status)
+    assert result.get_name() == 'b'
+    assert result.get_bayesian_status() == ('YELLOW', 0.25)
+
+def test_StatusArray__iter__yields_Status_of_every_index():
+    # Arrange
+    cut = StatusArray(['a', 'b'])
+    cut.set_status(0, 'RED', 0.5)
+    cut.set_status(1, 'GREEN', 1.0)
+
+    # Act
+    result = [(res.get_name(), res.get_bayesian_status()) for res in cut]
+
+    # Assert
+    assert result == [('a', ('RED', 0.5)), ('b', ('GREEN', 1.0))]
+
+def test_StatusArray_set_status_moves_index_between_counts_and_built_index_sets():
+    # Arrange
+    cut = StatusArray(['a', 'b', 'c'])
+    cut.set_status(0, 'RED', 1.0)
+    cut.set_status(2, 'RED', 1.0)
+
+    # Act
+    first_result = cut.get_status_indices('RED')
+    cut.set_status(1, 'RED', 1.0)
+    cut.set_status(0, 'GREEN', 1.0)
+    second_result = cut.get_status_indices('RED')
+
+    # Assert
+    assert first_result == [0, 2]
+    assert second_result == [1, 2]
+    assert cut.get_status_indices('GREEN') == [0]
+    assert cut.counts.tolist() == [0, 1, 0, 2]
+
+def test_StatusArray_set_codes_replaces_every_status_and_recounts():
+    # Arrange
+    cut = StatusArray(['a', 'b', 'c'])
+    cut.get_status_indices('---')
+    arg_codes = np.array([status.GREEN, status.RED, status.GREEN])
+    arg_confidences = np.array([1.0, 0.5, 1.0])
+
+    # Act
+    cut.set_codes(arg_codes, arg_confidences)
+
+    # Assert
+    assert cut.codes.tolist() == arg_codes.tolist()
+    assert cut.confidences.tolist() == arg_confidences.tolist()
+    assert cut.counts.tolist() == [0, 2, 0, 1]
+    assert cut.get_status_indices('---') == []
+    assert cut.get_status_indices('GREEN') == [0, 2]
+
+def test_StatusArray_get_rollup_matches_strict_calc_single_status():
+    # Arrange
+    for _ in range(20):
+        fake_statuses = [pytest.gen.choice(status.STATUSES) for _ in range(pytest.gen.randint(1, 10))] # arbitrary, from 1 to 10
+        cut = StatusArray([str(i) for i in range(len(fake_statuses))])
+        for i, stat in enumerate(fake_statuses):
+            cut.set_status(i, stat, 1.0)
+
+        # Act
+        result = cut.get_rollup()
+
+        # Assert
+        assert result == TelemetryTestSuite.calc_single_status(None, fake_statuses)
+
+def test_StatusArray_get_rollup_breaks_ties_by_first_occurrence():
+    # Arrange
+    cut = StatusArray(['a', 'b', 'c', 'd'])
+    for i, stat in enumerate(['YELLOW', 'GREEN', 'GREEN', 'YELLOW']):
+        cut.set_status(i, stat, 1.0)
+
+    # Act / Assert
+    assert cut.get_rollup() == ('YELLOW', 1.0)
+
+def test_StatusArray_get_status_names_returns_names_with_status_and_empty_list_for_unknown_status():
+    # Arrange
+    cut = StatusArray(['a', 'b', 'c'])
+    cut.set_status(0, 'GREEN', 1.0)
+    cut.set_status(1, 'RED', 1.0)
+    cut.set_status(2, 'GREEN', 1.0)
+
+    # Act / Assert
+    assert cut.get_status_names('GREEN') == ['a', 'c']
+    assert cut.get_status_names('RED') == ['b']
+    assert cut.get_status_names('YELLOW') == []
+    assert cut.get_status_names(MagicMock()) == []
@@ -0,0 +1,163 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test StatusRollup Functionality """
+import pytest
+from unittest.mock import MagicMock
+import numpy as np
+
+import onair.src.systems.status_rollup as status_rollup
+import onair.src.systems.evidence as evidence
+from onair.src.systems.status_rollup import StatusRollup
+from onair.src.systems.status import STATUSES, STATUS_CODES
+from onair.src.systems.telemetry_test_suite import TelemetryTestSuite
+
+# select_statuses tests
+def test_status_rollup_select_statuses_returns_RED_with_red_fraction_in_strict_mode_without_breaking_ties():
+    # Arrange
+    arg_counts = np.array([[0, 1, 1, 2],
+                           [1, 1, 1, 1]])
+    fake_first_seen = MagicMock()
+
+    # Act
+    statuses, confidences = status_rollup.select_statuses(arg_counts, 'strict', fake_first_seen)
+
+    # Assert
+    assert statuses.tolist() == [STATUS_CODES['RED'], STATUS_CODES['RED']]
+    assert confidences.tolist() == [0.5, 0.25]
+    assert fake_first_seen.call_count == 0
+
+def test_status_rollup_select_statuses_breaks_ties_of_tied_rows_only_by_first_occurrence():
+    # Arrange
+    arg_counts = np.array([[0, 3, 1, 0],
+                           [0, 2, 2, 0]])
+    fake_first_seen = MagicMock(return_value=np.array([[9, 3, 1, 9]]))
+
+    # Act
+    statuses, confidences = status_rollup.select_statuses(arg_counts, 'strict', fake_first_seen)
+
+    # Assert
+    assert fake_first_seen.call_args_list[0].args[0].tolist() == [1]
+    assert statuses.tolist() == [STATUS_CODES['GREEN'], STATUS_CODES['YELLOW']]
+    assert confidences.tolist() == [1.0, 1.0]
+
+@pytest.mark.parametrize('arg_mode', ['strict', 'distr', 'max', 'other'])
+def test_status_rollup_select_statuses_matches_calc_single_status_in_every_mode(arg_mode):
+    for _ in range(20):
+        # Arrange
+        fake_statuses = [pytest.gen.choice(STATUSES) for _ in range(pytest.gen.randint(1, 10))] # arbitrary, from 1 to 10
+        codes = np.array([STATUS_CODES[stat] for stat in fake_statuses])
+        arg_counts = np.bincount(codes, minlength=len(STATUSES))[np.newaxis, :]
+
+        def first_seen(rows):
+            return np.array([[np.argmax(codes == code) for code in range(len(STATUSES))]])
+
+        # Act
+        statuses, confidences = status_rollup.select_statuses(arg_counts, arg_mode, first_seen)
+
+        # Assert
+        expected_result = TelemetryTestSuite.calc_single_status(None, fake_statuses, arg_mode)
+        assert (STATUSES[statuses[0]], confidences[0]) == expected_result
+
+# StatusRollup tests
+def test_StatusRollup__init__lists_subsystems_in_order_of_first_assignment_and_pairs_members():
+    # Act
+    cut = StatusRollup([['POWER'], [], ['THERMAL', 'POWER'], ['THERMAL']])
+
+    # Assert
+    assert cut.subsystems == ['POWER', 'THERMAL']
+    assert cut.member_mnemonics.tolist() == [0, 2, 2, 3]
+    assert cut.member_subsystems.tolist() == [0, 1, 0, 1]
+
+def test_StatusRollup_rollup_returns_nothing_when_there_are_no_subsystems():
+    # Arrange
+    cut = StatusRollup([[], []])
+
+    # Act
+    statuses, confidences = cut.rollup(np.array([1, 3], dtype=np.int8))
+
+    # Assert
+    assert len(statuses) == 0
+    assert len(confidences) == 0
+
+@pytest.mark.parametrize('arg_mode', ['strict', 'distr', 'max'])
+def test_StatusRollup_rollup_matches_calc_single_status_of_each_subsystem(arg_mode):
+    # Arrange
+    subsystem_names = ['A', 'B', 'C']
+    num_mnemonics = pytest.gen.randint(1, 30) # arbitrary, from 1 to 30
+    arg_assignments = [pytest.gen.sample(subsystem_names, pytest.gen.randint(0, 2)) for _ in range(num_mnemonics)]
+    fake_statuses = [pytest.gen.choice(STATUSES) for _ in range(num_mnemonics)]
+    arg_codes = np.array([STATUS_CODES[stat] for stat in fake_statuses], dtype=np.int8)
+
+    cut = StatusRollup(arg_assignments)
+
+    # Act
+    statuses, confidences = cut.rollup(arg_codes, arg_mode)
+
+    # Assert
+    for subsystem, stat, conf in zip(cut.subsystems, statuses.tolist(), confidences.tolist()):
+        members = [fake_statuses[i] for i in range(num_mnemonics) if subsystem in arg_assignments[i]]
+        assert (STATUSES[stat], conf) == TelemetryTestSuite.calc_single_status(None, members, arg_mode)
+
+@pytest.mark.parametrize('arg_mode', ['strict', 'distr', 'max'])
+def test_StatusRollup_rollup_of_changed_indices_matches_a_full_rollup(arg_mode):
+    # Arrange
+    subsystem_names = ['A', 'B', 'C']
+    num_mnemonics = pytest.gen.randint(1, 30) # arbitrary, from 1 to 30
+    arg_assignments = [pytest.gen.sample(subsystem_names, pytest.gen.randint(0, 2)) for _ in range(num_mnemonics)]
+    arg_codes = np.array([pytest.gen.randint(0, len(STATUSES) - 1) for _ in range(num_mnemonics)], dtype=np.int8)
+    arg_changed_indices = sorted(pytest.gen.sample(range(num_mnemonics), pytest.gen.randint(0, num_mnemonics))) # arbitrary
+    changed_codes = arg_codes.copy()
+    for i in arg_changed_indices:
+        changed_codes[i] = pytest.gen.randint(0, len(STATUSES) - 1)
+
+    cut = StatusRollup(arg_assignments)
+    cut.rollup(arg_codes, arg_mode)
+
+    # Act
+    statuses, confidences = cut.rollup(changed_codes, arg_mode, arg_changed_indices)
+
+    # Assert
+    expected_statuses, expected_confidences = StatusRollup(arg_assignments).rollup(changed_codes, arg_mode)
+    assert statuses.tolist() == expected_statuses.tolist()
+    assert confidences.tolist() == pytest.approx(expected_confidences.tolist())
+
+def test_StatusRollup_rollup_gives_the_last_rollup_again_when_no_changed_code_differs(mocker):
+    # Arrange
+    arg_codes = np.array([1, 3, 2], dtype=np.int8)
+
+    cut = StatusRollup([['A'], ['A', 'B'], ['B']])
+    latest = cut.rollup(arg_codes)
+
+    mocker.patch(status_rollup.__name__ + '.select_statuses')
+
+    # Act
+    result = cut.rollup(arg_codes, 'strict', [0, 2])
+
+    # Assert
+    assert result is latest
+    assert status_rollup.select_statuses.call_count == 0
+    assert cut.counts.tolist() == [[0, 1, 0, 1], [0, 0, 1, 1]]
+
+def test_StatusRollup_combine_evidence_combines_discounted_masses_of_each_subsystem(mocker):
+    # Arrange
+    arg_masses = np.array([evidence.mass_vector([({'GREEN'}, 1.0)]), evidence.mass_vector([({'RED'}, 1.0)])])
+    arg_reliability = 0.5
+
+    cut = StatusRollup([['POWER'], ['POWER', 'THERMAL']])
+
+    # Act
+    masses, conflict = cut.combine_evidence(arg_masses, arg_reliability)
+
+    # Assert
+    expected_power = evidence.combine(evidence.discount(arg_masses, arg_reliability)[np.newaxis], axis=1)
+    assert np.allclose(masses[0], expected_power[0][0])
+    assert np.isclose(conflict[0], 0.25)
+    assert np.allclose(masses[1], evidence.discount(arg_masses[1:], arg_reliability)[0])
+    assert conflict[1] == 0.0
@@ -11,17 +11,26 @@
 import pytest
 from unittest.mock import MagicMock
 
+import numpy as np
+
 import onair.src.systems.telemetry_test_suite as telemetry_test_suite
 from onair.src.systems.telemetry_test_suite import TelemetryTestSuite
+from onair.src.systems.status import STATUSES
 
 # __init__ tests
 def test_TelemetryTestSuite__init__sets_the_expected_values_with_given_headers_and_tests(mocker):
     # Arrange
     arg_headers = MagicMock()
     arg_tests = MagicMock()
+    fake_vectorized_suite = MagicMock()
 
     cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
 
+    fake_compiled_tests = MagicMock()
+
+    mocker.patch.object(cut, 'compile_tests', return_value=fake_compiled_tests)
+    mocker.patch.object(cut, 'build_vectorized_suite', return_value=fake_vectorized_suite)
+
     # Act
     cut.__init__(arg_headers, arg_tests)
 
@@ -33,6 +42,41 @@ def test_TelemetryTestSuite__init__sets_the_expected_values_with_given_headers_a
     assert cut.all_tests == {'STATE' : cut.state,
                       'FEASIBILITY' : cut.feasibility,
                              'NOOP' : cut.noop}
+    assert cut.compile_tests.call_count == 1
+    assert cut.compile_tests.call_args_list[0].args == (arg_tests, )
+    assert cut.compiled_tests == fake_compiled_tests
+    assert cut.build_vectorized_suite.call_count == 1
+    assert cut.build_vectorized_suite.call_args_list[0].args == (arg_headers, arg_tests)
+    assert cut.vectorized_suite == fake_vectorized_suite
+
+def test_TelemetryTestSuite__init__builds_status_results_and_header_indices_of_first_occurrences(mocker):
+    # Arrange
+    arg_headers = ['a', 'b', 'a', 'c']
+    arg_tests = [[['NOOP']]] * len(arg_headers)
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+
+    # Act
+    cut.__init__(arg_headers, arg_tests)
+
+    # Assert
+    assert isinstance(cut.status_results, telemetry_test_suite.StatusArray)
+    assert cut.status_results.names == arg_headers
+    assert cut.header_indices == {'a':0, 'b':1, 'c':3}
+
+def test_TelemetryTestSuite__init__does_not_build_status_results_when_tests_cannot_be_compiled(mocker):
+    # Arrange
+    arg_headers = ['a']
+    arg_tests = [[['UNKNOWN']]]
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+
+    # Act
+    cut.__init__(arg_headers, arg_tests)
+
+    # Assert
+    assert cut.compiled_tests == None
+    assert cut.status_results == None
 
 def test_TelemetryTestSuite__init__default_arg_tests_is_empty_list(mocker):
     # Arrange
@@ -56,7 +100,276 @@ def test_TelemetryTestSuite__init__default_arg_headers_is_empty_list(mocker):
     # Assert
     assert cut.dataFields == []
 
+# compile_tests tests
+def test_TelemetryTestSuite_compile_tests_returns_compiled_test_for_each_test_of_each_header(mocker):
+    # Arrange
+    arg_tests = [[MagicMock() for _ in range(pytest.gen.randint(0, 3))] for _ in range(pytest.gen.randint(0, 5))] # arbitrary, from 0 to 3 tests of 0 to 5 headers
+    num_tests = sum(len(header_tests) for header_tests in arg_tests)
+    fake_compiled = [MagicMock() for _ in range(num_tests)]
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.all_tests = MagicMock()
+    cut.epsilon = MagicMock()
+
+    mocker.patch(telemetry_test_suite.__name__ + '.compile_test', side_effect=fake_compiled)
+
+    # Act
+    result = cut.compile_tests(arg_tests)
+
+    # Assert
+    assert telemetry_test_suite.compile_test.call_count == num_tests
+    call = 0
+    for i, header_tests in enumerate(arg_tests):
+        for j, test in enumerate(header_tests):
+            assert telemetry_test_suite.compile_test.call_args_list[call].args == (test, cut.all_tests, cut.epsilon)
+            assert result[i][j] == fake_compiled[call]
+            call += 1
+    assert len(result) == len(arg_tests)
+
+def test_TelemetryTestSuite_compile_tests_returns_None_when_a_test_cannot_be_compiled(mocker):
+    # Arrange
+    fake_error = pytest.gen.choice([TypeError, KeyError, IndexError])
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.all_tests = MagicMock()
+    cut.epsilon = MagicMock()
+
+    mocker.patch(telemetry_test_suite.__name__ + '.compile_test', side_effect=fake_error)
+
+    # Act
+    result = cut.compile_tests([[MagicMock()]])
+
+    # Assert
+    assert result == None
+
+# build_vectorized_suite tests
+def test_TelemetryTestSuite_build_vectorized_suite_returns_VectorizedSuite_of_given_tests(mocker):
+    # Arrange
+    num_headers = pytest.gen.randint(0, 10) # arbitrary, from 0 to 10
+    arg_headers = [MagicMock() for _ in range(num_headers)]
+    arg_tests = [MagicMock() for _ in range(num_headers)]
+    fake_vectorized_suite = MagicMock()
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+
+    mocker.patch(telemetry_test_suite.__name__ + '.VectorizedSuite', return_value=fake_vectorized_suite)
+
+    # Act
+    result = cut.build_vectorized_suite(arg_headers, arg_tests)
+
+    # Assert
+    assert telemetry_test_suite.VectorizedSuite.call_count == 1
+    assert telemetry_test_suite.VectorizedSuite.call_args_list[0].args == (arg_tests, )
+    assert result == fake_vectorized_suite
+
+def test_TelemetryTestSuite_build_vectorized_suite_returns_None_when_headers_and_tests_differ_in_length(mocker):
+    # Arrange
+    num_headers = pytest.gen.randint(0, 10) # arbitrary, from 0 to 10
+    arg_headers = [MagicMock() for _ in range(num_headers)]
+    arg_tests = [MagicMock() for _ in range(num_headers + 1)]
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+
+    mocker.patch(telemetry_test_suite.__name__ + '.VectorizedSuite')
+
+    # Act
+    result = cut.build_vectorized_suite(arg_headers, arg_tests)
+
+    # Assert
+    assert telemetry_test_suite.VectorizedSuite.call_count == 0
+    assert result == None
+
+def test_TelemetryTestSuite_build_vectorized_suite_returns_None_when_tests_cannot_be_vectorized(mocker):
+    # Arrange
+    fake_error = pytest.gen.choice([TypeError, ValueError])
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+
+    mocker.patch(telemetry_test_suite.__name__ + '.VectorizedSuite', side_effect=fake_error)
+
+    # Act
+    result = cut.build_vectorized_suite([MagicMock()], [MagicMock()])
+
+    # Assert
+    assert result == None
+
 # execute_suite tests
+def test_TelemetryTestSuite_execute_suite_executes_compiled_suite_and_sets_latest_results_to_status_results_when_frame_matches_them(mocker):
+    # Arrange
+    num_headers = pytest.gen.randint(0, 10) # arbitrary, from 0 to 10
+    arg_update_frame = [MagicMock() for _ in range(num_headers)]
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.status_results = telemetry_test_suite.StatusArray([str(i) for i in range(num_headers)])
+
+    mocker.patch.object(cut, 'execute_compiled_suite')
+    mocker.patch.object(cut, 'run_tests')
+
+    # Act
+    cut.execute_suite(arg_update_frame)
+
+    # Assert
+    assert cut.execute_compiled_suite.call_count == 1
+    assert cut.execute_compiled_suite.call_args_list[0].args == (arg_update_frame, )
+    assert cut.run_tests.call_count == 0
+    assert cut.latest_results is cut.status_results
+
+def test_TelemetryTestSuite_execute_suite_runs_tests_of_each_item_when_frame_does_not_match_status_results(mocker):
+    # Arrange
+    arg_update_frame = [MagicMock(), MagicMock()]
+    fake_results = [MagicMock(), MagicMock()]
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.status_results = telemetry_test_suite.StatusArray(['only one name'])
+
+    mocker.patch.object(cut, 'execute_compiled_suite')
+    mocker.patch.object(cut, 'run_tests', side_effect=fake_results)
+
+    # Act
+    cut.execute_suite(arg_update_frame)
+
+    # Assert
+    assert cut.execute_compiled_suite.call_count == 0
+    assert cut.latest_results == fake_results
+
+# execute_compiled_suite tests
+def test_TelemetryTestSuite_execute_compiled_suite_copies_vectorized_results_into_status_results(mocker):
+    # Arrange
+    arg_update_frame = MagicMock()
+    fake_statuses = np.array([0, 1, 3])
+    fake_confidences = np.array([1.0, 1.0, 0.5])
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.status_results = telemetry_test_suite.StatusArray(['a', 'b', 'c'])
+    cut.status_results.status_indices = MagicMock()
+    cut.vectorized_suite = MagicMock()
+    cut.vectorized_suite.evaluate.return_value = (fake_statuses, fake_confidences)
+    cut.compiled_tests = MagicMock()
+
+    # Act
+    cut.execute_compiled_suite(arg_update_frame)
+
+    # Assert
+    assert cut.vectorized_suite.evaluate.call_args_list[0].args == (arg_update_frame, )
+    assert cut.status_results.codes.tolist() == [0, 1, 3]
+    assert cut.status_results.confidences.tolist() == [1.0, 1.0, 0.5]
+    assert cut.status_results.counts.tolist() == [1, 1, 0, 1]
+    assert cut.compiled_tests.__getitem__.call_count == 0
+
+def test_TelemetryTestSuite_execute_compiled_suite_runs_compiled_tests_when_vectorized_suite_is_missing_or_cannot_evaluate_frame(mocker):
+    # Arrange
+    arg_update_frame = [MagicMock(), MagicMock()]
+    fake_tests = [[MagicMock(), MagicMock()], [MagicMock()]]
+    fake_bayesians = [('RED', 0.5), ('YELLOW', 1.0)]
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.status_results = telemetry_test_suite.StatusArray(['a', 'b'])
+    cut.compiled_tests = fake_tests
+    if pytest.gen.choice([True, False]):
+        cut.vectorized_suite = MagicMock()
+        cut.vectorized_suite.evaluate.return_value = None
+
+    mocker.patch.object(cut, 'calc_single_status', side_effect=fake_bayesians)
+
+    # Act
+    cut.execute_compiled_suite(arg_update_frame)
+
+    # Assert
+    for i in range(len(fake_tests)):
+        for test in fake_tests[i]:
+            assert test.status.call_args_list[0].args == (arg_update_frame[i], )
+        assert cut.calc_single_status.call_args_list[i].args == ([test.status.return_value for test in fake_tests[i]], )
+    assert cut.status_results.codes.tolist() == [STATUSES.index('RED'), STATUSES.index('YELLOW')]
+    assert cut.status_results.confidences.tolist() == [0.5, 1.0]
+
+# execute_changed tests
+def test_TelemetryTestSuite_execute_changed_runs_compiled_tests_of_changed_headers_only(mocker):
+    # Arrange
+    arg_update_frame = [MagicMock(), MagicMock(), MagicMock(), MagicMock()]
+    arg_changed_indices = [1, 3]
+    fake_tests = [[MagicMock()], [MagicMock(), MagicMock()], [MagicMock()], [MagicMock()]]
+    fake_bayesians = [('RED', 0.5), ('YELLOW', 1.0)]
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.status_results = telemetry_test_suite.StatusArray(['a', 'b', 'c', 'd'])
+    cut.latest_results = cut.status_results
+    cut.compiled_tests = fake_tests
+    cut.vectorized_suite = None
+
+    mocker.patch.object(cut, 'calc_single_status', side_effect=fake_bayesians)
+    mocker.patch.object(cut, 'execute_suite')
+
+    # Act
+    result = cut.execute_changed(arg_update_frame, arg_changed_indices)
+
+    # Assert
+    assert result == True
+    assert cut.execute_suite.call_count == 0
+    assert fake_tests[0][0].status.call_count == 0
+    assert fake_tests[2][0].status.call_count == 0
+    for i, expected_bayesian in zip(arg_changed_indices, fake_bayesians):
+        for test in fake_tests[i]:
+            assert test.status.call_args_list[0].args == (arg_update_frame[i], )
+        assert cut.status_results[i].get_bayesian_status() == expected_bayesian
+    assert cut.status_results.codes.tolist() == [0, STATUSES.index('RED'), 0, STATUSES.index('YELLOW')]
+
+@pytest.mark.parametrize('arg_case', ['no_status_results', 'not_latest', 'wrong_length', 'too_many_changed'])
+def test_TelemetryTestSuite_execute_changed_executes_whole_suite_when_changes_cannot_be_applied_alone(mocker, arg_case):
+    # Arrange
+    arg_update_frame = [MagicMock() for _ in range(4)]
+    arg_changed_indices = [0]
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.status_results = telemetry_test_suite.StatusArray(['a', 'b', 'c', 'd'])
+    cut.latest_results = cut.status_results
+    cut.compiled_tests = MagicMock()
+    cut.vectorized_suite = None
+    if arg_case == 'no_status_results':
+        cut.status_results = None
+    elif arg_case == 'not_latest':
+        cut.latest_results = []
+    elif arg_case == 'wrong_length':
+        arg_update_frame = arg_update_frame[:3]
+    else:
+        cut.vectorized_suite = MagicMock()
+        arg_changed_indices = [0, 1]
+
+    mocker.patch.object(cut, 'execute_suite')
+
+    # Act
+    result = cut.execute_changed(arg_update_frame, arg_changed_indices)
+
+    # Assert
+    assert result == False
+    assert cut.execute_suite.call_count == 1
+    assert cut.execute_suite.call_args_list[0].args == (arg_update_frame, )
+    assert cut.compiled_tests.__getitem__.call_count == 0
+
+def test_TelemetryTestSuite_execute_changed_matches_execute_suite_over_a_run_of_frames():
+    # Arrange
+    arg_headers = [str(i) for i in range(8)]
+    arg_tests = [[['FEASIBILITY', 0, 10]], [['FEASIBILITY', 0, 1, 2, 3], ['NOOP']], [['STATE', [1], [2], [3]]], [['NOOP']]] * 2
+    incremental = TelemetryTestSuite(arg_headers, arg_tests)
+    full = TelemetryTestSuite(arg_headers, arg_tests)
+    frame = [pytest.gen.randint(-1, 11) for _ in arg_headers]
+    incremental.execute_suite(frame)
+
+    for _ in range(20):
+        changed_indices = sorted(pytest.gen.sample(range(len(frame)), pytest.gen.randint(0, 3)))
+        for i in changed_indices:
+            frame[i] = pytest.gen.randint(-1, 11)
+
+        # Act
+        incremental.execute_changed(frame, changed_indices)
+        full.execute_suite(frame)
+
+        # Assert
+        assert incremental.status_results.codes.tolist() == full.status_results.codes.tolist()
+        assert incremental.status_results.confidences.tolist() == full.status_results.confidences.tolist()
+        assert incremental.get_suite_status() == full.get_suite_status()
+        for stat in STATUSES:
+            assert incremental.get_status_specific_mnemonics(stat) == full.get_status_specific_mnemonics(stat)
+
 def test_TelemetryTestSuite_execute_suite_sets_the_latest_results_to_empty_list_when_updated_frame_len_is_0(mocker):
     # Arrange
     arg_update_frame = '' # empty string for len of 0
@@ -110,6 +423,36 @@ def test_TelemetryTestSuite_execute_suite_default_arg_sync_data_is_empty_map(moc
     assert cut.run_tests.call_args_list[0].args == (0, arg_update_frame[0], {})
 
 # run_tests tests
+def test_TelemetryTestSuite_run_tests_uses_compiled_test_statuses_when_tests_are_compiled(mocker):
+    # Arrange
+    arg_header_index = MagicMock()
+    arg_test_val = MagicMock()
+    arg_sync_data = MagicMock()
+
+    num_fake_tests = pytest.gen.randint(1, 5) # arbitrary, from 1 to 5
+    fake_compiled = [MagicMock() for _ in range(num_fake_tests)]
+    fake_bayesian = [MagicMock(), MagicMock()]
+    expected_result = MagicMock()
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.compiled_tests = MagicMock()
+    cut.compiled_tests.__getitem__.return_value = fake_compiled
+    cut.dataFields = MagicMock()
+
+    mocker.patch.object(cut, 'calc_single_status', return_value=fake_bayesian)
+    mocker.patch(telemetry_test_suite.__name__ + '.Status', return_value=expected_result)
+
+    # Act
+    result = cut.run_tests(arg_header_index, arg_test_val, arg_sync_data)
+
+    # Assert
+    assert cut.compiled_tests.__getitem__.call_args_list[0].args == (arg_header_index, )
+    for test in fake_compiled:
+        assert test.status.call_args_list[0].args == (arg_test_val, )
+    assert cut.calc_single_status.call_args_list[0].args == ([test.status.return_value for test in fake_compiled], )
+    assert telemetry_test_suite.Status.call_args_list[0].args == (cut.dataFields.__getitem__.return_value, fake_bayesian[0], fake_bayesian[1])
+    assert result == expected_result
+
 def test_TelemetryTestSuite_run_tests_return_Status_object_based_upon_given_header_index_but_does_not_append_to_status_when_given_header_index_leads_to_empty_tests(mocker):
     # Arrange
     arg_header_index = MagicMock()
@@ -229,6 +572,43 @@ def test_TelemetryTestSuite_run_tests_return_Status_object_based_upon_given_head
     assert telemetry_test_suite.Status.call_args_list[0].args == (expected_datafield, fake_bayesian[0], fake_bayesian[1])
     assert result == expected_result
 
+# get_mass_assignments tests
+def test_TelemetryTestSuite_get_mass_assignments_returns_compiled_test_mass_assignments_when_tests_are_compiled(mocker):
+    # Arrange
+    arg_header_index = pytest.gen.randint(0, 2) # arbitrary, from 0 to 2
+    arg_test_val = MagicMock()
+    fake_compiled = [MagicMock(), MagicMock()]
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.compiled_tests = [[], [], []]
+    cut.compiled_tests[arg_header_index] = fake_compiled
+
+    # Act
+    result = cut.get_mass_assignments(arg_header_index, arg_test_val)
+
+    # Assert
+    for test in fake_compiled:
+        assert test.mass_assignments.call_args_list[0].args == (arg_test_val, )
+    assert result == [test.mass_assignments.return_value for test in fake_compiled]
+
+def test_TelemetryTestSuite_get_mass_assignments_runs_test_functions_when_tests_are_not_compiled(mocker):
+    # Arrange
+    arg_test_val = MagicMock()
+    fake_mass_assignments = MagicMock()
+    fake_test_function = MagicMock(return_value=(MagicMock(), fake_mass_assignments))
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.tests = [[['FAKE_TEST', 1, 2]]]
+    cut.all_tests = {'FAKE_TEST' : fake_test_function}
+    cut.epsilon = MagicMock()
+
+    # Act
+    result = cut.get_mass_assignments(0, arg_test_val)
+
+    # Assert
+    assert fake_test_function.call_args_list[0].args == (arg_test_val, [1, 2], cut.epsilon)
+    assert result == [fake_mass_assignments]
+
 # get_latest_result tests
 def test_TelemetryTestSuite_get_latest_results_returns_None_when_latest_results_is_None():
     # Arrange
@@ -263,6 +643,36 @@ def test_TelemetryTestSuite_get_latest_results_returns_None_when_latest_results_
     # Assert
     assert result == expected_result
 
+def test_TelemetryTestSuite_get_latest_results_looks_up_header_index_without_scanning_dataFields(mocker):
+    # Arrange
+    arg_field_name = MagicMock()
+
+    fake_hdr_index = pytest.gen.randint(0, 10) # arbitrary, from 0 to 10
+    expected_result = MagicMock()
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.latest_results = {fake_hdr_index:expected_result}
+    cut.header_indices = {arg_field_name:fake_hdr_index}
+    cut.dataFields = MagicMock()
+
+    # Act
+    result = cut.get_latest_result(arg_field_name)
+
+    # Assert
+    assert result == expected_result
+    assert cut.dataFields.index.call_count == 0
+
+def test_TelemetryTestSuite_get_latest_results_raises_ValueError_when_field_name_is_not_a_header(mocker):
+    # Arrange
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.latest_results = []
+    cut.header_indices = {}
+    cut.dataFields = []
+
+    # Act
+    with pytest.raises(ValueError):
+        cut.get_latest_result(str(MagicMock()))
+
 # state tests
 def test_TelemetryTestSuite_state_returns_tuple_of_str_GREEN_and_list_containing_tuple_of_set_of_str_GREEN_and_1_pt_0_when_int_val_is_in_range_test_params_0():
     # Arrange
@@ -1024,6 +1434,118 @@ def test_TelemetryTestSuite_get_suite_status_returns_value_from_call_to_calc_sin
     assert cut.calc_single_status.call_args_list[0].args == (fake_statuses, )
     assert result == expected_result
 
+def test_TelemetryTestSuite_get_suite_status_rolls_up_StatusArray_latest_results_without_calc_single_status(mocker):
+    # Arrange
+    fake_statuses = [pytest.gen.choice(STATUSES) for _ in range(pytest.gen.randint(1, 10))] # arbitrary, from 1 to 10
+    expected_result = TelemetryTestSuite.calc_single_status(None, fake_statuses)
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.latest_results = telemetry_test_suite.StatusArray([str(i) for i in range(len(fake_statuses))])
+    for i, stat in enumerate(fake_statuses):
+        cut.latest_results.set_status(i, stat, 1.0)
+
+    mocker.patch.object(cut, 'calc_single_status')
+
+    # Act
+    result = cut.get_suite_status()
+
+    # Assert
+    assert cut.calc_single_status.call_count == 0
+    assert result == expected_result
+
+# get_evidence tests
+def test_TelemetryTestSuite_get_evidence_returns_None_before_any_frame():
+    # Arrange
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+
+    # Act / Assert
+    assert cut.get_evidence() == None
+
+def test_TelemetryTestSuite_get_evidence_combines_vectorized_masses_of_latest_frame_once():
+    # Arrange
+    fake_combined = (MagicMock(), MagicMock())
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.dataFields = ['a', 'b']
+    cut.epsilon = MagicMock()
+    cut.latest_frame = MagicMock()
+    cut.vectorized_suite = MagicMock()
+    cut.vectorized_suite.evaluate_masses.return_value = fake_combined
+
+    # Act
+    result = cut.get_evidence()
+    cached_result = cut.get_evidence()
+
+    # Assert
+    assert cut.vectorized_suite.evaluate_masses.call_count == 1
+    assert cut.vectorized_suite.evaluate_masses.call_args_list[0].args == (cut.latest_frame, cut.epsilon)
+    assert result.names == cut.dataFields
+    assert result.masses == fake_combined[0]
+    assert result.conflict == fake_combined[1]
+    assert cached_result is result
+
+@pytest.mark.parametrize('has_vectorized_suite', [False, True])
+def test_TelemetryTestSuite_get_evidence_combines_mass_assignments_when_vectorized_suite_cannot_evaluate_frame(has_vectorized_suite):
+    # Arrange
+    arg_headers = ['a', 'b']
+    arg_tests = [[['FEASIBILITY', 0, 10], ['NOOP']], [['STATE', [1], [2], [3]]]]
+
+    cut = TelemetryTestSuite(arg_headers, arg_tests)
+    cut.execute_suite([5, 1])
+    # Without a vectorized suite, or with one that cannot evaluate the frame
+    cut.vectorized_suite = MagicMock(**{'evaluate_masses.return_value' : None}) if has_vectorized_suite else None
+
+    # Act
+    result = cut.get_evidence()
+
+    # Assert
+    assert result.get_interval('a', 'GREEN') == (1.0, 1.0)
+    assert result.get_interval('b', 'RED') == (0.0, 0.0)
+    assert result.conflict.tolist() == [0.0, 0.0]
+
+def test_TelemetryTestSuite_execute_suite_and_execute_changed_reset_evidence_for_new_frame(mocker):
+    # Arrange
+    arg_frame = MagicMock()
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.latest_evidence = MagicMock()
+    cut.status_results = telemetry_test_suite.StatusArray(['a'])
+    cut.latest_results = cut.status_results
+    arg_frame.__len__.return_value = 1
+    cut.compiled_tests = [[]]
+    cut.vectorized_suite = None
+
+    mocker.patch.object(cut, 'calc_single_status', return_value=('GREEN', 1.0))
+
+    # Act
+    cut.execute_changed(arg_frame, [0])
+
+    # Assert
+    assert cut.latest_frame == arg_frame
+    assert cut.latest_evidence == None
+
+# get_status_codes tests
+def test_TelemetryTestSuite_get_status_codes_returns_codes_of_StatusArray_latest_results():
+    # Arrange
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.latest_results = telemetry_test_suite.StatusArray(['a', 'b'])
+
+    # Act / Assert
+    assert cut.get_status_codes() is cut.latest_results.codes
+
+def test_TelemetryTestSuite_get_status_codes_returns_code_of_each_Status_in_latest_results():
+    # Arrange
+    fake_statuses = [pytest.gen.choice(STATUSES) for _ in range(pytest.gen.randint(0, 10))] # arbitrary, from 0 to 10
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.latest_results = [telemetry_test_suite.Status(str(i), stat) for i, stat in enumerate(fake_statuses)]
+
+    # Act
+    result = cut.get_status_codes()
+
+    # Assert
+    assert result.tolist() == [STATUSES.index(stat) for stat in fake_statuses]
+
 # get_status_specific_mnemonics
 # test_get_status_specific_mnemonics_raises_TypeError_when_latest_results_is_None was written because None is the init value for latest_results
 def test_TelemetryTestSuite_get_status_specific_mnemonics_raises_TypeError_when_latest_results_is_None(mocker):
@@ -1168,3 +1690,20 @@ def test_TelemetryTestSuite_get_status_specific_mnemonics_default_given_status_i
 
     # Assert
     assert result == [expected_name]
+
+def test_TelemetryTestSuite_get_status_specific_mnemonics_returns_status_names_of_StatusArray_latest_results(mocker):
+    # Arrange
+    arg_status = MagicMock()
+    fake_names = MagicMock()
+
+    cut = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    cut.latest_results = telemetry_test_suite.StatusArray([])
+
+    mocker.patch.object(cut.latest_results, 'get_status_names', return_value=fake_names)
+
+    # Act
+    result = cut.get_status_specific_mnemonics(arg_status)
+
+    # Assert
+    assert cut.latest_results.get_status_names.call_args_list[0].args == (arg_status, )
+    assert result == fake_names
@@ -0,0 +1,265 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test VectorizedSuite Functionality """
+import pytest
+from unittest.mock import MagicMock
+import numpy as np
+
+import onair.src.systems.vectorized_suite as vectorized_suite
+from onair.src.systems.vectorized_suite import VectorizedSuite
+from onair.src.systems.telemetry_test_suite import TelemetryTestSuite
+
+def scalar_results(tests, frame):
+    suite = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    suite.__init__([str(i) for i in range(len(tests))], tests)
+    suite.vectorized_suite = None
+    suite.execute_suite(frame)
+    return [(res.get_status(), res.get_bayesian_status()[1]) for res in suite.latest_results]
+
+def scalar_masses(tests, frame):
+    suite = TelemetryTestSuite.__new__(TelemetryTestSuite)
+    suite.__init__([str(i) for i in range(len(tests))], tests)
+    suite.vectorized_suite = None
+    suite.execute_suite(frame)
+    evidence = suite.get_evidence()
+    return evidence.masses, evidence.conflict
+
+def vectorized_results(tests, frame):
+    statuses, confidences = VectorizedSuite(tests).evaluate(frame)
+    return [(vectorized_suite.STATUSES[stat], conf) for stat, conf in zip(statuses.tolist(), confidences.tolist())]
+
+# constants tests
+def test_VectorizedSuite_STATUSES_are_expected_values():
+    assert vectorized_suite.STATUSES == ['---', 'GREEN', 'YELLOW', 'RED']
+    assert [vectorized_suite.NO_STATUS, vectorized_suite.GREEN, vectorized_suite.YELLOW, vectorized_suite.RED] == [0, 1, 2, 3]
+
+# __init__ tests
+def test_VectorizedSuite__init__groups_tests_by_type_and_number_of_parameters():
+    # Arrange
+    arg_tests = [[['NOOP']],
+                 [['FEASIBILITY', 0, 1], ['FEASIBILITY', 0, 1, 2, 3]],
+                 [['STATE', [1], [2], [3]], ['NOOP']]]
+
+    # Act
+    cut = VectorizedSuite(arg_tests)
+
+    # Assert
+    assert cut.num_headers == 3
+    assert cut.num_tests.tolist() == [1, 2, 2]
+    assert cut.width == 2
+    assert cut.noop_headers.tolist() == [0, 2]
+    assert cut.noop_slots.tolist() == [0, 1]
+    assert len(cut.feasibility_groups) == 2
+    assert cut.feasibility_groups[0][0].tolist() == [1]
+    assert cut.feasibility_groups[0][1].tolist() == [0]
+    assert cut.feasibility_groups[0][2].tolist() == [[0, 1]]
+    assert cut.feasibility_groups[1][1].tolist() == [1]
+    assert cut.feasibility_groups[1][2].tolist() == [[0, 1, 2, 3]]
+    assert cut.state_group[0].tolist() == [2]
+    assert cut.state_group[1].tolist() == [0]
+
+@pytest.mark.parametrize('arg_tests', [[[]],
+                                       [[['SYNC', 1]]],
+                                       [[['FEASIBILITY', 0, 1, 2]]],
+                                       [[['FEASIBILITY', 1, 0]]],
+                                       [[['FEASIBILITY', 0, float('nan')]]],
+                                       [[['FEASIBILITY', 'a', 'b']]],
+                                       [[['STATE', [1], [2]]]],
+                                       [[['STATE', [1], 2, [3]]]],
+                                       [[['STATE', ['1'], [2], [3]]]],
+                                       [[['STATE', [2 ** 60], [2], [3]]]]])
+def test_VectorizedSuite__init__raises_ValueError_for_tests_only_the_scalar_suite_can_run(arg_tests):
+    # Act
+    with pytest.raises(ValueError):
+        VectorizedSuite(arg_tests)
+
+# evaluate tests
+def test_VectorizedSuite_evaluate_returns_None_when_frame_length_does_not_match_tests():
+    # Arrange
+    cut = VectorizedSuite([[['NOOP']], [['NOOP']]])
+
+    # Act
+    result = cut.evaluate([1.0])
+
+    # Assert
+    assert result == None
+
+def test_VectorizedSuite_evaluate_returns_None_when_frame_is_not_numeric():
+    # Arrange
+    cut = VectorizedSuite([[['NOOP']]])
+
+    # Act
+    result = cut.evaluate(['not a number'])
+
+    # Assert
+    assert result == None
+
+def test_VectorizedSuite_evaluate_returns_None_when_STATE_value_is_not_finite():
+    # Arrange
+    cut = VectorizedSuite([[['STATE', [1], [2], [3]]]])
+
+    # Act
+    result = cut.evaluate([pytest.gen.choice([float('nan'), float('inf'), -float('inf')])])
+
+    # Assert
+    assert result == None
+
+def test_VectorizedSuite_evaluate_returns_empty_results_when_there_are_no_headers():
+    # Arrange
+    cut = VectorizedSuite([])
+
+    # Act
+    statuses, confidences = cut.evaluate([])
+
+    # Assert
+    assert len(statuses) == 0
+    assert len(confidences) == 0
+
+@pytest.mark.parametrize('arg_val', [-2.0, 0.0, 0.000001, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, float('inf'), float('nan')])
+def test_VectorizedSuite_evaluate_matches_scalar_suite_for_FEASIBILITY_values_on_and_between_thresholds(arg_val):
+    # Arrange
+    arg_tests = [[['FEASIBILITY', 0, 1, 2, 3]],
+                 [['FEASIBILITY', 0, 3]],
+                 [['FEASIBILITY', 0, 1, 1, 3]]]
+    arg_frame = [arg_val] * len(arg_tests)
+
+    # Act / Assert
+    assert vectorized_results(arg_tests, arg_frame) == scalar_results(arg_tests, arg_frame)
+
+@pytest.mark.parametrize('arg_val', [-1.0, 0.0, 1.0, 1.9, 2.0, 3.0, 4.0, -0.5])
+def test_VectorizedSuite_evaluate_matches_scalar_suite_for_STATE_membership(arg_val):
+    # Arrange
+    arg_tests = [[['STATE', [0, 1], [2], [3]]],
+                 [['STATE', [1.0], [1], [1.5, 3]]],
+                 [['STATE', [], [], []]],
+                 [['STATE', [4], (0,), {2}]]]
+    arg_frame = [arg_val] * len(arg_tests)
+
+    # Act / Assert
+    assert vectorized_results(arg_tests, arg_frame) == scalar_results(arg_tests, arg_frame)
+
+def test_VectorizedSuite_evaluate_matches_scalar_suite_when_combining_multiple_tests_per_mnemonic():
+    # Arrange
+    arg_tests = [[['NOOP'], ['FEASIBILITY', 0, 1], ['FEASIBILITY', 5, 6]],
+                 [['STATE', [], [], []], ['NOOP']],
+                 [['NOOP'], ['STATE', [], [], []]],
+                 [['FEASIBILITY', 0, 1, 2, 3], ['FEASIBILITY', 0, 10], ['NOOP']],
+                 [['FEASIBILITY', 0, 1], ['FEASIBILITY', 0, 1], ['FEASIBILITY', 5, 6], ['NOOP']]]
+    arg_frame = [0.5, 7.0, 7.0, 0.5, 0.5]
+
+    # Act / Assert
+    assert vectorized_results(arg_tests, arg_frame) == scalar_results(arg_tests, arg_frame)
+
+def test_VectorizedSuite_evaluate_matches_scalar_suite_for_random_tests_and_frames():
+    # Arrange
+    def random_test():
+        test_type = pytest.gen.choice(['FEASIBILITY', 'STATE', 'NOOP'])
+        if test_type == 'FEASIBILITY':
+            return [test_type] + sorted(pytest.gen.randint(-5, 5) for _ in range(pytest.gen.choice([2, 4])))
+        if test_type == 'STATE':
+            return [test_type] + [[pytest.gen.randint(-3, 3) for _ in range(pytest.gen.randint(0, 3))] for _ in range(3)]
+        return [test_type]
+    num_headers = pytest.gen.randint(1, 20) # arbitrary, from 1 to 20
+    arg_tests = [[random_test() for _ in range(pytest.gen.randint(1, 4))] for _ in range(num_headers)]
+
+    for _ in range(10):
+        arg_frame = [pytest.gen.choice([pytest.gen.randint(-6, 6), pytest.gen.uniform(-6, 6)]) for _ in range(num_headers)]
+
+        # Act / Assert
+        assert vectorized_results(arg_tests, arg_frame) == scalar_results(arg_tests, arg_frame)
+
+# evaluate_masses tests
+def test_VectorizedSuite_evaluate_masses_returns_None_when_frame_length_does_not_match_tests():
+    # Arrange
+    cut = VectorizedSuite([[['NOOP']], [['NOOP']]])
+
+    # Act / Assert
+    assert cut.evaluate_masses([1.0], 0.00001) == None
+
+def test_VectorizedSuite_evaluate_masses_returns_None_when_frame_is_not_numeric_or_STATE_value_is_not_finite():
+    # Arrange
+    cut = VectorizedSuite([[['NOOP']], [['STATE', [1], [2], [3]]]])
+
+    # Act / Assert
+    assert cut.evaluate_masses(['not a number', 1.0], 0.00001) == None
+    assert cut.evaluate_masses([1.0, float('nan')], 0.00001) == None
+
+@pytest.mark.parametrize('arg_val', [-2.0, -0.000001, 0.0, 0.000001, 0.5, 0.99999, 1.0, 1.000001, 1.5, 2.0, 2.99999, 3.0, 3.00001, 5.0, float('inf'), float('nan')])
+def test_VectorizedSuite_evaluate_masses_matches_scalar_suite_for_FEASIBILITY_values_on_and_near_thresholds(arg_val):
+    # Arrange
+    arg_tests = [[['FEASIBILITY', 0, 1, 2, 3]],
+                 [['FEASIBILITY', 0, 3]],
+                 [['FEASIBILITY', 0, 1, 1, 3]],
+                 [['FEASIBILITY', 0, 2, 2, 3], ['FEASIBILITY', 0, 0.5]]]
+    arg_frame = [arg_val] * len(arg_tests)
+
+    # Act
+    masses, conflict = VectorizedSuite(arg_tests).evaluate_masses(arg_frame, 0.00001)
+
+    # Assert
+    expected_masses, expected_conflict = scalar_masses(arg_tests, arg_frame)
+    assert np.allclose(masses, expected_masses)
+    assert np.allclose(conflict, expected_conflict)
+
+def test_VectorizedSuite_evaluate_masses_matches_scalar_suite_for_random_tests_and_frames():
+    # Arrange
+    def random_test():
+        test_type = pytest.gen.choice(['FEASIBILITY', 'STATE', 'NOOP'])
+        if test_type == 'FEASIBILITY':
+            return [test_type] + sorted(pytest.gen.randint(-5, 5) for _ in range(pytest.gen.choice([2, 4])))
+        if test_type == 'STATE':
+            return [test_type] + [[pytest.gen.randint(-3, 3) for _ in range(pytest.gen.randint(0, 3))] for _ in range(3)]
+        return [test_type]
+    num_headers = pytest.gen.randint(1, 20) # arbitrary, from 1 to 20
+    arg_tests = [[random_test() for _ in range(pytest.gen.randint(1, 4))] for _ in range(num_headers)]
+    cut = VectorizedSuite(arg_tests)
+
+    for _ in range(10):
+        arg_frame = [pytest.gen.choice([pytest.gen.randint(-6, 6), pytest.gen.uniform(-6, 6)]) for _ in range(num_headers)]
+
+        # Act
+        masses, conflict = cut.evaluate_masses(arg_frame, 0.00001)
+
+        # Assert
+        expected_masses, expected_conflict = scalar_masses(arg_tests, arg_frame)
+        assert np.allclose(masses, expected_masses)
+        assert np.allclose(conflict, expected_conflict)
+
+# calc_statuses tests
+def test_VectorizedSuite_calc_statuses_returns_RED_with_red_fraction_when_any_test_is_RED():
+    # Arrange
+    cut = VectorizedSuite.__new__(VectorizedSuite)
+    cut.width = 4
+    cut.num_tests = np.array([4, 3])
+    arg_codes = np.array([[vectorized_suite.GREEN, vectorized_suite.RED, vectorized_suite.GREEN, vectorized_suite.RED],
+                          [vectorized_suite.RED, vectorized_suite.YELLOW, vectorized_suite.YELLOW, -1]], dtype=np.int8)
+
+    # Act
+    statuses, confidences = cut.calc_statuses(arg_codes)
+
+    # Assert
+    assert statuses.tolist() == [vectorized_suite.RED, vectorized_suite.RED]
+    assert confidences.tolist() == [0.5, 1/3]
+
+def test_VectorizedSuite_calc_statuses_returns_most_common_status_breaking_ties_by_first_occurrence():
+    # Arrange
+    cut = VectorizedSuite.__new__(VectorizedSuite)
+    cut.width = 4
+    cut.num_tests = np.array([4, 3, 1])
+    arg_codes = np.array([[vectorized_suite.YELLOW, vectorized_suite.GREEN, vectorized_suite.GREEN, vectorized_suite.YELLOW],
+                          [vectorized_suite.NO_STATUS, vectorized_suite.GREEN, vectorized_suite.GREEN, -1],
+                          [vectorized_suite.NO_STATUS, -1, -1, -1]], dtype=np.int8)
+
+    # Act
+    statuses, confidences = cut.calc_statuses(arg_codes)
+
+    # Assert
+    assert statuses.tolist() == [vectorized_suite.YELLOW, vectorized_suite.GREEN, vectorized_suite.NO_STATUS]
+    assert confidences.tolist() == [1.0, 1.0, 1.0]
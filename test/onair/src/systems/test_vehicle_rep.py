@@ -11,8 +11,11 @@
 import pytest
 from unittest.mock import MagicMock
 
+import numpy as np
+
 import onair.src.systems.vehicle_rep as vehicle_rep
 from onair.src.systems.vehicle_rep import VehicleRepresentation
+import onair.src.systems.evidence as evidence
 
 # __init__ tests
 def test_VehicleRepresentation__init__asserts_when_len_given_headers_is_not_eq_to_len_given_tests(mocker):
@@ -67,6 +70,38 @@ def test_VehicleRepresentation__init__sets_status_to_Status_with_str_MISSION_and
     assert vehicle_rep.TelemetryTestSuite.call_args_list[0].args == (arg_headers, arg_tests)
     assert cut.test_suite == fake_test_suite
     assert cut.curr_data == ['-'] * fake_len
+    assert cut.subsystem_rollup == None
+    assert cut.subsystem_statuses == {}
+
+def test_VehicleRepresentation__init__sets_subsystem_rollup_and_a_Status_for_each_subsystem_when_given_subsystem_assignments(mocker):
+    # Arrange
+    arg_headers = ['a', 'b', 'c']
+    arg_tests = [MagicMock(), MagicMock(), MagicMock()]
+    arg_subsystem_assignments = [['POWER'], ['THERMAL'], ['POWER']]
+
+    mocker.patch(vehicle_rep.__name__ + '.TelemetryTestSuite')
+
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+
+    # Act
+    cut.__init__(arg_headers, arg_tests, {}, arg_subsystem_assignments)
+
+    # Assert
+    assert cut.subsystem_rollup.subsystems == ['POWER', 'THERMAL']
+    assert list(cut.subsystem_statuses.keys()) == ['POWER', 'THERMAL']
+    for subsystem, stat in cut.subsystem_statuses.items():
+        assert stat.get_name() == subsystem
+        assert stat.get_bayesian_status() == ('---', -1.0)
+
+def test_VehicleRepresentation__init__asserts_when_len_subsystem_assignments_is_not_eq_to_len_given_headers(mocker):
+    # Arrange
+    mocker.patch(vehicle_rep.__name__ + '.TelemetryTestSuite')
+
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+
+    # Act
+    with pytest.raises(AssertionError):
+        cut.__init__(['a', 'b'], [MagicMock(), MagicMock()], {}, [['POWER']])
 
 # update tests
 def test_VehicleRepresentation_update_calls_update_constructs_then_update_curr_data_then_executes_test_suite_and_finally_sets_status(mocker):
@@ -74,10 +109,7 @@ def test_VehicleRepresentation_update_calls_update_constructs_then_update_curr_d
     mock_manager = mocker.MagicMock()
     arg_frame = MagicMock()
 
-    fake_suite_status = []
-    num_fake_status = pytest.gen.randint(0, 10) # from 0 to 10 arbitrary
-    for i in range(num_fake_status):
-        fake_suite_status.append(MagicMock())
+    fake_suite_status = (MagicMock(), MagicMock())
 
     cut = VehicleRepresentation.__new__(VehicleRepresentation)
     cut.test_suite = MagicMock()
@@ -102,6 +134,264 @@ def test_VehicleRepresentation_update_calls_update_constructs_then_update_curr_d
         mocker.call.update_constructs(cut.curr_data),
     ], any_order=False)
 
+def test_VehicleRepresentation_update_executes_only_changed_tests_when_update_curr_data_found_changed_indices(mocker):
+    # Arrange
+    mock_manager = mocker.MagicMock()
+    arg_frame = MagicMock()
+    fake_changed_indices = MagicMock()
+    fake_suite_status = [MagicMock(), MagicMock()]
+
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    cut.curr_data = MagicMock()
+    cut.status = MagicMock()
+
+    def fake_update_curr_data(frame):
+        cut.changed_indices = fake_changed_indices
+
+    mocker.patch.object(cut, 'update_constructs')
+    mock_manager.attach_mock(mocker.patch.object(cut, 'update_curr_data', side_effect=fake_update_curr_data), 'update_curr_data')
+    mock_manager.attach_mock(mocker.patch.object(cut.test_suite, 'execute_changed', return_value=True), 'test_suite.execute_changed')
+    mock_manager.attach_mock(mocker.patch.object(cut.test_suite, 'get_suite_status', return_value=fake_suite_status), 'test_suite.get_suite_status')
+
+    # Act
+    cut.update(arg_frame)
+
+    # Assert
+    mock_manager.assert_has_calls([
+        mocker.call.update_curr_data(arg_frame),
+        mocker.call.test_suite.execute_changed(cut.curr_data, fake_changed_indices),
+        mocker.call.test_suite.get_suite_status(),
+    ], any_order=False)
+    assert cut.test_suite.execute_suite.call_count == 0
+
+def test_VehicleRepresentation_update_executes_whole_suite_when_incremental_updates_are_off(mocker):
+    # Arrange
+    arg_frame = MagicMock()
+
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    cut.curr_data = MagicMock()
+    cut.status = MagicMock()
+    cut.changed_indices = MagicMock()
+    cut.incremental_updates = False
+
+    mocker.patch.object(cut, 'update_constructs')
+    mocker.patch.object(cut, 'update_curr_data')
+    mocker.patch.object(cut.test_suite, 'get_suite_status', return_value=[MagicMock(), MagicMock()])
+
+    # Act
+    cut.update(arg_frame)
+
+    # Assert
+    assert cut.test_suite.execute_suite.call_args_list[0].args == (cut.curr_data, )
+    assert cut.test_suite.execute_changed.call_count == 0
+
+def test_VehicleRepresentation_update_executes_whole_suite_once_after_a_reset(mocker):
+    # Arrange
+    arg_frame = MagicMock()
+
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    cut.curr_data = MagicMock()
+    cut.status = MagicMock()
+    cut.changed_indices = MagicMock()
+    cut.rerun_all_tests = True
+
+    mocker.patch.object(cut, 'update_constructs')
+    mocker.patch.object(cut, 'update_curr_data')
+    mocker.patch.object(cut.test_suite, 'get_suite_status', return_value=[MagicMock(), MagicMock()])
+
+    # Act
+    cut.update(arg_frame)
+    cut.update(arg_frame)
+
+    # Assert
+    assert cut.test_suite.execute_suite.call_count == 1
+    assert cut.test_suite.execute_changed.call_count == 1
+    assert cut.rerun_all_tests == False
+
+# reset tests
+def test_VehicleRepresentation_reset_makes_curr_data_stale_and_resets_each_knowledge_synthesis_construct():
+    # Arrange
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.headers = [MagicMock() for _ in range(pytest.gen.randint(1, 10))] # arbitrary, from 1 to 10
+    cut.curr_data = [MagicMock() for _ in cut.headers]
+    cut.knowledge_synthesis_constructs = [MagicMock() for _ in range(pytest.gen.randint(0, 5))] # arbitrary, from 0 to 5
+
+    # Act
+    cut.reset()
+
+    # Assert
+    assert cut.curr_data == ['-'] * len(cut.headers)
+    assert cut.rerun_all_tests == True
+    for construct in cut.knowledge_synthesis_constructs:
+        assert construct.reset.call_count == 1
+
+# finish tests
+def test_VehicleRepresentation_finish_finishes_each_knowledge_synthesis_construct():
+    # Arrange
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.knowledge_synthesis_constructs = [MagicMock() for _ in range(pytest.gen.randint(0, 5))] # arbitrary, from 0 to 5
+
+    # Act
+    cut.finish()
+
+    # Assert
+    for construct in cut.knowledge_synthesis_constructs:
+        assert construct.finish.call_count == 1
+
+# update_subsystem_statuses tests
+def test_VehicleRepresentation_update_subsystem_statuses_does_nothing_when_there_is_no_subsystem_rollup():
+    # Arrange
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+
+    # Act
+    result = cut.update_subsystem_statuses()
+
+    # Assert
+    assert result == None
+    assert cut.test_suite.get_status_codes.call_count == 0
+
+def test_VehicleRepresentation_update_subsystem_statuses_sets_each_subsystem_Status_from_rollup_of_test_suite_status_codes(mocker):
+    # Arrange
+    fake_subsystems = ['POWER', 'THERMAL']
+    fake_rollup = MagicMock()
+    fake_rollup.subsystems = fake_subsystems
+    fake_rollup.rollup.return_value = (np.array([3, 1]), np.array([0.5, 1.0]))
+
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    cut.subsystem_rollup = fake_rollup
+    cut.subsystem_rollup_mode = MagicMock()
+    cut.subsystem_statuses = {subsystem : MagicMock() for subsystem in fake_subsystems}
+
+    # Act
+    cut.update_subsystem_statuses()
+
+    # Assert
+    assert fake_rollup.rollup.call_args_list[0].args == (cut.test_suite.get_status_codes.return_value, cut.subsystem_rollup_mode, None)
+    assert cut.subsystem_statuses['POWER'].set_status.call_args_list[0].args == ('RED', 0.5)
+    assert cut.subsystem_statuses['THERMAL'].set_status.call_args_list[0].args == ('GREEN', 1.0)
+
+def test_VehicleRepresentation_update_subsystem_statuses_does_nothing_when_no_mnemonic_was_retested():
+    # Arrange
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    cut.subsystem_rollup = MagicMock()
+
+    # Act
+    cut.update_subsystem_statuses([])
+
+    # Assert
+    assert cut.subsystem_rollup.rollup.call_count == 0
+    assert cut.test_suite.get_status_codes.call_count == 0
+
+@pytest.mark.parametrize('arg_incremental', [True, False])
+def test_VehicleRepresentation_update_rolls_up_only_retested_mnemonics_when_execute_changed_ran_incrementally(mocker, arg_incremental):
+    # Arrange
+    fake_changed_indices = [MagicMock()]
+
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    cut.test_suite.get_suite_status.return_value = ('GREEN', 1.0)
+    cut.test_suite.execute_changed.return_value = arg_incremental
+    cut.curr_data = MagicMock()
+    cut.status = MagicMock()
+
+    def fake_update_curr_data(frame):
+        cut.changed_indices = fake_changed_indices
+
+    mocker.patch.object(cut, 'update_curr_data', side_effect=fake_update_curr_data)
+    mocker.patch.object(cut, 'update_subsystem_statuses')
+    mocker.patch.object(cut, 'update_constructs')
+
+    # Act
+    cut.update(MagicMock())
+
+    # Assert
+    expected_indices = fake_changed_indices if arg_incremental else None
+    assert cut.update_subsystem_statuses.call_args_list[0].args == (expected_indices, )
+
+def test_VehicleRepresentation_update_keeps_subsystem_statuses_matching_a_full_rollup_over_frames():
+    # Arrange
+    arg_headers = ['a', 'b', 'c', 'd']
+    arg_tests = [[['FEASIBILITY', 0, 10]]] * len(arg_headers)
+    arg_subsystem_assignments = [['POWER'], ['THERMAL'], ['POWER'], ['POWER', 'THERMAL']]
+    arg_frames = [[5, 20, -5, 5], [5, 5, -5, 5], [5, 5, -5, 5], [5, 5, 5, 20], ['-', 30, '-', 5]]
+
+    cut = VehicleRepresentation(arg_headers, arg_tests, {}, arg_subsystem_assignments)
+    cut.test_suite.incremental_limit = 1.0
+
+    for frame in arg_frames:
+        # Act
+        cut.update(frame)
+
+        # Assert
+        full = VehicleRepresentation(arg_headers, arg_tests, {}, arg_subsystem_assignments)
+        full.update(list(cut.curr_data))
+        assert ({subsystem : status.get_bayesian_status() for subsystem, status in cut.get_subsystem_statuses().items()} ==
+                {subsystem : status.get_bayesian_status() for subsystem, status in full.get_subsystem_statuses().items()})
+
+def test_VehicleRepresentation_update_sets_subsystem_statuses_matching_calc_single_status_of_their_mnemonics():
+    # Arrange
+    arg_headers = ['a', 'b', 'c', 'd']
+    arg_tests = [[['FEASIBILITY', 0, 10]]] * len(arg_headers)
+    arg_subsystem_assignments = [['POWER'], ['THERMAL'], ['POWER'], ['POWER', 'THERMAL']]
+    arg_frame = [5, 20, -5, 5]
+
+    cut = VehicleRepresentation(arg_headers, arg_tests, {}, arg_subsystem_assignments)
+
+    # Act
+    cut.update(arg_frame)
+
+    # Assert
+    assert cut.get_subsystem_statuses()['POWER'].get_bayesian_status() == ('RED', 1/3)
+    assert cut.get_subsystem_statuses()['THERMAL'].get_bayesian_status() == ('RED', 0.5)
+
+def test_VehicleRepresentation_update_sets_status_confidences_to_beliefs_from_combined_evidence_when_evidence_confidence_is_on():
+    # Arrange
+    arg_headers = ['a', 'b', 'c', 'd']
+    arg_tests = [[['FEASIBILITY', 0, 10]]] * len(arg_headers)
+    arg_subsystem_assignments = [['POWER'], ['THERMAL'], ['POWER'], ['POWER', 'THERMAL']]
+    arg_frame = [5, 20, -5, 5]
+
+    cut = VehicleRepresentation(arg_headers, arg_tests, {}, arg_subsystem_assignments)
+    cut.evidence_confidence = True
+
+    # Act
+    cut.update(arg_frame)
+
+    # Assert
+    subsystem_evidence = cut.get_subsystem_evidence()
+    assert cut.get_bayesian_status() == ('RED', pytest.approx(cut.get_mission_evidence().get_belief(['RED'])[0]))
+    assert cut.get_subsystem_statuses()['POWER'].get_bayesian_status() == ('RED', pytest.approx(subsystem_evidence.get_belief(['RED'])[0]))
+    assert cut.get_subsystem_statuses()['THERMAL'].get_bayesian_status() == ('RED', pytest.approx(subsystem_evidence.get_belief(['RED'])[1]))
+    # The confidence differs from the share of mnemonics with the status
+    assert cut.get_bayesian_status()[1] != pytest.approx(0.5)
+
+def test_VehicleRepresentation_update_keeps_the_confidence_of_no_status_when_evidence_confidence_is_on(mocker):
+    # Arrange
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    cut.test_suite.get_suite_status.return_value = ('---', -1.0)
+    cut.curr_data = MagicMock()
+    cut.status = MagicMock()
+    cut.evidence_confidence = True
+
+    mocker.patch.object(cut, 'update_curr_data')
+    mocker.patch.object(cut, 'update_subsystem_statuses')
+    mocker.patch.object(cut, 'update_constructs')
+    mocker.patch.object(cut, 'get_mission_evidence')
+
+    # Act
+    cut.update(MagicMock())
+
+    # Assert
+    assert cut.get_mission_evidence.call_count == 0
+    assert cut.status.set_status.call_args_list[0].args == ('---', -1.0)
+
 # update_constructs tests
 def test_VehicleRepresentation_update_constructs_does_nothing_when_knowledge_synthesis_constructs_are_empty(mocker):
     # Arrange
@@ -205,6 +495,99 @@ def test_VehicleRepresentation_update_copies_only_occupied_frame_data_into_curr_
     # Assert
     assert cut.curr_data == expected_curr_data
 
+def test_VehicleRepresentation_update_curr_data_sets_changed_indices_to_occupied_frame_data_that_differ_from_curr_data():
+    # Arrange
+    arg_frame = [1.0, '-', 3.0, 4.0, '-']
+
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.curr_data = [1.0, 2.0, 0.0, '-', '-']
+
+    # Act
+    cut.update_curr_data(arg_frame)
+
+    # Assert
+    assert cut.changed_indices == [2, 3]
+    assert cut.curr_data == [1.0, 2.0, 3.0, 4.0, '-']
+
+# get_subsystem_statuses tests
+def test_VehicleRepresentation_get_subsystem_statuses_returns_subsystem_statuses():
+    # Arrange
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.subsystem_statuses = MagicMock()
+
+    # Act / Assert
+    assert cut.get_subsystem_statuses() == cut.subsystem_statuses
+
+# get_evidence tests
+def test_VehicleRepresentation_get_evidence_returns_test_suite_evidence():
+    # Arrange
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+
+    # Act / Assert
+    assert cut.get_evidence() == cut.test_suite.get_evidence.return_value
+
+# get_subsystem_evidence tests
+def test_VehicleRepresentation_get_subsystem_evidence_returns_None_without_subsystems_or_evidence():
+    # Arrange
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    if pytest.gen.choice([True, False]):
+        cut.subsystem_rollup = MagicMock()
+        cut.test_suite.get_evidence.return_value = None
+
+    # Act / Assert
+    assert cut.get_subsystem_evidence() == None
+
+def test_VehicleRepresentation_get_subsystem_evidence_combines_mnemonic_evidence_of_each_subsystem():
+    # Arrange
+    fake_combined = (MagicMock(), MagicMock())
+
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    cut.subsystem_rollup = MagicMock()
+    cut.subsystem_rollup.subsystems = ['POWER']
+    cut.subsystem_rollup.combine_evidence.return_value = fake_combined
+
+    # Act
+    result = cut.get_subsystem_evidence()
+
+    # Assert
+    assert cut.subsystem_rollup.combine_evidence.call_args_list[0].args == (cut.test_suite.get_evidence.return_value.masses, cut.subsystem_evidence_reliability)
+    assert result.names == ['POWER']
+    assert result.masses == fake_combined[0]
+    assert result.conflict == fake_combined[1]
+
+# get_mission_evidence tests
+def test_VehicleRepresentation_get_mission_evidence_returns_None_without_evidence():
+    # Arrange
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    cut.test_suite.get_evidence.return_value = None
+
+    # Act / Assert
+    assert cut.get_mission_evidence() == None
+
+def test_VehicleRepresentation_get_mission_evidence_combines_discounted_evidence_of_every_mnemonic():
+    # Arrange
+    fake_masses = np.array([evidence.mass_vector([({'GREEN'}, 1.0)]),
+                            evidence.mass_vector([({'RED'}, 0.5), ({'RED', 'YELLOW'}, 0.5)])])
+
+    cut = VehicleRepresentation.__new__(VehicleRepresentation)
+    cut.test_suite = MagicMock()
+    cut.test_suite.get_evidence.return_value.masses = fake_masses
+    cut.status = vehicle_rep.Status('MISSION')
+
+    # Act
+    result = cut.get_mission_evidence()
+
+    # Assert
+    expected = vehicle_rep.combine_groups(vehicle_rep.discount(fake_masses, cut.subsystem_evidence_reliability),
+                                          np.array([0, 0]), 1)
+    assert result.names == ['MISSION']
+    assert np.allclose(result.masses, expected[0])
+    assert np.allclose(result.conflict, expected[1])
+
 # get_headers tests
 def test_VehicleRepresentation_get_headers_returns_headers():
     # Arrange
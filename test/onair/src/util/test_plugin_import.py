@@ -279,3 +279,38 @@ def test_plugin_import_returns_two_item_list_when_given_module_dict_contains_two
     assert fake_mod_name in plugin_import.sys.modules
     assert plugin_import.sys.modules[fake_mod_name] == fake_module
     assert result == [fake_Plugin_instance_1, fake_Plugin_instance_2]
+
+def test_plugin_import_builds_a_ProcessPlugin_for_each_construct_named_in_process_plugins(mocker):
+    # Arrange
+    arg_headers = MagicMock()
+    fake_process_name = MagicMock()
+    fake_process_path = MagicMock()
+    fake_construct_name = MagicMock()
+    fake_module_path = MagicMock()
+    arg_module_dict = {fake_process_name:fake_process_path,
+                       fake_construct_name:fake_module_path}
+    arg_process_plugins = [fake_process_name]
+
+    fake_plugin = MagicMock()
+    fake_Plugin_instance = MagicMock()
+    fake_ProcessPlugin_instance = MagicMock()
+
+    mocker.patch.object(fake_module_path, 'endswith', return_value=False)
+    mocker.patch(plugin_import.__name__ + '.os.path.basename', return_value='fake_mod_name')
+    mocker.patch.dict(plugin_import.sys.modules, {'fake_mod_name':MagicMock()})
+    mocker.patch(plugin_import.__name__ + '.ProcessPlugin', return_value=fake_ProcessPlugin_instance)
+    import_mock = mocker.patch('builtins.__import__', return_value=fake_plugin)
+    mocker.patch.object(fake_plugin, 'Plugin', return_value=fake_Plugin_instance)
+
+    # Act
+    result = plugin_import.import_plugins(arg_headers, arg_module_dict, arg_process_plugins)
+
+    # Assert
+    assert import_mock.call_count == 1
+    mocker.stop(import_mock)
+
+    assert plugin_import.ProcessPlugin.call_count == 1
+    assert plugin_import.ProcessPlugin.call_args_list[0].args == (fake_process_name, arg_headers, fake_process_path)
+    assert fake_plugin.Plugin.call_count == 1
+    assert fake_plugin.Plugin.call_args_list[0].args == (fake_construct_name, arg_headers)
+    assert result == [fake_ProcessPlugin_instance, fake_Plugin_instance]
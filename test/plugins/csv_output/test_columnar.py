@@ -0,0 +1,101 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test Columnar Output Format Functionality """
+import pytest
+import numpy as np
+
+from plugins.csv_output import columnar
+
+def write_file(file_name, columns, chunks, compression='zlib'):
+    with open(file_name, 'wb') as file:
+        file.write(columnar.encode_header(columns, compression))
+        for rows in chunks:
+            file.write(columnar.encode_chunk(rows, compression))
+
+# encode_header tests
+def test_columnar_encode_header_raises_ValueError_for_unknown_compression():
+    with pytest.raises(ValueError) as e_info:
+        columnar.encode_header(['a'], 'unknown')
+
+    assert e_info.match("Unknown compression 'unknown'")
+
+# load_run tests
+@pytest.mark.parametrize('arg_compression', list(columnar.COMPRESSIONS))
+def test_columnar_load_run_reads_back_numeric_and_text_columns_of_every_chunk(tmp_path, arg_compression):
+    # Arrange
+    file_name = str(tmp_path / 'run.col')
+    num_rows = pytest.gen.randint(1, 20) # arbitrary, from 1 to 20
+    numbers = [pytest.gen.uniform(-10.0, 10.0) for _ in range(num_rows)]
+    texts = [str(pytest.gen.randint(0, 10)) + 'x' for _ in range(num_rows)]
+    rows = [[number, text] for number, text in zip(numbers, texts)]
+    split = pytest.gen.randint(0, num_rows)
+    write_file(file_name, ['number', 'text'], [rows[:split], rows[split:]], arg_compression)
+
+    # Act
+    result = columnar.load_run(file_name)
+
+    # Assert
+    assert list(result) == ['number', 'text']
+    assert result['number'].dtype == np.float64
+    assert result['number'].tolist() == numbers
+    assert result['text'].tolist() == texts
+
+def test_columnar_load_run_pads_short_rows_and_names_columns_past_the_header(tmp_path):
+    # Arrange
+    file_name = str(tmp_path / 'run.col')
+    write_file(file_name, ['a'], [[[1.0], [2.0, 'x', 3.0]], [[4.0, 5.0]]])
+
+    # Act
+    result = columnar.load_run(file_name)
+
+    # Assert
+    assert list(result) == ['a', 'column_1', 'column_2']
+    assert result['a'].tolist() == [1.0, 2.0, 4.0]
+    assert result['column_1'].tolist() == ['', 'x', '5.0']
+    assert np.isnan(result['column_2'][[0, 2]]).all()
+    assert result['column_2'][1] == 3.0
+
+def test_columnar_load_run_joins_files_matching_pattern_in_sorted_order(tmp_path):
+    # Arrange
+    write_file(str(tmp_path / 'run_0002.col'), ['a'], [[[3.0]]])
+    write_file(str(tmp_path / 'run_0001.col'), ['a'], [[[1.0], [2.0]]])
+    write_file(str(tmp_path / 'other_0001.col'), ['a'], [[[9.0]]])
+
+    # Act
+    result = columnar.load_run(str(tmp_path / 'run_*.col'))
+
+    # Assert
+    assert result['a'].tolist() == [1.0, 2.0, 3.0]
+
+def test_columnar_load_run_gives_empty_columns_of_file_without_chunks(tmp_path):
+    # Arrange
+    file_name = str(tmp_path / 'run.col')
+    write_file(file_name, ['a', 'b'], [])
+
+    # Act
+    result = columnar.load_run(file_name)
+
+    # Assert
+    assert list(result) == ['a', 'b']
+    assert len(result['a']) == 0
+
+# read_file tests
+def test_columnar_read_file_raises_ValueError_when_file_is_not_columnar(tmp_path):
+    # Arrange
+    file_name = str(tmp_path / 'run.csv')
+    with open(file_name, 'w') as file:
+        file.write('a,b\n1,2\n')
+
+    # Act
+    with pytest.raises(ValueError) as e_info:
+        columnar.read_file(file_name)
+
+    # Assert
+    assert e_info.match('is not a columnar output file')
@@ -15,6 +15,7 @@ from copy import copy
 
 from plugins.csv_output import csv_output_plugin
 from plugins.csv_output.csv_output_plugin import Plugin as CSV_Output
+from plugins.csv_output import columnar
 
 
 def test_init_initalizes_expected_default_variables():
@@ -165,6 +166,9 @@ def test_update_fills_buffer_with_high_level_data():
 
     assert csv_out.current_buffer == expected_buffer
 
+def test_render_reasoning_opts_out_of_reasoning_cache_to_write_every_render():
+    assert CSV_Output.cache_reasoning == False
+
 def test_render_reasoning_creates_expected_file_on_first_frame():
     arg_name = MagicMock()
     arg_headers = ['header1', 'header2']
@@ -235,3 +239,207 @@ def test_render_reasoning_changes_file_when_lines_per_file_reached():
         raise AssertionError("file name was not updated or new file was created prematurely")
     finally:
         os.remove(old_file_name)
+
+def test_render_reasoning_numbers_files_and_starts_each_with_headers(tmp_path):
+    arg_name = MagicMock()
+    arg_headers = ['header1', 'header2']
+    csv_out = CSV_Output(arg_name, arg_headers)
+    csv_out.filename_preamble = str(tmp_path / 'test_')
+    csv_out.lines_per_file = 2
+
+    for frame in range(3):
+        csv_out.current_buffer = [str(frame), str(frame)]
+        csv_out.render_reasoning()
+    csv_out.writer.close()
+
+    file_names = sorted(os.listdir(tmp_path))
+    assert len(file_names) == 2
+    assert file_names[0].endswith('_0001.csv')
+    assert file_names[1].endswith('_0002.csv')
+    assert (tmp_path / file_names[0]).read_text() == 'header1,header2\n0,0\n1,1\n'
+    assert (tmp_path / file_names[1]).read_text() == 'header1,header2\n2,2\n'
+
+def test_render_reasoning_keeps_rows_in_buffer_until_flush_rows_are_waiting(tmp_path):
+    arg_name = MagicMock()
+    arg_headers = ['header1']
+    csv_out = CSV_Output(arg_name, arg_headers)
+    csv_out.filename_preamble = str(tmp_path / 'test_')
+    csv_out.lines_per_file = 0
+    csv_out.flush_rows = 3
+    csv_out.flush_seconds = float('inf')
+
+    csv_out.current_buffer = ['a']
+    csv_out.render_reasoning()
+    written_before_flush = open(csv_out.file_name).read()
+    csv_out.current_buffer = ['b']
+    csv_out.render_reasoning()
+
+    assert written_before_flush == ''
+    assert open(csv_out.file_name).read() == 'header1\na\nb\n'
+
+def test_render_reasoning_batches_rows_of_many_files_into_one_flush_with_default_settings(tmp_path):
+    arg_name = MagicMock()
+    arg_headers = ['header1']
+    csv_out = CSV_Output(arg_name, arg_headers)
+    csv_out.filename_preamble = str(tmp_path / 'test_')
+    csv_out.flush_seconds = float('inf')
+    num_files = csv_out.flush_rows // (csv_out.lines_per_file + 1)
+
+    for frame in range(num_files * csv_out.lines_per_file):
+        csv_out.current_buffer = [str(frame)]
+        csv_out.render_reasoning()
+    written_before_flush = [(tmp_path / file_name).read_text() for file_name in sorted(os.listdir(tmp_path))]
+    csv_out.writer.close()
+
+    file_names = sorted(os.listdir(tmp_path))
+    assert written_before_flush == [''] * num_files
+    assert len(file_names) == num_files
+    for number, file_name in enumerate(file_names):
+        rows = range(number * csv_out.lines_per_file, (number + 1) * csv_out.lines_per_file)
+        assert (tmp_path / file_name).read_text() == 'header1\n' + ''.join(f'{row}\n' for row in rows)
+
+# RowWriter tests
+def test_render_reasoning_gives_plugins_started_in_the_same_second_files_of_their_own(tmp_path, mocker):
+    arg_headers = ['header1']
+    csv_outs = [CSV_Output(MagicMock(), list(arg_headers)) for _ in range(2)]
+
+    mocker.patch(csv_output_plugin.__name__ + '.datetime')
+    csv_output_plugin.datetime.today.return_value.strftime.return_value = 'same_second'
+
+    for number, csv_out in enumerate(csv_outs):
+        csv_out.filename_preamble = str(tmp_path / 'test_')
+        csv_out.current_buffer = [str(number)]
+        csv_out.render_reasoning()
+        csv_out.finish()
+
+    assert csv_outs[0].file_name != csv_outs[1].file_name
+    assert str(os.getpid()) in csv_outs[0].file_name
+    assert open(csv_outs[0].file_name).read() == 'header1\n0\n'
+    assert open(csv_outs[1].file_name).read() == 'header1\n1\n'
+
+def test_finish_writes_out_every_buffered_row_and_closes_the_file(tmp_path):
+    arg_name = MagicMock()
+    arg_headers = ['header1']
+    csv_out = CSV_Output(arg_name, arg_headers)
+    csv_out.filename_preamble = str(tmp_path / 'test_')
+    csv_out.lines_per_file = 2
+    csv_out.flush_seconds = float('inf')
+
+    for frame in range(3):
+        csv_out.current_buffer = [str(frame)]
+        csv_out.render_reasoning()
+    csv_out.finish()
+
+    file_names = sorted(os.listdir(tmp_path))
+    assert csv_out.writer.file == None
+    assert [(tmp_path / file_name).read_text() for file_name in file_names] == ['header1\n0\n1\n', 'header1\n2\n']
+
+def test_finish_does_nothing_before_any_render():
+    csv_out = CSV_Output(MagicMock(), ['header1'])
+
+    csv_out.finish()
+
+    assert csv_out.writer == None
+
+def test_RowWriter_open_keeps_rows_of_the_file_before_waiting_then_flush_writes_and_closes_it(tmp_path):
+    first_name = str(tmp_path / 'first.csv')
+    second_name = str(tmp_path / 'second.csv')
+    writer = csv_output_plugin.RowWriter(max_rows=100, max_seconds=float('inf'))
+
+    writer.open(first_name, ['h'])
+    writer.write('a\n')
+    first_file = writer.file
+    writer.open(second_name, ['h'])
+    writer.write('b\n')
+    written_before_flush = open(first_name).read()
+    writer.flush()
+
+    assert written_before_flush == ''
+    assert open(first_name).read() == 'h\na\n'
+    assert open(second_name).read() == 'h\nb\n'
+    assert first_file.closed == True
+    assert writer.file.closed == False
+    assert writer.earlier_files == []
+    assert writer.waiting_rows == 0
+    writer.close()
+
+def test_RowWriter_flushes_rows_once_max_seconds_have_passed(tmp_path, mocker):
+    file_name = str(tmp_path / 'rows.csv')
+    mocker.patch(csv_output_plugin.__name__ + '.time.monotonic', side_effect=[0.0, 0.5, 2.0, 2.0])
+    writer = csv_output_plugin.RowWriter(max_rows=100, max_seconds=1.0)
+    writer.open(file_name, ['h'])
+
+    writer.write('a\n')
+    written_before_flush = open(file_name).read()
+    writer.write('b\n')
+
+    assert written_before_flush == ''
+    assert open(file_name).read() == 'h\na\nb\n'
+
+def test_RowWriter_does_not_repeat_headers_when_opening_file_already_holding_rows(tmp_path):
+    file_name = str(tmp_path / 'rows.csv')
+    with open(file_name, 'w') as file:
+        file.write('h\nold\n')
+    writer = csv_output_plugin.RowWriter()
+
+    writer.open(file_name, ['h'])
+    writer.write('new\n')
+    writer.close()
+
+    assert open(file_name).read() == 'h\nold\nnew\n'
+    assert writer.file == None
+
+def test_RowWriter_in_background_mode_has_written_every_row_once_closed(tmp_path):
+    file_name = str(tmp_path / 'rows.csv')
+    num_rows = pytest.gen.randint(1, 50) # arbitrary, from 1 to 50
+    writer = csv_output_plugin.RowWriter(max_rows=pytest.gen.randint(1, 10), background=True) # arbitrary, from 1 to 10
+
+    writer.open(file_name, ['h'])
+    for row in range(num_rows):
+        writer.write(f'{row}\n')
+    writer.close()
+
+    assert open(file_name).read() == 'h\n' + ''.join(f'{row}\n' for row in range(num_rows))
+
+def test_RowWriter_raises_error_of_background_write_on_next_flush(tmp_path):
+    writer = csv_output_plugin.RowWriter(max_rows=1, background=True)
+    fake_file = MagicMock()
+    fake_file.write.side_effect = OSError('disk full')
+    writer.file = fake_file
+
+    writer.write('a\n')
+    writer.batches.join()
+
+    with pytest.raises(OSError):
+        writer.write('b\n')
+
+def test_update_keeps_values_as_they_are_for_columnar_output():
+    arg_name = MagicMock()
+    arg_headers = [MagicMock(), MagicMock()]
+    csv_out = CSV_Output(arg_name, arg_headers)
+    csv_out.output_format = 'columnar'
+
+    low_level_data = [pytest.gen.uniform(-10.0, 10.0) for x in range(10)]
+
+    csv_out.update(low_level_data, {'learning_system':{'plugin_1': [1, 'a']}})
+
+    assert csv_out.current_buffer == low_level_data + [1, 'a']
+
+def test_render_reasoning_writes_columnar_files_that_load_back_as_a_run(tmp_path):
+    arg_name = MagicMock()
+    arg_headers = ['header1', 'header2']
+    csv_out = CSV_Output(arg_name, arg_headers)
+    csv_out.filename_preamble = str(tmp_path / 'test_')
+    csv_out.output_format = 'columnar'
+    csv_out.compression = pytest.gen.choice(list(columnar.COMPRESSIONS))
+    csv_out.lines_per_file = 2
+
+    for frame in range(3):
+        csv_out.current_buffer = [float(frame), str(frame) + 'x']
+        csv_out.render_reasoning()
+    csv_out.writer.close()
+
+    assert csv_out.file_name.endswith('_0002.col')
+    result = columnar.load_run(str(tmp_path / 'test_*.col'))
+    assert result['header1'].tolist() == [0.0, 1.0, 2.0]
+    assert result['header2'].tolist() == ['0x', '1x', '2x']
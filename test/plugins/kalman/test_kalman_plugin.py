@@ -10,6 +10,7 @@
 """ Test Kalman Plugin Functionality """
 import pytest
 from unittest.mock import MagicMock
+import numpy as np
 import onair
 
 from plugins.kalman import kalman_plugin
@@ -42,7 +43,14 @@ def test_Kalman__init__initializes_variables_to_expected_values_when_given_all_a
     cut.__init__(arg_name, arg_headers)
 
     # Assert
-    assert cut.frames == []
+    assert cut.buffer == None
+    assert cut.valid == None
+    assert cut.head == 0
+    assert cut.count == 0
+    assert cut.online == False
+    assert cut.states == None
+    assert cut.residuals == None
+    assert cut.gain == None
     assert cut.component_name == arg_name
     assert cut.headers == arg_headers
     assert cut.window_size == 3
@@ -53,11 +61,27 @@ def test_Kalman__init__initializes_variables_to_expected_values_when_given_all_a
     assert cut.kf.observation_model == forced_array_return_value
     assert cut.kf.observation_noise == 1.0
 
+def test_Kalman__init__keeps_class_online_when_not_given_online(mocker):
+    # Arrange
+    class OnlineKalman(Kalman):
+        online = True
+
+    mocker.patch(kalman_plugin.__name__ + '.simdkalman.KalmanFilter')
+
+    # Act
+    result = OnlineKalman('test', ['a', 'b'])
+    overridden = OnlineKalman('test', ['a', 'b'], online=False)
+
+    # Assert
+    assert result.online == True
+    assert overridden.online == False
+
 def test_Kalman__init__initializes_variables_to_expected_values_when_given_all_args(mocker):
     # Arrange
     arg_name = MagicMock()
     arg_headers = [MagicMock(), MagicMock()]
     arg_window_size = MagicMock()
+    arg_online = MagicMock()
 
     fake_var = MagicMock()
     class Fake_KalmanFilter():
@@ -77,10 +101,14 @@ def test_Kalman__init__initializes_variables_to_expected_values_when_given_all_a
     cut = Kalman.__new__(Kalman)
 
     # Act
-    cut.__init__(arg_name, arg_headers, arg_window_size)
+    cut.__init__(arg_name, arg_headers, arg_window_size, arg_online)
 
     # Assert
-    assert cut.frames == []
+    assert cut.buffer == None
+    assert cut.valid == None
+    assert cut.head == 0
+    assert cut.count == 0
+    assert cut.online == arg_online
     assert cut.component_name == arg_name
     assert cut.headers == arg_headers
     assert cut.window_size == arg_window_size
@@ -92,169 +120,297 @@ def test_Kalman__init__initializes_variables_to_expected_values_when_given_all_a
     assert cut.kf.observation_noise == 1.0
 
 # test update
-def test_Kalman_update_does_not_mutate_frames_attribute_when_arg_frame_is_empty():
+def test_Kalman_update_does_not_change_windows_when_arg_frame_is_empty():
     # Arrange
-    fake_frames = MagicMock()
+    fake_buffer = MagicMock()
     arg_frame = []
 
     cut = Kalman.__new__(Kalman)
-    cut.frames = fake_frames
+    cut.buffer = fake_buffer
+    cut.head = 0
+    cut.count = 0
 
     # Act
     cut.update(arg_frame)
 
     # Assert
-    assert cut.frames == fake_frames
+    assert cut.buffer == fake_buffer
+    assert cut.head == 0
+    assert cut.count == 0
 
-def test_Kalman_update_mutates_frames_attribute_as_expected_when_frames_is_empty_and_arg_frame_is_not_empty():
+def test_Kalman_update_allocates_buffer_for_first_frame_and_writes_it_as_window(mocker):
     # Arrange
-    fake_frames = []
     len_arg_frame = pytest.gen.randint(1, 10) # arbitrary, random integer from 1 to 10
-    arg_frame = [MagicMock()] * len_arg_frame
+    arg_frame = [pytest.gen.uniform(-10.0, 10.0) for _ in range(len_arg_frame)]
+    fake_window_size = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
 
     cut = Kalman.__new__(Kalman)
-    cut.frames = fake_frames
-
-    expected_result = []
-    for data_pt in arg_frame:
-        expected_result.append([data_pt])
+    cut.buffer = None
+    cut.valid = None
+    cut.head = 0
+    cut.count = 0
+    cut.window_size = fake_window_size
 
     # Act
     cut.update(arg_frame)
 
     # Assert
-    assert cut.frames == expected_result
-
-def test_Kalman_update_mutates_frames_attribute_as_expected_when_both_frames_and_arg_frame_are_not_empty_and_len_arg_frame_greater_than_len_frames():
+    values, valid = cut.get_window()
+    assert cut.buffer.shape == (len_arg_frame, 2 * fake_window_size)
+    assert values.tolist() == [[val] for val in arg_frame]
+    assert valid.all()
+    assert cut.head == 1 % fake_window_size
+    assert cut.count == 1
+
+def test_Kalman_update_keeps_latest_window_size_values_of_each_attribute_oldest_first():
     # Arrange
-    len_fake_frames = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
-    fake_frames = [[MagicMock()]] * len_fake_frames
-    fake_window_size = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
-
-    len_arg_frame = pytest.gen.randint(6, 10) # arbitrary int greater than max len of fake_frames, from 6 to 10
-    arg_frame = [MagicMock()] * len_arg_frame
+    num_attributes = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
+    fake_window_size = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
+    num_frames = pytest.gen.randint(1, 15) # arbitrary, random int from 1 to 15
+    arg_frames = [[pytest.gen.uniform(-10.0, 10.0) for _ in range(num_attributes)] for _ in range(num_frames)]
 
     cut = Kalman.__new__(Kalman)
-    cut.frames = fake_frames
+    cut.buffer = None
+    cut.valid = None
+    cut.head = 0
+    cut.count = 0
     cut.window_size = fake_window_size
 
-    len_dif = len_arg_frame - len_fake_frames
-    expected_result = fake_frames.copy()
+    expected_result = [[frame[i] for frame in arg_frames][-fake_window_size:] for i in range(num_attributes)]
 
-    for i in range(len_dif):
-        expected_result.append([arg_frame[i]])
+    # Act
+    for arg_frame in arg_frames:
+        cut.update(arg_frame)
 
-    for i in range(len_dif, len_arg_frame):
-        expected_result[i].append(arg_frame[i])
-        if len(expected_result[i]) > fake_window_size:
-            expected_result[i].pop(0)
+    # Assert
+    values, valid = cut.get_window()
+    assert values.tolist() == expected_result
+    assert valid.all()
+    assert np.shares_memory(values, cut.buffer)
+
+def test_Kalman_update_grows_buffer_when_len_arg_frame_greater_than_attributes_in_buffer():
+    # Arrange
+    fake_window_size = pytest.gen.randint(2, 5) # arbitrary, random int from 2 to 5
+    len_first_frame = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
+    len_arg_frame = pytest.gen.randint(6, 10) # arbitrary int greater than len of first frame, from 6 to 10
+    first_frame = [pytest.gen.uniform(-10.0, 10.0) for _ in range(len_first_frame)]
+    arg_frame = [pytest.gen.uniform(-10.0, 10.0) for _ in range(len_arg_frame)]
+
+    cut = Kalman.__new__(Kalman)
+    cut.buffer = None
+    cut.valid = None
+    cut.head = 0
+    cut.count = 0
+    cut.window_size = fake_window_size
+    cut.update(first_frame)
 
     # Act
     cut.update(arg_frame)
 
     # Assert
-    assert cut.frames == expected_result
-
-def test_Kalman_update_mutates_frames_attribute_as_expected_when_both_frames_and_arg_frame_are_not_empty_and_len_arg_frame_less_than_len_frames():
+    values, valid = cut.get_window()
+    assert values.shape == (len_arg_frame, 2)
+    assert values[:len_first_frame].tolist() == [[first_frame[i], arg_frame[i]] for i in range(len_first_frame)]
+    assert values[len_first_frame:, 1].tolist() == arg_frame[len_first_frame:]
+    assert valid[:, 1].all()
+    assert not valid[len_first_frame:, 0].any()
+
+def test_Kalman_update_marks_attributes_missing_when_len_arg_frame_less_than_attributes_in_buffer_stale():
     # Arrange
-    len_fake_frames = pytest.gen.randint(6, 10) # arbitrary int greater than max len of arg_frame, from 6 to 10
-    fake_frames = [[MagicMock()]] * len_fake_frames
-    fake_window_size = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
-
+    fake_window_size = pytest.gen.randint(2, 5) # arbitrary, random int from 2 to 5
+    len_first_frame = pytest.gen.randint(6, 10) # arbitrary int greater than len of arg_frame, from 6 to 10
     len_arg_frame = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
-    arg_frame = [MagicMock()] * len_arg_frame
+    first_frame = [pytest.gen.uniform(-10.0, 10.0) for _ in range(len_first_frame)]
+    arg_frame = [pytest.gen.uniform(-10.0, 10.0) for _ in range(len_arg_frame)]
 
     cut = Kalman.__new__(Kalman)
-    cut.frames = fake_frames
+    cut.buffer = None
+    cut.valid = None
+    cut.head = 0
+    cut.count = 0
     cut.window_size = fake_window_size
-
-    expected_result = fake_frames.copy()
-    for i in range(len_arg_frame):
-        expected_result[i].append(arg_frame[i])
-        if len(expected_result[i]) > fake_window_size:
-            expected_result[i].pop(0)
+    cut.update(first_frame)
 
     # Act
     cut.update(arg_frame)
 
     # Assert
-    assert cut.frames == expected_result
+    values, valid = cut.get_window()
+    assert values[:len_arg_frame, 1].tolist() == arg_frame
+    assert valid[:len_arg_frame].all()
+    assert np.isnan(values[len_arg_frame:, 1]).all()
+    assert not valid[len_arg_frame:, 1].any()
+    assert valid[:, 0].all()
+
+def test_Kalman_update_marks_stale_values_invalid():
+    # Arrange
+    arg_frame = [1.0, '-', 3]
 
+    cut = Kalman.__new__(Kalman)
+    cut.buffer = None
+    cut.valid = None
+    cut.head = 0
+    cut.count = 0
+    cut.window_size = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
 
-def test_Kalman_update_pops_first_index_of_frames_data_points_when_window_size_is_exceeded():
-    # Arrange
-    len_fake_frames = pytest.gen.randint(6, 10) # arbitrary int greater than max len of arg_frame, from 6 to 10
-                                                # choosing to keep len of fake_frames greater than arg_frame in order to guarantee 'else' statement is reached
-    # fake_frames = [[MagicMock()]] * len_fake_frames
-    expected_result = []
-    fake_frames = []
-    for i in range(len_fake_frames):
-        fake_frame = [MagicMock()]
-        fake_frames.append([fake_frame])
-        expected_result.append([fake_frame])
-    fake_window_size = 1 # arbitrary, chosen to guarantee 'popping'
+    # Act
+    cut.update(arg_frame)
 
-    len_arg_frame = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
-    arg_frame = []
-    for i in range(len_arg_frame):
-        arg_frame.append(MagicMock())
+    # Assert
+    values, valid = cut.get_window()
+    assert values[[0, 2], 0].tolist() == [1.0, 3.0]
+    assert np.isnan(values[1, 0])
+    assert valid[:, 0].tolist() == [True, False, True]
+
+def test_Kalman_update_keeps_absolute_innovations_of_online_filters_in_residual_window(mocker):
+    # Arrange
+    num_attributes = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
+    fake_window_size = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
+    num_frames = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
+    arg_frames = [[pytest.gen.uniform(-10.0, 10.0) for _ in range(num_attributes)] for _ in range(num_frames)]
+    forced_innovations = [np.array([pytest.gen.uniform(-10.0, 10.0) for _ in range(num_attributes)]) for _ in range(num_frames)]
 
     cut = Kalman.__new__(Kalman)
-    cut.frames = fake_frames
+    cut.buffer = None
+    cut.valid = None
+    cut.states = None
+    cut.residuals = None
+    cut.gain = MagicMock()
+    cut.head = 0
+    cut.count = 0
     cut.window_size = fake_window_size
+    cut.online = True
+    stepped_values = []
+    def fake_filter_step(values):
+        stepped_values.append(values.tolist())
+        return forced_innovations[len(stepped_values) - 1]
+    mocker.patch.object(cut, 'filter_step', side_effect=fake_filter_step)
+
+    # Act
+    for arg_frame in arg_frames:
+        cut.update(arg_frame)
+
+    # Assert
+    assert stepped_values == arg_frames
+    expected_result = np.abs(np.array(forced_innovations).T[:, -fake_window_size:])
+    assert cut.window_of(cut.residuals).tolist() == expected_result.tolist()
 
-    for i in range(len_arg_frame):
-        expected_result[i].append(arg_frame[i])
-        expected_result[i].pop(0)
+# test reset
+@pytest.mark.parametrize('arg_online', [False, True])
+def test_Kalman_reset_forgets_windows_and_filter_states_so_next_update_starts_again(arg_online):
+    # Arrange
+    fake_window_size = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
+    arg_frames = [[pytest.gen.uniform(-10.0, 10.0) for _ in range(3)] for _ in range(fake_window_size + 2)]
+
+    def with_model(plugin):
+        # simdkalman is mocked, so the filters are given the model the plugin builds
+        plugin.kf = MagicMock()
+        plugin.kf.state_transition = [[1,1],[0,1]]
+        plugin.kf.process_noise = np.diag([0.1, 0.01])
+        plugin.kf.observation_model = np.array([[1,0]])
+        plugin.kf.observation_noise = 1.0
+        return plugin
+
+    cut = with_model(Kalman('test', ['a', 'b', 'c'], fake_window_size, online=arg_online))
+    for frame in arg_frames:
+        cut.update(frame)
 
     # Act
-    cut.update(arg_frame)
+    cut.reset()
+    cut.update(arg_frames[0])
 
     # Assert
-    assert cut.frames == expected_result
+    fresh = with_model(Kalman('test', ['a', 'b', 'c'], fake_window_size, online=arg_online))
+    fresh.update(arg_frames[0])
+    assert cut.head == fresh.head
+    assert cut.count == fresh.count == 1
+    assert np.array_equal(cut.buffer, fresh.buffer, equal_nan=True)
+    if arg_online:
+        assert np.array_equal(cut.states, fresh.states, equal_nan=True)
+        assert np.array_equal(cut.residuals, fresh.residuals, equal_nan=True)
+
+# test steady_state_gain
+def test_Kalman_steady_state_gain_is_gain_of_covariance_the_filter_settles_to():
+    # Arrange
+    cut = Kalman.__new__(Kalman)
+    cut.kf = MagicMock()
+    cut.kf.state_transition = [[1,1],[0,1]]
+    cut.kf.process_noise = np.diag([0.1, 0.01])
+    cut.kf.observation_model = np.array([[1,0]])
+    cut.kf.observation_noise = 1.0
+
+    # Act
+    result = cut.steady_state_gain()
 
-def test_Kalman_update_will_not_pop_first_index_of_frames_data_points_when_window_size_is_never_exceeded():
+    # Assert
+    transition = np.array([[1.0, 1.0], [0.0, 1.0]])
+    observation = np.array([[1.0, 0.0]])
+    predicted_covariance = cut.kf.process_noise
+    for _ in range(10000):
+        gain = predicted_covariance @ observation.T / (observation @ predicted_covariance @ observation.T + 1.0)
+        predicted_covariance = transition @ (predicted_covariance - gain @ observation @ predicted_covariance) @ transition.T + cut.kf.process_noise
+    assert np.allclose(result, gain[:, 0])
+
+# test filter_step
+def test_Kalman_filter_step_starts_filters_at_first_observation_predicts_through_stale_values_and_updates_the_rest():
     # Arrange
-    len_fake_frames = pytest.gen.randint(6, 10) # arbitrary int greater than max len of arg_frame, from 6 to 10
-                                                # choosing to keep len of fake_frames greater than arg_frame in order to guarantee 'else' statement is reached
-    # fake_frames = [[MagicMock()]] * len_fake_frames
-    expected_result = []
-    fake_frames = []
-    for i in range(len_fake_frames):
-        fake_frame = [MagicMock()]
-        fake_frames.append([fake_frame])
-        expected_result.append([fake_frame])
-    fake_window_size = 99 # arbitrary, chosen to guarantee no 'popping' will occur
+    arg_values = np.array([4.0, np.nan, 3.0, np.nan])
+    fake_gain = np.array([pytest.gen.uniform(0.0, 1.0), pytest.gen.uniform(0.0, 1.0)]) # arbitrary, from 0.0 to 1.0
 
-    len_arg_frame = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
-    arg_frame = []
-    for i in range(len_arg_frame):
-        arg_frame.append(MagicMock())
+    cut = Kalman.__new__(Kalman)
+    cut.kf = MagicMock()
+    cut.kf.state_transition = [[1,1],[0,1]]
+    cut.kf.observation_model = np.array([[1,0]])
+    cut.gain = fake_gain
+    cut.states = np.array([[np.nan, np.nan], [1.0, 2.0], [1.0, 0.5], [np.nan, np.nan]])
+
+    # Act
+    result = cut.filter_step(arg_values)
+
+    # Assert
+    assert np.isnan(result[[0, 1, 3]]).all()
+    assert result[2] == 1.5
+    assert cut.states[0].tolist() == [4.0, 0.0]
+    assert cut.states[1].tolist() == [3.0, 2.0]
+    assert np.allclose(cut.states[2], np.array([1.5, 0.5]) + 1.5 * fake_gain)
+    assert np.isnan(cut.states[3]).all()
+
+# test to_row
+def test_Kalman_to_row_raises_error_when_a_value_is_neither_numeric_nor_stale():
+    # Arrange
+    arg_frame = ['-', 'not a number']
 
     cut = Kalman.__new__(Kalman)
-    cut.frames = fake_frames
-    cut.window_size = fake_window_size
 
-    for i in range(len_arg_frame):
-        expected_result[i].append(arg_frame[i])
+    # Act
+    with pytest.raises(ValueError):
+        cut.to_row(arg_frame)
+
+# test get_window
+def test_Kalman_get_window_returns_empty_views_before_first_update():
+    # Arrange
+    cut = Kalman.__new__(Kalman)
+    cut.buffer = None
 
     # Act
-    cut.update(arg_frame)
+    values, valid = cut.get_window()
 
     # Assert
-    assert cut.frames == expected_result
+    assert values.size == 0
+    assert valid.size == 0
 
 # test render diagnosis
-def test_Kalman_render_reasoning_returns_value_returned_by_frame_diagnosis_function(mocker):
+def test_Kalman_render_reasoning_returns_value_returned_by_frame_diagnosis_function_of_window(mocker):
     # Arrange
-    fake_frames = MagicMock()
+    fake_values = MagicMock()
+    fake_valid = MagicMock()
     fake_headers = MagicMock()
     forced_frame_diagnose_return = MagicMock()
 
     cut = Kalman.__new__(Kalman)
-    cut.frames = fake_frames
     cut.headers = fake_headers
 
+    mocker.patch.object(cut, 'get_window', return_value=(fake_values, fake_valid))
     mocker.patch.object(cut, 'frame_diagnosis', return_value=forced_frame_diagnose_return)
 
     # Act
@@ -262,6 +418,44 @@ def test_Kalman_render_reasoning_returns_value_returned_by_frame_diagnosis_funct
 
     # Assert
     assert result == forced_frame_diagnose_return
+    assert cut.frame_diagnosis.call_args_list[0].args == (fake_values, fake_headers, fake_valid)
+
+def test_Kalman_render_reasoning_returns_empty_list_when_online_before_first_update():
+    # Arrange
+    cut = Kalman.__new__(Kalman)
+    cut.online = True
+    cut.residuals = None
+
+    # Act
+    result = cut.render_reasoning()
+
+    # Assert
+    assert result == []
+
+def test_Kalman_render_reasoning_returns_residual_diagnosis_of_residual_window_when_online(mocker):
+    # Arrange
+    fake_residuals = MagicMock()
+    fake_window = MagicMock()
+    fake_headers = MagicMock()
+    forced_residual_diagnosis_return = MagicMock()
+
+    cut = Kalman.__new__(Kalman)
+    cut.online = True
+    cut.residuals = fake_residuals
+    cut.headers = fake_headers
+
+    mocker.patch.object(cut, 'window_of', return_value=fake_window)
+    mocker.patch.object(cut, 'residual_diagnosis', return_value=forced_residual_diagnosis_return)
+    mocker.patch.object(cut, 'frame_diagnosis')
+
+    # Act
+    result = cut.render_reasoning()
+
+    # Assert
+    assert result == forced_residual_diagnosis_return
+    assert cut.window_of.call_args_list[0].args == (fake_residuals, )
+    assert cut.residual_diagnosis.call_args_list[0].args == (fake_window, fake_headers)
+    assert cut.frame_diagnosis.call_count == 0
 
 # test mean
 def test_Kalman_mean_calculates_return_value_by_dividing_sum_by_len(mocker):
@@ -496,131 +690,121 @@ def test_Kalman_predict_floatifies_args_and_smoothes_data_and_predicts_result_us
     assert fake_kf.predict.call_count == 1
     assert fake_kf.predict.call_args_list[0].args == (arg_data_float, arg_forward_steps)
 
-# test predictions_for_given_data
-def test_Kalman_predictions_for_given_data_raises_error_when_data_arg_is_empty(mocker):
+# test one_step_predictions
+def test_Kalman_one_step_predictions_filters_all_but_last_point_of_every_row_once_and_steps_filtered_states_forward():
     # Arrange
-    arg_data = []
+    arg_data = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    fake_kf = MagicMock()
+    fake_kf.state_transition = np.array([[1, 1], [0, 1]])
+    fake_kf.observation_model = np.array([[1, 0]])
+    fake_states = np.array([[[1.0, 0.5], [2.0, 1.0]], [[4.0, 0.0], [5.0, -1.0]]])
+    fake_kf.compute.return_value.filtered.states.mean = fake_states
 
     cut = Kalman.__new__(Kalman)
-    mocker.patch.object(cut, 'predict')
+    cut.kf = fake_kf
 
     # Act
-    with pytest.raises(IndexError) as e_info:
-        cut.predictions_for_given_data(arg_data)
+    result = cut.one_step_predictions(arg_data)
 
     # Assert
-    assert e_info.match('list index out of range')
-    assert cut.predict.call_count == 0
-
-def test_Kalman_predictions_for_given_data_returns_expected_result_when_data_arg_has_only_one_element(mocker):
+    assert fake_kf.compute.call_count == 1
+    assert fake_kf.compute.call_args_list[0].args[0].tolist() == [[1.0, 2.0], [4.0, 5.0]]
+    assert fake_kf.compute.call_args_list[0].args[1] == 0
+    assert fake_kf.compute.call_args_list[0].kwargs == {'smoothed':False, 'filtered':True}
+    assert result.tolist() == [[1.5, 3.0], [4.0, 4.0]]
+
+# test generate_residuals
+def test_Kalman_generate_residuals_returns_a_zero_for_each_row_when_rows_have_fewer_than_two_points(mocker):
     # Arrange
-    arg_data = [MagicMock()]
+    arg_data = np.zeros((pytest.gen.randint(1, 10), pytest.gen.randint(0, 1))) # arbitrary, from 1 to 10 rows
 
     cut = Kalman.__new__(Kalman)
-
-    mocker.patch.object(cut, 'predict')
-
-    expected_result = [0]
+    mocker.patch.object(cut, 'one_step_predictions')
 
     # Act
-    result = cut.predictions_for_given_data(arg_data)
+    result = cut.generate_residuals(arg_data)
 
     # Assert
-    assert result == expected_result
-    assert cut.predict.call_count == 0
+    assert result.tolist() == [[0.0]] * arg_data.shape[0]
+    assert cut.one_step_predictions.call_count == 0
 
-def test_Kalman_predictions_for_given_data_returns_expected_result_when_data_arg_has_more_than_one_element(mocker):
+def test_Kalman_generate_residuals_returns_abs_difference_of_each_point_after_the_first_and_its_prediction(mocker):
     # Arrange
-    len_data = pytest.gen.randint(2, 10) # arbitrary, random int from 1 to 10
-    arg_data = [MagicMock()] * len_data
+    arg_data = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    forced_predictions = np.array([[2.5, 2.0], [6.0, 7.5]])
 
     cut = Kalman.__new__(Kalman)
+    mocker.patch.object(cut, 'one_step_predictions', return_value=forced_predictions)
 
-    forced_predict_return_value = MagicMock()
-    forced_pred_mean = MagicMock()
-    mocker.patch.object(forced_predict_return_value, 'observations', forced_predict_return_value)
-    mocker.patch.object(forced_predict_return_value, 'mean', forced_pred_mean)
-    mocker.patch.object(cut, 'predict', return_value=forced_predict_return_value)
+    # Act
+    result = cut.generate_residuals(arg_data)
 
-    expected_result = []
-    for i in range(len_data - 1):
-        expected_result.append(forced_pred_mean)
+    # Assert
+    assert cut.one_step_predictions.call_args_list[0].args == (arg_data, )
+    assert result.tolist() == [[0.5, 1.0], [1.0, 1.5]]
+
+# test predictions_for_given_data
+def test_Kalman_predictions_for_given_data_returns_expected_result_when_data_arg_has_fewer_than_two_elements(mocker):
+    # Arrange
+    arg_data = [MagicMock()] * pytest.gen.randint(0, 1)
+
+    cut = Kalman.__new__(Kalman)
+    mocker.patch.object(cut, 'one_step_predictions')
 
     # Act
     result = cut.predictions_for_given_data(arg_data)
 
     # Assert
-    assert result == expected_result
-    assert cut.predict.call_count == len_data - 1
-    for i in range(len_data - 1):
-        cut.predict.call_args_list[i].args == (arg_data[0:i+1], 1, arg_data[0])
+    assert result == [0]
+    assert cut.one_step_predictions.call_count == 0
 
-# test generate_residuals_for_given_data
-def test_Kalman_generate_residuals_for_given_data_raises_error_when_data_arg_is_empty(mocker):
+def test_Kalman_predictions_for_given_data_returns_one_step_predictions_of_data_as_a_single_row(mocker):
     # Arrange
-    arg_data = []
+    len_data = pytest.gen.randint(2, 10) # arbitrary, random int from 2 to 10
+    arg_data = [str(pytest.gen.uniform(-10.0, 10.0)) for _ in range(len_data)]
+    forced_predictions = np.array([[pytest.gen.uniform(-10.0, 10.0) for _ in range(len_data - 1)]])
 
     cut = Kalman.__new__(Kalman)
-    mocker.patch.object(cut, 'predict')
+    mocker.patch.object(cut, 'one_step_predictions', return_value=forced_predictions)
 
     # Act
-    with pytest.raises(IndexError) as e_info:
-        cut.generate_residuals_for_given_data(arg_data)
+    result = cut.predictions_for_given_data(arg_data)
 
     # Assert
-    assert e_info.match('list index out of range')
-    assert cut.predict.call_count == 0
+    assert result == forced_predictions[0].tolist()
+    assert cut.one_step_predictions.call_args_list[0].args[0].tolist() == [[float(val) for val in arg_data]]
 
-def test_Kalman_generate_residuals_for_given_data_returns_expected_result_when_data_arg_has_only_one_element(mocker):
+# test generate_residuals_for_given_data
+def test_Kalman_generate_residuals_for_given_data_raises_error_when_data_arg_is_not_numeric(mocker):
     # Arrange
-    arg_data = [MagicMock()]
+    arg_data = ['not a number', str(MagicMock())]
 
     cut = Kalman.__new__(Kalman)
-
-    mocker.patch.object(cut, 'predict')
-
-    expected_result = [0]
+    mocker.patch.object(cut, 'generate_residuals')
 
     # Act
-    result = cut.generate_residuals_for_given_data(arg_data)
+    with pytest.raises(ValueError):
+        cut.generate_residuals_for_given_data(arg_data)
 
     # Assert
-    assert result == expected_result
-    assert cut.predict.call_count == 0
+    assert cut.generate_residuals.call_count == 0
 
-def test_Kalman_generate_residuals_for_given_data_returns_expected_result_when_data_arg_has_more_than_one_element(mocker):
+def test_Kalman_generate_residuals_for_given_data_returns_residuals_of_data_as_a_single_row(mocker):
     # Arrange
-    len_data = pytest.gen.randint(2, 10) # arbitrary, random int from 1 to 10
-    arg_data = [MagicMock()] * len_data
+    len_data = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
+    arg_data = [pytest.gen.uniform(-10.0, 10.0) for _ in range(len_data)]
+    forced_residuals = np.array([[pytest.gen.uniform(0.0, 10.0) for _ in range(max(len_data - 1, 1))]])
 
     cut = Kalman.__new__(Kalman)
-
-    forced_predict_return_value = MagicMock()
-    forced_pred_mean = MagicMock()
-    forced_residual_side_effect = []
-    for i in range(len_data - 1):
-        rand_float = pytest.gen.uniform(-10.0, 10.0) # arbitrary, random float from -10.0 to 10.0
-        forced_residual_side_effect.append(rand_float)
-    mocker.patch.object(forced_predict_return_value, 'observations', forced_predict_return_value)
-    mocker.patch.object(forced_predict_return_value, 'mean', forced_pred_mean)
-    mocker.patch.object(cut, 'residual', side_effect=forced_residual_side_effect)
-    mocker.patch.object(cut, 'predict', return_value=forced_predict_return_value)
-
-    expected_result = []
-    for i in range(len_data - 1):
-        expected_result.append(forced_residual_side_effect[i])
+    mocker.patch.object(cut, 'generate_residuals', return_value=forced_residuals)
 
     # Act
     result = cut.generate_residuals_for_given_data(arg_data)
 
     # Assert
-    assert result == expected_result
-    assert cut.predict.call_count == len_data - 1
-    for i in range(len_data - 1):
-        cut.predict.call_args_list[i].args == (arg_data[0:i+1], 1, arg_data[0])
-    assert cut.residual.call_count == len_data - 1
-    for i in range(len_data - 1):
-        cut.residual.call_args_list[i].args == (forced_pred_mean, arg_data[i + 1])
+    assert result == forced_residuals[0].tolist()
+    assert cut.generate_residuals.call_args_list[0].args[0].tolist() == [arg_data]
 
 # test current_attribute_chunk_get_error
 def test_Kalman_current_attribute_chunk_get_error_returns_true_when_abs_of_mean_residuals_equal_to_or_greater_than_one_point_five(mocker):
@@ -689,36 +873,32 @@ def test_Kalman_frame_diagnosis_returns_empty_list_when_args_frame_and_headers_a
     # Assert
     assert result == []
 
-def test_Kalman_frame_diagnosis_returns_empty_list_when_current_attribute_chunk_get_error_always_returns_false_and_args_not_empty(mocker):
+def test_Kalman_frame_diagnosis_generates_residuals_of_all_attributes_at_once(mocker):
     # Arrange
     len_args = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
-    arg_frame = []
-    for i in range(len_args):
-        arg_frame.append(MagicMock())
-    arg_headers = MagicMock()
+    window_size = pytest.gen.randint(1, 5) # arbitrary, random int from 1 to 5
+    arg_frame = [[pytest.gen.uniform(-10.0, 10.0) for _ in range(window_size)] for _ in range(len_args)]
+    arg_headers = [str(MagicMock()) for _ in range(len_args)]
 
     cut = Kalman.__new__(Kalman)
-    forced_get_error_return_value = False
-    mocker.patch.object(cut, 'current_attribute_chunk_get_error', return_value=forced_get_error_return_value)
+    mocker.patch.object(cut, 'generate_residuals', return_value=np.zeros((len_args, 1)))
 
     # Act
     result = cut.frame_diagnosis(arg_frame, arg_headers)
 
     # Assert
     assert result == []
-    assert cut.current_attribute_chunk_get_error.call_count == len_args
-    for i in range(len_args):
-        assert cut.current_attribute_chunk_get_error.call_args_list[i].args == (arg_frame[i], )
+    assert cut.generate_residuals.call_count == 1
+    assert cut.generate_residuals.call_args_list[0].args[0].tolist() == arg_frame
 
 def test_Kalman_frame_diagnosis_returns_empty_list_when_all_elements_in_headers_arg_match_time_str(mocker):
     # Arrange
     len_args = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
-    arg_frame = [MagicMock()] * len_args
+    arg_frame = [[0.0, 1.0]] * len_args
     arg_headers = ['TIME'] * len_args
 
     cut = Kalman.__new__(Kalman)
-    forced_get_error_return_value = True
-    mocker.patch.object(cut, 'current_attribute_chunk_get_error', return_value=forced_get_error_return_value)
+    mocker.patch.object(cut, 'generate_residuals', return_value=np.full((len_args, 1), 10.0))
 
     # Act
     result = cut.frame_diagnosis(arg_frame, arg_headers)
@@ -726,55 +906,57 @@ def test_Kalman_frame_diagnosis_returns_empty_list_when_all_elements_in_headers_
     # Assert
     assert result == []
 
-def test_Kalman_frame_diagnosis_returns_list_of_all_elements_in_headers_arg_when_current_attribute_chunk_get_error_always_returns_true_and_args_not_empty_and_headers_does_not_contain_strings_matching_time_str(mocker):
+def test_Kalman_frame_diagnosis_returns_headers_whose_abs_mean_residual_is_at_least_one_point_five_or_nan_except_time(mocker):
     # Arrange
-    len_args = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
-    arg_frame = []
-    arg_headers = []
-    for i in range(len_args):
-        arg_frame.append(MagicMock())
-        arg_headers.append(str(MagicMock()))
+    arg_frame = [[0.0, 1.0, 2.0]] * 6
+    arg_headers = ['a', 'b', 'c', 'time', 'd', 'e']
+    forced_residuals = np.array([[1.0, 1.0], [1.0, 2.0], [2.0, 3.0], [5.0, 5.0], [np.nan, 0.0], [1.4, 1.59]])
 
     cut = Kalman.__new__(Kalman)
-    forced_get_error_return_value = True
-    mocker.patch.object(cut, 'current_attribute_chunk_get_error', return_value=forced_get_error_return_value)
+    mocker.patch.object(cut, 'generate_residuals', return_value=forced_residuals)
 
     # Act
     result = cut.frame_diagnosis(arg_frame, arg_headers)
 
     # Assert
-    assert result == arg_headers
+    assert result == ['b', 'c', 'd']
 
-def test_Kalman_frame_diagnosis_returns_expected_sublist_of_headers_when_headers_contains_strings_matching_time_str_and_the_result_of_current_attribute_chunk_get_error_is_not_constant(mocker):
+def test_Kalman_frame_diagnosis_leaves_residuals_of_stale_values_out_of_mean(mocker):
     # Arrange
-    len_args = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
-    arg_frame = []
-    arg_headers = []
-    for i in range(len_args):
-        arg_frame.append(MagicMock())
-        arg_headers.append(str(MagicMock()))
-
-    num_time_strings = pytest.gen.randint(1, 10) # arbitrary, random int from 1 to 10
-    for i in range(num_time_strings):
-        rand_index = pytest.gen.randint(0, len_args) # random index in arg_frame
-        arg_frame.append(MagicMock()) # ordering of frame does not matter
-        arg_headers.insert(rand_index, 'time')
-        len_args += 1
-
-    cut = Kalman.__new__(Kalman)
-    expected_result = []
-    forced_get_error_side_effect = []
-    for i in range(len_args):
-        coin_flip = pytest.gen.randint(0, 1) # random int, either 0 or 1
-        if coin_flip == 0 or arg_headers[i] == 'time':
-            forced_get_error_side_effect.append(False)
-        else:
-            forced_get_error_side_effect.append(True)
-            expected_result.append(arg_headers[i])
-    mocker.patch.object(cut, 'current_attribute_chunk_get_error', side_effect=forced_get_error_side_effect)
+    arg_frame = [[0.0, 1.0, 2.0]] * 3
+    arg_headers = ['a', 'b', 'c']
+    arg_valid = np.array([[True, True, False], [True, False, False], [True, True, True]])
+    forced_residuals = np.array([[1.0, np.nan], [np.nan, np.nan], [1.0, 2.0]])
+
+    cut = Kalman.__new__(Kalman)
+    mocker.patch.object(cut, 'generate_residuals', return_value=forced_residuals)
 
     # Act
-    result = cut.frame_diagnosis(arg_frame, arg_headers)
+    result = cut.frame_diagnosis(arg_frame, arg_headers, arg_valid)
+
+    # Assert
+    assert result == ['c']
+
+# test residual_diagnosis
+def test_Kalman_residual_diagnosis_returns_empty_list_when_there_are_no_attributes():
+    # Arrange
+    cut = Kalman.__new__(Kalman)
+
+    # Act
+    result = cut.residual_diagnosis(np.empty((0, 0)), [])
+
+    # Assert
+    assert result == []
+
+def test_Kalman_residual_diagnosis_returns_headers_whose_mean_residual_is_at_least_one_point_five_except_time():
+    # Arrange
+    arg_residuals = np.array([[1.0, np.nan], [np.nan, 2.0], [np.nan, np.nan], [1.4, 1.7], [5.0, 5.0]])
+    arg_headers = ['a', 'b', 'c', 'd', 'time']
+
+    cut = Kalman.__new__(Kalman)
+
+    # Act
+    result = cut.residual_diagnosis(arg_residuals, arg_headers)
 
     # Assert
-    assert result == expected_result
+    assert result == ['b', 'd']
@@ -0,0 +1,31 @@
+# GSC-19165-1, "The On-Board Artificial Intelligence Research (OnAIR) Platform"
+#
+# Copyright © 2023 United States Government as represented by the Administrator of
+# the National Aeronautics and Space Administration. No copyright is claimed in the
+# United States under Title 17, U.S. Code. All Other Rights Reserved.
+#
+# Licensed under the NASA Open Source Agreement version 1.3
+# See "NOSA GSC-19165-1 OnAIR.pdf"
+
+""" Test Online Kalman Plugin Functionality """
+import pytest
+
+from plugins.kalman import kalman_plugin
+from onair.src.util.plugin_import import import_plugins
+
+def test_kalman_online_Plugin_loaded_from_a_plugin_dict_filters_online(mocker):
+    # Arrange
+    arg_headers = ['a', 'b']
+    arg_module_dict = {'Kalman Filter' : 'plugins/kalman_online'}
+
+    mocker.patch(kalman_plugin.__name__ + '.simdkalman.KalmanFilter')
+
+    # Act
+    result = import_plugins(arg_headers, arg_module_dict)
+
+    # Assert
+    assert len(result) == 1
+    assert isinstance(result[0], kalman_plugin.Plugin)
+    assert result[0].component_name == 'Kalman Filter'
+    assert result[0].headers == arg_headers
+    assert result[0].online == True
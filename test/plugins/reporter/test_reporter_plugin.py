@@ -60,6 +60,13 @@ def test_Reporter_update_saves_given_args_and_outputs_all_info_when_verbose_mode
     assert cut.high_level_data == arg_high_level_data
 
 # test render_reasoning
+def test_Reporter_opts_out_of_reasoning_cache_to_report_every_render():
+    # Arrange
+    cut = Reporter.__new__(Reporter)
+
+    # Assert
+    assert cut.cache_reasoning == False
+
 def test_Reporter_render_reasoning_only_outputs_render_reasoning_when_not_verbose_mode(mocker):
     # Arrange
     cut = Reporter.__new__(Reporter)
@@ -95,3 +102,151 @@ def test_Reporter_render_reasoning_outputs_all_info_when_verbose_mode(mocker):
     assert reporter_plugin.print.call_args_list[0].args == (f"{cut.component_name}: RENDER_REASONING", )
     assert reporter_plugin.print.call_args_list[1].args == (f" : My low_level_data is {fake_low_level_data}", )
     assert reporter_plugin.print.call_args_list[2].args == (f" : My high_level_data is {fake_high_level_data}", )
+
+def test_Reporter_render_reasoning_outputs_nothing_when_frame_is_not_reported(mocker):
+    # Arrange
+    cut = Reporter.__new__(Reporter)
+    cut.reporting = False
+
+    mocker.patch(reporter_plugin.__name__ + '.print')
+
+    # Act
+    cut.render_reasoning()
+
+    # Assert
+    assert reporter_plugin.print.call_count == 0
+
+# test sample_frame
+def test_Reporter_sample_frame_reports_every_report_every_th_frame_starting_with_first():
+    # Arrange
+    cut = Reporter.__new__(Reporter)
+    cut.report_every = pytest.gen.randint(1, 5) # arbitrary, from 1 to 5
+    num_frames = pytest.gen.randint(1, 20) # arbitrary, from 1 to 20
+
+    # Act
+    result = [cut.sample_frame() for _ in range(num_frames)]
+
+    # Assert
+    assert result == [frame % cut.report_every == 0 for frame in range(num_frames)]
+
+def test_Reporter_sample_frame_reports_no_more_often_than_report_interval(mocker):
+    # Arrange
+    cut = Reporter.__new__(Reporter)
+    cut.report_interval = 1.0
+    mocker.patch(reporter_plugin.__name__ + '.time.monotonic', side_effect=[10.0, 10.5, 11.0, 11.9, 12.1])
+
+    # Act
+    result = [cut.sample_frame() for _ in range(5)]
+
+    # Assert
+    assert result == [True, False, True, False, True]
+
+def test_Reporter_update_outputs_nothing_when_frame_is_not_sampled(mocker):
+    # Arrange
+    cut = Reporter.__new__(Reporter)
+    cut.verbose_mode = True
+
+    mocker.patch.object(cut, 'sample_frame', return_value=False)
+    mocker.patch(reporter_plugin.__name__ + '.print')
+
+    # Act
+    cut.update(MagicMock(), MagicMock())
+
+    # Assert
+    assert reporter_plugin.print.call_count == 0
+    assert cut.reporting == False
+
+# test report
+def test_Reporter_report_puts_report_holding_copies_of_data_on_shared_queue_when_queue_reports(mocker):
+    # Arrange
+    arg_low_level_data = [pytest.gen.random()]
+    arg_high_level_data = {'layer' : {}}
+    fake_queue = MagicMock()
+
+    cut = Reporter.__new__(Reporter)
+    cut.component_name = MagicMock(name='fake.cut.component_name')
+    cut.headers = MagicMock(name='fake.cut.headers')
+    cut.verbose_mode = True
+    cut.queue_reports = True
+
+    mocker.patch(reporter_plugin.__name__ + '.get_report_queue', return_value=fake_queue)
+    mocker.patch(reporter_plugin.__name__ + '.print')
+
+    # Act
+    cut.update(arg_low_level_data, arg_high_level_data)
+    arg_low_level_data.append(pytest.gen.random())
+
+    # Assert
+    assert reporter_plugin.print.call_count == 0
+    assert fake_queue.put.call_count == 1
+    component_name, event, details = fake_queue.put.call_args_list[0].args[0]
+    assert (component_name, event) == (cut.component_name, 'UPDATE')
+    assert details[0] == cut.headers
+    assert len(details[1]) == 1
+    assert details[2] == arg_high_level_data
+    assert details[2] is not arg_high_level_data
+
+# test finish
+@pytest.mark.parametrize('arg_queue_reports', [True, False])
+def test_Reporter_finish_drains_shared_queue_only_when_queue_reports(mocker, arg_queue_reports):
+    # Arrange
+    cut = Reporter.__new__(Reporter)
+    cut.queue_reports = arg_queue_reports
+
+    mocker.patch(reporter_plugin.__name__ + '.shared_report_queue')
+
+    # Act
+    cut.finish()
+
+    # Assert
+    assert reporter_plugin.shared_report_queue.drain.call_count == (1 if arg_queue_reports else 0)
+
+def test_Reporter_finish_does_nothing_before_any_report_is_queued(mocker):
+    # Arrange
+    cut = Reporter.__new__(Reporter)
+    cut.queue_reports = True
+
+    mocker.patch(reporter_plugin.__name__ + '.shared_report_queue', None)
+
+    # Act
+    result = cut.finish()
+
+    # Assert
+    assert result == None
+
+# test ReportQueue
+def test_ReportQueue_prints_queued_reports_in_order_on_its_thread(mocker):
+    # Arrange
+    num_reports = pytest.gen.randint(1, 10) # arbitrary, from 1 to 10
+    mocker.patch(reporter_plugin.__name__ + '.print')
+
+    cut = reporter_plugin.ReportQueue()
+
+    # Act
+    for i in range(num_reports):
+        cut.put((f'reporter {i}', 'UPDATE', None))
+    cut.drain()
+
+    # Assert
+    assert [call.args for call in reporter_plugin.print.call_args_list] == [(f'reporter {i}: UPDATE', ) for i in range(num_reports)]
+
+def test_ReportQueue_drops_reports_when_full_and_prints_how_many_with_next_report(mocker):
+    # Arrange
+    mocker.patch(reporter_plugin.__name__ + '.threading.Thread')
+    mocker.patch(reporter_plugin.__name__ + '.print')
+    max_reports = pytest.gen.randint(1, 5) # arbitrary, from 1 to 5
+    num_dropped = pytest.gen.randint(1, 5) # arbitrary, from 1 to 5
+
+    cut = reporter_plugin.ReportQueue(max_reports)
+    for i in range(max_reports + num_dropped):
+        cut.put(('reporter', 'UPDATE', None))
+
+    # Act
+    mocker.patch.object(cut.reports, 'get', side_effect=[cut.reports.get_nowait(), SystemExit])
+    with pytest.raises(SystemExit):
+        cut.print_reports()
+
+    # Assert
+    assert cut.dropped == num_dropped
+    assert reporter_plugin.print.call_args_list[0].args == (f"reporter: {num_dropped} reports dropped", )
+    assert reporter_plugin.print.call_args_list[1].args == ('reporter: UPDATE', )